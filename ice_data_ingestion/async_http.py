@@ -0,0 +1,242 @@
+# ice_data_ingestion/async_http.py
+"""
+Shared Non-Blocking HTTP Client for ICE API Connectors
+One long-lived event loop thread owns a pooled keep-alive aiohttp session, so connector
+coroutines overlap for real and sync code can call them without building a loop per call
+Token-bucket rate limiters keep concurrent callers inside provider limits (SEC: 10 req/s)
+Relevant files: sec_edgar_connector.py, financial_news_connectors.py, robust_client.py
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+try:
+    import aiohttp
+    from multidict import CIMultiDict
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for coroutines
+
+    Each acquire() reserves the next free token under a lock and sleeps until it is due,
+    so N concurrent callers are spread at `rate` per second instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests/second)
+            capacity: Burst size (default: rate, i.e. one second of burst)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; returns seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait for a token"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class AsyncLoopRunner:
+    """
+    Long-lived event loop on a daemon thread
+
+    Sync code submits coroutines with run(); everything submitted shares one loop, so
+    sessions, connection pools and rate limiters stay alive between calls.
+    """
+
+    def __init__(self, name: str = 'ice-async-http'):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runner's loop, started on first use"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def in_runner_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]):
+        """Schedule a coroutine on the runner loop; returns a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine to completion from sync code (safe from any thread and inside Jupyter)"""
+        if self.in_runner_thread():
+            coro.close()
+            raise RuntimeError("AsyncLoopRunner.run() called from its own loop - await the coroutine instead")
+        return self.submit(coro).result(timeout=timeout)
+
+    def stop(self):
+        """Stop the loop thread (a new one starts on next use)"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            loop.close()
+
+
+_runner = AsyncLoopRunner()
+
+
+def get_loop_runner() -> AsyncLoopRunner:
+    """Process-wide loop runner shared by all connectors"""
+    return _runner
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a connector coroutine from sync code on the shared long-lived loop"""
+    return _runner.run(coro, timeout=timeout)
+
+
+@dataclass
+class HTTPResponse:
+    """Fully-read HTTP response (requests.Response-style accessors)"""
+    status_code: int
+    content: bytes
+    headers: Dict[str, str] = field(default_factory=dict)  # case-insensitive when built by AsyncHTTPClient
+    url: str = ''
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHTTPClient:
+    """
+    Pooled keep-alive HTTP client; all requests run on the shared loop runner
+
+    Awaiting get() from any event loop hops onto the runner loop, so a single
+    aiohttp session (and its connection pool) serves every caller.
+    """
+
+    def __init__(self, service_name: str, pool_size: int = 20, pool_per_host: int = 10,
+                 timeout: float = 30.0, runner: Optional[AsyncLoopRunner] = None):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp not installed. Install with: pip install aiohttp")
+        self.service_name = service_name
+        self.pool_size = pool_size
+        self.pool_per_host = pool_per_host
+        self.timeout = timeout
+        self.runner = runner or get_loop_runner()
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # Only called on the runner loop, so no locking needed
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_per_host,
+                                             ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+            logger.info(f"Created async connection pool for {self.service_name}")
+        return self._session
+
+    async def _request(self, method: str, url: str, rate_limiter: Optional[AsyncTokenBucket],
+                       timeout: Optional[float], **kwargs) -> HTTPResponse:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        if timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        async with self._get_session().request(method, url, **kwargs) as response:
+            content = await response.read()
+            return HTTPResponse(status_code=response.status, content=content,
+                                headers=CIMultiDict(response.headers), url=str(response.url))
+
+    async def request(self, method: str, url: str, rate_limiter: Optional[AsyncTokenBucket] = None,
+                      timeout: Optional[float] = None, **kwargs) -> HTTPResponse:
+        """
+        Make a request and read the full body
+
+        Args:
+            method: HTTP method
+            url: Target URL
+            rate_limiter: Token bucket to acquire from before sending
+            timeout: Total timeout in seconds (default: client timeout)
+            **kwargs: aiohttp request arguments (params, headers, ...)
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError on network failures
+        """
+        coro = self._request(method, url, rate_limiter, timeout, **kwargs)
+        if self.runner.in_runner_thread():
+            return await coro
+        return await asyncio.wrap_future(self.runner.submit(coro))
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        """GET request (see request())"""
+        return await self.request('GET', url, **kwargs)
+
+    async def _close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def close(self):
+        """Close the connection pool"""
+        if self._session is not None:
+            self.runner.run(self._close(), timeout=10)
+
+
+# Global client registry
+_clients: Dict[str, AsyncHTTPClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_async_http_client(service_name: str, **client_kwargs) -> AsyncHTTPClient:
+    """Get or create the shared async HTTP client for a service (kwargs apply on first creation)"""
+    with _clients_lock:
+        if service_name not in _clients:
+            _clients[service_name] = AsyncHTTPClient(service_name, **client_kwargs)
+        return _clients[service_name]
+
+
+@atexit.register
+def _shutdown():
+    """Close pooled sessions before the loop thread dies with the interpreter"""
+    for client in list(_clients.values()):
+        try:
+            client.close()
+        except Exception:
+            pass
+    _runner.stop()
@@ -11,7 +11,8 @@ Production-ready email ingestion with:
 - Investment-focused content extraction
 - Comprehensive edge case handling
 - Incremental sync with state persistence
-- Parallel processing for attachments
+- Bulk UID FETCH with latency-adaptive batch size; parsing runs on a thread pool
+  while the next batch downloads (the IMAP connection is only used by one thread)
 - Smart deduplication and validation
 """
 
@@ -28,7 +29,7 @@ import re
 import ssl
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.header import decode_header
@@ -43,6 +44,7 @@ from bs4 import BeautifulSoup
 from .robust_client import BaseDataClient, CircuitBreaker
 from .secure_config import SecureConfig
 from .data_validator import DataValidator, ValidationResult, DataQuality
+from .imap_bulk_fetch import adapt_batch_size, parse_uid_fetch_response
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +119,7 @@ class EmailIngestionState:
     def __init__(self, state_file: Path):
         self.state_file = state_file
         self.state = self._load_state()
+        self._lock = threading.RLock()  # Parse workers mark/fail emails concurrently
 
     def _load_state(self) -> Dict[str, Any]:
         """Load persisted state from disk"""
@@ -138,13 +141,14 @@ class EmailIngestionState:
     def save(self):
         """Persist state to disk"""
         try:
-            # Convert sets to lists for JSON serialization
-            state_to_save = self.state.copy()
-            state_to_save['processed_message_ids'] = list(self.state.get('processed_message_ids', set()))
-
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(state_to_save, f, indent=2, default=str)
+            with self._lock:
+                # Convert sets to lists for JSON serialization
+                state_to_save = self.state.copy()
+                state_to_save['processed_message_ids'] = list(self.state.get('processed_message_ids', set()))
+
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.state_file, 'w') as f:
+                    json.dump(state_to_save, f, indent=2, default=str)
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
 
@@ -161,29 +165,32 @@ class EmailIngestionState:
 
     def is_processed(self, message_id: str) -> bool:
         """Check if message was already processed"""
-        if 'processed_message_ids' not in self.state:
-            self.state['processed_message_ids'] = set()
-        elif isinstance(self.state['processed_message_ids'], list):
-            self.state['processed_message_ids'] = set(self.state['processed_message_ids'])
-        return message_id in self.state['processed_message_ids']
+        with self._lock:
+            if 'processed_message_ids' not in self.state:
+                self.state['processed_message_ids'] = set()
+            elif isinstance(self.state['processed_message_ids'], list):
+                self.state['processed_message_ids'] = set(self.state['processed_message_ids'])
+            return message_id in self.state['processed_message_ids']
 
     def mark_processed(self, message_id: str):
         """Mark message as processed"""
-        if 'processed_message_ids' not in self.state:
-            self.state['processed_message_ids'] = set()
-        elif isinstance(self.state['processed_message_ids'], list):
-            self.state['processed_message_ids'] = set(self.state['processed_message_ids'])
-        self.state['processed_message_ids'].add(message_id)
+        with self._lock:
+            if 'processed_message_ids' not in self.state:
+                self.state['processed_message_ids'] = set()
+            elif isinstance(self.state['processed_message_ids'], list):
+                self.state['processed_message_ids'] = set(self.state['processed_message_ids'])
+            self.state['processed_message_ids'].add(message_id)
 
     def add_failed(self, email_info: Dict[str, Any]):
         """Track failed email for retry"""
-        if 'failed_emails' not in self.state:
-            self.state['failed_emails'] = []
-        self.state['failed_emails'].append({
-            **email_info,
-            'failed_at': datetime.now().isoformat()
-        })
-        self.save()
+        with self._lock:
+            if 'failed_emails' not in self.state:
+                self.state['failed_emails'] = []
+            self.state['failed_emails'].append({
+                **email_info,
+                'failed_at': datetime.now().isoformat()
+            })
+            self.save()
 
 
 class EmailIngestionClient(BaseDataClient):
@@ -206,8 +213,11 @@ class EmailIngestionClient(BaseDataClient):
         self.last_activity = datetime.now()
 
         # Processing configuration
-        self.batch_size = 50
-        self.parallel_workers = 4
+        self.batch_size = 50  # Initial UID FETCH batch size (adapts to mailbox latency)
+        self.min_fetch_batch = 10
+        self.max_fetch_batch = 500
+        self.fetch_target_seconds = 5.0  # Grow batches while a fetch round-trip stays under this
+        self.parallel_workers = 4  # Parse/extract threads (never touch the IMAP connection)
         self.connection_timeout = 30
         self.idle_timeout = 300  # 5 minutes
 
@@ -327,9 +337,13 @@ class EmailIngestionClient(BaseDataClient):
         """
         Fetch and process emails in batches with incremental sync
 
+        Messages are downloaded with one `UID FETCH <set> (RFC822)` per batch on the calling
+        thread, while the previous batch is parsed on the worker pool. The batch size grows
+        while round-trips stay fast and shrinks when the server slows down.
+
         Args:
             folder: Email folder to fetch from
-            batch_size: Number of emails per batch
+            batch_size: Initial number of emails per UID FETCH (default: self.batch_size)
             since_uid: Start from this UID (for incremental sync)
 
         Returns:
@@ -349,7 +363,7 @@ class EmailIngestionClient(BaseDataClient):
                 logger.error(f"Failed to select folder {folder}")
                 return []
 
-            # Get message UIDs
+            # Get message UIDs (UIDs, not sequence numbers, so state stays valid across sessions)
             if since_uid:
                 # Incremental sync from last UID
                 search_criteria = f'UID {int(since_uid)+1}:*'
@@ -357,43 +371,45 @@ class EmailIngestionClient(BaseDataClient):
             else:
                 # Get recent messages (last 7 days by default)
                 since_date = (datetime.now() - timedelta(days=7)).strftime("%d-%b-%Y")
-                result, data = self.imap.search(None, 'SINCE', since_date)
+                result, data = self.imap.uid('search', None, 'SINCE', since_date)
 
             if result != 'OK':
                 logger.error("Email search failed")
                 return []
 
-            message_ids = data[0].split() if data[0] else []
-            if not message_ids:
+            uids = [uid.decode() if isinstance(uid, bytes) else str(uid)
+                    for uid in (data[0].split() if data and data[0] else [])]
+            if since_uid:
+                # 'N:*' always matches the newest message, even when it is older than N
+                uids = [uid for uid in uids if int(uid) > int(since_uid)]
+            if not uids:
                 logger.info("No new emails found")
                 return []
 
-            # Process in batches
-            for i in range(0, len(message_ids), batch_size):
-                batch_ids = message_ids[i:i+batch_size]
-
-                # Parallel processing of batch
-                with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-                    futures = []
-                    for msg_id in batch_ids:
-                        future = executor.submit(self._process_single_email, msg_id, folder)
-                        futures.append(future)
-
-                    # Collect results
-                    for future in as_completed(futures):
-                        try:
-                            email_result = future.result(timeout=30)
-                            if email_result:
-                                processed_emails.append(email_result)
-                                self.stats['emails_processed'] += 1
-                        except Exception as e:
-                            logger.error(f"Failed to process email: {e}")
+            with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
+                pending = None  # (batch_uids, futures) being parsed while the next batch downloads
+                position = 0
+                while position < len(uids):
+                    batch_uids = uids[position:position + batch_size]
+                    position += len(batch_uids)
+
+                    start_time = time.time()
+                    raw_emails = self._fetch_raw_emails(batch_uids)
+                    batch_size = self._adapt_batch_size(batch_size, time.time() - start_time)
+
+                    futures = [(uid, executor.submit(self._process_raw_email, uid, raw_emails[uid], folder))
+                               for uid in batch_uids if uid in raw_emails]
+                    for uid in batch_uids:
+                        if uid not in raw_emails:
                             self.stats['emails_failed'] += 1
+                            self.state.add_failed({'msg_id': uid, 'folder': folder, 'error': 'Not returned by UID FETCH'})
 
-                # Update state after each batch
-                if batch_ids:
-                    last_uid = batch_ids[-1].decode() if isinstance(batch_ids[-1], bytes) else str(batch_ids[-1])
-                    self.state.update_uid(folder, last_uid)
+                    if pending:
+                        processed_emails.extend(self._collect_batch(folder, *pending))
+                    pending = (batch_uids, futures)
+
+                if pending:
+                    processed_emails.extend(self._collect_batch(folder, *pending))
 
             logger.info(f"Processed {len(processed_emails)} emails from {folder}")
             return processed_emails
@@ -402,25 +418,81 @@ class EmailIngestionClient(BaseDataClient):
             logger.error(f"Batch fetch failed: {e}")
             return processed_emails
 
+    def _fetch_raw_emails(self, uids: List[str]) -> Dict[str, bytes]:
+        """
+        Download several messages with a single UID FETCH
+
+        Returns:
+            {uid: raw RFC822 bytes} for every message the server returned
+        """
+        result, data = self.imap.uid('fetch', ','.join(uids), '(RFC822)')
+        if result != 'OK':
+            raise Exception(f"UID FETCH failed: {data}")
+
+        raw_emails = parse_uid_fetch_response(data)
+        self.last_activity = datetime.now()
+        return raw_emails
+
+    def _adapt_batch_size(self, batch_size: int, elapsed: float) -> int:
+        """Double the batch while fetches are fast, halve it when they exceed the latency target"""
+        return adapt_batch_size(batch_size, elapsed, self.fetch_target_seconds,
+                                self.min_fetch_batch, self.max_fetch_batch)
+
+    def _collect_batch(self, folder: str, batch_uids: List[str], futures: List[Tuple[str, Any]]) -> List[ProcessedEmail]:
+        """Wait for a batch's parse jobs, flag the messages seen and checkpoint the folder UID"""
+        processed = []
+        seen_uids = []
+        for uid, future in futures:
+            try:
+                email_result = future.result(timeout=30)
+                if email_result:
+                    processed.append(email_result)
+                    seen_uids.append(uid)
+                    self.stats['emails_processed'] += 1
+            except Exception as e:
+                logger.error(f"Failed to process email {uid}: {e}")
+                self.stats['emails_failed'] += 1
+
+        # Mark as read (optional) - one STORE for the whole batch, on the IMAP-owning thread
+        if seen_uids:
+            try:
+                self.imap.uid('store', ','.join(seen_uids), '+FLAGS', '(\\Seen)')
+            except Exception as e:
+                logger.warning(f"Failed to flag {len(seen_uids)} emails as seen: {e}")
+
+        # Update state after each batch
+        self.state.update_uid(folder, max(batch_uids, key=int))
+        return processed
+
     def _process_single_email(self, msg_id: Union[str, bytes], folder: str) -> Optional[ProcessedEmail]:
-        """Process a single email with comprehensive extraction"""
+        """Fetch and process a single email by UID (used for retries)"""
+        if isinstance(msg_id, bytes):
+            msg_id = msg_id.decode()
+
         try:
-            start_time = time.time()
+            raw_email = self._fetch_raw_emails([msg_id]).get(msg_id)
+        except Exception as e:
+            logger.error(f"Failed to fetch email {msg_id}: {e}")
+            self.state.add_failed({'msg_id': str(msg_id), 'folder': folder, 'error': str(e)})
+            return None
+        if raw_email is None:
+            return None
 
-            # Fetch email data
-            if isinstance(msg_id, bytes):
-                msg_id = msg_id.decode()
+        processed = self._process_raw_email(msg_id, raw_email, folder)
+        if processed:
+            self.imap.uid('store', msg_id, '+FLAGS', '(\\Seen)')
+        return processed
 
-            result, msg_data = self.imap.fetch(msg_id, '(RFC822 FLAGS)')
-            if result != 'OK' or not msg_data:
-                return None
+    def _process_raw_email(self, uid: str, raw_email: bytes, folder: str) -> Optional[ProcessedEmail]:
+        """Parse and extract a downloaded email (thread-safe: no IMAP access)"""
+        try:
+            start_time = time.time()
 
             # Parse email
-            raw_email = msg_data[0][1] if isinstance(msg_data[0], tuple) else msg_data[0]
             email_message = email.message_from_bytes(raw_email)
 
             # Extract metadata
-            metadata = self._extract_metadata(email_message, msg_id, folder)
+            metadata = self._extract_metadata(email_message, uid, folder)
 
             # Check deduplication
             if self.state.is_processed(metadata.message_id):
@@ -449,14 +521,11 @@ class EmailIngestionClient(BaseDataClient):
             # Mark as processed
             self.state.mark_processed(metadata.message_id)
 
-            # Mark as read (optional)
-            self.imap.store(msg_id, '+FLAGS', '\\Seen')
-
             return processed
 
         except Exception as e:
-            logger.error(f"Failed to process email {msg_id}: {e}")
-            self.state.add_failed({'msg_id': str(msg_id), 'folder': folder, 'error': str(e)})
+            logger.error(f"Failed to process email {uid}: {e}")
+            self.state.add_failed({'msg_id': str(uid), 'folder': folder, 'error': str(e)})
             return None
 
     def _extract_metadata(self, email_message: email.message.Message, uid: str, folder: str) -> EmailMetadata:
@@ -3,13 +3,14 @@
 Financial News API Connectors for ICE Investment Context Engine
 Provides direct access to multiple financial news sources including Finnhub, Marketaux, and Yahoo RSS
 Handles rate limiting, data parsing, and unified response format
-Relevant files: free_api_connectors.py, sec_edgar_connector.py
+Requests run on the shared pooled async HTTP client, so get_aggregated_news() sources overlap
+Relevant files: free_api_connectors.py, sec_edgar_connector.py, async_http.py
 """
 
 import asyncio
 import logging
 import time
-import requests
+import aiohttp
 import feedparser
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
@@ -25,6 +26,11 @@ import json
 import re
 from urllib.parse import urlencode
 
+try:
+    from .async_http import AsyncTokenBucket, get_async_http_client
+except ImportError:
+    from async_http import AsyncTokenBucket, get_async_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,18 +73,12 @@ class FinnhubNewsConnector:
         
         # Rate limiting: 60 requests/minute on free tier
         self.rate_limit = 1.0  # 1 second between requests to be safe
-        self.last_request_time = 0
+        self.rate_limiter = AsyncTokenBucket(rate=1 / self.rate_limit, capacity=1)
+        self.http_client = get_async_http_client('finnhub')
     
     async def _rate_limit_delay(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit:
-            delay = self.rate_limit - time_since_last
-            await asyncio.sleep(delay)
-        
-        self.last_request_time = time.time()
+        """Ensure we don't exceed rate limits (concurrent calls are spaced, not serialized)"""
+        await self.rate_limiter.acquire()
     
     async def get_company_news(self, symbol: str, days_back: int = 7) -> NewsResponse:
         """Get company-specific news with improved error handling and retry logic"""
@@ -114,22 +114,18 @@ class FinnhubNewsConnector:
                 
                 url = f"{self.base_url}/company-news"
                 
-                # Enhanced request with better session handling and headers
                 headers = {
                     'User-Agent': 'ICE-Investment-Engine/1.0',
-                    'Accept': 'application/json',
-                    'Connection': 'close'  # Force connection close to avoid keep-alive issues
+                    'Accept': 'application/json'
                 }
                 
-                # Use a fresh session for each request to avoid connection pooling issues
-                with requests.Session() as session:
-                    session.headers.update(headers)
-                    response = session.get(
-                        url, 
-                        params=params, 
-                        timeout=20,  # Increased timeout
-                        verify=True  # Explicitly verify SSL
-                    )
+                # Pooled keep-alive session (stale connections surface as ClientConnectionError and are retried)
+                response = await self.http_client.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=20  # Increased timeout
+                )
                 
                 processing_time = time.time() - start_time
                 
@@ -179,7 +175,7 @@ class FinnhubNewsConnector:
                         processing_time=processing_time
                     )
                     
-            except (requests.exceptions.ConnectionError, ConnectionResetError) as e:
+            except (aiohttp.ClientConnectionError, ConnectionResetError) as e:
                 # Handle connection-specific errors with retries
                 if attempt < max_retries - 1:
                     logger.warning(f"Finnhub connection error for {symbol} (attempt {attempt + 1}): {e}. Retrying...")
@@ -198,7 +194,7 @@ class FinnhubNewsConnector:
                         processing_time=processing_time
                     )
                     
-            except requests.exceptions.Timeout as e:
+            except asyncio.TimeoutError as e:
                 if attempt < max_retries - 1:
                     logger.warning(f"Finnhub timeout for {symbol} (attempt {attempt + 1}): {e}. Retrying...")
                     await asyncio.sleep(retry_delay)
@@ -254,21 +250,17 @@ class FinnhubNewsConnector:
                 
                 url = f"{self.base_url}/news"
                 
-                # Enhanced request with better session handling
                 headers = {
                     'User-Agent': 'ICE-Investment-Engine/1.0',
-                    'Accept': 'application/json',
-                    'Connection': 'close'
+                    'Accept': 'application/json'
                 }
                 
-                with requests.Session() as session:
-                    session.headers.update(headers)
-                    response = session.get(
-                        url, 
-                        params=params, 
-                        timeout=20,
-                        verify=True
-                    )
+                response = await self.http_client.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=20
+                )
                 
                 processing_time = time.time() - start_time
                 
@@ -311,7 +303,7 @@ class FinnhubNewsConnector:
                         processing_time=processing_time
                     )
                     
-            except (requests.exceptions.ConnectionError, ConnectionResetError) as e:
+            except (aiohttp.ClientConnectionError, ConnectionResetError) as e:
                 if attempt < max_retries - 1:
                     logger.warning(f"Finnhub market news connection error (attempt {attempt + 1}): {e}. Retrying...")
                     await asyncio.sleep(retry_delay)
@@ -327,7 +319,7 @@ class FinnhubNewsConnector:
                         processing_time=processing_time
                     )
                     
-            except requests.exceptions.Timeout as e:
+            except asyncio.TimeoutError as e:
                 if attempt < max_retries - 1:
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 1.5
@@ -364,18 +356,12 @@ class MarketauxNewsConnector:
         
         # Rate limiting for free tier (be conservative)
         self.rate_limit = 2.0  # 2 seconds between requests
-        self.last_request_time = 0
+        self.rate_limiter = AsyncTokenBucket(rate=1 / self.rate_limit, capacity=1)
+        self.http_client = get_async_http_client('marketaux')
     
     async def _rate_limit_delay(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit:
-            delay = self.rate_limit - time_since_last
-            await asyncio.sleep(delay)
-        
-        self.last_request_time = time.time()
+        """Ensure we don't exceed rate limits (concurrent calls are spaced, not serialized)"""
+        await self.rate_limiter.acquire()
     
     async def get_company_news(self, symbol: str, limit: int = 10) -> NewsResponse:
         """Get company-specific news"""
@@ -395,7 +381,7 @@ class MarketauxNewsConnector:
                 params['api_token'] = self.api_token
             
             url = f"{self.base_url}/news/all"
-            response = requests.get(url, params=params, timeout=15)
+            response = await self.http_client.get(url, params=params, timeout=15)
             
             processing_time = time.time() - start_time
             
@@ -478,7 +464,7 @@ class MarketauxNewsConnector:
                 params['api_token'] = self.api_token
             
             url = f"{self.base_url}/news/all"
-            response = requests.get(url, params=params, timeout=15)
+            response = await self.http_client.get(url, params=params, timeout=15)
             
             processing_time = time.time() - start_time
             
@@ -535,18 +521,12 @@ class YahooRSSNewsConnector:
         
         # Rate limiting to be respectful
         self.rate_limit = 1.0  # 1 second between requests
-        self.last_request_time = 0
+        self.rate_limiter = AsyncTokenBucket(rate=1 / self.rate_limit, capacity=1)
+        self.http_client = get_async_http_client('yahoo_rss')
     
     async def _rate_limit_delay(self):
-        """Ensure we don't exceed rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit:
-            delay = self.rate_limit - time_since_last
-            await asyncio.sleep(delay)
-        
-        self.last_request_time = time.time()
+        """Ensure we don't exceed rate limits (concurrent calls are spaced, not serialized)"""
+        await self.rate_limiter.acquire()
     
     async def get_company_news(self, symbol: str, limit: int = 10) -> NewsResponse:
         """Get company-specific news from Yahoo RSS"""
@@ -558,8 +538,9 @@ class YahooRSSNewsConnector:
             # Yahoo RSS URL for specific symbol
             url = f"{self.base_url}/headline?s={symbol}&region=US&lang=en-US"
             
-            # Parse RSS feed
-            feed = feedparser.parse(url)
+            # Fetch on the pooled session, then parse the RSS feed
+            response = await self.http_client.get(url, headers={'User-Agent': 'ICE-Investment-Engine/1.0'}, timeout=15)
+            feed = feedparser.parse(response.content)
             
             processing_time = time.time() - start_time
             
@@ -631,8 +612,9 @@ class YahooRSSNewsConnector:
             # Yahoo RSS URL for general market news
             url = f"{self.base_url}/topstories?region=US&lang=en-US"
             
-            # Parse RSS feed
-            feed = feedparser.parse(url)
+            # Fetch on the pooled session, then parse the RSS feed
+            response = await self.http_client.get(url, headers={'User-Agent': 'ICE-Investment-Engine/1.0'}, timeout=15)
+            feed = feedparser.parse(response.content)
             
             processing_time = time.time() - start_time
             
@@ -742,19 +724,18 @@ async def get_aggregated_news(symbol: str, limit_per_source: int = 5) -> Dict[st
         tasks.append(("NewsAPI.org", newsapi_connector.get_company_news(symbol, limit_per_source)))
     
     # Execute all requests concurrently
-    for name, task in tasks:
-        try:
-            result = await task
-            results[name] = result
-        except Exception as e:
-            logger.error(f"Error fetching news from {name}: {e}")
-            results[name] = NewsResponse(
+    responses = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+    for (name, _), result in zip(tasks, responses):
+        if isinstance(result, Exception):
+            logger.error(f"Error fetching news from {name}: {result}")
+            result = NewsResponse(
                 success=False,
                 articles=[],
                 source_name=name,
                 symbol=symbol,
-                error=str(e)
+                error=str(result)
             )
+        results[name] = result
     
     return results
 
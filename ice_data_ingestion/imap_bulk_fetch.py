@@ -0,0 +1,56 @@
+# ice_data_ingestion/imap_bulk_fetch.py
+"""
+Bulk IMAP UID FETCH Helpers
+Response parsing and latency-adaptive batch sizing for EmailIngestionClient.fetch_emails_batch,
+kept free of the client's dependencies so they can be imported and tested on their own
+Relevant files: email_ingestion_unified.py, tests/test_email_bulk_fetch.py
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+_UID_PATTERN = re.compile(rb'UID (\d+)')
+
+
+def parse_uid_fetch_response(data: Optional[List[Any]]) -> Dict[str, bytes]:
+    """
+    Map each message in a `UID FETCH <set> (RFC822)` response to its UID
+
+    Message parts arrive as (b'<seq> (UID <uid> RFC822 {<size>}', raw_bytes); the b')'
+    separators between them, and parts without a UID, are skipped.
+
+    Args:
+        data: Response data from imaplib's uid('fetch', ...)
+
+    Returns:
+        {uid: raw RFC822 bytes} for every message the server returned
+    """
+    raw_emails = {}
+    for item in data or []:
+        if isinstance(item, tuple) and len(item) >= 2:
+            match = _UID_PATTERN.search(item[0])
+            if match:
+                raw_emails[match.group(1).decode()] = item[1]
+    return raw_emails
+
+
+def adapt_batch_size(batch_size: int, elapsed: float, target_seconds: float,
+                     min_batch: int, max_batch: int) -> int:
+    """
+    Double the batch while fetches are fast, halve it when they exceed the latency target
+
+    Args:
+        batch_size: Size of the batch just fetched
+        elapsed: Seconds the UID FETCH round-trip took
+        target_seconds: Latency target for one fetch
+        min_batch: Lower bound for the next batch
+        max_batch: Upper bound for the next batch
+
+    Returns:
+        Size of the next batch
+    """
+    if elapsed > target_seconds:
+        return max(min_batch, batch_size // 2)
+    if elapsed < target_seconds / 2:
+        return min(max_batch, batch_size * 2)
+    return batch_size
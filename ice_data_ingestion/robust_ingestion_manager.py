@@ -17,15 +17,20 @@ This module provides a production-ready data ingestion system with:
 """
 
 import asyncio
+import atexit
 import hashlib
 import json
 import logging
-from collections import defaultdict
+import math
+import os
+import threading
+import weakref
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import time
 from functools import wraps
 import re
@@ -231,37 +236,231 @@ class DataValidator:
         )
 
 
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over hex content hashes
+
+    Bit positions come from the SHA256 digest itself (double hashing), so membership
+    checks cost no extra hashing. Sized for `capacity` items at `error_rate` false positives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, data_hash: str):
+        h1 = int(data_hash[:16], 16)
+        h2 = int(data_hash[16:32], 16) | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, data_hash: str):
+        for pos in self._positions(data_hash):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, data_hash: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(data_hash))
+
+    def save(self, path: Path):
+        """Write the bit array (atomic replace)"""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, capacity: int, error_rate: float, count: int) -> 'BloomFilter':
+        bloom = cls(capacity, error_rate)
+        bits = path.read_bytes()
+        if len(bits) != len(bloom.bits):
+            raise ValueError(f"{path.name} does not match capacity {capacity}")
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+# Deduplicators whose pending changes are flushed at exit (weak, as in smart_cache)
+_open_deduplicators: "weakref.WeakSet[DataDeduplicator]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_deduplicators():
+    for deduplicator in list(_open_deduplicators):
+        deduplicator.flush()
+
+
 class DataDeduplicator:
-    """Handles data deduplication using content hashing"""
+    """
+    Handles data deduplication using content hashing
+
+    Exact store: hash -> last-seen time, kept in recency order (a repeat moves to the end),
+    bounded by max_entries and a time window; the oldest entries are evicted first.
+
+    Optional Bloom layer (bloom_capacity > 0): remembers hashes evicted from the exact store
+    by the size cap for the rest of the window, in ~1.8 bytes per item at 0.1% error, so
+    millions of items stay deduplicated in bounded memory. It answers "maybe seen" with
+    bounded false positives, so it is off by default. Two generations rotate every window.
+
+    Persistence is batched: new/refreshed entries are appended to a journal every
+    save_every changes, and the journal is compacted into a snapshot once it outgrows
+    the exact store.
+    """
 
-    def __init__(self, cache_dir: str = "storage/cache/dedup_cache"):
+    def __init__(
+        self,
+        cache_dir: str = "storage/cache/dedup_cache",
+        max_entries: Optional[int] = None,
+        window_hours: Optional[float] = None,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = 0.001,
+        save_every: int = 100
+    ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.seen_hashes = self._load_cache()
+        self.snapshot_file = self.cache_dir / "seen_hashes.json"
+        self.journal_file = self.cache_dir / "seen_hashes.journal.jsonl"
+        self.bloom_meta_file = self.cache_dir / "seen_hashes.bloom.json"
+
+        self.max_entries = max_entries or int(os.getenv('DEDUP_MAX_ENTRIES', '10000'))
+        self.window_seconds = (window_hours or float(os.getenv('DEDUP_WINDOW_HOURS', '168'))) * 3600
+        self.save_every = save_every
+
+        if bloom_capacity is None:
+            bloom_capacity = int(os.getenv('DEDUP_BLOOM_CAPACITY', '0'))
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._blooms: List[Tuple[float, BloomFilter]] = []  # (generation start, filter), newest first
+
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, float]] = []
+        self._journal_lines = 0
         self.duplicates_found = 0
+        self.seen_hashes: "OrderedDict[str, float]" = self._load_cache()
+        _open_deduplicators.add(self)
 
-    def _load_cache(self) -> Set[str]:
-        """Load previously seen hashes"""
-        cache_file = self.cache_dir / "seen_hashes.json"
-        if cache_file.exists():
+    def _load_cache(self) -> "OrderedDict[str, float]":
+        """Load previously seen hashes (snapshot, then journal replay)"""
+        seen: "OrderedDict[str, float]" = OrderedDict()
+        if self.snapshot_file.exists():
             try:
-                with open(cache_file, 'r') as f:
-                    return set(json.load(f))
-            except:
-                return set()
-        return set()
+                with open(self.snapshot_file, 'r') as f:
+                    entries = json.load(f)
+                now = time.time()
+                for entry in entries:
+                    # Legacy snapshots are a bare list of hashes (order unknown)
+                    data_hash, seen_at = (entry, now) if isinstance(entry, str) else entry
+                    seen[data_hash] = seen_at
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable dedup snapshot: {e}")
+
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'r') as f:
+                    for line in f:
+                        try:
+                            data_hash, seen_at = json.loads(line)
+                        except ValueError:
+                            break  # Torn final line from an interrupted append
+                        seen[data_hash] = seen_at
+                        seen.move_to_end(data_hash)
+                        self._journal_lines += 1
+            except OSError as e:
+                logger.warning(f"Ignoring unreadable dedup journal: {e}")
+
+        self.seen_hashes = seen
+        if self.bloom_capacity:
+            self._load_blooms()
+        self._evict(time.time())
+        return self.seen_hashes
+
+    def _load_blooms(self):
+        if not self.bloom_meta_file.exists():
+            return
+        try:
+            with open(self.bloom_meta_file, 'r') as f:
+                generations = json.load(f)
+            self._blooms = [
+                (gen['start'], BloomFilter.load(self.cache_dir / gen['file'], self.bloom_capacity,
+                                                self.bloom_error_rate, gen['count']))
+                for gen in generations
+            ]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable dedup Bloom filter: {e}")
+            self._blooms = []
+
+    def _save_blooms(self):
+        generations = []
+        for i, (start, bloom) in enumerate(self._blooms):
+            filename = f"seen_hashes.bloom{i}"
+            bloom.save(self.cache_dir / filename)
+            generations.append({'start': start, 'file': filename, 'count': bloom.count})
+        tmp_file = self.bloom_meta_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(generations, f)
+        os.replace(tmp_file, self.bloom_meta_file)
+
+    def _bloom_contains(self, data_hash: str) -> bool:
+        return any(data_hash in bloom for _, bloom in self._blooms)
+
+    def _bloom_add(self, data_hash: str, now: float):
+        if not self._blooms or now - self._blooms[0][0] >= self.window_seconds:
+            # New generation; the previous one still covers the last window
+            self._blooms = [(now, BloomFilter(self.bloom_capacity, self.bloom_error_rate))] + self._blooms[:1]
+        self._blooms[0][1].add(data_hash)
+
+    def _evict(self, now: float):
+        """Drop entries outside the window, then the least recently seen beyond max_entries"""
+        cutoff = now - self.window_seconds
+        seen = self.seen_hashes
+        while seen:
+            data_hash, seen_at = next(iter(seen.items()))
+            if seen_at >= cutoff and len(seen) <= self.max_entries:
+                break
+            seen.popitem(last=False)
+            if self.bloom_capacity and seen_at >= cutoff:
+                self._bloom_add(data_hash, seen_at)
 
     def _save_cache(self):
-        """Persist seen hashes"""
-        cache_file = self.cache_dir / "seen_hashes.json"
+        """Persist pending changes (journal append, or snapshot compaction)"""
+        pending, self._pending = self._pending, []
         try:
-            # Keep only recent hashes (last 10000)
-            recent_hashes = list(self.seen_hashes)[-10000:]
-            with open(cache_file, 'w') as f:
-                json.dump(recent_hashes, f)
+            if self._journal_lines + len(pending) > self.max_entries:
+                tmp_file = self.snapshot_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'w') as f:
+                    json.dump([[h, t] for h, t in self.seen_hashes.items()], f)
+                os.replace(tmp_file, self.snapshot_file)
+                if self._blooms:
+                    # Saved with the snapshot they complement (journal replay re-evicts into them)
+                    self._save_blooms()
+                open(self.journal_file, 'w').close()
+                self._journal_lines = 0
+            elif pending:
+                with open(self.journal_file, 'a') as f:
+                    f.writelines(json.dumps([h, t]) + '\n' for h, t in pending)
+                self._journal_lines += len(pending)
         except Exception as e:
             logger.error(f"Failed to save dedup cache: {e}")
 
+    def flush(self):
+        """Persist any pending changes now (including the Bloom layer)"""
+        with self._lock:
+            if self._pending:
+                self._save_cache()
+            if self._blooms:
+                try:
+                    self._save_blooms()
+                except OSError as e:
+                    logger.error(f"Failed to save dedup Bloom filter: {e}")
+
+    def close(self):
+        """Persist pending changes; the deduplicator no longer flushes at exit"""
+        self.flush()
+        _open_deduplicators.discard(self)
+
     def compute_hash(self, data: Dict) -> str:
         """Compute content hash for deduplication"""
         # Create canonical representation
@@ -269,20 +468,39 @@ class DataDeduplicator:
         return hashlib.sha256(canonical.encode()).hexdigest()
 
     def is_duplicate(self, data: Dict) -> bool:
-        """Check if data is duplicate"""
+        """Check if data was seen within the window (marks it as seen either way)"""
         data_hash = self.compute_hash(data)
+        now = time.time()
 
-        if data_hash in self.seen_hashes:
-            self.duplicates_found += 1
-            return True
+        with self._lock:
+            seen_at = self.seen_hashes.get(data_hash)
+            duplicate = seen_at is not None and now - seen_at <= self.window_seconds
+            if not duplicate and seen_at is None and self._blooms:
+                duplicate = self._bloom_contains(data_hash)
+
+            # Record (or refresh) as most recently seen
+            self.seen_hashes[data_hash] = now
+            self.seen_hashes.move_to_end(data_hash)
+            self._pending.append((data_hash, now))
+            self._evict(now)
 
-        self.seen_hashes.add(data_hash)
+            # Periodically save cache
+            if len(self._pending) >= self.save_every:
+                self._save_cache()
 
-        # Periodically save cache
-        if len(self.seen_hashes) % 100 == 0:
-            self._save_cache()
+        if duplicate:
+            self.duplicates_found += 1
+        return duplicate
 
-        return False
+    def get_stats(self) -> Dict[str, Any]:
+        """Store size and configuration"""
+        return {
+            'tracked_hashes': len(self.seen_hashes),
+            'max_entries': self.max_entries,
+            'window_hours': self.window_seconds / 3600,
+            'bloom_items': sum(bloom.count for _, bloom in self._blooms),
+            'duplicates_found': self.duplicates_found
+        }
 
 
 class CircuitBreaker:
@@ -620,6 +838,10 @@ class RobustIngestionManager:
 
         return metrics
 
+    def close(self):
+        """Persist deduplication state held in memory"""
+        self.deduplicator.close()
+
     def get_health_status(self) -> Dict[str, Any]:
         """Get overall health status of ingestion system"""
 
@@ -3,20 +3,29 @@
 SEC EDGAR API Connector for ICE Investment Context Engine
 Provides direct access to SEC EDGAR filing data via official SEC APIs
 Handles ticker-to-CIK lookup and filing retrieval with proper rate limiting
-Relevant files: free_api_connectors.py, mcp_client_manager.py
+Requests run on the shared pooled async HTTP client, so concurrent calls overlap up to SEC's 10 req/s
+Relevant files: free_api_connectors.py, mcp_client_manager.py, async_http.py
 """
 
 import asyncio
 import logging
-import time
+import weakref
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
-import requests
 from dataclasses import dataclass
 import json
 
+try:
+    from .async_http import AsyncTokenBucket, get_async_http_client
+except ImportError:
+    from async_http import AsyncTokenBucket, get_async_http_client
+
 logger = logging.getLogger(__name__)
 
+# SEC fair-access policy is 10 requests/second per client IP - shared by every connector instance
+SEC_REQUESTS_PER_SECOND = 10
+SEC_RATE_LIMITER = AsyncTokenBucket(rate=SEC_REQUESTS_PER_SECOND, capacity=1)
+
 
 @dataclass
 class SECFiling:
@@ -64,13 +73,14 @@ class SECEdgarConnector:
         self.base_url = "https://data.sec.gov"
         self.tickers_url = "https://www.sec.gov/files/company_tickers.json"
         
-        # Rate limiting: SEC allows 10 requests/second
-        self.rate_limit = 0.1  # 100ms between requests
-        self.last_request_time = 0
+        # Rate limiting: SEC allows 10 requests/second (token bucket shared across instances)
+        self.rate_limiter = SEC_RATE_LIMITER
+        self.http_client = get_async_http_client('sec_edgar')
         
         # Cache for ticker-to-CIK mapping
         self._ticker_cache = {}
         self._cache_loaded = False
+        self._cache_locks = weakref.WeakKeyDictionary()  # event loop -> asyncio.Lock
     
     def _get_headers(self) -> Dict[str, str]:
         """Get proper headers for SEC API requests"""
@@ -79,30 +89,31 @@ class SECEdgarConnector:
             'Accept-Encoding': 'gzip, deflate',
         }
     
-    async def _rate_limit_delay(self) -> None:
-        """Ensure we don't exceed SEC rate limits"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.rate_limit:
-            delay = self.rate_limit - time_since_last
-            await asyncio.sleep(delay)
-        
-        self.last_request_time = time.time()
+    async def _get(self, url: str, timeout: float):
+        """Rate-limited GET on the pooled keep-alive session"""
+        return await self.http_client.get(
+            url,
+            headers=self._get_headers(),
+            timeout=timeout,
+            rate_limiter=self.rate_limiter
+        )
     
     async def _load_ticker_cache(self) -> bool:
-        """Load ticker-to-CIK mapping from SEC"""
+        """Load ticker-to-CIK mapping from SEC (once, even when many tickers look up concurrently)"""
         if self._cache_loaded:
             return True
-            
+        
+        loop = asyncio.get_running_loop()
+        lock = self._cache_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            if self._cache_loaded:
+                return True
+            return await self._fetch_ticker_cache()
+    
+    async def _fetch_ticker_cache(self) -> bool:
+        """Download company_tickers.json and build the ticker-to-CIK mapping"""
         try:
-            await self._rate_limit_delay()
-            
-            response = requests.get(
-                self.tickers_url,
-                headers=self._get_headers(),
-                timeout=30
-            )
+            response = await self._get(self.tickers_url, timeout=30)
             
             if response.status_code == 200:
                 tickers_data = response.json()
@@ -146,14 +157,8 @@ class SECEdgarConnector:
             return None
         
         try:
-            await self._rate_limit_delay()
-            
             url = f"{self.base_url}/submissions/CIK{cik}.json"
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                timeout=15
-            )
+            response = await self._get(url, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -192,14 +197,8 @@ class SECEdgarConnector:
             return []
         
         try:
-            await self._rate_limit_delay()
-            
             url = f"{self.base_url}/submissions/CIK{cik}.json"
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                timeout=15
-            )
+            response = await self._get(url, timeout=15)
             
             if response.status_code == 200:
                 data = response.json()
@@ -258,6 +257,20 @@ class SECEdgarConnector:
                 filtered_filings.append(filing)
         
         return filtered_filings
+    
+    async def get_recent_filings_batch(self, tickers: List[str], limit: int = 10) -> Dict[str, List[SECFiling]]:
+        """
+        Get recent filings for many tickers concurrently
+        
+        Requests overlap on the pooled session, so total time is bounded by the
+        SEC rate limit (10 req/s) rather than serial round-trips.
+        
+        Returns:
+            {ticker: [SECFiling, ...]} in input order (empty list on failure)
+        """
+        tickers = list(dict.fromkeys(tickers))
+        results = await asyncio.gather(*(self.get_recent_filings(t, limit) for t in tickers))
+        return dict(zip(tickers, results))
 
 
 # Global instance for easy access
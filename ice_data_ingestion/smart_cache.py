@@ -11,7 +11,8 @@ rate-limited responses return wrong ticker data. The smart cache includes:
 
 1. Validation-aware caching that prevents corrupted data storage
 2. Adaptive TTL based on quota usage and data quality
-3. Multi-tier caching with in-memory and persistent layers
+3. Multi-tier caching with in-memory and persistent layers (single indexed SQLite
+   file with zlib-compressed payloads, TTL expiry column and batched writes)
 4. Circuit breaker pattern for API health monitoring
 5. Cache warming and proactive quota management
 6. Cross-source validation for data integrity
@@ -26,12 +27,16 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
 import json
+import zlib
+import atexit
+import sqlite3
 import hashlib
 import logging
 import time
 from collections import OrderedDict
 from functools import wraps
 import threading
+import weakref
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -138,6 +143,17 @@ class AlphaVantageValidator(CacheValidator):
 
         return True, confidence
 
+# Open caches whose buffered writes are flushed at exit. Weak references, so a cache
+# that goes out of scope can still be garbage collected before the process ends.
+_open_caches: "weakref.WeakSet[SmartCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches():
+    for cache in list(_open_caches):
+        cache.flush()
+
+
 class SmartCache:
     """
     Intelligent caching system with validation and adaptive strategies
@@ -148,14 +164,22 @@ class SmartCache:
     - Adaptive TTL based on quota and quality
     - Circuit breaker for API health
     - Cache warming and preloading
+
+    The disk tier is one SQLite file (cache_dir/smart_cache.sqlite) holding compressed
+    payloads with an indexed expires_at column, so expiry sweeps are a single DELETE.
+    Writes are buffered and committed write_batch_size at a time; get() sees buffered
+    entries, and flush() (also run at exit) commits the rest.
     """
 
+    DB_FILENAME = "smart_cache.sqlite"
+
     def __init__(
         self,
         cache_dir: str = "storage/cache/smart_cache",
         memory_size: int = 100,
         default_ttl_hours: int = 6,
-        validator: Optional[CacheValidator] = None
+        validator: Optional[CacheValidator] = None,
+        write_batch_size: int = 32
     ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -164,6 +188,10 @@ class SmartCache:
         self.memory_cache: OrderedDict[str, Tuple[Dict, CacheMetadata]] = OrderedDict()
         self.memory_size = memory_size
 
+        # Disk tier: pending rows are committed in one transaction per batch
+        self.write_batch_size = max(1, write_batch_size)
+        self._pending_writes: Dict[str, tuple] = {}
+
         # Configuration
         self.default_ttl = timedelta(hours=default_ttl_hours)
         self.validator = validator or AlphaVantageValidator()
@@ -184,9 +212,133 @@ class SmartCache:
             "corrupted_prevented": 0
         }
 
-        # Thread safety
+        # Thread safety (also guards the shared SQLite connection)
         self.lock = threading.RLock()
 
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self._conn = self._open_db()
+        self._migrate_json_files()
+        _open_caches.add(self)
+
+    # Column order for rows in the smart_cache table
+    _COLUMNS = ("cache_key", "payload", "created_at", "ttl_seconds", "expires_at", "validation_status",
+                "requested_symbol", "response_symbol", "confidence_score", "source_provider",
+                "quota_usage_at_cache", "validation_failures")
+
+    def _open_db(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS smart_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    ttl_seconds INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    validation_status TEXT NOT NULL,
+                    requested_symbol TEXT,
+                    response_symbol TEXT,
+                    confidence_score REAL DEFAULT 1.0,
+                    source_provider TEXT,
+                    quota_usage_at_cache REAL DEFAULT 0.0,
+                    validation_failures INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_smart_cache_expires ON smart_cache(expires_at)")
+        return conn
+
+    @staticmethod
+    def _encode_payload(data: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _decode_payload(payload: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(payload))
+
+    def _make_row(self, cache_key: str, data: Dict[str, Any], metadata: CacheMetadata) -> tuple:
+        created_at = metadata.timestamp.timestamp()
+        return (cache_key, self._encode_payload(data), created_at, metadata.ttl_seconds,
+                created_at + metadata.ttl_seconds, metadata.validation_status.value,
+                metadata.requested_symbol, metadata.response_symbol, metadata.confidence_score,
+                metadata.source_provider, metadata.quota_usage_at_cache, metadata.validation_failures)
+
+    @staticmethod
+    def _metadata_from_row(row: tuple) -> CacheMetadata:
+        """Rebuild metadata from a smart_cache row (column order as _COLUMNS)"""
+        return CacheMetadata(
+            timestamp=datetime.fromtimestamp(row[2]),
+            ttl_seconds=row[3],
+            validation_status=CacheValidationStatus(row[5]),
+            requested_symbol=row[6],
+            response_symbol=row[7],
+            confidence_score=row[8] if row[8] is not None else 1.0,
+            source_provider=row[9],
+            quota_usage_at_cache=row[10] or 0.0,
+            validation_failures=row[11] or 0
+        )
+
+    def flush(self) -> int:
+        """Commit buffered disk writes in one transaction; returns rows written"""
+        with self.lock:
+            if not self._pending_writes:
+                return 0
+            rows = list(self._pending_writes.values())
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO smart_cache ({', '.join(self._COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                        rows
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write cache batch ({len(rows)} entries): {e}")
+                return 0
+            self._pending_writes.clear()
+            return len(rows)
+
+    def close(self):
+        """Flush pending writes and close the database"""
+        with self.lock:
+            self.flush()
+            self._conn.close()
+        _open_caches.discard(self)
+
+    def _migrate_json_files(self):
+        """One-time import of entries from the old one-JSON-file-per-key layout"""
+        legacy_files = list(self.cache_dir.glob("*.json"))
+        if not legacy_files:
+            return
+
+        imported = 0
+        for cache_file in legacy_files:
+            try:
+                with open(cache_file, 'r') as f:
+                    cache_entry = json.load(f)
+                meta = cache_entry["metadata"]
+                metadata = CacheMetadata(
+                    timestamp=datetime.fromisoformat(meta["timestamp"]),
+                    ttl_seconds=meta["ttl_seconds"],
+                    validation_status=CacheValidationStatus(meta["validation_status"]),
+                    requested_symbol=meta.get("requested_symbol"),
+                    response_symbol=meta.get("response_symbol"),
+                    confidence_score=meta.get("confidence_score", 1.0),
+                    source_provider=meta.get("source_provider"),
+                    quota_usage_at_cache=meta.get("quota_usage_at_cache", 0.0),
+                    validation_failures=meta.get("validation_failures", 0)
+                )
+                if metadata.is_valid():
+                    self._pending_writes[cache_file.stem] = self._make_row(cache_file.stem, cache_entry["data"], metadata)
+                    imported += 1
+            except Exception as e:
+                logger.warning(f"Skipping unreadable legacy cache file {cache_file.name}: {e}")
+
+        if self.flush() == imported:
+            for cache_file in legacy_files:
+                cache_file.unlink(missing_ok=True)
+            logger.info(f"Migrated {imported} legacy JSON cache entries into {self.db_path.name}")
+
     def _get_cache_key(self, provider: str, endpoint: str, params: Dict[str, Any]) -> str:
         """Generate deterministic cache key"""
         # Include symbol explicitly in key for better clarity
@@ -292,26 +444,18 @@ class SmartCache:
                     # Remove expired entry
                     del self.memory_cache[cache_key]
 
-            # Check disk cache
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache_entry = json.load(f)
-
-                    # Reconstruct metadata
-                    metadata = CacheMetadata(
-                        timestamp=datetime.fromisoformat(cache_entry["metadata"]["timestamp"]),
-                        ttl_seconds=cache_entry["metadata"]["ttl_seconds"],
-                        validation_status=CacheValidationStatus(cache_entry["metadata"]["validation_status"]),
-                        requested_symbol=cache_entry["metadata"].get("requested_symbol"),
-                        response_symbol=cache_entry["metadata"].get("response_symbol"),
-                        confidence_score=cache_entry["metadata"].get("confidence_score", 1.0),
-                        validation_failures=cache_entry["metadata"].get("validation_failures", 0)
-                    )
+            # Check disk cache (buffered writes first, then the database)
+            row = self._pending_writes.get(cache_key)
+            try:
+                if row is None:
+                    row = self._conn.execute(
+                        f"SELECT {', '.join(self._COLUMNS)} FROM smart_cache WHERE cache_key = ?", (cache_key,)
+                    ).fetchone()
 
+                if row is not None:
+                    metadata = self._metadata_from_row(row)
                     if metadata.is_valid():
-                        data = cache_entry["data"]
+                        data = self._decode_payload(row[1])
                         # Promote to memory cache
                         self._evict_memory_cache()
                         self.memory_cache[cache_key] = (data, metadata)
@@ -320,15 +464,23 @@ class SmartCache:
                         return data
                     else:
                         # Remove expired/invalid cache
-                        cache_file.unlink()
+                        self._delete_disk_entry(cache_key)
 
-                except Exception as e:
-                    logger.warning(f"Failed to read cache {cache_file}: {e}")
-                    cache_file.unlink()
+            except Exception as e:
+                logger.warning(f"Failed to read cache entry {cache_key}: {e}")
+                self._delete_disk_entry(cache_key)
 
             self.stats["misses"] += 1
             return None
 
+    def _delete_disk_entry(self, cache_key: str):
+        self._pending_writes.pop(cache_key, None)
+        try:
+            with self._conn:
+                self._conn.execute("DELETE FROM smart_cache WHERE cache_key = ?", (cache_key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to delete cache entry {cache_key}: {e}")
+
     def set(
         self,
         provider: str,
@@ -378,32 +530,18 @@ class SmartCache:
             self._evict_memory_cache()
             self.memory_cache[cache_key] = (data, metadata)
 
-            # Store on disk
-            cache_file = self.cache_dir / f"{cache_key}.json"
-            cache_entry = {
-                "data": data,
-                "metadata": {
-                    "timestamp": metadata.timestamp.isoformat(),
-                    "ttl_seconds": metadata.ttl_seconds,
-                    "validation_status": metadata.validation_status.value,
-                    "requested_symbol": metadata.requested_symbol,
-                    "response_symbol": metadata.response_symbol,
-                    "confidence_score": metadata.confidence_score,
-                    "source_provider": metadata.source_provider,
-                    "quota_usage_at_cache": metadata.quota_usage_at_cache,
-                    "validation_failures": metadata.validation_failures
-                }
-            }
-
+            # Store on disk (buffered; committed in batches)
             try:
-                with open(cache_file, 'w') as f:
-                    json.dump(cache_entry, f, indent=2)
-                logger.debug(f"Cached {provider}:{endpoint} ({requested_symbol}) with TTL={metadata.ttl_seconds}s")
-                return True
-            except Exception as e:
+                self._pending_writes[cache_key] = self._make_row(cache_key, data, metadata)
+            except (TypeError, ValueError) as e:
                 logger.error(f"Failed to write cache: {e}")
                 return False
 
+            if len(self._pending_writes) >= self.write_batch_size:
+                self.flush()
+            logger.debug(f"Cached {provider}:{endpoint} ({requested_symbol}) with TTL={metadata.ttl_seconds}s")
+            return True
+
     def should_use_cache(self) -> bool:
         """
         Determine if cache should be used based on circuit state
@@ -454,12 +592,15 @@ class SmartCache:
             except Exception as e:
                 logger.warning(f"Failed to warm cache for {symbol}: {e}")
 
+        self.flush()
         if warmed > 0:
             logger.info(f"Warmed cache with {warmed} symbols")
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get cache statistics and health metrics"""
         with self.lock:
+            self.flush()
+            disk_cache_size = self._conn.execute("SELECT COUNT(*) FROM smart_cache").fetchone()[0]
             total_requests = self.stats["hits"] + self.stats["misses"]
             hit_rate = self.stats["hits"] / total_requests if total_requests > 0 else 0
 
@@ -471,6 +612,7 @@ class SmartCache:
                 "validations_failed": self.stats["validations_failed"],
                 "corrupted_prevented": self.stats["corrupted_prevented"],
                 "memory_cache_size": len(self.memory_cache),
+                "disk_cache_size": disk_cache_size,
                 "circuit_state": self.circuit_state.value,
                 "circuit_failures": self.circuit_failures
             }
@@ -487,26 +629,13 @@ class SmartCache:
             for key in keys_to_remove:
                 del self.memory_cache[key]
 
-            # Clear disk cache
-            removed = 0
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file, 'r') as f:
-                        cache_entry = json.load(f)
-
-                    metadata = CacheMetadata(
-                        timestamp=datetime.fromisoformat(cache_entry["metadata"]["timestamp"]),
-                        ttl_seconds=cache_entry["metadata"]["ttl_seconds"],
-                        validation_status=CacheValidationStatus(cache_entry["metadata"]["validation_status"])
-                    )
-
-                    if not metadata.is_valid():
-                        cache_file.unlink()
-                        removed += 1
-
-                except Exception:
-                    cache_file.unlink()
-                    removed += 1
+            # Clear disk cache (indexed expiry scan)
+            self.flush()
+            with self._conn:
+                removed = self._conn.execute(
+                    "DELETE FROM smart_cache WHERE expires_at < ? OR validation_status != ?",
+                    (time.time(), CacheValidationStatus.VALID.value)
+                ).rowcount
 
             logger.info(f"Cleared {len(keys_to_remove)} memory and {removed} disk cache entries")
 
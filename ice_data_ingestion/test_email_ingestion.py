@@ -416,15 +416,23 @@ class TestEmailIngestionClient(unittest.TestCase):
         self.assertLess(score_low, 0.6)
 
     @patch.object(EmailIngestionClient, 'ensure_connection')
-    @patch.object(EmailIngestionClient, '_process_single_email')
+    @patch.object(EmailIngestionClient, '_process_raw_email')
     def test_batch_processing(self, mock_process, mock_ensure):
         """Test batch email processing"""
         mock_ensure.return_value = True
 
-        # Mock IMAP responses
+        # Mock IMAP responses: UID SEARCH, then one UID FETCH per batch
+        def imap_uid(command, *args):
+            if command == 'search':
+                return ('OK', [b'1 2 3 4 5'])
+            if command == 'fetch':
+                return ('OK', [(f'{i} (UID {uid} RFC822 {{3}}'.encode(), b'raw')
+                               for i, uid in enumerate(args[0].split(','))])
+            return ('OK', [])
+
         self.client.imap = MagicMock()
         self.client.imap.select.return_value = ('OK', [])
-        self.client.imap.search.return_value = ('OK', [b'1 2 3 4 5'])
+        self.client.imap.uid.side_effect = imap_uid
 
         # Mock processing
         mock_process.return_value = ProcessedEmail(
@@ -437,9 +445,11 @@ class TestEmailIngestionClient(unittest.TestCase):
         # Process batch
         results = self.client.fetch_emails_batch(batch_size=2)
 
-        # Should process all 5 emails in batches
+        # Should process all 5 emails with fewer fetches than emails
+        fetches = [c for c in self.client.imap.uid.call_args_list if c.args[0] == 'fetch']
         self.assertEqual(mock_process.call_count, 5)
         self.assertEqual(len(results), 5)
+        self.assertLess(len(fetches), 5)
 
     def test_retry_failed_emails(self):
         """Test retry mechanism for failed emails"""
@@ -4,6 +4,7 @@
 # RELEVANT FILES: attachment_processor.py, graph_builder.py, ice_integrator.py
 
 import re
+import bisect
 import logging
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime, timedelta
@@ -56,6 +57,116 @@ FINANCIAL_ACRONYMS = {
     'US', 'UK', 'CN', 'JP', 'HK', 'SG', 'AU', 'EU', 'APAC', 'EMEA', 'LATAM'
 }
 
+class AliasAutomaton:
+    """Aho-Corasick automaton over lowercase company aliases
+
+    Finds every alias occurrence (including overlapping ones such as 'apple'
+    inside 'apple inc') in a single pass over the text, so matching cost is
+    linear in text length instead of aliases x text. Patterns can be added
+    incrementally; failure links are rebuilt lazily on the next search.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._terminal: List[Optional[str]] = [None]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._values: Dict[str, str] = {}
+        self._blob = ""
+        self._blob_starts: List[int] = []
+        self._blob_patterns: List[str] = []
+        self._dirty = False
+        if patterns:
+            self.add_patterns(patterns)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add_patterns(self, patterns: Dict[str, str]) -> int:
+        """Add alias -> value mappings, returning the number of new patterns"""
+        added = 0
+        for pattern, value in patterns.items():
+            pattern = pattern.lower()
+            if not pattern:
+                continue
+            if pattern not in self._values:
+                node = 0
+                for ch in pattern:
+                    nxt = self._goto[node].get(ch)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto[node][ch] = nxt
+                        self._goto.append({})
+                        self._terminal.append(None)
+                    node = nxt
+                self._terminal[node] = pattern
+                added += 1
+                self._dirty = True
+            self._values[pattern] = value
+        return added
+
+    def _build(self):
+        """Compute failure links and merged outputs breadth-first"""
+        node_count = len(self._goto)
+        self._fail = [0] * node_count
+        self._output = [[] for _ in range(node_count)]
+
+        queue = []
+        for child in self._goto[0].values():
+            queue.append(child)
+        for node in queue:
+            if self._terminal[node]:
+                self._output[node].append(self._terminal[node])
+            self._output[node].extend(self._output[self._fail[node]])
+            for ch, child in self._goto[node].items():
+                state = self._fail[node]
+                while state and ch not in self._goto[state]:
+                    state = self._fail[state]
+                self._fail[child] = self._goto[state].get(ch, 0)
+                queue.append(child)
+
+        # Newline-joined alias blob for reverse (fragment-in-alias) lookups
+        self._blob_patterns = list(self._values)
+        self._blob_starts = []
+        offset = 0
+        for pattern in self._blob_patterns:
+            self._blob_starts.append(offset)
+            offset += len(pattern) + 1
+        self._blob = "\n".join(self._blob_patterns)
+        self._dirty = False
+
+    def search(self, text_lower: str) -> List[Tuple[int, int, str, str]]:
+        """Return (start, end, alias, value) for every alias hit in lowercased text"""
+        if self._dirty or len(self._fail) != len(self._goto):
+            self._build()
+
+        goto, fail, output, values = self._goto, self._fail, self._output, self._values
+        hits = []
+        node = 0
+        for i, ch in enumerate(text_lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                for alias in output[node]:
+                    hits.append((i + 1 - len(alias), i + 1, alias, values[alias]))
+        return hits
+
+    def lookup_fragment(self, fragment_lower: str) -> Optional[str]:
+        """Value of the first alias found in the fragment, or that contains the fragment"""
+        hits = self.search(fragment_lower)
+        if hits:
+            return hits[0][3]
+
+        if not fragment_lower or "\n" in fragment_lower:
+            return None
+        idx = self._blob.find(fragment_lower)
+        if idx == -1:
+            return None
+        pattern = self._blob_patterns[bisect.bisect_right(self._blob_starts, idx) - 1]
+        return self._values[pattern]
+
+
 class EntityExtractor:
     def __init__(self, config_path: str = "./config"):
         self.logger = logging.getLogger(__name__)
@@ -74,6 +185,7 @@ class EntityExtractor:
         # Load configuration data
         self.tickers = self._load_ticker_list()
         self.companies = self._load_company_aliases()
+        self.alias_automaton = AliasAutomaton(self.companies)
         self.financial_metrics = self._load_financial_patterns()
         self.sender_profiles = self._load_sender_profiles()
         
@@ -293,25 +405,46 @@ class EntityExtractor:
             r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         )
     
-    def extract_entities(self, text: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Extract all entities from text with confidence scores"""
+    def _parse(self, text: str):
+        """Run the spaCy pipeline once for a document (None if NLP unavailable)"""
+        if not self.nlp:
+            return None
+        try:
+            return self.nlp(text)
+        except Exception as e:
+            self.logger.warning(f"spaCy parsing failed: {e}")
+            return None
+    
+    def extract_entities(self, text: str, metadata: Dict[str, Any] = None, doc=None) -> Dict[str, Any]:
+        """Extract all entities from text with confidence scores
+        
+        The spaCy parse is computed once and shared by all sub-extractors.
+        Callers that already hold a parsed doc (e.g. from nlp.pipe) can pass it in.
+        """
         if not text or not text.strip():
             return self._empty_result()
         
         text = text.strip()
         metadata = metadata or {}
         
+        if doc is None:
+            doc = self._parse(text)
+        
+        # Lowercase once per document; every extractor carries match spans so
+        # context windows are sliced directly instead of re-searched
+        text_lower = text.lower()
+        
         # Extract different entity types
         entities = {
             'tickers': self._extract_tickers(text),
-            'companies': self._extract_companies(text),
-            'people': self._extract_people(text),
+            'companies': self._extract_companies(text, doc, text_lower),
+            'people': self._extract_people(text, doc),
             'financial_metrics': self._extract_financial_metrics(text),
-            'dates': self._extract_dates(text),
+            'dates': self._extract_dates(text, doc),
             'prices': self._extract_prices(text),
             'ratings': self._extract_ratings(text),
-            'topics': self._extract_topics(text),
-            'sentiment': self._analyze_sentiment(text)
+            'topics': self._extract_topics(text, text_lower),
+            'sentiment': self._analyze_sentiment(text, text_lower)
         }
         
         # Add context from metadata
@@ -323,17 +456,62 @@ class EntityExtractor:
         
         return entities
     
+    def extract_entities_many(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None,
+                              n_process: int = 1, batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Extract entities from many texts, batching the spaCy parse via nlp.pipe
+        
+        Args:
+            texts: Documents to process
+            metadatas: Optional per-document metadata (same length as texts)
+            n_process: Worker processes for nlp.pipe (1 = in-process)
+            batch_size: Documents per nlp.pipe batch
+        
+        Returns:
+            One extraction result per input text, in input order
+        """
+        metadatas = metadatas or [None] * len(texts)
+        if len(metadatas) != len(texts):
+            raise ValueError("metadatas must have the same length as texts")
+        
+        # Empty documents short-circuit in extract_entities, so only parse the rest
+        stripped = [text.strip() if text else "" for text in texts]
+        parse_indices = [i for i, text in enumerate(stripped) if text]
+        docs = [None] * len(texts)
+        
+        if self.nlp and parse_indices:
+            try:
+                parsed = self.nlp.pipe(
+                    (stripped[i] for i in parse_indices),
+                    n_process=n_process,
+                    batch_size=batch_size
+                )
+                for i, doc in zip(parse_indices, parsed):
+                    docs[i] = doc
+            except Exception as e:
+                self.logger.warning(f"spaCy batch parsing failed, falling back to per-document parsing: {e}")
+                docs = [None] * len(texts)
+        
+        return [
+            self.extract_entities(text, metadata, doc=doc)
+            for text, metadata, doc in zip(texts, metadatas, docs)
+        ]
+    
     def _extract_tickers(self, text: str) -> List[Dict[str, Any]]:
         """Extract stock tickers with confidence scores"""
         tickers = []
-        matches = self.ticker_pattern.findall(text)
+        seen_tickers = set()
 
-        for match in matches:
+        for m in self.ticker_pattern.finditer(text):
+            match = m.group(1)
             # Skip financial acronyms and common words (comprehensive filter)
             # This prevents false positives like EPS, EBIT, RMB, etc.
             if match.upper() in FINANCIAL_ACRONYMS:
                 continue
 
+            # Keep only the first occurrence of each ticker
+            if match.upper() in seen_tickers:
+                continue
+
             # Check if it's a known ticker
             if match.upper() in self.tickers:
                 confidence = 0.95
@@ -341,9 +519,12 @@ class EntityExtractor:
                     'ticker': match.upper(),
                     'confidence': confidence,
                     'source': 'known_ticker',
-                    'context': self._get_surrounding_context(text, match)
+                    'start': m.start(1),
+                    'end': m.end(1),
+                    'context': self._get_surrounding_context(text, m.start(1), m.end(1))
                 }
                 tickers.append(ticker_info)
+                seen_tickers.add(ticker_info['ticker'])
             elif len(match) <= 4 and match.isupper():
                 # Possible ticker but not in known list
                 # Only include if not in financial acronyms (already filtered above)
@@ -352,51 +533,46 @@ class EntityExtractor:
                     'ticker': match.upper(),
                     'confidence': confidence,
                     'source': 'pattern_match',
-                    'context': self._get_surrounding_context(text, match)
+                    'start': m.start(1),
+                    'end': m.end(1),
+                    'context': self._get_surrounding_context(text, m.start(1), m.end(1))
                 }
                 tickers.append(ticker_info)
+                seen_tickers.add(ticker_info['ticker'])
         
-        # Remove duplicates
-        seen_tickers = set()
-        unique_tickers = []
-        for ticker in tickers:
-            if ticker['ticker'] not in seen_tickers:
-                unique_tickers.append(ticker)
-                seen_tickers.add(ticker['ticker'])
-        
-        return unique_tickers
+        return tickers
     
-    def _extract_companies(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_companies(self, text: str, doc=None, text_lower: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract company names and map to tickers"""
         companies = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Check company aliases
-        for company_name, ticker in self.companies.items():
-            if company_name in text_lower:
-                confidence = 0.85
-                company_info = {
-                    'company': company_name.title(),
-                    'ticker': ticker,
-                    'confidence': confidence,
-                    'source': 'alias_match',
-                    'context': self._get_surrounding_context(text, company_name)
-                }
-                companies.append(company_info)
+        # Check company aliases in a single automaton pass (first hit per alias)
+        seen_aliases = set()
+        for start, end, company_name, ticker in self.alias_automaton.search(text_lower):
+            if company_name in seen_aliases:
+                continue
+            seen_aliases.add(company_name)
+            confidence = 0.85
+            company_info = {
+                'company': company_name.title(),
+                'ticker': ticker,
+                'confidence': confidence,
+                'source': 'alias_match',
+                'start': start,
+                'end': end,
+                'context': self._get_surrounding_context(text, start, end)
+            }
+            companies.append(company_info)
         
-        # Use spaCy for additional entity extraction if available
-        if self.nlp:
+        # Use the shared spaCy parse for additional entity extraction if available
+        if doc is not None:
             try:
-                doc = self.nlp(text)
                 for ent in doc.ents:
                     if ent.label_ in ['ORG', 'PERSON'] and len(ent.text) > 3:
                         # Try to map organization names to tickers
-                        org_lower = ent.text.lower()
-                        mapped_ticker = None
-                        for alias, ticker in self.companies.items():
-                            if alias in org_lower or org_lower in alias:
-                                mapped_ticker = ticker
-                                break
+                        mapped_ticker = self.alias_automaton.lookup_fragment(ent.text.lower())
                         
                         confidence = 0.7 if ent.label_ == 'ORG' else 0.5
                         company_info = {
@@ -404,7 +580,9 @@ class EntityExtractor:
                             'ticker': mapped_ticker,
                             'confidence': confidence,
                             'source': 'nlp_extraction',
-                            'entity_type': ent.label_
+                            'entity_type': ent.label_,
+                            'start': ent.start_char,
+                            'end': ent.end_char
                         }
                         companies.append(company_info)
             except Exception as e:
@@ -412,20 +590,21 @@ class EntityExtractor:
         
         return companies
     
-    def _extract_people(self, text: str) -> List[Dict[str, Any]]:
-        """Extract person names"""
+    def _extract_people(self, text: str, doc=None) -> List[Dict[str, Any]]:
+        """Extract person names from the shared spaCy parse"""
         people = []
         
-        if self.nlp:
+        if doc is not None:
             try:
-                doc = self.nlp(text)
                 for ent in doc.ents:
                     if ent.label_ == 'PERSON' and len(ent.text.split()) >= 2:
                         person_info = {
                             'name': ent.text,
                             'confidence': 0.8,
                             'source': 'nlp_extraction',
-                            'context': self._get_surrounding_context(text, ent.text)
+                            'start': ent.start_char,
+                            'end': ent.end_char,
+                            'context': self._get_surrounding_context(text, ent.start_char, ent.end_char)
                         }
                         people.append(person_info)
             except Exception as e:
@@ -448,7 +627,9 @@ class EntityExtractor:
                         'full_match': match.group(0),
                         'confidence': 0.8,
                         'source': 'regex_pattern',
-                        'context': self._get_surrounding_context(text, match.group(0))
+                        'start': match.start(),
+                        'end': match.end(),
+                        'context': self._get_surrounding_context(text, match.start(), match.end())
                     }
                     category_matches.append(metric_info)
             
@@ -457,21 +638,22 @@ class EntityExtractor:
         
         return metrics
     
-    def _extract_dates(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_dates(self, text: str, doc=None) -> List[Dict[str, Any]]:
         """Extract date mentions"""
         dates = []
         
-        # Use spaCy for date extraction if available
-        if self.nlp:
+        # Use the shared spaCy parse for date extraction if available
+        if doc is not None:
             try:
-                doc = self.nlp(text)
                 for ent in doc.ents:
                     if ent.label_ == 'DATE':
                         date_info = {
                             'date': ent.text,
                             'confidence': 0.8,
                             'source': 'nlp_extraction',
-                            'context': self._get_surrounding_context(text, ent.text)
+                            'start': ent.start_char,
+                            'end': ent.end_char,
+                            'context': self._get_surrounding_context(text, ent.start_char, ent.end_char)
                         }
                         dates.append(date_info)
             except Exception as e:
@@ -485,7 +667,9 @@ class EntityExtractor:
                     'date': match.group(0),
                     'confidence': 0.7,
                     'source': 'regex_pattern',
-                    'context': self._get_surrounding_context(text, match.group(0))
+                    'start': match.start(),
+                    'end': match.end(),
+                    'context': self._get_surrounding_context(text, match.start(), match.end())
                 }
                 dates.append(date_info)
         
@@ -501,7 +685,9 @@ class EntityExtractor:
                 'price': match.group(0),
                 'confidence': 0.9,
                 'source': 'currency_pattern',
-                'context': self._get_surrounding_context(text, match.group(0))
+                'start': match.start(),
+                'end': match.end(),
+                'context': self._get_surrounding_context(text, match.start(), match.end())
             }
             prices.append(price_info)
         
@@ -519,16 +705,19 @@ class EntityExtractor:
                         'rating': match.group(0).lower(),
                         'confidence': 0.85,
                         'source': 'rating_pattern',
-                        'context': self._get_surrounding_context(text, match.group(0))
+                        'start': match.start(),
+                        'end': match.end(),
+                        'context': self._get_surrounding_context(text, match.start(), match.end())
                     }
                     ratings.append(rating_info)
         
         return ratings
     
-    def _extract_topics(self, text: str) -> List[str]:
+    def _extract_topics(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract investment topics and themes"""
         topics = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         topic_keywords = {
             'earnings': ['earnings', 'eps', 'quarterly results', 'guidance'],
@@ -549,9 +738,10 @@ class EntityExtractor:
         
         return topics
     
-    def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
+    def _analyze_sentiment(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Analyze investment sentiment"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
 
         bullish_terms = [
             'buy', 'bullish', 'positive', 'outperform', 'strong buy', 'upgrade',
@@ -635,15 +825,11 @@ class EntityExtractor:
         else:
             return 'general'
     
-    def _get_surrounding_context(self, text: str, match: str, window: int = 50) -> str:
-        """Get surrounding context for a match"""
+    def _get_surrounding_context(self, text: str, start: int, end: int, window: int = 50) -> str:
+        """Get surrounding context for a match span (sliced, no re-search of the text)"""
         try:
-            start_idx = text.lower().find(match.lower())
-            if start_idx == -1:
-                return ""
-            
-            context_start = max(0, start_idx - window)
-            context_end = min(len(text), start_idx + len(match) + window)
+            context_start = max(0, start - window)
+            context_end = min(len(text), end + window)
             
             return text[context_start:context_end].strip()
         except Exception:
@@ -694,8 +880,8 @@ class EntityExtractor:
             'confidence': 0.0
         }
     
-    def update_ticker_list(self, new_tickers: List[str]):
-        """Update the ticker list with new symbols"""
+    def update_ticker_list(self, new_tickers: List[str], company_aliases: Optional[Dict[str, str]] = None):
+        """Update the ticker list with new symbols (and optionally their company aliases)"""
         try:
             self.tickers.update(ticker.upper() for ticker in new_tickers)
             
@@ -706,6 +892,24 @@ class EntityExtractor:
             self.logger.info(f"Updated ticker list with {len(new_tickers)} new symbols")
         except Exception as e:
             self.logger.error(f"Failed to update ticker list: {e}")
+        
+        if company_aliases:
+            self.update_company_aliases(company_aliases)
+    
+    def update_company_aliases(self, new_aliases: Dict[str, str]):
+        """Add company name -> ticker aliases and extend the alias automaton incrementally"""
+        try:
+            normalized = {alias.lower(): ticker.upper() for alias, ticker in new_aliases.items() if alias}
+            self.companies.update(normalized)
+            added = self.alias_automaton.add_patterns(normalized)
+            
+            alias_file = self.config_path / "company_aliases.json"
+            with open(alias_file, 'w') as f:
+                json.dump(self.companies, f, indent=2)
+            
+            self.logger.info(f"Updated company aliases with {added} new names")
+        except Exception as e:
+            self.logger.error(f"Failed to update company aliases: {e}")
     
     def get_extraction_stats(self) -> Dict[str, Any]:
         """Get entity extraction statistics"""
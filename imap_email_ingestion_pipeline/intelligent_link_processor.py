@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import re
+import threading
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
@@ -34,6 +35,16 @@ except ImportError:
     DOCX_AVAILABLE = False
     logging.warning("DOCX processing not available")
 
+try:
+    # Shared long-lived loop + pooled session (keeps connections alive across emails)
+    from ice_data_ingestion.async_http import get_async_http_client
+    ASYNC_HTTP_AVAILABLE = True
+except ImportError:
+    ASYNC_HTTP_AVAILABLE = False
+
+# Cache index entries written between index flushes
+CACHE_INDEX_FLUSH_EVERY = 20
+
 @dataclass
 class ExtractedLink:
     """A link extracted from an email"""
@@ -118,8 +129,11 @@ class IntelligentLinkProcessor:
         # Configurable via environment variables for flexibility
         self.rate_limit_delay = float(os.getenv('URL_RATE_LIMIT_DELAY', '1.0'))  # Default 1 second between requests
         self.concurrent_downloads = int(os.getenv('URL_CONCURRENT_DOWNLOADS', '3'))  # Max 3 concurrent downloads
-        self.last_download_time = {}  # Track last download time per domain
-        self.download_semaphore = asyncio.Semaphore(self.concurrent_downloads)  # Limit concurrent downloads
+        self.connections_per_host = int(os.getenv('URL_CONNECTIONS_PER_HOST', '2'))  # Keep-alive connections per domain
+        self.max_reports_per_email = int(os.getenv('URL_MAX_REPORTS_PER_EMAIL', '10'))
+        self.next_download_slot = {}  # Earliest start time (monotonic) for the next request per domain
+        self._domain_slot_lock = threading.Lock()  # Slots are booked from the caller loop and the HTTP loop thread
+        self.download_semaphore = asyncio.Semaphore(self.concurrent_downloads)  # Global download slots (all emails)
         
         # URL classification patterns
         self.classification_patterns = {
@@ -183,8 +197,21 @@ class IntelligentLinkProcessor:
             }
         }
         
+        # Long-lived pooled session on the shared loop thread: every email's downloads go
+        # through one scheduler (download_semaphore) instead of a new session per email
+        self.http_client = None
+        if ASYNC_HTTP_AVAILABLE:
+            self.http_client = get_async_http_client(
+                'research_links',
+                pool_size=max(self.concurrent_downloads, self.connections_per_host),
+                pool_per_host=self.connections_per_host,
+                timeout=self.session_config['timeout'].total
+            )
+
         # Cache for downloaded content
         self.content_cache = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._load_cache_index()
 
         self.logger.info(f"Intelligent Link Processor initialized. Storage path: {self.storage_path}")
@@ -322,6 +349,10 @@ class IntelligentLinkProcessor:
                 failed_downloads=[{'error': str(e), 'stage': 'initialization'}],
                 processing_summary={'error': str(e), 'processing_time': processing_time}
             )
+
+        finally:
+            # One index write per email, not one per download
+            self.flush_cache_index()
     
     def _extract_all_urls(self, html_content: str) -> List[ExtractedLink]:
         """Extract ALL URLs from email HTML content properly"""
@@ -846,6 +877,7 @@ class IntelligentLinkProcessor:
         try:
             from crawl4ai import AsyncWebCrawler
 
+            await self._wait_for_domain_slot(url)
             self.logger.info(f"Fetching with Crawl4AI: {url[:60]}...")
 
             async with AsyncWebCrawler(
@@ -898,31 +930,29 @@ class IntelligentLinkProcessor:
         downloaded_reports = []
         failed_downloads = []
 
-        async with aiohttp.ClientSession(**self.session_config) as session:
-            # Process downloads with concurrency limit
-            semaphore = asyncio.Semaphore(5)  # Max 5 concurrent downloads
+        # All links start together; the shared scheduler (download_semaphore +
+        # per-domain slots) decides how many actually hit the network at once
+        download_tasks = [
+            self._download_single_report(link, email_uid)
+            for link in research_links[:self.max_reports_per_email]
+        ]
+
+        results = await asyncio.gather(*download_tasks, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                failed_downloads.append({
+                    'error': str(result),
+                    'stage': 'download_task'
+                })
+            elif result['success']:
+                downloaded_reports.append(result['report'])
+            else:
+                failed_downloads.append(result['error_info'])
 
-            download_tasks = [
-                self._download_single_report(session, semaphore, link, email_uid)
-                for link in research_links[:10]  # Limit to first 10 reports
-            ]
-            
-            results = await asyncio.gather(*download_tasks, return_exceptions=True)
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    failed_downloads.append({
-                        'error': str(result),
-                        'stage': 'download_task'
-                    })
-                elif result['success']:
-                    downloaded_reports.append(result['report'])
-                else:
-                    failed_downloads.append(result['error_info'])
-        
         return downloaded_reports, failed_downloads
     
-    async def _download_single_report(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, link: ClassifiedLink, email_uid: str) -> Dict[str, Any]:
+    async def _download_single_report(self, link: ClassifiedLink, email_uid: str) -> Dict[str, Any]:
         """
         Download a single research report using 6-tier classification system.
 
@@ -935,284 +965,302 @@ class IntelligentLinkProcessor:
 
         Saves directly to: storage_path/{email_uid}/{file_hash}/original/{filename}
         """
-        async with semaphore:
-            start_time = datetime.now()
+        start_time = datetime.now()
+        
+        try:
+            # Check cache first
+            url_hash = hashlib.sha256(link.url.encode()).hexdigest()
+            if self._is_cached(url_hash):
+                cached_result = self._get_cached_result(url_hash)
+                if cached_result:
+                    self._cache_hits += 1
+                    self.logger.debug(f"Cache HIT for {link.url[:50]}...")
+                    return {'success': True, 'report': cached_result}
+            self._cache_misses += 1
             
-            try:
-                # Check cache first
-                url_hash = hashlib.sha256(link.url.encode()).hexdigest()
-                if self._is_cached(url_hash):
-                    cached_result = self._get_cached_result(url_hash)
-                    if cached_result:
-                        self.logger.debug(f"Cache HIT for {link.url[:50]}...")
-                        return {'success': True, 'report': cached_result}
-                
-                # NEW: 6-Tier Classification System
-                tier, tier_name = self._classify_url_tier(link.url)
-                self.logger.info(f"URL classified as Tier {tier} ({tier_name}): {link.url[:60]}...")
-                
-                # Handle Tier 6: Skip
-                # FIX (2025-11-04): Return consistent error_info structure for transparency
-                # Bug: Previously returned {'success': False, 'skipped': True} without 'url' or 'error_info'
-                # Result: Skipped URLs missing from Cell 15 output (4 URLs extracted, only 1 shown)
-                # Fix: Wrap in error_info structure matching line 994 error handling
-                if tier == 6:
-                    self.logger.info(f"Skipping Tier 6 URL (social/tracking): {link.url[:60]}...")
-                    return {
-                        'success': False,
-                        'error_info': {  # ✅ Consistent with error handling (line 994)
-                            'url': link.url,  # ✅ Required by output formatter (data_ingestion.py:1359)
-                            'skipped': True,
-                            'tier': tier,
-                            'tier_name': tier_name,
-                            'reason': 'URL classified as social media or tracking (no research value)',
-                            'stage': 'classification'
-                        }
+            # NEW: 6-Tier Classification System
+            tier, tier_name = self._classify_url_tier(link.url)
+            self.logger.info(f"URL classified as Tier {tier} ({tier_name}): {link.url[:60]}...")
+            
+            # Handle Tier 6: Skip
+            # FIX (2025-11-04): Return consistent error_info structure for transparency
+            # Bug: Previously returned {'success': False, 'skipped': True} without 'url' or 'error_info'
+            # Result: Skipped URLs missing from Cell 15 output (4 URLs extracted, only 1 shown)
+            # Fix: Wrap in error_info structure matching line 994 error handling
+            if tier == 6:
+                self.logger.info(f"Skipping Tier 6 URL (social/tracking): {link.url[:60]}...")
+                return {
+                    'success': False,
+                    'error_info': {  # ✅ Consistent with error handling (line 994)
+                        'url': link.url,  # ✅ Required by output formatter (data_ingestion.py:1359)
+                        'skipped': True,
+                        'tier': tier,
+                        'tier_name': tier_name,
+                        'reason': 'URL classified as social media or tracking (no research value)',
+                        'stage': 'classification'
                     }
-                
-                # Route based on tier
-                content = None
-                content_type = None
-                
-                if tier in [1, 2]:
-                    # Tier 1 & 2: Simple HTTP (direct downloads, token auth)
-                    self.logger.debug(f"Using simple HTTP for Tier {tier}: {link.url[:60]}...")
-                    content, content_type = await self._download_with_retry(session, link.url)
-                
-                elif tier == 3:
-                    # Tier 3: Simple crawl (Crawl4AI + content filtering)
-                    if self.use_crawl4ai:
-                        self.logger.info(f"Using Crawl4AI for Tier 3 (simple crawl): {link.url[:60]}...")
-                        try:
-                            # Phase 1: Basic Crawl4AI (markdown only)
-                            # Phase 2 will add PruningContentFilter here
-                            content, content_type = await self._fetch_with_crawl4ai(link.url)
-                        except Exception as crawl4ai_error:
-                            # Graceful degradation: fallback to simple HTTP
-                            self.logger.warning(f"Crawl4AI failed for Tier 3, falling back to simple HTTP: {crawl4ai_error}")
-                            content, content_type = await self._download_with_retry(session, link.url)
-                    else:
-                        # Crawl4AI disabled - use simple HTTP
-                        content, content_type = await self._download_with_retry(session, link.url)
-                
-                elif tier == 4:
-                    # Tier 4: Research portals (Crawl4AI + session auth + CSS extraction)
-                    if self.use_crawl4ai:
-                        self.logger.info(f"Using Crawl4AI for Tier 4 (portal auth): {link.url[:60]}...")
-                        try:
-                            # Phase 1: Basic Crawl4AI (markdown only)
-                            # Phase 3 will add portal-specific strategies + CSS extraction here
-                            content, content_type = await self._fetch_with_crawl4ai(link.url)
-                        except Exception as crawl4ai_error:
-                            # Graceful degradation: fallback to simple HTTP (likely to fail but try anyway)
-                            self.logger.warning(f"Crawl4AI failed for Tier 4, falling back to simple HTTP: {crawl4ai_error}")
-                            content, content_type = await self._download_with_retry(session, link.url)
-                    else:
-                        # Crawl4AI disabled - portals likely won't work with simple HTTP
-                        self.logger.warning(f"Tier 4 portal requires Crawl4AI but it's disabled. Trying simple HTTP anyway: {link.url[:60]}...")
-                        content, content_type = await self._download_with_retry(session, link.url)
-                
-                elif tier == 5:
-                    # Tier 5: News paywalls (Crawl4AI + BM25 filtering)
-                    if self.use_crawl4ai:
-                        self.logger.info(f"Using Crawl4AI for Tier 5 (paywall): {link.url[:60]}...")
-                        try:
-                            # Phase 1: Basic Crawl4AI (markdown only)
-                            # Phase 2 will add BM25ContentFilter here
-                            content, content_type = await self._fetch_with_crawl4ai(link.url)
-                        except Exception as crawl4ai_error:
-                            # Graceful degradation: fallback to simple HTTP (paywalls likely block)
-                            self.logger.warning(f"Crawl4AI failed for Tier 5, falling back to simple HTTP: {crawl4ai_error}")
-                            content, content_type = await self._download_with_retry(session, link.url)
-                    else:
-                        # Crawl4AI disabled - paywalls likely won't work
-                        self.logger.warning(f"Tier 5 paywall requires Crawl4AI but it's disabled. Trying simple HTTP anyway: {link.url[:60]}...")
-                        content, content_type = await self._download_with_retry(session, link.url)
-                
+                }
+            
+            # Route based on tier
+            content = None
+            content_type = None
+            
+            if tier in [1, 2]:
+                # Tier 1 & 2: Simple HTTP (direct downloads, token auth)
+                self.logger.debug(f"Using simple HTTP for Tier {tier}: {link.url[:60]}...")
+                content, content_type = await self._download_with_retry(link.url)
+            
+            elif tier == 3:
+                # Tier 3: Simple crawl (Crawl4AI + content filtering)
+                if self.use_crawl4ai:
+                    self.logger.info(f"Using Crawl4AI for Tier 3 (simple crawl): {link.url[:60]}...")
+                    try:
+                        # Phase 1: Basic Crawl4AI (markdown only)
+                        # Phase 2 will add PruningContentFilter here
+                        content, content_type = await self._fetch_with_crawl4ai(link.url)
+                    except Exception as crawl4ai_error:
+                        # Graceful degradation: fallback to simple HTTP
+                        self.logger.warning(f"Crawl4AI failed for Tier 3, falling back to simple HTTP: {crawl4ai_error}")
+                        content, content_type = await self._download_with_retry(link.url)
                 else:
-                    # Unknown tier (should not happen) - default to simple HTTP
-                    self.logger.warning(f"Unknown tier {tier}, defaulting to simple HTTP: {link.url[:60]}...")
-                    content, content_type = await self._download_with_retry(session, link.url)
-                
-                # Save to structured storage (matches AttachmentProcessor pattern)
-                # Pattern: storage_path/{email_uid}/{file_hash}/original/{filename}
-                file_hash = self._compute_file_hash(content)
-                file_extension = self._get_file_extension(content_type, link.url)
-                local_filename = f"{url_hash[:12]}_{int(time.time())}.{file_extension}"
-
-                # Create directory structure
-                storage_dir = self.storage_path / email_uid / file_hash
-                original_dir = storage_dir / 'original'
-                original_dir.mkdir(parents=True, exist_ok=True)
-
-                # Save to final location
-                local_path = original_dir / local_filename
-
-                async with aiofiles.open(local_path, 'wb') as f:
-                    await f.write(content)
-
-                # CRITICAL: Verify file was actually written to disk
-                if not local_path.exists():
-                    raise IOError(f"File write claimed success but file not found: {local_path}")
-
-                actual_size = local_path.stat().st_size
-                if actual_size != len(content):
-                    self.logger.warning(f"⚠️  Size mismatch: expected {len(content)} bytes, got {actual_size} bytes")
-
-                # Log detailed storage information for debugging
-                self.logger.info(f"📁 STORAGE VERIFIED: {local_path}")
-                self.logger.info(f"   Size on disk: {actual_size:,} bytes (expected: {len(content):,})")
-                self.logger.info(f"   Email UID: {email_uid}")
-                self.logger.info(f"   File hash: {file_hash}")
-                self.logger.info(f"   Storage dir: {storage_dir}")
-
-                # Extract text content
-                text_content = await self._extract_text_from_content(content, content_type, str(local_path))
-
-                # Save extracted text (consistency with AttachmentProcessor)
-                if text_content:
-                    extracted_path = storage_dir / 'extracted.txt'
-                    async with aiofiles.open(extracted_path, 'w', encoding='utf-8') as f:
-                        await f.write(text_content)
-
-                # Create metadata.json for traceability
-                try:
-                    metadata = {
-                        "source_type": "url_pdf",
-                        "source_context": {
-                            "email_uid": email_uid,
-                            "original_url": link.url,
-                            "url_classification": {
-                                "tier": tier,
-                                "tier_name": tier_name
-                            },
-                            "link_context": link.context,
-                            "classification_confidence": link.confidence,
-                            "download_method": "crawl4ai" if tier in [3, 4, 5] and self.use_crawl4ai else "simple_http"
-                        },
-                        "file_info": {
-                            "original_filename": local_filename,
-                            "file_hash": file_hash,
-                            "file_size": len(content),
-                            "mime_type": content_type
-                        },
-                        "processing": {
-                            "timestamp": datetime.now().isoformat(),
-                            "extraction_method": "docling" if self.use_docling_urls and self.docling_processor else "pdfplumber",
-                            "status": "completed",
-                            "text_chars": len(text_content)
+                    # Crawl4AI disabled - use simple HTTP
+                    content, content_type = await self._download_with_retry(link.url)
+            
+            elif tier == 4:
+                # Tier 4: Research portals (Crawl4AI + session auth + CSS extraction)
+                if self.use_crawl4ai:
+                    self.logger.info(f"Using Crawl4AI for Tier 4 (portal auth): {link.url[:60]}...")
+                    try:
+                        # Phase 1: Basic Crawl4AI (markdown only)
+                        # Phase 3 will add portal-specific strategies + CSS extraction here
+                        content, content_type = await self._fetch_with_crawl4ai(link.url)
+                    except Exception as crawl4ai_error:
+                        # Graceful degradation: fallback to simple HTTP (likely to fail but try anyway)
+                        self.logger.warning(f"Crawl4AI failed for Tier 4, falling back to simple HTTP: {crawl4ai_error}")
+                        content, content_type = await self._download_with_retry(link.url)
+                else:
+                    # Crawl4AI disabled - portals likely won't work with simple HTTP
+                    self.logger.warning(f"Tier 4 portal requires Crawl4AI but it's disabled. Trying simple HTTP anyway: {link.url[:60]}...")
+                    content, content_type = await self._download_with_retry(link.url)
+            
+            elif tier == 5:
+                # Tier 5: News paywalls (Crawl4AI + BM25 filtering)
+                if self.use_crawl4ai:
+                    self.logger.info(f"Using Crawl4AI for Tier 5 (paywall): {link.url[:60]}...")
+                    try:
+                        # Phase 1: Basic Crawl4AI (markdown only)
+                        # Phase 2 will add BM25ContentFilter here
+                        content, content_type = await self._fetch_with_crawl4ai(link.url)
+                    except Exception as crawl4ai_error:
+                        # Graceful degradation: fallback to simple HTTP (paywalls likely block)
+                        self.logger.warning(f"Crawl4AI failed for Tier 5, falling back to simple HTTP: {crawl4ai_error}")
+                        content, content_type = await self._download_with_retry(link.url)
+                else:
+                    # Crawl4AI disabled - paywalls likely won't work
+                    self.logger.warning(f"Tier 5 paywall requires Crawl4AI but it's disabled. Trying simple HTTP anyway: {link.url[:60]}...")
+                    content, content_type = await self._download_with_retry(link.url)
+            
+            else:
+                # Unknown tier (should not happen) - default to simple HTTP
+                self.logger.warning(f"Unknown tier {tier}, defaulting to simple HTTP: {link.url[:60]}...")
+                content, content_type = await self._download_with_retry(link.url)
+            
+            # Save to structured storage (matches AttachmentProcessor pattern)
+            # Pattern: storage_path/{email_uid}/{file_hash}/original/{filename}
+            file_hash = self._compute_file_hash(content)
+            file_extension = self._get_file_extension(content_type, link.url)
+            local_filename = f"{url_hash[:12]}_{int(time.time())}.{file_extension}"
+
+            # Create directory structure
+            storage_dir = self.storage_path / email_uid / file_hash
+            original_dir = storage_dir / 'original'
+            original_dir.mkdir(parents=True, exist_ok=True)
+
+            # Save to final location
+            local_path = original_dir / local_filename
+
+            async with aiofiles.open(local_path, 'wb') as f:
+                await f.write(content)
+
+            # CRITICAL: Verify file was actually written to disk
+            if not local_path.exists():
+                raise IOError(f"File write claimed success but file not found: {local_path}")
+
+            actual_size = local_path.stat().st_size
+            if actual_size != len(content):
+                self.logger.warning(f"⚠️  Size mismatch: expected {len(content)} bytes, got {actual_size} bytes")
+
+            # Log detailed storage information for debugging
+            self.logger.info(f"📁 STORAGE VERIFIED: {local_path}")
+            self.logger.info(f"   Size on disk: {actual_size:,} bytes (expected: {len(content):,})")
+            self.logger.info(f"   Email UID: {email_uid}")
+            self.logger.info(f"   File hash: {file_hash}")
+            self.logger.info(f"   Storage dir: {storage_dir}")
+
+            # Extract text content
+            text_content = await self._extract_text_from_content(content, content_type, str(local_path))
+
+            # Save extracted text (consistency with AttachmentProcessor)
+            if text_content:
+                extracted_path = storage_dir / 'extracted.txt'
+                async with aiofiles.open(extracted_path, 'w', encoding='utf-8') as f:
+                    await f.write(text_content)
+
+            # Create metadata.json for traceability
+            try:
+                metadata = {
+                    "source_type": "url_pdf",
+                    "source_context": {
+                        "email_uid": email_uid,
+                        "original_url": link.url,
+                        "url_classification": {
+                            "tier": tier,
+                            "tier_name": tier_name
                         },
-                        "storage": {
-                            "original_path": f"original/{local_filename}",
-                            "extracted_text_path": "extracted.txt" if text_content else None,
-                            "created_at": datetime.now().isoformat()
-                        }
+                        "link_context": link.context,
+                        "classification_confidence": link.confidence,
+                        "download_method": "crawl4ai" if tier in [3, 4, 5] and self.use_crawl4ai else "simple_http"
+                    },
+                    "file_info": {
+                        "original_filename": local_filename,
+                        "file_hash": file_hash,
+                        "file_size": len(content),
+                        "mime_type": content_type
+                    },
+                    "processing": {
+                        "timestamp": datetime.now().isoformat(),
+                        "extraction_method": "docling" if self.use_docling_urls and self.docling_processor else "pdfplumber",
+                        "status": "completed",
+                        "text_chars": len(text_content)
+                    },
+                    "storage": {
+                        "original_path": f"original/{local_filename}",
+                        "extracted_text_path": "extracted.txt" if text_content else None,
+                        "created_at": datetime.now().isoformat()
                     }
+                }
 
-                    metadata_path = storage_dir / 'metadata.json'
-                    async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
-                        await f.write(json.dumps(metadata, indent=2))
-
-                    self.logger.debug(f"Saved metadata for {link.url[:50]}...")
+                metadata_path = storage_dir / 'metadata.json'
+                async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
+                    await f.write(json.dumps(metadata, indent=2))
 
-                except Exception as e:
-                    # Log but don't fail the entire process
-                    self.logger.warning(f"Failed to create metadata.json for {link.url[:50]}...: {e}")
+                self.logger.debug(f"Saved metadata for {link.url[:50]}...")
 
-                processing_time = (datetime.now() - start_time).total_seconds()
-                
-                # Create report object
-                report = DownloadedReport(
-                    url=link.url,
-                    local_path=str(local_path),
-                    content_type=content_type,
-                    file_size=len(content),
-                    text_content=text_content,
-                    metadata={
-                        'context': link.context,
-                        'classification_confidence': link.confidence,
-                        'download_timestamp': datetime.now().isoformat(),
-                        'tier': tier,  # NEW: Track which tier was used
-                        'tier_name': tier_name
-                    },
-                    download_time=datetime.now(),
-                    processing_time=processing_time
-                )
-                
-                # Cache the result
-                self._cache_result(url_hash, report)
-                
-                self.logger.info(f"Downloaded Tier {tier} report: {link.url[:50]}... ({len(content)} bytes, {len(text_content)} chars text)")
-                
-                return {'success': True, 'report': report, 'tier': tier, 'tier_name': tier_name}
-                
             except Exception as e:
-                processing_time = (datetime.now() - start_time).total_seconds()
-                error_info = {
-                    'url': link.url,
-                    'error': str(e),
-                    'processing_time': processing_time,
-                    'stage': 'download',
-                    'tier': tier if 'tier' in locals() else None,
-                    'tier_name': tier_name if 'tier_name' in locals() else None
-                }
-                
-                self.logger.warning(f"Failed to download {link.url}: {e}")
-                return {'success': False, 'error_info': error_info}
-    
-    async def _download_with_retry(self, session: aiohttp.ClientSession, url: str, max_retries: int = 3) -> Tuple[bytes, str]:
+                # Log but don't fail the entire process
+                self.logger.warning(f"Failed to create metadata.json for {link.url[:50]}...: {e}")
+
+            processing_time = (datetime.now() - start_time).total_seconds()
+            
+            # Create report object
+            report = DownloadedReport(
+                url=link.url,
+                local_path=str(local_path),
+                content_type=content_type,
+                file_size=len(content),
+                text_content=text_content,
+                metadata={
+                    'context': link.context,
+                    'classification_confidence': link.confidence,
+                    'download_timestamp': datetime.now().isoformat(),
+                    'tier': tier,  # NEW: Track which tier was used
+                    'tier_name': tier_name
+                },
+                download_time=datetime.now(),
+                processing_time=processing_time
+            )
+            
+            # Cache the result
+            self._cache_result(url_hash, report)
+            
+            self.logger.info(f"Downloaded Tier {tier} report: {link.url[:50]}... ({len(content)} bytes, {len(text_content)} chars text)")
+            
+            return {'success': True, 'report': report, 'tier': tier, 'tier_name': tier_name}
+            
+        except Exception as e:
+            processing_time = (datetime.now() - start_time).total_seconds()
+            error_info = {
+                'url': link.url,
+                'error': str(e),
+                'processing_time': processing_time,
+                'stage': 'download',
+                'tier': tier if 'tier' in locals() else None,
+                'tier_name': tier_name if 'tier_name' in locals() else None
+            }
+            
+            self.logger.warning(f"Failed to download {link.url}: {e}")
+            return {'success': False, 'error_info': error_info}
+
+    def _reserve_domain_slot(self, domain: str) -> float:
+        """Book the next request slot for a domain; returns seconds to wait for it
+
+        Slots are handed out in order, so N concurrent requests to one host are spaced
+        rate_limit_delay apart instead of all seeing the same "last download" time.
+        """
+        with self._domain_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self.next_download_slot.get(domain, 0.0))
+            self.next_download_slot[domain] = slot + self.rate_limit_delay
+            return slot - now
+
+    async def _wait_for_domain_slot(self, url: str):
+        """Domain-level politeness: wait for this URL's host slot"""
+        domain = urlparse(url).netloc
+        delay = self._reserve_domain_slot(domain)
+        if delay > 0:
+            self.logger.debug(f"Rate limiting: waiting {delay:.1f}s before downloading from {domain}")
+            await asyncio.sleep(delay)
+
+    async def _fetch_url(self, url: str) -> Tuple[bytes, str]:
+        """Single GET through the download scheduler (domain slot, then a global download slot)"""
+        await self._wait_for_domain_slot(url)
+
+        async with self.download_semaphore:
+            if self.http_client is not None:
+                response = await self.http_client.get(url, headers=self.session_config['headers'])
+                status, content, headers = response.status_code, response.content, response.headers
+            else:
+                async with aiohttp.ClientSession(**self.session_config) as session:
+                    async with session.get(url) as response:
+                        status, content, headers = response.status, await response.read(), response.headers
+
+        if status != 200:
+            raise IOError(f"HTTP {status} from {url}")
+        return content, headers.get('content-type', 'application/octet-stream')
+
+    async def _download_with_retry(self, url: str, max_retries: int = 3) -> Tuple[bytes, str]:
         """Download content with exponential backoff retry logic and rate limiting
         
         Implements:
         - Per-domain rate limiting to respect server limits
-        - Concurrent download limits to prevent resource exhaustion
-        - Exponential backoff on failures
+        - Concurrent download limits shared by every email (download_semaphore)
+        - Exponential backoff on failures (without holding a download slot)
+
+        Requests run on the shared async HTTP loop, so the pooled keep-alive session and
+        the scheduler outlive the event loop of any single process_email_links() call.
         """
-        # Extract domain for rate limiting
-        domain = urlparse(url).netloc
-        
-        # Acquire semaphore to limit concurrent downloads
-        async with self.download_semaphore:
-            # Apply rate limiting per domain
-            if domain in self.last_download_time:
-                time_since_last = time.time() - self.last_download_time[domain]
-                if time_since_last < self.rate_limit_delay:
-                    delay = self.rate_limit_delay - time_since_last
-                    self.logger.debug(f"Rate limiting: waiting {delay:.1f}s before downloading from {domain}")
-                    await asyncio.sleep(delay)
-            
-            # Record download time
-            self.last_download_time[domain] = time.time()
-            
-            for attempt in range(max_retries):
-                try:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            content = await response.read()
-                            content_type = response.headers.get('content-type', 'application/octet-stream')
-                            return content, content_type
-                        else:
-                            raise aiohttp.ClientResponseError(
-                                request_info=response.request_info,
-                                history=response.history,
-                                status=response.status,
-                                message=f"HTTP {response.status}"
-                            )
-                
-                except Exception as e:
-                    if attempt == max_retries - 1:  # Last attempt
-                        raise e
-                    
-                    # Exponential backoff: 1s, 2s, 4s
-                    wait_time = 2 ** attempt
-                    self.logger.debug(f"Download attempt {attempt + 1} failed for {url}, retrying in {wait_time}s...")
-                    await asyncio.sleep(wait_time)
+        for attempt in range(max_retries):
+            try:
+                if self.http_client is not None and not self.http_client.runner.in_runner_thread():
+                    return await asyncio.wrap_future(self.http_client.runner.submit(self._fetch_url(url)))
+                return await self._fetch_url(url)
+
+            except Exception as e:
+                if attempt == max_retries - 1:  # Last attempt
+                    raise e
+
+                # Exponential backoff: 1s, 2s, 4s
+                wait_time = 2 ** attempt
+                self.logger.debug(f"Download attempt {attempt + 1} failed for {url}, retrying in {wait_time}s...")
+                await asyncio.sleep(wait_time)
     
     async def _extract_text_from_content(self, content: bytes, content_type: str, local_path: str) -> str:
         """Extract text from downloaded content based on content type"""
         try:
             if 'pdf' in content_type.lower():
-                return self._extract_pdf_text(content, local_path)
+                # Await docling conversion so other downloads keep flowing while the PDF converts
+                docling_text = await self._aextract_pdf_with_docling(content, local_path)
+                return self._extract_pdf_text(content, local_path, docling_text=docling_text)
             elif 'word' in content_type.lower() or content_type.endswith('docx'):
                 return self._extract_docx_text(local_path)
             elif 'html' in content_type.lower():
@@ -1241,33 +1289,64 @@ class IntelligentLinkProcessor:
             Extracted text content (markdown format)
             Empty string if processing fails (graceful degradation to pdfplumber)
         """
-        if not self.docling_processor:
-            self.logger.debug("Docling processor not available, falling back to pdfplumber")
-            return ""
-
-        if not self.use_docling_urls:
-            self.logger.debug("Docling for URL PDFs disabled (USE_DOCLING_URLS=false)")
+        if not self._docling_urls_enabled():
             return ""
 
         try:
             # Process PDF bytes with Docling (same API as email attachments)
             result = self.docling_processor.process_pdf_bytes(content, filename)
+            return self._docling_result_text(result, filename)
 
-            if result.get('processing_status') == 'completed':
-                text = result.get('extracted_text', '')
-                tables = result.get('extracted_data', {}).get('tables', [])
-                self.logger.info(f"✅ Docling processed {filename}: {len(text)} chars, {len(tables)} tables (97.9% accuracy)")
-                return text
+        except Exception as e:
+            self.logger.warning(f"Docling processing exception for {filename}: {e}")
+            return ""  # Fall back to pdfplumber
+
+    async def _aextract_pdf_with_docling(self, content: bytes, filename: str) -> str:
+        """
+        Async _extract_pdf_with_docling() - awaits the docling worker pool
+
+        Falls back to running the sync API in a thread for processors without aprocess_pdf_bytes().
+        """
+        if not self._docling_urls_enabled():
+            return ""
+
+        try:
+            if hasattr(self.docling_processor, 'aprocess_pdf_bytes'):
+                result = await self.docling_processor.aprocess_pdf_bytes(content, filename)
             else:
-                error = result.get('error', 'Unknown error')
-                self.logger.warning(f"Docling processing failed for {filename}: {error}")
-                return ""  # Fall back to pdfplumber
+                result = await asyncio.to_thread(self.docling_processor.process_pdf_bytes, content, filename)
+            return self._docling_result_text(result, filename)
 
         except Exception as e:
             self.logger.warning(f"Docling processing exception for {filename}: {e}")
             return ""  # Fall back to pdfplumber
 
-    def _extract_pdf_text(self, content: bytes, filename: str = "unknown.pdf") -> str:
+    def _docling_urls_enabled(self) -> bool:
+        """Whether URL PDFs should go through Docling"""
+        if not self.docling_processor:
+            self.logger.debug("Docling processor not available, falling back to pdfplumber")
+            return False
+
+        if not self.use_docling_urls:
+            self.logger.debug("Docling for URL PDFs disabled (USE_DOCLING_URLS=false)")
+            return False
+
+        return True
+
+    def _docling_result_text(self, result: Dict[str, Any], filename: str) -> str:
+        """Extracted text from a docling result, empty string on failure (falls back to pdfplumber)"""
+        if result.get('processing_status') == 'completed':
+            text = result.get('extracted_text', '')
+            tables = result.get('extracted_data', {}).get('tables', [])
+            self.logger.info(f"✅ Docling processed {filename}: {len(text)} chars, {len(tables)} tables (97.9% accuracy)")
+            return text
+        else:
+            error = result.get('error', 'Unknown error')
+            self.logger.warning(f"Docling processing failed for {filename}: {error}")
+            return ""  # Fall back to pdfplumber
+
+    def _extract_pdf_text(self, content: bytes, filename: str = "unknown.pdf",
+                          docling_text: Optional[str] = None) -> str:
         """
         Extract text from PDF content (with Docling integration)
 
@@ -1275,12 +1354,16 @@ class IntelligentLinkProcessor:
         1. Try Docling first (97.9% table accuracy)
         2. Fall back to pdfplumber (42% table accuracy)
         3. Fall back to PyPDF2 (basic text)
+
+        Args:
+            docling_text: Docling result already computed by the caller (async path); None to run Docling here
         """
         if not PDF_AVAILABLE:
             return "[PDF_PROCESSING_NOT_AVAILABLE]"
 
         # PHASE 2: Try Docling first (97.9% accuracy)
-        docling_text = self._extract_pdf_with_docling(content, filename)
+        if docling_text is None:
+            docling_text = self._extract_pdf_with_docling(content, filename)
         if docling_text:
             return docling_text
 
@@ -1411,57 +1494,55 @@ class IntelligentLinkProcessor:
             return portal_reports, portal_failed
 
         # Process each portal link
-        async with aiohttp.ClientSession(**self.session_config) as session:
-            for link in portal_links[:5]:  # Limit to first 5 portals
-                try:
-                    self.logger.info(f"Processing portal: {link.url[:70]}...")
-
-                    # Fetch portal page with Crawl4AI
-                    portal_html, content_type = await self._fetch_with_crawl4ai(link.url)
-
-                    # Parse HTML to find download links
-                    discovered_links = self._extract_download_links_from_portal(
-                        portal_html.decode('utf-8', errors='ignore'),
-                        link.url
-                    )
+        for link in portal_links[:5]:  # Limit to first 5 portals
+            try:
+                self.logger.info(f"Processing portal: {link.url[:70]}...")
 
-                    if not discovered_links:
-                        portal_failed.append({
-                            'url': link.url,
-                            'error': 'No download links found in portal page',
-                            'stage': 'portal_parsing'
-                        })
-                        continue
-
-                    self.logger.info(f"Found {len(discovered_links)} download links in portal")
-
-                    # Download discovered links
-                    semaphore = asyncio.Semaphore(3)  # Limit concurrent downloads
-                    download_tasks = [
-                        self._download_single_report(session, semaphore, disc_link, email_uid)
-                        for disc_link in discovered_links[:3]  # Limit to first 3 links
-                    ]
-
-                    results = await asyncio.gather(*download_tasks, return_exceptions=True)
-
-                    for result in results:
-                        if isinstance(result, Exception):
-                            portal_failed.append({
-                                'url': link.url,
-                                'error': str(result),
-                                'stage': 'portal_download'
-                            })
-                        elif result['success']:
-                            portal_reports.append(result['report'])
-                        else:
-                            portal_failed.append(result['error'])
-
-                except Exception as e:
+                # Fetch portal page with Crawl4AI
+                portal_html, content_type = await self._fetch_with_crawl4ai(link.url)
+
+                # Parse HTML to find download links
+                discovered_links = self._extract_download_links_from_portal(
+                    portal_html.decode('utf-8', errors='ignore'),
+                    link.url
+                )
+
+                if not discovered_links:
                     portal_failed.append({
                         'url': link.url,
-                        'error': f'Portal processing failed: {str(e)}',
-                        'stage': 'portal_crawl'
+                        'error': 'No download links found in portal page',
+                        'stage': 'portal_parsing'
                     })
+                    continue
+
+                self.logger.info(f"Found {len(discovered_links)} download links in portal")
+
+                # Download discovered links (through the shared download scheduler)
+                download_tasks = [
+                    self._download_single_report(disc_link, email_uid)
+                    for disc_link in discovered_links[:3]  # Limit to first 3 links
+                ]
+
+                results = await asyncio.gather(*download_tasks, return_exceptions=True)
+
+                for result in results:
+                    if isinstance(result, Exception):
+                        portal_failed.append({
+                            'url': link.url,
+                            'error': str(result),
+                            'stage': 'portal_download'
+                        })
+                    elif result['success']:
+                        portal_reports.append(result['report'])
+                    else:
+                        portal_failed.append(result['error_info'])
+
+            except Exception as e:
+                portal_failed.append({
+                    'url': link.url,
+                    'error': f'Portal processing failed: {str(e)}',
+                    'stage': 'portal_crawl'
+                })
 
         return portal_reports, portal_failed
 
@@ -1555,14 +1636,32 @@ class IntelligentLinkProcessor:
                 self.cache_index = {}
         else:
             self.cache_index = {}
-    
+        self._cache_index_pending = 0  # Entries added since the last index write
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any):
+        """Write JSON via temp file + rename so readers never see a half-written file"""
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
     def _save_cache_index(self):
         """Save cache index to disk"""
         try:
-            with open(self.cache_index_file, 'w') as f:
-                json.dump(self.cache_index, f, indent=2, default=str)
+            self._write_json_atomic(self.cache_index_file, self.cache_index)
+            self._cache_index_pending = 0
         except Exception as e:
             self.logger.error(f"Failed to save cache index: {e}")
+
+    def flush_cache_index(self):
+        """Write the cache index if downloads were cached since the last write"""
+        if self._cache_index_pending:
+            self._save_cache_index()
+
+    def close(self):
+        """Persist pending cache index entries (the pooled HTTP session is shared and closed at exit)"""
+        self.flush_cache_index()
     
     def _is_cached(self, url_hash: str) -> bool:
         """Check if URL is cached"""
@@ -1599,18 +1698,19 @@ class IntelligentLinkProcessor:
             report_dict = asdict(report)
             report_dict['download_time'] = report.download_time.isoformat()
             
-            with open(cache_file, 'w') as f:
-                json.dump(report_dict, f, indent=2, default=str)
+            self._write_json_atomic(cache_file, report_dict)
             
-            # Update index
+            # Update index (written in batches - see flush_cache_index)
             self.cache_index[url_hash] = {
                 'cached_time': datetime.now().isoformat(),
                 'url': report.url,
                 'file_size': report.file_size,
                 'text_length': len(report.text_content)
             }
+            self._cache_index_pending += 1
             
-            self._save_cache_index()
+            if self._cache_index_pending >= CACHE_INDEX_FLUSH_EVERY:
+                self._save_cache_index()
             
         except Exception as e:
             self.logger.error(f"Failed to cache result: {e}")
@@ -1618,8 +1718,8 @@ class IntelligentLinkProcessor:
     def _get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
         return {
-            'hits': getattr(self, '_cache_hits', 0),
-            'misses': getattr(self, '_cache_misses', 0),
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
             'total_cached': len(self.cache_index)
         }
     
@@ -147,6 +147,73 @@ class TestEntityExtractor(unittest.TestCase):
         entities = self.entity_extractor.extract_entities(None)
         self.assertEqual(entities['confidence'], 0.0)
 
+    def test_single_nlp_parse_per_document(self):
+        """Test that spaCy runs once per document and is shared by sub-extractors"""
+        person = Mock(text="Tim Cook", label_="PERSON", start_char=0, end_char=8)
+        date = Mock(text="next quarter", label_="DATE", start_char=30, end_char=42)
+        fake_nlp = Mock(return_value=Mock(ents=[person, date]))
+        self.entity_extractor.nlp = fake_nlp
+
+        entities = self.entity_extractor.extract_entities("Tim Cook expects AAPL growth next quarter.")
+
+        self.assertEqual(fake_nlp.call_count, 1)
+        self.assertEqual([p['name'] for p in entities['people']], ["Tim Cook"])
+        self.assertIn("next quarter", [d['date'] for d in entities['dates']])
+
+    def test_extract_entities_many(self):
+        """Test batched extraction matches per-document extraction and uses nlp.pipe"""
+        texts = ["AAPL price target raised to $150.", "", "MSFT downgraded to sell."]
+        fake_nlp = Mock(return_value=Mock(ents=[]))
+        fake_nlp.pipe = Mock(side_effect=lambda docs, **kwargs: [Mock(ents=[]) for _ in docs])
+        self.entity_extractor.nlp = fake_nlp
+
+        results = self.entity_extractor.extract_entities_many(texts, n_process=2, batch_size=8)
+
+        self.assertEqual(len(results), 3)
+        fake_nlp.pipe.assert_called_once()
+        self.assertEqual(fake_nlp.pipe.call_args.kwargs, {'n_process': 2, 'batch_size': 8})
+        fake_nlp.assert_not_called()
+        self.assertEqual(results[1]['confidence'], 0.0)
+        self.assertEqual([t['ticker'] for t in results[0]['tickers']], ['AAPL'])
+        self.assertEqual(results[2]['ratings'], self.entity_extractor.extract_entities(texts[2])['ratings'])
+
+    def test_company_alias_automaton(self):
+        """Test single-pass alias matching reports overlapping hits with offsets"""
+        text = "Apple Inc and Goldman Sachs both commented."
+        companies = self.entity_extractor.extract_entities(text)['companies']
+        by_name = {c['company']: c for c in companies if c['source'] == 'alias_match'}
+
+        self.assertIn('Apple', by_name)
+        self.assertIn('Apple Inc', by_name)
+        self.assertEqual(by_name['Goldman Sachs']['ticker'], 'GS')
+        hit = by_name['Goldman Sachs']
+        self.assertEqual(text[hit['start']:hit['end']], 'Goldman Sachs')
+
+    def test_alias_automaton_incremental_update(self):
+        """Test new aliases are matchable after update_ticker_list"""
+        text = "Broadcom raised guidance."
+        self.assertEqual(self.entity_extractor.extract_entities(text)['companies'], [])
+
+        self.entity_extractor.update_ticker_list(['AVGO'], company_aliases={'Broadcom': 'avgo'})
+
+        companies = self.entity_extractor.extract_entities(text)['companies']
+        self.assertEqual([(c['company'], c['ticker']) for c in companies], [('Broadcom', 'AVGO')])
+        self.assertEqual(self.entity_extractor.alias_automaton.lookup_fragment('broadcom inc'), 'AVGO')
+        self.assertEqual(self.entity_extractor.alias_automaton.lookup_fragment('goldman'), 'GS')
+
+    def test_context_windows_follow_match_spans(self):
+        """Test context is sliced around each match span, not the first text occurrence"""
+        text = "Buy rating. " + "x" * 120 + " Price target $150 on NVDA."
+        entities = self.entity_extractor.extract_entities(text)
+
+        price = entities['prices'][0]
+        self.assertEqual(text[price['start']:price['end']], '$150')
+        self.assertIn('NVDA', price['context'])
+        self.assertNotIn('Buy rating', price['context'])
+
+        ticker = next(t for t in entities['tickers'] if t['ticker'] == 'NVDA')
+        self.assertEqual(text[ticker['start']:ticker['end']], 'NVDA')
+
 
 class TestGraphBuilder(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,205 @@
+# Location: src/ice_core/embedding_cache.py
+# Purpose: Persistent LRU cache of chunk embeddings in a memory-mapped float32 matrix
+# Why: The same retrieved chunks come back across queries; re-embedding them each time costs latency and API spend
+# Relevant Files: sentence_attributor.py, src/ice_lightrag/mmap_vector_storage.py
+
+"""
+Chunk embedding cache for sentence attribution
+
+One cache per embedding model: `{model}.f32` holds fixed-width float32 rows and
+`{model}.index.json` maps sha256(text) -> row slot in least-recently-used order. Rows are
+appended until max_entries is reached, after which the least recently used slots are
+overwritten in place, so the file never grows beyond max_entries rows.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+
+class ChunkEmbeddingCache:
+    """
+    Memory-mapped embedding cache keyed by text hash, scoped to one embedding model
+
+    Usage:
+        cache = ChunkEmbeddingCache(storage_dir, "text-embedding-3-small")
+        embeddings = cache.get_or_embed(chunk_texts, embed_func)  # embeds misses only
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], model_name: str, max_entries: int = 20000):
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        self.max_entries = max_entries
+
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        self.vectors_path = self.cache_dir / f"{slug}.f32"
+        self.index_path = self.cache_dir / f"{slug}.index.json"
+
+        self.embedding_dim: Optional[int] = None
+        self._slots: "OrderedDict[str, int]" = OrderedDict()  # key -> slot, least recently used first
+        self._rows = 0
+        self._matrix: Optional[np.memmap] = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+        self._load()
+
+    def _load(self):
+        """Load the index; drop the cache if it doesn't match the vector file"""
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('version') != INDEX_VERSION or index.get('model') != self.model_name:
+                raise ValueError("index version/model mismatch")
+
+            dim, rows = index['embedding_dim'], index['rows']
+            if not self.vectors_path.exists() or self.vectors_path.stat().st_size < rows * dim * 4:
+                raise ValueError("vector file shorter than index")
+
+            self.embedding_dim, self._rows = dim, rows
+            self._slots = OrderedDict((key, slot) for key, slot in index['slots'])
+        except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding embedding cache for {self.model_name}: {e}")
+            self.embedding_dim, self._rows, self._slots = None, 0, OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _read_rows(self, slots: List[int]) -> np.ndarray:
+        if self._matrix is None or self._matrix.shape[0] < self._rows:
+            self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode='r',
+                                     shape=(self._rows, self.embedding_dim))
+        return np.array(self._matrix[slots])
+
+    def _write_rows(self, slots: List[int], vectors: np.ndarray):
+        """Write rows in place (slots below self._rows) or at the end of the file"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        mode = 'r+b' if self.vectors_path.exists() else 'w+b'
+        with open(self.vectors_path, mode) as f:
+            for slot, vector in zip(slots, vectors):
+                f.seek(slot * self.embedding_dim * 4)
+                f.write(vector.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._matrix = None  # Re-map after the file changed
+
+    def _save_index(self):
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'version': INDEX_VERSION,
+                'model': self.model_name,
+                'embedding_dim': self.embedding_dim,
+                'rows': self._rows,
+                'slots': list(self._slots.items())
+            }, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    def _allocate_slots(self, count: int) -> List[int]:
+        """Fresh rows while below max_entries, then least recently used slots"""
+        slots = []
+        while len(slots) < count and self._rows < self.max_entries:
+            slots.append(self._rows)
+            self._rows += 1
+        evicted = False
+        while len(slots) < count:
+            _, slot = self._slots.popitem(last=False)
+            slots.append(slot)
+            evicted = True
+        if evicted:
+            # Forget evicted keys on disk before their rows are overwritten
+            self._save_index()
+        return slots
+
+    def get_or_embed(self, texts: List[str], embed_func: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """
+        Embeddings for texts, calling embed_func once with only the uncached unique texts
+
+        Args:
+            texts: Texts to embed (duplicates allowed)
+            embed_func: Batch embedding function returning shape (len(batch), dim)
+
+        Returns:
+            float32 array of shape (len(texts), dim), rows in input order
+        """
+        if not texts:
+            return np.zeros((0, self.embedding_dim or 0), dtype=np.float32)
+
+        with self._lock:
+            keys = [self._key(t) for t in texts]
+            vectors: Dict[str, np.ndarray] = {}
+            missing: Dict[str, str] = {}
+            for key, text in zip(keys, texts):
+                if key in self._slots:
+                    self._slots.move_to_end(key)
+                elif key not in missing:
+                    missing[key] = text
+
+            misses = sum(1 for k in keys if k in missing)
+            self.hits += len(keys) - misses
+            self.misses += misses
+
+            # Read hits before storing misses - storing may evict and overwrite their slots
+            cached_keys = [k for k in dict.fromkeys(keys) if k not in missing]
+            if cached_keys:
+                vectors.update(zip(cached_keys, self._read_rows([self._slots[k] for k in cached_keys])))
+
+            if missing:
+                embedded = np.asarray(embed_func(list(missing.values())), dtype=np.float32)
+                if self.embedding_dim is None:
+                    self.embedding_dim = embedded.shape[1]
+                if embedded.shape[1] != self.embedding_dim:
+                    raise ValueError(f"Embedding dim {embedded.shape[1]} != cached dim {self.embedding_dim}")
+                vectors.update(zip(missing, embedded))
+
+                # A batch larger than the cache only keeps its last max_entries rows
+                to_store = list(missing)[-self.max_entries:] if self.max_entries > 0 else []
+                if to_store:
+                    slots = self._allocate_slots(len(to_store))
+                    self._write_rows(slots, np.stack([vectors[k] for k in to_store]))
+                    self._slots.update(zip(to_store, slots))
+                    self._save_index()
+
+            return np.stack([vectors[k] for k in keys])
+
+    def get_stats(self) -> Dict[str, Union[int, float, str, None]]:
+        """Hit/miss counters and size"""
+        lookups = self.hits + self.misses
+        return {
+            'model': self.model_name,
+            'entries': len(self._slots),
+            'max_entries': self.max_entries,
+            'embedding_dim': self.embedding_dim,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """Delete all cached embeddings for this model"""
+        with self._lock:
+            self._slots.clear()
+            self._rows = 0
+            self.embedding_dim = None
+            self._matrix = None
+            self.vectors_path.unlink(missing_ok=True)
+            self.index_path.unlink(missing_ok=True)
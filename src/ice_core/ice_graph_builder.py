@@ -8,6 +8,7 @@ Relevant files: ice_lightrag/ice_rag.py, ui_mockups/ice_ui_v17.py, ice_system_ma
 
 import re
 import json
+import heapq
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple, Set
@@ -470,107 +471,128 @@ class ICEGraphBuilder:
                 edge_type=edge_type
             )
     
-    def find_causal_paths(self, entity: str, max_hops: int = 3, min_confidence: float = 0.6) -> List[Dict]:
+    def find_causal_paths(self, entity: str, max_hops: int = 3, min_confidence: float = 0.6,
+                          top_k: int = 10, paths_per_target: int = 3,
+                          branching_limit: int = 10, max_expansions: int = 2000) -> List[Dict]:
         """
-        Find causal reasoning paths from/to a specific entity
-        
+        Find causal reasoning paths from a specific entity
+
+        Runs a single depth-limited DFS over simple paths from the entity, pruning edges
+        below min_confidence while expanding, and keeps the best paths in bounded heaps.
+        The search is budgeted so hub entities (tickers) stay as cheap as ordinary nodes:
+        each node contributes only its branching_limit strongest out-edges, strongest
+        first, and at most max_expansions nodes are expanded in total.
+
         Args:
             entity: Starting entity for path finding
             max_hops: Maximum number of hops in path
             min_confidence: Minimum confidence threshold for edges
-            
+            top_k: Maximum number of paths returned
+            paths_per_target: Maximum number of paths kept per target entity
+            branching_limit: Strongest out-edges followed per node (None for all)
+            max_expansions: Maximum number of nodes expanded (None for no cap)
+
         Returns:
-            List of causal path dictionaries
+            List of causal path dictionaries, best (confidence, fewer hops) first
         """
-        if entity not in self.graph:
+        if entity not in self.graph or max_hops < 1 or top_k < 1:
             return []
-        
-        paths = []
-        
+
+        # Per-target min-heaps of (confidence, -hop_count, seq, nodes, hops)
+        best_by_target: Dict[str, List[Tuple]] = {}
+        strongest_edges: Dict[str, List[Tuple]] = {}
+        seq = 0
+        expansions = 0
+
         try:
-            # Find all paths within max_hops
-            for target in self.graph.nodes():
-                if target == entity:
-                    continue
-                    
-                try:
-                    # Find shortest path
-                    if nx.has_path(self.graph, entity, target):
-                        path = nx.shortest_path(self.graph, entity, target)
-                        
-                        if len(path) <= max_hops + 1:  # +1 because path includes start node
-                            path_info = self._analyze_causal_path(path, min_confidence)
-                            if path_info:
-                                paths.append(path_info)
-                                
-                except nx.NetworkXNoPath:
-                    continue
-                    
+            stack = [(entity, [entity], [], 1.0)]
+            while stack:
+                if max_expansions is not None and expansions >= max_expansions:
+                    logger.debug(f"Causal path search from {entity} stopped after {expansions} expansions")
+                    break
+                node, nodes, hops, product = stack.pop()
+                expansions += 1
+
+                if node not in strongest_edges:
+                    strongest_edges[node] = self._strongest_out_edges(node, min_confidence, branching_limit)
+
+                children = []
+                for target, edge_type, confidence in strongest_edges[node]:
+                    if target in nodes:
+                        continue  # Simple paths only
+
+                    path_nodes = nodes + [target]
+                    path_hops = hops + [(edge_type, target, confidence)]
+                    path_product = product * confidence
+
+                    seq += 1
+                    candidate = (path_product ** (1.0 / len(path_hops)), -len(path_hops), seq, path_nodes, path_hops)
+                    heap = best_by_target.setdefault(target, [])
+                    if len(heap) < paths_per_target:
+                        heapq.heappush(heap, candidate)
+                    elif candidate[:3] > heap[0][:3]:
+                        heapq.heapreplace(heap, candidate)
+
+                    if len(path_hops) < max_hops:
+                        children.append((target, path_nodes, path_hops, path_product))
+
+                # Reversed so the strongest edge is expanded first
+                stack.extend(reversed(children))
+
         except Exception as e:
             logger.error(f"Causal path finding failed for {entity}: {e}")
-            
+
         # Sort paths by confidence and length
-        paths.sort(key=lambda x: (x['confidence'], -x['hop_count']), reverse=True)
-        return paths[:10]  # Return top 10 paths
-    
-    def _analyze_causal_path(self, path: List[str], min_confidence: float) -> Optional[Dict]:
+        candidates = (c for heap in best_by_target.values() for c in heap)
+        best = heapq.nlargest(top_k, candidates, key=lambda c: c[:3])
+        return [self._format_causal_path(nodes, hops, confidence) for confidence, _, _, nodes, hops in best]
+
+    def _strongest_out_edges(self, node: str, min_confidence: float,
+                             limit: Optional[int] = None) -> List[Tuple[str, str, float]]:
         """
-        Analyze a causal path and extract metadata
-        
+        Outgoing (target, edge_type, confidence) for a node, strongest parallel edge per target
+
         Args:
-            path: List of nodes in the path
-            min_confidence: Minimum confidence threshold
-            
+            node: Source node
+            min_confidence: Edges below this confidence are pruned
+            limit: Keep only this many targets (None for all)
+
         Returns:
-            Path analysis dict or None if below threshold
+            List of (target, edge_type, confidence) tuples, strongest first
+        """
+        edges = []
+        for target, parallel_edges in self.graph[node].items():
+            edge_info = max(parallel_edges.values(), key=lambda e: e.get('confidence', 0.5))
+            confidence = edge_info.get('confidence', 0.5)
+            if confidence >= min_confidence:
+                edges.append((target, edge_info.get('edge_type', 'linked_to'), confidence))
+        if limit is not None and len(edges) > limit:
+            return heapq.nlargest(limit, edges, key=lambda e: e[2])
+        return sorted(edges, key=lambda e: e[2], reverse=True)
+
+    @staticmethod
+    def _format_causal_path(nodes: List[str], hops: List[Tuple[str, str, float]], confidence: float) -> Dict:
+        """
+        Build the causal path dict returned by find_causal_paths
+
+        Args:
+            nodes: Entities along the path, starting node first
+            hops: (edge_type, target, confidence) per hop
+            confidence: Geometric mean of hop confidences
+
+        Returns:
+            Path analysis dict
         """
-        if len(path) < 2:
-            return None
-            
-        hops = []
-        total_confidence = 1.0
-        
-        for i in range(len(path) - 1):
-            source, target = path[i], path[i + 1]
-            
-            # Get edge data
-            if self.graph.has_edge(source, target):
-                edge_data = self.graph[source][target]
-                
-                # Handle MultiDiGraph - get first edge if multiple
-                if isinstance(edge_data, dict):
-                    edge_info = list(edge_data.values())[0]
-                else:
-                    edge_info = edge_data
-                
-                confidence = edge_info.get('confidence', 0.5)
-                edge_type = edge_info.get('edge_type', 'linked_to')
-                
-                if confidence < min_confidence:
-                    return None  # Path doesn't meet confidence threshold
-                
-                hops.append({
-                    "edge_type": edge_type,
-                    "target": target,
-                    "confidence": confidence
-                })
-                
-                total_confidence *= confidence
-            else:
-                return None  # Missing edge
-        
-        # Calculate average confidence
-        avg_confidence = total_confidence ** (1.0 / len(hops))
-        
         return {
-            "path_str": " → ".join([f"{path[i]} --{hops[i]['edge_type']}--> {hops[i]['target']}" 
-                                   for i in range(len(hops))]),
+            "path_str": " → ".join(f"{nodes[i]} --{edge_type}--> {target}"
+                                   for i, (edge_type, target, _) in enumerate(hops)),
             "hop_count": len(hops),
-            "confidence": avg_confidence,
-            "hops": hops,
-            "entities": path
+            "confidence": confidence,
+            "hops": [{"edge_type": edge_type, "target": target, "confidence": hop_confidence}
+                     for edge_type, target, hop_confidence in hops],
+            "entities": nodes
         }
-    
+
     def get_graph_edges_for_ui(self, min_confidence: float = 0.6, max_age_days: int = 365, 
                               edge_types: Optional[List[str]] = None) -> List[Tuple]:
         """
@@ -646,5 +668,6 @@ class ICEGraphBuilder:
             "total_connections": len(list(self.graph[entity])) + len(list(self.graph.predecessors(entity))),
             "outgoing_relationships": outgoing,
             "incoming_relationships": incoming,
-            "centrality": nx.degree_centrality(self.graph).get(entity, 0)
+            # Same value as nx.degree_centrality(graph)[entity] without computing it for every node
+            "centrality": self.graph.degree(entity) / (len(self.graph) - 1) if len(self.graph) > 1 else 1.0
         }
\ No newline at end of file
@@ -10,7 +10,7 @@ import os
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from pathlib import Path
 
 # Import custom exceptions for better error reporting
@@ -275,7 +275,8 @@ class ICESystemManager:
             }
         }
     
-    def query_ice(self, question: str, mode: str = "hybrid", use_graph_context: bool = False) -> Dict[str, Any]:
+    def query_ice(self, question: str, mode: str = "hybrid", use_graph_context: bool = False,
+                  use_cache: bool = True) -> Dict[str, Any]:
         """
         Main ICE query interface - combines LightRAG with graph intelligence
 
@@ -283,6 +284,7 @@ class ICESystemManager:
             question: User's investment question
             mode: LightRAG query mode ("hybrid", "local", "global", "naive")
             use_graph_context: Whether to enhance with graph-based context (Week 3+ feature, disabled for Week 2)
+            use_cache: Serve repeated questions from the query-result cache (False forces a fresh query)
 
         Returns:
             Dict with query results, sources, and metadata
@@ -306,7 +308,7 @@ class ICESystemManager:
                 result = self.query_processor.process_enhanced_query(question, mode)
             else:
                 # Fallback to basic LightRAG query
-                result = self.lightrag.query(question, mode)
+                result = self.lightrag.query(question, mode, use_cache=use_cache)
                 
             logger.info(f"ICE query completed: mode={mode}, graph_context={use_graph_context}")
             return result
@@ -318,6 +320,45 @@ class ICESystemManager:
                 "message": f"Query processing failed: {str(e)}"
             }
     
+    def query_ice_batch(self, questions: List[Any], mode: str = "hybrid", max_concurrency: Optional[int] = None,
+                        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                        timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Run several LightRAG queries concurrently on one event loop
+
+        Args:
+            questions: List of question strings or {"question", "mode", "use_cache"} dicts
+            mode: LightRAG query mode for plain-string questions
+            max_concurrency: Maximum queries in flight (default: ICE_MAX_CONCURRENT_QUERIES)
+            on_result: Called with (index, result) as each query finishes
+            timeout: Overall deadline in seconds; unfinished queries come back as timeouts
+
+        Returns:
+            One result dict per question, in input order
+        """
+        if not self.is_ready():
+            return [{
+                "status": "error",
+                "message": "ICE system not ready - check LightRAG initialization",
+                "errors": self.component_errors
+            } for _ in questions]
+
+        self.query_count += len(questions)
+        self.last_query_time = datetime.utcnow()
+
+        try:
+            results = self.lightrag.query_concurrent(questions, mode, max_concurrency=max_concurrency,
+                                                     on_result=on_result, timeout=timeout)
+            logger.info(f"ICE batch query completed: {len(questions)} queries, mode={mode}, max_concurrency={max_concurrency}")
+            return results
+
+        except Exception as e:
+            logger.error(f"ICE batch query failed: {e}")
+            return [{
+                "status": "error",
+                "message": f"Query processing failed: {str(e)}"
+            } for _ in questions]
+
     def add_document(self, text: str, doc_type: str = "financial", update_graph: bool = True, file_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Add document to ICE knowledge base with optional graph update
@@ -357,6 +398,35 @@ class ICESystemManager:
                 "message": f"Document processing failed: {str(e)}"
             }
     
+    def add_documents_batch(self, documents: List[Dict[str, Any]], max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Add several documents to the ICE knowledge base as one LightRAG batch
+
+        Args:
+            documents: List of {"content", "type", "file_path"} dictionaries
+            max_concurrency: Maximum number of documents LightRAG processes at the same time
+
+        Returns:
+            One result dict per input document, in input order
+        """
+        if not self.is_ready():
+            return [{
+                "status": "error",
+                "message": "ICE system not ready for document ingestion"
+            } for _ in documents]
+
+        try:
+            results = self.lightrag.add_documents_concurrent(documents, max_concurrency=max_concurrency)
+            logger.info(f"Documents added as one batch: {len(documents)} docs, max_concurrency={max_concurrency}")
+            return results
+
+        except Exception as e:
+            logger.error(f"Batch document ingestion failed: {e}")
+            return [{
+                "status": "error",
+                "message": f"Document processing failed: {str(e)}"
+            } for _ in documents]
+
     def get_ticker_intelligence(self, ticker: str, analysis_depth: int = 2) -> Dict[str, Any]:
         """
         Get comprehensive ticker intelligence using ICE capabilities
@@ -15,18 +15,31 @@ Key Features:
 - Temporal metadata for time-based queries
 - API data coverage tracking
 - Automatic backup and recovery
+
+Persistence: a compact JSON snapshot plus an append-only journal of changes made since
+the snapshot. save() only appends the pending changes; the snapshot is rewritten (and the
+journal truncated) once the journal outgrows the snapshot. Duplicate checks go through
+an in-memory content-hash index and statistics are maintained incrementally, so adding
+a document is O(1) regardless of manifest size.
 """
 
+import os
 import json
+import shutil
 import hashlib
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set, Any
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 logger = logging.getLogger(__name__)
 
+API_SOURCE_TYPES = ('api', 'api_news', 'api_financial', 'api_sec')
+
+# Rewrite the snapshot once the journal holds this many records AND more records than documents
+JOURNAL_COMPACTION_MIN_RECORDS = 1000
+
 
 class IngestionManifest:
     """
@@ -49,8 +62,18 @@ class IngestionManifest:
 
         self.manifest_path = self.storage_dir / ".ingestion_manifest.json"
         self.backup_path = self.storage_dir / ".ingestion_manifest.json.bak"
+        self.journal_path = self.storage_dir / ".ingestion_manifest.journal.jsonl"
+
+        # Journal state: sequence number of the last change and changes not yet written
+        self._snapshot_seq = 0
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._needs_snapshot = False
 
         self.manifest = self._load_or_create()
+        self._replay_journal()
+        self._rebuild_indexes()
 
     def _load_or_create(self) -> Dict[str, Any]:
         """Load existing manifest or create new one."""
@@ -58,10 +81,12 @@ class IngestionManifest:
             try:
                 with open(self.manifest_path, 'r') as f:
                     manifest = json.load(f)
+                self._snapshot_seq = self._journal_seq = manifest.pop('journal_seq', 0)
 
                 # Validate and potentially migrate schema
                 if manifest.get('version') != self.VERSION:
                     manifest = self._migrate_manifest(manifest)
+                    self._needs_snapshot = True
 
                 logger.info(f"Loaded manifest with {len(manifest['documents'])} documents")
                 return manifest
@@ -73,6 +98,8 @@ class IngestionManifest:
                 if self.backup_path.exists():
                     with open(self.backup_path, 'r') as f:
                         manifest = json.load(f)
+                        self._snapshot_seq = self._journal_seq = manifest.pop('journal_seq', 0)
+                        self._needs_snapshot = True
                         logger.info("Recovered from backup manifest")
                         return manifest
 
@@ -80,6 +107,50 @@ class IngestionManifest:
         logger.info("Creating new ingestion manifest")
         return self._create_empty_manifest()
 
+    def _replay_journal(self) -> None:
+        """Apply journal records written after the loaded snapshot."""
+        if not self.journal_path.exists():
+            return
+
+        replayed = 0
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from an interrupted save - everything before it is intact
+                    logger.warning("Ignoring truncated manifest journal record")
+                    self._needs_snapshot = True
+                    break
+
+                self._journal_records += 1
+                if record['seq'] <= self._snapshot_seq:
+                    continue  # Already folded into the snapshot
+                self._apply(record)
+                self._journal_seq = record['seq']
+                replayed += 1
+
+        if replayed:
+            logger.info(f"Replayed {replayed} manifest journal records")
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one journal record to the in-memory manifest."""
+        op = record['op']
+        if op == 'document':
+            self.manifest['documents'][record['doc_id']] = record['entry']
+        elif op == 'portfolio':
+            self.manifest['portfolio_history'].append(record['entry'])
+        elif op == 'api_coverage':
+            self.manifest['api_data_coverage'][record['ticker']] = record['coverage']
+        self.manifest['last_updated'] = record['last_updated']
+
+    def _journal(self, record: Dict[str, Any]) -> None:
+        """Queue a change for the next save()."""
+        self._journal_seq += 1
+        record['seq'] = self._journal_seq
+        record['last_updated'] = self.manifest['last_updated']
+        self._pending.append(record)
+
     def _create_empty_manifest(self) -> Dict[str, Any]:
         """Create empty manifest with current schema."""
         return {
@@ -101,7 +172,7 @@ class IngestionManifest:
         """Migrate old manifest schema to current version."""
         logger.info(f"Migrating manifest from v{old_manifest.get('version', '1.0')} to v{self.VERSION}")
 
-        # Handle v1.0 → v2.0 migration
+        # Handle v1.0 → v2.0 migration (statistics are recomputed by _rebuild_indexes)
         if not old_manifest.get('version') or old_manifest.get('version') == "1.0":
             # Add temporal metadata to documents
             for doc_id, doc_meta in old_manifest.get('documents', {}).items():
@@ -147,12 +218,11 @@ class IngestionManifest:
 
     def is_content_duplicate(self, content: str) -> bool:
         """Check if content (by hash) already exists."""
-        content_hash = self.compute_content_hash(content)
+        return self.compute_content_hash(content) in self._hash_index
 
-        for doc_meta in self.manifest['documents'].values():
-            if doc_meta.get('content_hash') == content_hash:
-                return True
-        return False
+    def find_documents_by_hash(self, content_hash: str) -> Set[str]:
+        """Return IDs of documents with the given content hash."""
+        return set(self._hash_index.get(content_hash, ()))
 
     def add_document(
         self,
@@ -171,12 +241,14 @@ class IngestionManifest:
         Returns:
             Document entry that was added
         """
+        metadata = metadata or {}
         content_hash = self.compute_content_hash(content)
 
         # Check for duplicate content with different ID
-        for existing_id, existing_meta in self.manifest['documents'].items():
-            if existing_meta.get('content_hash') == content_hash and existing_id != doc_id:
+        for existing_id in self._hash_index.get(content_hash, ()):
+            if existing_id != doc_id:
                 logger.warning(f"Content duplicate detected: {doc_id} has same content as {existing_id}")
+                break
 
         now = datetime.now(timezone.utc).isoformat()
 
@@ -184,7 +256,7 @@ class IngestionManifest:
             "ingested_at": now,
             "content_hash": content_hash,
             "source_type": metadata.get('source_type', 'unknown'),
-            "metadata": metadata or {}
+            "metadata": metadata
         }
 
         # Add temporal metadata if available
@@ -195,8 +267,14 @@ class IngestionManifest:
         if 'portfolio_relevance' in metadata:
             doc_entry['portfolio_relevance'] = metadata['portfolio_relevance']
 
+        previous = self.manifest['documents'].get(doc_id)
+        if previous is not None:
+            self._unindex_document(doc_id, previous)
+
         self.manifest['documents'][doc_id] = doc_entry
         self.manifest['last_updated'] = now
+        self._index_document(doc_id, doc_entry)
+        self._journal({'op': 'document', 'doc_id': doc_id, 'entry': doc_entry})
 
         # Update statistics
         self._update_statistics()
@@ -241,6 +319,7 @@ class IngestionManifest:
 
         self.manifest['portfolio_history'].append(entry)
         self.manifest['last_updated'] = datetime.now(timezone.utc).isoformat()
+        self._journal({'op': 'portfolio', 'entry': entry})
 
         logger.info(f"Updated portfolio: {holdings}")
 
@@ -259,6 +338,10 @@ class IngestionManifest:
             current = self.manifest['api_data_coverage'][ticker].get(data_type, 0)
             self.manifest['api_data_coverage'][ticker][data_type] = current + count
 
+        # Journal the resulting totals (not the increments) so replay is idempotent
+        self._journal({'op': 'api_coverage', 'ticker': ticker,
+                       'coverage': dict(self.manifest['api_data_coverage'][ticker])})
+
     def get_new_documents(
         self,
         available_docs: List[Dict[str, Any]]
@@ -324,31 +407,56 @@ class IngestionManifest:
 
         return updated_docs
 
+    def _rebuild_indexes(self) -> None:
+        """Build the content-hash index and statistics counters from all documents."""
+        self._hash_index: Dict[str, Set[str]] = defaultdict(set)
+        self._source_counts: Counter = Counter()
+        self._ticker_counts: Counter = Counter()
+        self._tickers_changed = True
+
+        for doc_id, doc_meta in self.manifest['documents'].items():
+            self._index_document(doc_id, doc_meta)
+
+        self.manifest.setdefault('statistics', {})
+        self._update_statistics()
+
+    def _index_document(self, doc_id: str, doc_meta: Dict[str, Any]) -> None:
+        """Add one document to the hash index and counters."""
+        content_hash = doc_meta.get('content_hash')
+        if content_hash:
+            self._hash_index[content_hash].add(doc_id)
+        self._source_counts[doc_meta.get('source_type')] += 1
+        if 'ticker' in doc_meta:
+            self._ticker_counts[doc_meta['ticker']] += 1
+            self._tickers_changed = self._tickers_changed or self._ticker_counts[doc_meta['ticker']] == 1
+
+    def _unindex_document(self, doc_id: str, doc_meta: Dict[str, Any]) -> None:
+        """Remove one document from the hash index and counters."""
+        content_hash = doc_meta.get('content_hash')
+        ids = self._hash_index.get(content_hash)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del self._hash_index[content_hash]
+        self._source_counts[doc_meta.get('source_type')] -= 1
+        if 'ticker' in doc_meta:
+            self._ticker_counts[doc_meta['ticker']] -= 1
+            if self._ticker_counts[doc_meta['ticker']] <= 0:
+                del self._ticker_counts[doc_meta['ticker']]
+                self._tickers_changed = True
+
     def _update_statistics(self) -> None:
-        """Update manifest statistics."""
+        """Update manifest statistics from the incremental counters."""
         stats = self.manifest['statistics']
 
         stats['total_documents'] = len(self.manifest['documents'])
+        stats['total_emails'] = self._source_counts['email']
+        stats['total_api_documents'] = sum(self._source_counts[t] for t in API_SOURCE_TYPES)
 
-        # Count by type
-        email_count = sum(
-            1 for d in self.manifest['documents'].values()
-            if d.get('source_type') == 'email'
-        )
-        api_count = sum(
-            1 for d in self.manifest['documents'].values()
-            if d.get('source_type') in ['api', 'api_news', 'api_financial', 'api_sec']
-        )
-
-        stats['total_emails'] = email_count
-        stats['total_api_documents'] = api_count
-
-        # Unique tickers
-        tickers = set()
-        for doc_meta in self.manifest['documents'].values():
-            if 'ticker' in doc_meta:
-                tickers.add(doc_meta['ticker'])
-        stats['unique_tickers'] = sorted(list(tickers))
+        # Unique tickers (re-sorted only when a ticker appears or disappears)
+        if self._tickers_changed:
+            stats['unique_tickers'] = sorted(self._ticker_counts)
+            self._tickers_changed = False
 
     def _calculate_statistics(self, manifest: Dict) -> Dict[str, Any]:
         """Calculate statistics for migration."""
@@ -360,17 +468,19 @@ class IngestionManifest:
         }
 
     def save(self) -> None:
-        """Save manifest to disk with backup."""
+        """Persist pending changes to the journal, compacting into the snapshot when due."""
         try:
-            # Create backup first
-            if self.manifest_path.exists():
-                import shutil
-                shutil.copy(self.manifest_path, self.backup_path)
-                logger.debug("Created manifest backup")
-
-            # Save manifest
-            with open(self.manifest_path, 'w') as f:
-                json.dump(self.manifest, f, indent=2, default=str)
+            if self._needs_snapshot or not self.manifest_path.exists() or self._journal_due_for_compaction():
+                self.compact()
+                return
+
+            if self._pending:
+                with open(self.journal_path, 'a') as f:
+                    f.writelines(json.dumps(r, separators=(',', ':'), default=str) + '\n' for r in self._pending)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_records += len(self._pending)
+                self._pending = []
 
             logger.info(f"Saved manifest with {len(self.manifest['documents'])} documents")
 
@@ -378,6 +488,33 @@ class IngestionManifest:
             logger.error(f"Failed to save manifest: {e}")
             raise
 
+    def _journal_due_for_compaction(self) -> bool:
+        records = self._journal_records + len(self._pending)
+        return records >= JOURNAL_COMPACTION_MIN_RECORDS and records > len(self.manifest['documents'])
+
+    def compact(self) -> None:
+        """Rewrite the full snapshot (with backup) and truncate the journal."""
+        # Create backup first
+        if self.manifest_path.exists():
+            shutil.copy(self.manifest_path, self.backup_path)
+            logger.debug("Created manifest backup")
+
+        # Atomic snapshot write; journal_seq marks which journal records it already contains
+        tmp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({**self.manifest, 'journal_seq': self._journal_seq}, f, separators=(',', ':'), default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+
+        self.journal_path.unlink(missing_ok=True)
+        self._snapshot_seq = self._journal_seq
+        self._journal_records = 0
+        self._pending = []
+        self._needs_snapshot = False
+
+        logger.info(f"Compacted manifest snapshot with {len(self.manifest['documents'])} documents")
+
     def get_summary(self) -> Dict[str, Any]:
         """Get manifest summary for reporting."""
         return {
@@ -398,6 +535,9 @@ class IngestionManifest:
 
         # Reset manifest
         self.manifest = self._create_empty_manifest()
+        self._rebuild_indexes()
+        self._pending = []
+        self._needs_snapshot = True
 
         # TODO: Implement source scanning logic based on your data directories
         # This would scan:
@@ -3,13 +3,22 @@
 # Why: Enable granular sentence-level traceability for compliance and verification
 # Relevant Files: ice_query_processor.py, src/ice_lightrag/context_parser.py
 
+import os
 import re
 import logging
+from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Persistent chunk embedding cache (retrieved chunks repeat across queries)
+try:
+    from .embedding_cache import ChunkEmbeddingCache
+    EMBEDDING_CACHE_AVAILABLE = True
+except ImportError:
+    EMBEDDING_CACHE_AVAILABLE = False
+
 
 class SentenceAttributor:
     """
@@ -25,18 +34,43 @@ class SentenceAttributor:
     Accuracy: 80-90% (per user acceptance criteria)
     """
 
-    def __init__(self, similarity_threshold: float = 0.70):
+    def __init__(
+        self,
+        similarity_threshold: float = 0.70,
+        cache_dir: Optional[str] = None,
+        cache_max_entries: Optional[int] = None
+    ):
         """
         Initialize sentence attributor.
 
         Args:
             similarity_threshold: Minimum cosine similarity to attribute sentence to chunk
                 Default: 0.70 (balances precision/recall for 80-90% accuracy target)
+            cache_dir: Directory for the chunk embedding cache
+                Default: ICE_EMBEDDING_CACHE_DIR or {ICE_WORKING_DIR}/attribution_embeddings
+            cache_max_entries: Maximum cached chunk embeddings (LRU eviction beyond this)
+                Default: ICE_EMBEDDING_CACHE_MAX_ENTRIES or 20000
         """
         self.similarity_threshold = similarity_threshold
         self._embedding_func = None
+        self._embedding_model = None
         self._initialize_embedding_function()
 
+        self._chunk_cache = None
+        if self._embedding_func and EMBEDDING_CACHE_AVAILABLE and os.getenv('ICE_EMBEDDING_CACHE', 'true').lower() == 'true':
+            cache_dir = cache_dir or os.getenv(
+                'ICE_EMBEDDING_CACHE_DIR',
+                str(Path(os.getenv('ICE_WORKING_DIR', './src/ice_lightrag/storage')) / 'attribution_embeddings')
+            )
+            try:
+                self._chunk_cache = ChunkEmbeddingCache(
+                    cache_dir,
+                    self._embedding_model,
+                    max_entries=cache_max_entries or int(os.getenv('ICE_EMBEDDING_CACHE_MAX_ENTRIES', '20000'))
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Chunk embedding cache disabled: {e}")
+
     def _initialize_embedding_function(self):
         """
         Initialize embedding function (uses same provider as LightRAG for consistency).
@@ -53,6 +87,7 @@ class SentenceAttributor:
             api_key = os.getenv('OPENAI_API_KEY')
             if api_key:
                 self._embedding_func = self._openai_embed
+                self._embedding_model = "text-embedding-3-small"
                 logger.info("Using OpenAI embeddings for sentence attribution")
                 return
         except ImportError:
@@ -63,6 +98,7 @@ class SentenceAttributor:
             from sentence_transformers import SentenceTransformer
             self._model = SentenceTransformer('all-MiniLM-L6-v2')  # 384-dim, fast
             self._embedding_func = self._local_embed
+            self._embedding_model = "all-MiniLM-L6-v2"
             logger.info("Using local embeddings (sentence-transformers) for sentence attribution")
         except ImportError:
             logger.warning("No embedding provider available for sentence attribution")
@@ -103,6 +139,26 @@ class SentenceAttributor:
         """
         return self._model.encode(texts, convert_to_numpy=True)
 
+    def _embed_chunks(self, chunk_texts: List[str]) -> np.ndarray:
+        """
+        Embed prepared chunk texts, reusing cached embeddings and batch-embedding only misses.
+
+        Args:
+            chunk_texts: Output of _prepare_chunk_for_embedding() per chunk
+
+        Returns:
+            numpy array of shape (len(chunk_texts), dim)
+        """
+        if self._chunk_cache is None:
+            return self._embedding_func(chunk_texts)
+        return self._chunk_cache.get_or_embed(chunk_texts, self._embedding_func)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Chunk embedding cache hit/miss statistics ({"enabled": False} when disabled)."""
+        if self._chunk_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._chunk_cache.get_stats()}
+
     def attribute_sentences(
         self,
         answer: str,
@@ -161,7 +217,7 @@ class SentenceAttributor:
             # TIER 2: Preprocess chunks to expand structured markers before embedding
             # This improves semantic matching between markers and natural language answers
             chunk_texts = [self._prepare_chunk_for_embedding(c.get('content', '')[:500]) for c in chunks]
-            chunk_embeddings = self._embedding_func(chunk_texts)
+            chunk_embeddings = self._embed_chunks(chunk_texts)
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}")
             return self._fallback_attribution(answer)
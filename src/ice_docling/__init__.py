@@ -14,6 +14,10 @@ Provides docling-based document processing for:
 Switchable architecture via config.py toggles:
 - USE_DOCLING_SEC (default: true)
 - USE_DOCLING_EMAIL (default: true)
+
+Conversions run in a shared worker pool (conversion_service.py):
+- DOCLING_WORKERS (default: min(4, CPU count); 0 = in-process)
+- DOCLING_CACHE_DIR (default: ~/.ice/docling_cache)
 """
 
 __version__ = '1.0.0'
@@ -0,0 +1,280 @@
+# Location: src/ice_docling/conversion_service.py
+# Purpose: Shared Docling conversion worker pool with a content-hash result cache
+# Why: Conversions ran synchronously on the caller thread (and inside the async link downloader),
+#      so a backlog of broker PDFs converted one at a time on one core
+# Relevant Files: docling_processor.py, sec_filing_processor.py, intelligent_link_processor.py, config.py
+
+"""
+Docling Conversion Service
+
+One process pool per interpreter, shared by email attachments (DoclingProcessor),
+URL PDFs (IntelligentLinkProcessor) and SEC filings (SECFilingProcessor):
+
+- Each worker builds its DocumentConverter once (pool initializer), so layout/table
+  models are loaded once per worker instead of once per processor instance
+- submit() returns a concurrent.futures.Future; convert() blocks, aconvert() awaits
+- Results are cached on disk by SHA256 of the document bytes, so the same PDF
+  attached to several emails, linked from a URL, or re-ingested is converted once
+- Identical documents submitted while a conversion is in flight share one future
+
+Configuration (same variables as ICEConfig):
+- DOCLING_WORKERS: worker processes (default min(4, CPU count); 0 = convert in-process on one thread)
+- DOCLING_CACHE_DIR: cache root (default ~/.ice/docling_cache)
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import threading
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached result format changes
+CONVERSION_CACHE_VERSION = 1
+
+# Per-process converter (warm-loaded by the pool initializer)
+_worker_converter = None
+
+
+def _init_worker():
+    """Pool initializer: load docling models once per worker process"""
+    global _worker_converter
+    if _worker_converter is None:
+        from docling.document_converter import DocumentConverter
+        _worker_converter = DocumentConverter()
+
+
+def extract_tables(result) -> List[Dict[str, Any]]:
+    """
+    Extract tables from a docling ConversionResult as JSON-serializable dicts
+
+    Each table is exported via TableFormer to a pandas DataFrame:
+    {'index', 'data' (records), 'num_rows', 'num_cols', 'markdown' (optional), 'error'}
+    """
+    tables = []
+
+    # Access docling's detected tables
+    if not hasattr(result, 'document'):
+        logger.warning("Result has no 'document' attribute, cannot extract tables")
+        return tables
+
+    if not hasattr(result.document, 'tables'):
+        logger.warning("Document has no 'tables' attribute, cannot extract tables")
+        return tables
+
+    for table_ix, table in enumerate(result.document.tables):
+        try:
+            # Pass doc argument to avoid deprecation warning (as of docling 1.7+)
+            table_df = table.export_to_dataframe(doc=result.document)
+
+            table_data = {
+                'index': table_ix,
+                'data': table_df.to_dict(orient='records'),  # List of row dicts
+                'num_rows': len(table_df),
+                'num_cols': len(table_df.columns),
+                'error': None
+            }
+
+            # Add markdown preview for debugging/logging
+            try:
+                table_data['markdown'] = table_df.to_markdown(index=False)
+            except Exception:
+                pass  # Markdown conversion optional, don't fail on error
+
+            tables.append(table_data)
+
+            logger.debug(
+                f"Extracted table {table_ix}: {table_data['num_rows']} rows, "
+                f"{table_data['num_cols']} cols"
+            )
+
+        except Exception as e:
+            # Log error but continue processing other tables
+            logger.error(f"Failed to extract table {table_ix}: {e}")
+            tables.append({
+                'index': table_ix,
+                'data': [],
+                'num_rows': 0,
+                'num_cols': 0,
+                'error': str(e)
+            })
+
+    logger.info(f"Extracted {len(tables)} table(s) from document")
+    return tables
+
+
+def convert_document(content: bytes, filename: str) -> Dict[str, Any]:
+    """
+    Convert document bytes with this process's converter (runs inside pool workers)
+
+    Returns:
+        {'text': markdown, 'tables': [...], 'page_count': int}
+    """
+    _init_worker()
+    from docling_core.types.io import DocumentStream
+
+    result = _worker_converter.convert(DocumentStream(name=filename, stream=BytesIO(content)))
+
+    page_count = getattr(result.document, 'num_pages', 1)
+    if callable(page_count):
+        page_count = page_count()
+
+    return {
+        'text': result.document.export_to_markdown(),
+        'tables': extract_tables(result),
+        'page_count': page_count
+    }
+
+
+class DoclingConversionService:
+    """
+    Docling conversion pool with submit/future API and content-hash result cache
+
+    Usage:
+        service = get_conversion_service()
+        future = service.submit(pdf_bytes, "broker_note.pdf")   # non-blocking
+        result = service.convert(pdf_bytes, "broker_note.pdf")  # blocking
+        result = await service.aconvert(pdf_bytes, "broker_note.pdf")
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cache_dir: Optional[str] = None):
+        """
+        Args:
+            max_workers: Worker processes (default: DOCLING_WORKERS or min(4, CPU count))
+                         0 converts in-process on a single background thread
+            cache_dir: Cache root (default: DOCLING_CACHE_DIR or ~/.ice/docling_cache)
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv('DOCLING_WORKERS', str(min(4, os.cpu_count() or 1))))
+        self.max_workers = max_workers
+
+        cache_root = cache_dir or os.getenv('DOCLING_CACHE_DIR', str(Path.home() / '.ice' / 'docling_cache'))
+        self.cache_dir = Path(cache_root) / f'conversions_v{CONVERSION_CACHE_VERSION}'
+
+        self._executor = None
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'submitted': 0, 'cache_hits': 0, 'converted': 0, 'failed': 0}
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """SHA256 of document bytes (cache key)"""
+        return hashlib.sha256(content).hexdigest()
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def _load_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._cache_path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable docling cache entry {path.name}: {e}")
+            return None
+
+    def _store_cached(self, key: str, result: Dict[str, Any]):
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache docling result {key[:12]}: {e}")
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.max_workers > 0:
+                # spawn, not fork: the parent holds event-loop threads and SQLite connections
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+                logger.info(f"🔄 Docling conversion pool started ({self.max_workers} workers)")
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='docling')
+        return self._executor
+
+    def _on_done(self, key: str, future: Future):
+        error = future.exception()
+        if error is None:
+            # Cache before leaving the in-flight table so a concurrent submit finds one or the other
+            self._store_cached(key, future.result())
+
+        with self._lock:
+            self._inflight.pop(key, None)
+            self.stats['failed' if error else 'converted'] += 1
+            if isinstance(error, BrokenProcessPool):
+                # A worker died (e.g. OOM on a huge PDF) - start a fresh pool on next submit
+                self._executor = None
+
+    def submit(self, content: bytes, filename: str) -> Future:
+        """
+        Schedule a conversion; returns a Future resolving to {'text', 'tables', 'page_count', 'cached'?}
+
+        Cache hits resolve immediately with 'cached': True.
+        """
+        key = self.content_hash(content)
+        with self._lock:
+            self.stats['submitted'] += 1
+
+        cached = self._load_cached(key)
+        if cached is not None:
+            with self._lock:
+                self.stats['cache_hits'] += 1
+            future = Future()
+            future.set_result({**cached, 'cached': True})
+            return future
+
+        with self._lock:
+            future = self._inflight.get(key)
+            # A failed future may linger until its done-callback runs - retry rather than reuse it
+            if future is not None and not (future.done() and future.exception() is not None):
+                return future
+            try:
+                future = self._get_executor().submit(convert_document, content, filename)
+            except BrokenProcessPool:
+                self._executor = None
+                future = self._get_executor().submit(convert_document, content, filename)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda f: self._on_done(key, f))
+        return future
+
+    def convert(self, content: bytes, filename: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Blocking conversion (raises the worker's exception on failure)"""
+        return self.submit(content, filename).result(timeout=timeout)
+
+    async def aconvert(self, content: bytes, filename: str) -> Dict[str, Any]:
+        """Awaitable conversion - the event loop keeps running while workers convert"""
+        return await asyncio.wrap_future(self.submit(content, filename))
+
+    def shutdown(self, wait: bool = True):
+        """Stop worker processes (a new pool starts on the next submit)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_service: Optional[DoclingConversionService] = None
+_service_lock = threading.Lock()
+
+
+def get_conversion_service() -> DoclingConversionService:
+    """Process-wide shared conversion service (one worker pool and cache for all processors)"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = DoclingConversionService()
+        return _service
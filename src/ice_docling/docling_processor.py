@@ -25,13 +25,18 @@ Design Decisions:
 - API compatibility: Same signature as AttachmentProcessor
 - Storage compatibility: Exact same directory structure
 - Error handling: Clear messages with actionable solutions
+- Conversion: Shared DoclingConversionService worker pool + content-hash cache
+  (process_attachments() converts a batch across all workers)
 """
 
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Union
 import hashlib
 import logging
 
+from .conversion_service import DoclingConversionService, extract_tables, get_conversion_service
+
 class DoclingProcessor:
     """
     Email attachment processor using docling
@@ -43,7 +48,8 @@ class DoclingProcessor:
     - Same storage path structure
     """
 
-    def __init__(self, storage_path: str = "./data/attachments"):
+    def __init__(self, storage_path: str = "./data/attachments",
+                 conversion_service: Optional[DoclingConversionService] = None):
         """
         Initialize docling processor
 
@@ -52,17 +58,20 @@ class DoclingProcessor:
                          MUST match AttachmentProcessor for compatibility
                          Example: "data/attachments"
                          Default: "./data/attachments" (matches AttachmentProcessor)
+            conversion_service: Docling worker pool (default: process-wide shared service,
+                                so attachments, URL PDFs and SEC filings share workers and cache)
         """
-        # Initialize docling converter
+        # Verify docling is installed (models are loaded in the conversion workers)
         try:
-            from docling.document_converter import DocumentConverter
-            self.converter = DocumentConverter()
+            import docling.document_converter  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "Docling not installed. Install with: pip install docling\n"
                 "Or run: python scripts/download_docling_models.py"
             ) from e
 
+        self.conversion_service = conversion_service or get_conversion_service()
+
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
@@ -96,21 +105,45 @@ class DoclingProcessor:
                 'extracted_text': str,
                 'extracted_data': dict,  # {'tables': [...]}
                 'page_count': int,
+                'cached': bool,  # True when the conversion came from the content-hash cache
                 'error': str | None
             }
         """
+        return self._finish_attachment(*self._submit_attachment(attachment_data, email_uid))
+
+    def process_attachments(self, attachments: List[Tuple[Dict[str, Any], str]]) -> List[Dict[str, Any]]:
+        """
+        Process several attachments, converting them concurrently across the worker pool
+
+        Args:
+            attachments: List of (attachment_data, email_uid) pairs (see process_attachment)
+
+        Returns:
+            One process_attachment()-style result dict per input, in input order
+        """
+        submitted = [self._submit_attachment(data, uid) for data, uid in attachments]
+        return [self._finish_attachment(*item) for item in submitted]
+
+    def _submit_attachment(self, attachment_data: Dict[str, Any],
+                           email_uid: str) -> Tuple[Dict[str, Any], Union[Future, Dict[str, Any]]]:
+        """
+        Validate and store the original, then schedule its conversion
+
+        Returns:
+            (context, Future) on success, or (context, failure result dict)
+        """
         try:
             # 1. Extract and validate content (match AttachmentProcessor logic)
             content = attachment_data['part'].get_payload(decode=True)
             if not content:
-                return {
+                return {}, {
                     'error': 'No content in attachment',
                     'processing_status': 'failed',
                     'filename': attachment_data.get('filename', 'unknown')
                 }
 
             if len(content) > self.max_file_size:
-                return {
+                return {}, {
                     'error': f'File too large: {len(content)} bytes (max: {self.max_file_size})',
                     'filename': attachment_data['filename'],
                     'file_size': len(content),
@@ -131,23 +164,48 @@ class DoclingProcessor:
             original_path.write_bytes(content)
             self.logger.debug(f"Saved original: {original_path}")
 
-            # 5. Convert with docling
-            try:
-                # Log processing start for large files
-                if len(content) > 1024 * 1024:  # > 1MB
-                    self.logger.info(f"🔄 Processing large file ({len(content) / (1024 * 1024):.1f}MB): {attachment_data['filename']}")
+            # 5. Schedule docling conversion on the worker pool
+            # Log processing start for large files
+            if len(content) > 1024 * 1024:  # > 1MB
+                self.logger.info(f"🔄 Processing large file ({len(content) / (1024 * 1024):.1f}MB): {attachment_data['filename']}")
 
-                result = self.converter.convert(str(original_path))
-                text = result.document.export_to_markdown()
+            context = {
+                'attachment_data': attachment_data,
+                'file_hash': file_hash,
+                'file_size': len(content),
+                'storage_dir': storage_dir
+            }
+            return context, self.conversion_service.submit(content, attachment_data['filename'])
 
-                # Extract tables (docling-specific)
-                tables = self._extract_tables(result)
+        except Exception as e:
+            # Catch-all error handling
+            self.logger.error(f"Unexpected error processing {attachment_data.get('filename')}: {e}")
+            return {}, {
+                'error': f'Processing error: {str(e)}',
+                'filename': attachment_data.get('filename', 'unknown'),
+                'processing_status': 'failed'
+            }
+
+    def _finish_attachment(self, context: Dict[str, Any], pending: Union[Future, Dict[str, Any]]) -> Dict[str, Any]:
+        """Wait for a scheduled conversion and build the AttachmentProcessor-compatible result"""
+        if isinstance(pending, dict):
+            return pending  # Failed before conversion
 
-                page_count = getattr(result.document, 'num_pages', 1)
+        attachment_data = context['attachment_data']
+        storage_dir = context['storage_dir']
+
+        try:
+            try:
+                conversion = pending.result()
+                text = conversion['text']
+                tables = conversion['tables']
+                page_count = conversion['page_count']
 
                 # Enhanced logging with more context
                 log_msg = f"✅ Docling conversion: {attachment_data['filename']}, "
                 log_msg += f"{len(text)} chars, {len(tables)} tables, {page_count} pages"
+                if conversion.get('cached'):
+                    log_msg += " (cached)"
 
                 # Add warnings for potentially concerning scenarios
                 if len(tables) == 0 and 'financial' in attachment_data['filename'].lower():
@@ -209,15 +267,16 @@ class DoclingProcessor:
             # 7. Build result dict (API-compatible with AttachmentProcessor)
             return {
                 'filename': attachment_data['filename'],
-                'file_hash': file_hash,
+                'file_hash': context['file_hash'],
                 'mime_type': attachment_data.get('content_type', 'application/octet-stream'),
-                'file_size': len(content),
+                'file_size': context['file_size'],
                 'storage_path': str(storage_dir),
                 'processing_status': 'completed',
                 'extraction_method': 'docling',  # Identifies processor used (vs 'pypdf2')
                 'extracted_text': text,
                 'extracted_data': {'tables': tables},  # Match AttachmentProcessor format
                 'page_count': page_count,
+                'cached': bool(conversion.get('cached')),
                 'error': None
             }
 
@@ -250,196 +309,129 @@ class DoclingProcessor:
                 'extraction_method': 'docling',
                 'page_count': int,
                 'processing_status': 'completed' | 'failed',
+                'cached': bool,
                 'error': str | None
             }
 
         Reference:
             Official BytesIO API: https://github.com/docling-project/docling/blob/main/docling/document_converter.py#L278-303
         """
+        invalid = self._validate_pdf_bytes(pdf_bytes, filename)
+        if invalid:
+            return invalid
         try:
-            # 1. Validate input
-            if not pdf_bytes or len(pdf_bytes) < 1024:  # Minimum valid PDF size
-                return {
-                    'error': f'Invalid PDF content for {filename} (size: {len(pdf_bytes)} bytes, minimum: 1024)',
-                    'filename': filename,
-                    'processing_status': 'failed'
-                }
-
-            if len(pdf_bytes) > self.max_file_size:
-                return {
-                    'error': f'File too large: {len(pdf_bytes)} bytes (max: {self.max_file_size})',
-                    'filename': filename,
-                    'file_size': len(pdf_bytes),
-                    'processing_status': 'failed'
-                }
-
-            # 2. Create BytesIO stream + DocumentStream (official API)
-            from io import BytesIO
-            from docling_core.types.io import DocumentStream
-
-            buffer = BytesIO(pdf_bytes)
-            doc_stream = DocumentStream(
-                name=filename,      # Filename for identification
-                stream=buffer       # Byte stream content
-            )
-
-            # 3. Convert with docling (same API as file path approach)
-            try:
-                # Log processing start for large files
-                if len(pdf_bytes) > 1024 * 1024:  # > 1MB
-                    self.logger.info(f"🔄 Processing large URL PDF ({len(pdf_bytes) / (1024 * 1024):.1f}MB): {filename}")
-
-                result = self.converter.convert(doc_stream)
-                text = result.document.export_to_markdown()
-
-                # Extract tables (reuse existing method)
-                tables = self._extract_tables(result)
-
-                page_count = getattr(result.document, 'num_pages', 1)
-
-                # Enhanced logging with more context
-                log_msg = f"✅ Docling conversion from bytes: {filename}, "
-                log_msg += f"{len(text)} chars, {len(tables)} tables, {page_count} pages"
+            conversion = self.conversion_service.convert(pdf_bytes, filename)
+        except Exception as e:
+            return self._pdf_bytes_error(filename, e)
+        return self._pdf_bytes_result(filename, conversion)
 
-                # Add warnings for potentially concerning scenarios
-                if len(tables) == 0 and ('financial' in filename.lower() or 'earning' in filename.lower()):
-                    log_msg += " ⚠️ No tables extracted from financial document"
-                if len(text) < 100:
-                    log_msg += " ⚠️ Very little text extracted"
+    async def aprocess_pdf_bytes(self, pdf_bytes: bytes, filename: str) -> Dict[str, Any]:
+        """
+        Async process_pdf_bytes() - awaits the worker pool instead of blocking the event loop
 
-                self.logger.info(log_msg)
+        Used by IntelligentLinkProcessor so URL downloads keep flowing while PDFs convert.
+        """
+        invalid = self._validate_pdf_bytes(pdf_bytes, filename)
+        if invalid:
+            return invalid
+        try:
+            conversion = await self.conversion_service.aconvert(pdf_bytes, filename)
+        except Exception as e:
+            return self._pdf_bytes_error(filename, e)
+        return self._pdf_bytes_result(filename, conversion)
 
-            except ImportError as e:
-                # Specific error for missing Docling installation
-                self.logger.error(f"❌ Docling not properly installed: {e}")
-                return {
-                    'error': (
-                        f"❌ Docling installation issue for {filename}\n"
-                        f"Reason: {str(e)}\n"
-                        f"Solutions:\n"
-                        f"  1. Install: pip install docling docling-core\n"
-                        f"  2. Run: python scripts/download_docling_models.py\n"
-                        f"  3. Fallback: export USE_DOCLING_URLS=false"
-                    ),
-                    'filename': filename,
-                    'processing_status': 'failed'
-                }
-            except Exception as e:
-                # Generic docling conversion error with detailed context
-                self.logger.error(f"❌ Docling conversion failed for {filename}: {e}", exc_info=True)
-                return {
-                    'error': (
-                        f"❌ Docling processing failed for {filename}\n"
-                        f"Error type: {type(e).__name__}\n"
-                        f"Reason: {str(e)}\n"
-                        f"Solutions:\n"
-                        f"  1. Check PDF format compatibility\n"
-                        f"  2. Try fallback: export USE_DOCLING_URLS=false (to use pdfplumber)\n"
-                        f"  3. Report issue with URL and error details"
-                    ),
-                    'filename': filename,
-                    'processing_status': 'failed'
-                }
+    def _validate_pdf_bytes(self, pdf_bytes: bytes, filename: str) -> Optional[Dict[str, Any]]:
+        """Failure result for empty/oversized PDF bytes, None if valid"""
+        if not pdf_bytes or len(pdf_bytes) < 1024:  # Minimum valid PDF size
+            return {
+                'error': f'Invalid PDF content for {filename} (size: {len(pdf_bytes or b"")} bytes, minimum: 1024)',
+                'filename': filename,
+                'processing_status': 'failed'
+            }
 
-            # 4. Return result (API-compatible format)
+        if len(pdf_bytes) > self.max_file_size:
             return {
+                'error': f'File too large: {len(pdf_bytes)} bytes (max: {self.max_file_size})',
                 'filename': filename,
-                'extracted_text': text,
-                'extracted_data': {'tables': tables},
-                'extraction_method': 'docling',
-                'page_count': page_count,
-                'processing_status': 'completed',
-                'error': None
+                'file_size': len(pdf_bytes),
+                'processing_status': 'failed'
             }
 
-        except Exception as e:
-            # Catch-all error handling
-            self.logger.error(f"Unexpected error processing PDF bytes for {filename}: {e}")
+        # Log processing start for large files
+        if len(pdf_bytes) > 1024 * 1024:  # > 1MB
+            self.logger.info(f"🔄 Processing large URL PDF ({len(pdf_bytes) / (1024 * 1024):.1f}MB): {filename}")
+        return None
+
+    def _pdf_bytes_result(self, filename: str, conversion: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the API-compatible result for a completed URL PDF conversion"""
+        text = conversion['text']
+        tables = conversion['tables']
+        page_count = conversion['page_count']
+
+        # Enhanced logging with more context
+        log_msg = f"✅ Docling conversion from bytes: {filename}, "
+        log_msg += f"{len(text)} chars, {len(tables)} tables, {page_count} pages"
+        if conversion.get('cached'):
+            log_msg += " (cached)"
+
+        # Add warnings for potentially concerning scenarios
+        if len(tables) == 0 and ('financial' in filename.lower() or 'earning' in filename.lower()):
+            log_msg += " ⚠️ No tables extracted from financial document"
+        if len(text) < 100:
+            log_msg += " ⚠️ Very little text extracted"
+
+        self.logger.info(log_msg)
+
+        return {
+            'filename': filename,
+            'extracted_text': text,
+            'extracted_data': {'tables': tables},
+            'extraction_method': 'docling',
+            'page_count': page_count,
+            'processing_status': 'completed',
+            'cached': bool(conversion.get('cached')),
+            'error': None
+        }
+
+    def _pdf_bytes_error(self, filename: str, e: Exception) -> Dict[str, Any]:
+        """Failure result for a URL PDF conversion error"""
+        if isinstance(e, ImportError):
+            # Specific error for missing Docling installation
+            self.logger.error(f"❌ Docling not properly installed: {e}")
             return {
-                'error': f'Processing error: {str(e)}',
+                'error': (
+                    f"❌ Docling installation issue for {filename}\n"
+                    f"Reason: {str(e)}\n"
+                    f"Solutions:\n"
+                    f"  1. Install: pip install docling docling-core\n"
+                    f"  2. Run: python scripts/download_docling_models.py\n"
+                    f"  3. Fallback: export USE_DOCLING_URLS=false"
+                ),
                 'filename': filename,
                 'processing_status': 'failed'
             }
 
+        # Generic docling conversion error with detailed context
+        self.logger.error(f"❌ Docling conversion failed for {filename}: {e}", exc_info=True)
+        return {
+            'error': (
+                f"❌ Docling processing failed for {filename}\n"
+                f"Error type: {type(e).__name__}\n"
+                f"Reason: {str(e)}\n"
+                f"Solutions:\n"
+                f"  1. Check PDF format compatibility\n"
+                f"  2. Try fallback: export USE_DOCLING_URLS=false (to use pdfplumber)\n"
+                f"  3. Report issue with URL and error details"
+            ),
+            'filename': filename,
+            'processing_status': 'failed'
+        }
+
     def _extract_tables(self, result) -> List[Dict[str, Any]]:
         """
         Extract tables from docling result using AI-powered table detection
-        
-        Docling provides professional-grade table extraction via TableFormer model.
-        Each table is converted to pandas DataFrame for structured access.
-        
-        Args:
-            result: Docling ConversionResult object with document attribute
-        
-        Returns:
-            List of table dictionaries:
-            [
-                {
-                    'index': 0,
-                    'data': pd.DataFrame as dict (orient='records'),
-                    'num_rows': int,
-                    'num_cols': int,
-                    'markdown': str (optional table preview),
-                    'error': None | str (if export failed)
-                },
-                ...
-            ]
-        
-        Reference: 
-        - Official example: https://github.com/docling-project/docling/blob/main/docs/examples/export_tables.py
-        - API: table.export_to_dataframe(doc=document) returns pandas DataFrame
+
+        Delegates to conversion_service.extract_tables (runs inside the conversion workers).
+        Kept for callers holding a ConversionResult directly.
         """
-        tables = []
-        
-        # Access docling's detected tables
-        if not hasattr(result, 'document'):
-            self.logger.warning("Result has no 'document' attribute, cannot extract tables")
-            return tables
-        
-        if not hasattr(result.document, 'tables'):
-            self.logger.warning("Document has no 'tables' attribute, cannot extract tables")
-            return tables
-        
-        # Iterate through detected tables
-        for table_ix, table in enumerate(result.document.tables):
-            try:
-                # Export to pandas DataFrame (official docling API)
-                # Pass doc argument to avoid deprecation warning (as of docling 1.7+)
-                # This leverages TableFormer AI model for structure recognition
-                table_df = table.export_to_dataframe(doc=result.document)
-                
-                # Convert DataFrame to structured dict
-                table_data = {
-                    'index': table_ix,
-                    'data': table_df.to_dict(orient='records'),  # List of row dicts
-                    'num_rows': len(table_df),
-                    'num_cols': len(table_df.columns),
-                    'error': None
-                }
-                
-                # Add markdown preview for debugging/logging
-                try:
-                    table_data['markdown'] = table_df.to_markdown(index=False)
-                except:
-                    pass  # Markdown conversion optional, don't fail on error
-                
-                tables.append(table_data)
-                
-                self.logger.debug(
-                    f"Extracted table {table_ix}: {table_data['num_rows']} rows, "
-                    f"{table_data['num_cols']} cols"
-                )
-                
-            except Exception as e:
-                # Log error but continue processing other tables
-                self.logger.error(f"Failed to extract table {table_ix}: {e}")
-                tables.append({
-                    'index': table_ix,
-                    'data': [],
-                    'num_rows': 0,
-                    'num_cols': 0,
-                    'error': str(e)
-                })
-        
-        self.logger.info(f"Extracted {len(tables)} table(s) from document")
-        return tables
+        return extract_tables(result)
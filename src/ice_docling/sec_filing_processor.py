@@ -29,14 +29,15 @@ Business Value:
 - 100% holdings coverage (vs 4% for email attachments)
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
-import asyncio
 
 # Standard library for file operations
 import hashlib
 
+from .conversion_service import DoclingConversionService, get_conversion_service
+
 class SECFilingProcessor:
     """
     SEC filing content extractor - matches email pipeline architecture
@@ -51,7 +52,8 @@ class SECFilingProcessor:
                  entity_extractor=None,
                  graph_builder=None,
                  robust_client=None,
-                 sec_connector=None):
+                 sec_connector=None,
+                 conversion_service: Optional[DoclingConversionService] = None):
         """
         Initialize SEC filing processor
 
@@ -61,16 +63,17 @@ class SECFilingProcessor:
             graph_builder: GraphBuilder instance (for typed relationships)
             robust_client: RobustHTTPClient instance (circuit breaker + retry)
             sec_connector: SECEdgarConnector instance (for CIK lookup, rate limiting)
+            conversion_service: Docling worker pool (default: process-wide shared service)
         """
-        # Initialize docling converter
+        # Verify docling is installed (models are loaded in the conversion workers)
         try:
-            from docling.document_converter import DocumentConverter
-            self.converter = DocumentConverter()
+            import docling.document_converter  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "Docling not installed. Install with: pip install docling\n"
                 "Or run: python scripts/download_docling_models.py"
             ) from e
+        self.conversion_service = conversion_service or get_conversion_service()
 
         # Cache directory for downloaded filings
         self.cache_dir = cache_dir or (Path.home() / '.ice' / 'sec_cache')
@@ -210,15 +213,16 @@ class SECFilingProcessor:
         # Download filing (with caching)
         filing_path = self._download_filing(accession, doc, ticker)
 
-        # Convert with docling
+        # Convert with docling (worker pool; re-extracting a cached filing hits the conversion cache)
         try:
-            result = self.converter.convert(str(filing_path))
-            text = result.document.export_to_markdown()
-
-            # Extract tables (docling-specific)
-            tables = self._extract_tables(result)
+            conversion = self.conversion_service.convert(filing_path.read_bytes(), filing_path.name)
+            text = conversion['text']
+            tables = conversion['tables']
 
-            self.logger.info(f"Docling extraction complete: {len(text)} chars, {len(tables)} tables")
+            self.logger.info(
+                f"Docling extraction complete: {len(text)} chars, {len(tables)} tables"
+                + (" (cached)" if conversion.get('cached') else "")
+            )
 
             return {
                 'text': text,
@@ -249,13 +253,9 @@ class SECFilingProcessor:
 
         # Get CIK from ticker (use existing SEC connector method)
         if self.sec_connector:
-            # Call async method synchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                cik = loop.run_until_complete(self.sec_connector.get_cik_by_ticker(ticker))
-            finally:
-                loop.close()
+            # Call async method synchronously on the connectors' shared loop
+            from ice_data_ingestion.async_http import run_sync
+            cik = run_sync(self.sec_connector.get_cik_by_ticker(ticker))
         else:
             raise ValueError(
                 f"Cannot download filing without SEC connector (need CIK for {ticker})\n"
@@ -297,11 +297,3 @@ class SECFilingProcessor:
         self.logger.info(f"Cached SEC filing: {cache_key} ({len(content)} bytes)")
 
         return cache_path
-
-    def _extract_tables(self, result) -> List[Dict[str, Any]]:
-        """Extract tables from docling result"""
-        tables = []
-        # TODO: Implement docling-specific table extraction
-        # Docling provides table detection and extraction APIs
-        # For MVP: Return empty list, enhance in future iterations
-        return tables
@@ -12,8 +12,10 @@ import os
 import sys
 import asyncio
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from dotenv import load_dotenv
 
 # Add project root to path for SecureConfig import
@@ -37,10 +39,14 @@ except ImportError:
 
 try:
     from lightrag import LightRAG, QueryParam
+    from lightrag.utils import compute_mdhash_id
     # Model provider imports moved to model_provider.py factory
     LIGHTRAG_AVAILABLE = True
+    # LightRAG 1.5+ builds per-role LLM queues from llm_model_func in __post_init__
+    LIGHTRAG_ROLE_QUEUES = "role_llm_configs" in getattr(LightRAG, "__dataclass_fields__", {})
 except ImportError:
     LIGHTRAG_AVAILABLE = False
+    LIGHTRAG_ROLE_QUEUES = False
 
 # Import model provider factory for Ollama/OpenAI selection
 try:
@@ -63,6 +69,47 @@ except ImportError:
     CONTEXT_PARSER_AVAILABLE = False
     logger.warning("Context parser not available")
 
+# Import memory-mapped vector storage backend (replaces JSON nano-vectordb files)
+try:
+    from .mmap_vector_storage import MMAP_VECTOR_STORAGE_NAME, register_mmap_vector_storage
+    MMAP_VECTOR_STORAGE_AVAILABLE = True
+except ImportError:
+    MMAP_VECTOR_STORAGE_AVAILABLE = False
+    logger.warning("Memory-mapped vector storage not available")
+
+# Import persistent query-result cache (invalidated on every successful insert)
+try:
+    from .query_cache import QueryResultCache
+    QUERY_CACHE_AVAILABLE = True
+except ImportError:
+    QUERY_CACHE_AVAILABLE = False
+    logger.warning("Query result cache not available")
+
+# doc_status values after which LightRAG no longer touches a document
+_FINAL_DOC_STATUSES = ("processed", "failed")
+_DOC_STATUS_POLL_SECONDS = 0.5
+
+# Model kwargs (temperature, seed, ...) for LLM calls made from the current task.
+# Task-local, so extraction and query traffic can share one LightRAG instance.
+_llm_call_kwargs: ContextVar[Optional[Dict[str, Any]]] = ContextVar("ice_llm_call_kwargs", default=None)
+
+
+def _with_call_kwargs(llm_func: Callable) -> Callable:
+    """
+    Wrap an LLM function so per-call kwargs are resolved from the caller's context
+
+    The kwargs override the llm_model_kwargs bound at LightRAG init. On v1.4.x the queued
+    llm_model_func is wrapped, because its shared worker tasks do not see the caller's
+    context variables; on 1.5+ the raw function is wrapped before the role queues are built.
+    """
+    async def llm_model_func(*args, **kwargs):
+        call_kwargs = _llm_call_kwargs.get()
+        if call_kwargs:
+            kwargs = {**call_kwargs, **kwargs}
+        return await llm_func(*args, **kwargs)
+
+    return llm_model_func
+
 
 class JupyterICERAG:
     """
@@ -95,13 +142,31 @@ class JupyterICERAG:
         # Initialize context parser for structured attribution (Phase 2)
         self._context_parser = LightRAGContextParser() if CONTEXT_PARSER_AVAILABLE else None
 
+        # Query-result cache keyed on the graph version (bumped after every successful insert)
+        self._query_cache = None
+        if QUERY_CACHE_AVAILABLE and self.config["query_cache"]:
+            try:
+                self._query_cache = QueryResultCache(
+                    self.working_dir / "query_cache.sqlite",
+                    max_entries=self.config["query_cache_max_entries"],
+                    ttl_seconds=self.config["query_cache_ttl"]
+                )
+            except Exception as e:
+                logger.warning(f"Query cache disabled: {e}")
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from environment and defaults"""
         return {
             "working_dir": os.getenv("ICE_WORKING_DIR", "./src/ice_lightrag/storage"),
             "batch_size": int(os.getenv("ICE_BATCH_SIZE", "5")),
+            "max_concurrent_queries": int(os.getenv("ICE_MAX_CONCURRENT_QUERIES", "3")),
             "timeout": int(os.getenv("ICE_TIMEOUT", "30")),
-            "retry_attempts": int(os.getenv("ICE_RETRY_ATTEMPTS", "3"))
+            "retry_attempts": int(os.getenv("ICE_RETRY_ATTEMPTS", "3")),
+            # ICEMmapVectorDBStorage (memory-mapped float32) or any LightRAG backend, e.g. NanoVectorDBStorage
+            "vector_storage": os.getenv("ICE_VECTOR_STORAGE", "ICEMmapVectorDBStorage"),
+            "query_cache": os.getenv("ICE_QUERY_CACHE", "true").lower() == "true",
+            "query_cache_ttl": int(os.getenv("ICE_QUERY_CACHE_TTL", "86400")),
+            "query_cache_max_entries": int(os.getenv("ICE_QUERY_CACHE_MAX_ENTRIES", "1000"))
         }
 
     def _detect_environment(self):
@@ -121,43 +186,34 @@ class JupyterICERAG:
             self._is_jupyter = False
             self._loop = None
 
-    def _set_operation_temperature(self, temperature: float):
+    @contextmanager
+    def _operation_temperature(self, temperature: float):
         """
-        Dynamically set operation-specific temperature for next LLM call
+        Use an operation-specific temperature for LLM calls made inside this block
 
-        LightRAG v1.4.9 wraps llm_model_func during initialization:
+        LightRAG v1.4.9 binds llm_model_kwargs once during initialization:
         ```python
         self.llm_model_func = priority_limit_async_func_call(...)(
             partial(self.llm_model_func, hashing_kv=hashing_kv, **self.llm_model_kwargs)
         )
         ```
 
-        This means llm_model_func already includes:
-        - hashing_kv binding (for LLM response caching)
-        - **llm_model_kwargs binding (temperature, seed, etc.)
-        - priority_limit_async_func_call wrapper (for async management)
-
-        CRITICAL FIX: We must ONLY update llm_model_kwargs, NOT llm_model_func.
-        Replacing llm_model_func would break the hashing_kv and wrapper, causing LLM
-        calls to fail silently with None responses.
+        so mutating the shared llm_model_kwargs neither reaches the LLM nor is safe when
+        an ingestion batch and a query run at the same time. Instead the kwargs are set in
+        a context variable (copied per asyncio task) and passed with each call by the
+        _with_call_kwargs wrapper installed in _ensure_initialized (around the raw
+        function on LightRAG 1.5+, whose per-role queues are built from it).
 
         Args:
             temperature: Temperature value (0.0-1.0)
         """
-        if not self._rag:
-            logger.warning("Cannot set temperature - RAG not initialized")
-            return
-
-        # Create new kwargs with desired temperature
-        new_kwargs = create_model_kwargs_with_temperature(
-            self._base_kwargs_template, temperature
+        token = _llm_call_kwargs.set(
+            create_model_kwargs_with_temperature(self._base_kwargs_template, temperature)
         )
-
-        # ONLY update llm_model_kwargs
-        # LightRAG's partial() at line 633 will pick up these new kwargs
-        self._rag.llm_model_kwargs = new_kwargs
-
-        logger.debug(f"Set operation temperature to {temperature}")
+        try:
+            yield
+        finally:
+            _llm_call_kwargs.reset(token)
 
     async def _ensure_initialized(self) -> bool:
         """
@@ -199,13 +255,25 @@ class JupyterICERAG:
             # Initialize LightRAG with selected provider
             # model_config contains llm_model_name and llm_model_kwargs for Ollama
             # Empty dict for OpenAI (uses defaults)
+            # Per-call temperature: kwargs come from the calling task, not shared state.
+            # LightRAG 1.5+ wraps llm_model_func into per-role queues at construction and
+            # runs each queued call under the enqueuer's context, so the raw function is
+            # wrapped before it is handed over. v1.4.x queue workers do not carry the
+            # caller's context, so there the queued function itself is wrapped afterwards.
+            if LIGHTRAG_ROLE_QUEUES:
+                llm_func = _with_call_kwargs(llm_func)
+
             self._rag = LightRAG(
                 working_dir=str(self.working_dir),
                 llm_model_func=llm_func,
                 embedding_func=embed_func,
+                vector_storage=self._resolve_vector_storage(),
                 **model_config
             )
 
+            if not LIGHTRAG_ROLE_QUEUES:
+                self._rag.llm_model_func = _with_call_kwargs(self._rag.llm_model_func)
+
             # Initialize LightRAG storages (doc_status, entities, relationships, chunks)
             await self._rag.initialize_storages()
 
@@ -233,6 +301,23 @@ class JupyterICERAG:
         """Check if system is ready (sync check, no initialization)"""
         return self._initialized and self._rag is not None
 
+    def _resolve_vector_storage(self) -> str:
+        """Configured vector storage backend, registering the ICE mmap backend if selected
+
+        Raises:
+            RuntimeError: If ICEMmapVectorDBStorage is selected but cannot be loaded
+        """
+        vector_storage = self.config["vector_storage"]
+        if vector_storage == "ICEMmapVectorDBStorage":
+            if MMAP_VECTOR_STORAGE_AVAILABLE and register_mmap_vector_storage():
+                logger.info(f"Using {MMAP_VECTOR_STORAGE_NAME} vector storage")
+                return vector_storage
+            raise RuntimeError(
+                "ICEMmapVectorDBStorage is configured but could not be loaded with the installed LightRAG - "
+                "set ICE_VECTOR_STORAGE=NanoVectorDBStorage to use LightRAG's built-in backend"
+            )
+        return vector_storage
+
     async def add_document(self, text: str, doc_type: str = "financial", file_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Add a single document with proper error handling and source tracking.
@@ -246,26 +331,108 @@ class JupyterICERAG:
             file_path: Optional source file path for traceability (e.g., 'email:Tencent_Q2_2025_Earnings.eml')
 
         Returns:
-            Dict with status and message
+            Dict with status, message and the LightRAG doc_id
         """
-        if not await self._ensure_initialized():
-            return {"status": "error", "message": "System not initialized"}
+        results = await self.add_documents_concurrent([{"content": text, "type": doc_type, "file_path": file_path}])
+        return results[0]
+
+    @staticmethod
+    def _unpack_document(doc) -> Tuple[str, str, Optional[str]]:
+        """Normalize a str or {"content", "type", "file_path"} document into (text, doc_type, file_path)"""
+        if isinstance(doc, dict):
+            return doc.get("content", ""), doc.get("type", "financial"), doc.get("file_path", None)
+        return str(doc), "financial", None
+
+    @staticmethod
+    def _document_id(text: str) -> str:
+        """Doc id ICE assigns to a [DOC_TYPE]-prefixed document (MD5 of the stripped text)"""
+        return compute_mdhash_id(text.strip(), prefix="doc-")
+
+    async def _wait_for_documents(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Doc status records for doc_ids once none of them is still queued or in progress
 
-        try:
-            # Set temperature for entity extraction (reproducibility-focused)
-            self._set_operation_temperature(self._extraction_temperature)
+        ainsert returns straight away when another call is already running LightRAG's
+        document pipeline ("Request queued"); that call processes our documents too, so
+        their final status is only known once doc_status says so. Asking the pipeline to
+        process the queue again picks them up if that run ended without them.
+        """
+        while True:
+            records = await self._rag.doc_status.get_by_ids(doc_ids)
+            found = {doc_id: record for doc_id, record in zip(doc_ids, records) if record}
+            if all(record["status"] in _FINAL_DOC_STATUSES for record in found.values()):
+                return found
+            await asyncio.sleep(_DOC_STATUS_POLL_SECONDS)
+            await self._rag.apipeline_process_enqueue_documents()
+
+    async def add_documents_concurrent(self, documents: list, max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Insert documents as one LightRAG batch, processing up to max_concurrency at a time
+
+        All documents go to a single ainsert call, so they share one pass of LightRAG's
+        document pipeline, which runs max_parallel_insert documents at a time (a sliding
+        window rather than fixed batches). Per-document results are read from doc_status,
+        keyed by the doc ids passed to ainsert.
+
+        Args:
+            documents: List of strings or {"content", "type", "file_path"} dicts
+            max_concurrency: Documents processed at the same time (default: ICE_BATCH_SIZE)
 
+        Returns:
+            One result dict per input document, in input order, with its LightRAG "doc_id"
+            (and doc_status "content_summary" once processed)
+        """
+        if not await self._ensure_initialized():
+            return [{"status": "error", "message": "System not initialized"} for _ in documents]
+        if not documents:
+            return []
+
+        doc_ids = []
+        batch = {}  # doc id -> (text, file_path); identical documents are inserted once
+        for doc in documents:
+            text, doc_type, file_path = self._unpack_document(doc)
             enhanced_text = f"[{doc_type.upper()}] {text}"
-            await self._rag.ainsert(enhanced_text, file_paths=file_path if file_path else None)
-            return {"status": "success", "message": "Document processed"}
+            doc_id = self._document_id(enhanced_text)
+            doc_ids.append(doc_id)
+            batch.setdefault(doc_id, (enhanced_text, file_path))
+
+        try:
+            self._rag.max_parallel_insert = max(1, max_concurrency or self.config["batch_size"])
+            # Entity extraction temperature (reproducibility-focused)
+            with self._operation_temperature(self._extraction_temperature):
+                await self._rag.ainsert(
+                    [text for text, _ in batch.values()],
+                    ids=list(batch),
+                    file_paths=[file_path for _, file_path in batch.values()]
+                )
+            records = await self._wait_for_documents(list(batch))
         except Exception as e:
             logger.error(f"Document processing failed: {e}")
-            return {"status": "error", "message": str(e)}
+            return [{"status": "error", "message": str(e), "doc_id": doc_id} for doc_id in doc_ids]
+
+        if self._query_cache and any(r["status"] == "processed" for r in records.values()):
+            self._query_cache.bump_graph_version()
+
+        results = []
+        for doc_id in doc_ids:
+            record = records.get(doc_id)
+            if record is None:
+                # LightRAG kept an earlier document with the same source instead
+                results.append({"status": "error", "message": "Duplicate of an existing document", "doc_id": doc_id})
+            elif record["status"] == "processed":
+                results.append({
+                    "status": "success", "message": "Document processed", "doc_id": doc_id,
+                    "content_summary": record.get("content_summary", "")
+                })
+            else:
+                message = record.get("error_msg") or "Document processing failed"
+                results.append({"status": "error", "message": message, "doc_id": doc_id})
+        return results
 
     async def add_documents_batch(self, documents: list, batch_size: Optional[int] = None) -> Dict[str, Any]:
         """
         OPTIMIZATION: Batch document processing (Fix #1)
-        Process multiple documents efficiently in batches
+        Process multiple documents in one LightRAG batch, at most batch_size at a time
         """
         if not await self._ensure_initialized():
             return {"status": "error", "message": "System not initialized"}
@@ -277,36 +444,14 @@ class JupyterICERAG:
         errors = []
 
         try:
-            # Process in batches to avoid overwhelming the system
-            for i in range(0, total_docs, batch_size):
-                batch = documents[i:i + batch_size]
-                batch_tasks = []
-
-                for doc in batch:
-                    if isinstance(doc, dict):
-                        text = doc.get("content", "")
-                        doc_type = doc.get("type", "financial")
-                        file_path = doc.get("file_path", None)  # Extract file_path for traceability
-                    else:
-                        text = str(doc)
-                        doc_type = "financial"
-                        file_path = None
-
-                    task = self.add_document(text, doc_type, file_path=file_path)
-                    batch_tasks.append(task)
-
-                # Process batch concurrently
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        failed += 1
-                        errors.append(str(result))
-                    elif isinstance(result, dict) and result.get("status") == "success":
-                        successful += 1
-                    else:
-                        failed += 1
-                        errors.append(result.get("message", "Unknown error"))
+            results = await self.add_documents_concurrent(documents, max_concurrency=batch_size)
+
+            for result in results:
+                if isinstance(result, dict) and result.get("status") == "success":
+                    successful += 1
+                else:
+                    failed += 1
+                    errors.append(result.get("message", "Unknown error"))
 
             return {
                 "status": "success" if successful > 0 else "error",
@@ -327,7 +472,7 @@ class JupyterICERAG:
                 "failed": total_docs
             }
 
-    async def query(self, question: str, mode: str = "hybrid") -> Dict[str, Any]:
+    async def query(self, question: str, mode: str = "hybrid", use_cache: bool = True) -> Dict[str, Any]:
         """
         Query with proper timeout and retry handling, extracts source attribution
 
@@ -336,21 +481,34 @@ class JupyterICERAG:
 
         v1.4.9 UPDATE: Uses aquery_llm for HONEST tracing - single query returns both answer
         AND the exact context used to generate it. No more dual-query dishonesty.
+
+        Successful results are cached per (question, mode, graph version); pass
+        use_cache=False to force a fresh query. Result dicts carry "cache_hit".
         """
         if not await self._ensure_initialized():
             return {"status": "error", "message": "System not initialized", "engine": "lightrag"}
 
-        try:
-            # Set temperature for query answering (creativity-focused)
-            self._set_operation_temperature(self._query_temperature)
+        cache = self._query_cache if use_cache else None
+        cache_settings = {"temperature": self._query_temperature}
+        graph_version = None
+        if cache:
+            cached = cache.get(question, mode, cache_settings)
+            if cached is not None:
+                logger.info(f"⚡ Query cache hit ({mode}): {question[:60]}")
+                cached["cache_hit"] = True
+                return cached
+            graph_version = cache.graph_version
 
+        try:
             # SINGLE QUERY with structured response (v1.4.9+ aquery_llm)
             # Returns: answer, entities, relationships, chunks, references in ONE call
             # This guarantees honest tracing: displayed context matches LLM's actual context
-            result_dict = await asyncio.wait_for(
-                self._rag.aquery_llm(question, param=QueryParam(mode=mode)),
-                timeout=self.config["timeout"]
-            )
+            # Query answering temperature (creativity-focused)
+            with self._operation_temperature(self._query_temperature):
+                result_dict = await asyncio.wait_for(
+                    self._rag.aquery_llm(question, param=QueryParam(mode=mode)),
+                    timeout=self.config["timeout"]
+                )
 
             # Validate LightRAG response structure (prevent silent failures)
             if not result_dict or not isinstance(result_dict, dict):
@@ -396,7 +554,7 @@ class JupyterICERAG:
             # Calculate confidence from chunks content
             confidence = self._calculate_confidence(context)
 
-            return {
+            result = {
                 "status": "success",
                 "result": answer,  # Alias for backward compat
                 "answer": answer,
@@ -408,6 +566,10 @@ class JupyterICERAG:
                 "engine": "lightrag",
                 "mode": mode
             }
+            if cache:
+                cache.put(question, mode, result, cache_settings, graph_version=graph_version)
+            result["cache_hit"] = False
+            return result
 
         except asyncio.TimeoutError:
             return {"status": "error", "message": "Query timeout", "engine": "lightrag"}
@@ -420,6 +582,79 @@ class JupyterICERAG:
             logger.error(f"Unexpected query failure: {e}", exc_info=True)
             return {"status": "error", "message": str(e), "engine": "lightrag"}
 
+    @staticmethod
+    def _unpack_query(query, default_mode: str) -> Tuple[str, str, bool]:
+        """Normalize a str or {"question", "mode", "use_cache"} query into (question, mode, use_cache)"""
+        if isinstance(query, dict):
+            return query.get("question", ""), query.get("mode", default_mode), query.get("use_cache", True)
+        return str(query), default_mode, True
+
+    async def query_concurrent(self, queries: list, mode: str = "hybrid", max_concurrency: Optional[int] = None,
+                               on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                               timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Run several queries concurrently with a bounded number in flight
+
+        A sliding-window semaphore keeps max_concurrency queries running: a portfolio of N
+        holdings costs about N / max_concurrency query latencies instead of N.
+
+        Args:
+            queries: List of question strings or {"question", "mode", "use_cache"} dicts
+            mode: Query mode for plain-string queries
+            max_concurrency: Maximum in-flight queries (default: ICE_MAX_CONCURRENT_QUERIES)
+            on_result: Called with (index, result) as each query finishes, in completion order
+            timeout: Overall deadline in seconds; unfinished queries are cancelled and
+                reported as timeouts while finished ones are kept (partial results)
+
+        Returns:
+            One result dict per input query, in input order (each with "response_time")
+        """
+        if not await self._ensure_initialized():
+            return [{"status": "error", "message": "System not initialized", "engine": "lightrag"} for _ in queries]
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.config["max_concurrent_queries"]))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        async def _query(index: int, query) -> None:
+            question, query_mode, use_cache = self._unpack_query(query, mode)
+            async with semaphore:
+                start = asyncio.get_running_loop().time()
+                try:
+                    result = await self.query(question, query_mode, use_cache=use_cache)
+                except Exception as e:
+                    logger.error(f"Concurrent query failed: {e}")
+                    result = {"status": "error", "message": str(e), "engine": "lightrag"}
+                result["response_time"] = asyncio.get_running_loop().time() - start
+            results[index] = result
+            if on_result is not None:
+                try:
+                    on_result(index, result)
+                except Exception as e:
+                    logger.warning(f"on_result callback failed for query {index}: {e}")
+
+        tasks = [asyncio.ensure_future(_query(i, q)) for i, q in enumerate(queries)]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(f"⏱️ {len(pending)}/{len(tasks)} concurrent queries cancelled at {timeout}s deadline")
+
+        return [result if result is not None else
+                {"status": "error", "message": "Query timeout", "engine": "lightrag", "error_code": "BATCH_TIMEOUT"}
+                for result in results]
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Query cache hit/miss metrics and size ({"enabled": False} when disabled)"""
+        if not self._query_cache:
+            return {"enabled": False}
+        return {"enabled": True, **self._query_cache.get_stats()}
+
+    def clear_query_cache(self) -> int:
+        """Drop all cached query results"""
+        return self._query_cache.clear() if self._query_cache else 0
+
     def _extract_sources(self, context_text: str) -> list:
         """
         Extract source attribution from retrieved context for traceability
@@ -563,8 +798,10 @@ class JupyterSyncWrapper:
 
             return loop.run_until_complete(coro)
         except RuntimeError as e:
-            if "no running event loop" in str(e).lower():
-                # No event loop exists - create one (standard Python environment)
+            message = str(e).lower()
+            if "no running event loop" in message or "no current event loop" in message:
+                # No event loop exists - create one (standard Python environment,
+                # or a thread whose loop was cleared by an earlier asyncio.run())
                 new_loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(new_loop)
                 try:
@@ -589,9 +826,29 @@ class JupyterSyncWrapper:
         """Sync version of batch processing"""
         return self._run_async(self._async_rag.add_documents_batch(documents))
 
-    def query(self, question: str, mode: str = "hybrid"):
+    def add_documents_concurrent(self, documents: list, max_concurrency: Optional[int] = None):
+        """Sync version of bounded-concurrency insertion (per-document results in input order)"""
+        return self._run_async(self._async_rag.add_documents_concurrent(documents, max_concurrency=max_concurrency))
+
+    def query(self, question: str, mode: str = "hybrid", use_cache: bool = True):
         """Sync version of query"""
-        return self._run_async(self._async_rag.query(question, mode))
+        return self._run_async(self._async_rag.query(question, mode, use_cache=use_cache))
+
+    def query_concurrent(self, queries: list, mode: str = "hybrid", max_concurrency: Optional[int] = None,
+                         on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                         timeout: Optional[float] = None):
+        """Sync version of bounded-concurrency querying (all queries share one event loop run)"""
+        return self._run_async(self._async_rag.query_concurrent(
+            queries, mode, max_concurrency=max_concurrency, on_result=on_result, timeout=timeout
+        ))
+
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Query cache hit/miss metrics and size"""
+        return self._async_rag.get_query_cache_stats()
+
+    def clear_query_cache(self) -> int:
+        """Drop all cached query results"""
+        return self._async_rag.clear_query_cache()
 
 
 # Backward compatibility aliases
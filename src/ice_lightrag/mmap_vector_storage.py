@@ -0,0 +1,691 @@
+# Location: src/ice_lightrag/mmap_vector_storage.py
+# Purpose: Memory-mapped float32 vector storage backend for LightRAG
+# Why: NanoVectorDB keeps every vector base64-encoded inside vdb_*.json, so startup, stats and
+#      queries all pay for parsing hundreds of MB of JSON
+# Relevant Files: ice_rag_fixed.py, updated_architectures/implementation/ice_simplified.py
+
+"""
+Memory-mapped vector storage for the ICE LightRAG wrapper
+
+Each namespace (chunks, entities, relationships) is stored as three files:
+
+    vdb_{namespace}.f32          float32 rows (L2-normalized), append-only, read via np.memmap
+    vdb_{namespace}.index.jsonl  one metadata line per row, plus delete tombstones, append-only
+    vdb_{namespace}.header.json  embedding_dim, committed row/index sizes, live row count
+
+The header is the commit point: it is rewritten atomically after rows and index lines have
+been appended, and anything past the committed sizes (e.g. after a crash mid-write) is
+ignored and truncated on the next load. Upserting an existing id appends a new row and
+leaves the old one as garbage; files are compacted once garbage outweighs live rows.
+
+MmapVectorStore has no LightRAG dependency. ICEMmapVectorDBStorage adapts it to LightRAG's
+BaseVectorStorage interface (mirroring NanoVectorDBStorage) and register_mmap_vector_storage()
+makes it selectable via LightRAG(vector_storage="ICEMmapVectorDBStorage"). Existing
+vdb_{namespace}.json files are migrated automatically on first load.
+"""
+
+import os
+import json
+import time
+import base64
+import logging
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MMAP_VECTOR_STORAGE_NAME = "ICEMmapVectorDBStorage"
+MMAP_FORMAT_VERSION = 1
+
+# Compact once at least this many dead rows exist and they outnumber live rows
+COMPACTION_MIN_DEAD_ROWS = 1000
+
+
+def _storage_files(storage_dir: Union[str, Path], namespace: str) -> Dict[str, Path]:
+    storage_dir = Path(storage_dir)
+    return {
+        'vectors': storage_dir / f"vdb_{namespace}.f32",
+        'index': storage_dir / f"vdb_{namespace}.index.jsonl",
+        'header': storage_dir / f"vdb_{namespace}.header.json",
+        'legacy': storage_dir / f"vdb_{namespace}.json",
+    }
+
+
+def _write_json_atomic(path: Path, payload: Dict[str, Any]):
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, path)
+
+
+def _read_header(files: Dict[str, Path]) -> Optional[Dict[str, Any]]:
+    if not files['header'].exists():
+        return None
+    try:
+        with open(files['header'], 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Unreadable vector storage header {files['header']}: {e}")
+        return None
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class MmapVectorStore:
+    """
+    Append-only float32 vector store with a JSONL metadata sidecar
+
+    Vectors live on disk and are only paged in by np.memmap during queries. Metadata for
+    live rows is held in memory (LightRAG needs it to build query results). Writes are
+    buffered until save(), matching NanoVectorDB's persist-on-index_done_callback contract.
+    """
+
+    def __init__(self, storage_dir: Union[str, Path], namespace: str, embedding_dim: int):
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.embedding_dim = int(embedding_dim)
+        self.files = _storage_files(self.storage_dir, namespace)
+        self._generation = 0
+        self._load()
+
+    # ------------------------------------------------------------------ loading
+
+    def _reset(self):
+        self._matrix: Optional[np.memmap] = None
+        self._committed_rows = 0
+        self._committed_index_bytes = 0
+        self._row_meta: List[Optional[Dict[str, Any]]] = []  # None = dead row
+        self._id_to_row: Dict[str, int] = {}
+        self._dead: set = set()
+        self._pending_vectors: List[np.ndarray] = []
+        self._pending_lines: List[str] = []
+
+    def _load(self):
+        self._reset()
+        header = _read_header(self.files)
+
+        if header is None:
+            if self.files['legacy'].exists():
+                self._migrate_legacy_json()
+            return
+
+        if header.get('embedding_dim') != self.embedding_dim:
+            raise ValueError(
+                f"Vector storage {self.files['header'].name} has embedding_dim "
+                f"{header.get('embedding_dim')}, expected {self.embedding_dim}"
+            )
+
+        rows = int(header.get('rows', 0))
+        index_bytes = int(header.get('index_bytes', 0))
+        self._generation = int(header.get('generation', 0))
+        self._truncate_uncommitted(rows, index_bytes)
+
+        if index_bytes:
+            with open(self.files['index'], 'rb') as f:
+                for line in f.read(index_bytes).splitlines():
+                    if line.strip():
+                        self._apply_index_line(json.loads(line))
+
+        self._committed_rows = rows
+        self._committed_index_bytes = index_bytes
+        self._open_matrix()
+
+    def _truncate_uncommitted(self, rows: int, index_bytes: int):
+        """Drop bytes appended after the last committed header (interrupted save)"""
+        vector_bytes = rows * self.embedding_dim * 4
+        for path, size in ((self.files['vectors'], vector_bytes), (self.files['index'], index_bytes)):
+            if path.exists() and path.stat().st_size > size:
+                logger.warning(f"Truncating uncommitted data in {path.name}")
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def _apply_index_line(self, record: Dict[str, Any]):
+        if '__deleted__' in record:
+            row = self._id_to_row.pop(record['__deleted__'], None)
+            if row is not None:
+                self._row_meta[row] = None
+                self._dead.add(row)
+            return
+
+        row = len(self._row_meta)
+        previous = self._id_to_row.get(record['__id__'])
+        if previous is not None:
+            self._row_meta[previous] = None  # Superseded by this upsert
+            self._dead.add(previous)
+        self._row_meta.append(record)
+        self._id_to_row[record['__id__']] = row
+
+    def _open_matrix(self):
+        if self._committed_rows:
+            self._matrix = np.memmap(
+                self.files['vectors'], dtype=np.float32, mode='r',
+                shape=(self._committed_rows, self.embedding_dim)
+            )
+        else:
+            self._matrix = None
+
+    def _migrate_legacy_json(self):
+        """Import a NanoVectorDB vdb_{namespace}.json file, then move it aside"""
+        legacy = self.files['legacy']
+        with open(legacy, 'r') as f:
+            storage = json.load(f)
+
+        if storage.get('embedding_dim', self.embedding_dim) != self.embedding_dim:
+            raise ValueError(
+                f"{legacy.name} has embedding_dim {storage.get('embedding_dim')}, expected {self.embedding_dim}"
+            )
+
+        datas = storage.get('data', [])
+        if datas:
+            matrix = np.frombuffer(base64.b64decode(storage['matrix']), dtype=np.float32)
+            matrix = matrix.reshape(len(datas), self.embedding_dim)
+            metas = [{k: v for k, v in dp.items() if k != 'vector'} for dp in datas]
+            self.upsert(metas, matrix)
+        self.save()
+
+        legacy.rename(legacy.with_name(legacy.name + '.migrated'))
+        logger.info(f"✅ Migrated {len(datas)} vectors from {legacy.name} to memory-mapped storage")
+
+    # ------------------------------------------------------------------ writes
+
+    def upsert(self, metas: List[Dict[str, Any]], vectors: np.ndarray) -> List[str]:
+        """
+        Append rows; an id that already exists is superseded by its new row
+
+        Args:
+            metas: Metadata dicts, each with an '__id__'
+            vectors: (len(metas), embedding_dim) array
+
+        Returns:
+            Upserted ids
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(metas), self.embedding_dim)
+        self._pending_vectors.append(_normalize(vectors))
+        for meta in metas:
+            self._pending_lines.append(json.dumps(meta, default=str))
+            self._apply_index_line(meta)
+        return [meta['__id__'] for meta in metas]
+
+    def delete(self, ids: List[str]) -> int:
+        """Tombstone ids, returning how many existed"""
+        deleted = 0
+        for id_ in ids:
+            if id_ in self._id_to_row:
+                record = {'__deleted__': id_}
+                self._pending_lines.append(json.dumps(record))
+                self._apply_index_line(record)
+                deleted += 1
+        return deleted
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._pending_lines)
+
+    def save(self):
+        """Append buffered rows/index lines and commit them with a new header"""
+        if self.dead_rows >= COMPACTION_MIN_DEAD_ROWS and self.dead_rows > len(self):
+            self._compact()
+            return
+
+        if self._pending_vectors:
+            with open(self.files['vectors'], 'ab') as f:
+                for block in self._pending_vectors:
+                    f.write(block.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        if self._pending_lines:
+            with open(self.files['index'], 'ab') as f:
+                f.write(''.join(line + '\n' for line in self._pending_lines).encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+
+        self._committed_rows = len(self._row_meta)
+        if self.files['index'].exists():
+            self._committed_index_bytes = self.files['index'].stat().st_size
+        self._pending_vectors = []
+        self._pending_lines = []
+        self._write_header()
+        self._open_matrix()
+
+    def _write_header(self):
+        _write_json_atomic(self.files['header'], {
+            'version': MMAP_FORMAT_VERSION,
+            'embedding_dim': self.embedding_dim,
+            'rows': self._committed_rows,
+            'index_bytes': self._committed_index_bytes,
+            'live': len(self._id_to_row),
+            'generation': self._generation,
+        })
+
+    def _compact(self):
+        """Rewrite vectors/index with live rows only"""
+        live_rows = sorted(self._id_to_row.values())
+        all_vectors = self._all_vectors()
+        tmp_vectors = self.files['vectors'].with_suffix('.f32.tmp')
+        tmp_index = self.files['index'].with_suffix('.jsonl.tmp')
+
+        with open(tmp_vectors, 'wb') as f:
+            if live_rows:
+                f.write(np.ascontiguousarray(all_vectors[live_rows]).tobytes())
+        with open(tmp_index, 'wb') as f:
+            f.write(''.join(
+                json.dumps(self._row_meta[row], default=str) + '\n' for row in live_rows
+            ).encode('utf-8'))
+
+        self._matrix = None  # Release the memmap before replacing its file
+        os.replace(tmp_vectors, self.files['vectors'])
+        os.replace(tmp_index, self.files['index'])
+
+        metas = [self._row_meta[row] for row in live_rows]
+        self._reset()
+        for meta in metas:
+            self._apply_index_line(meta)
+        self._committed_rows = len(metas)
+        self._committed_index_bytes = self.files['index'].stat().st_size
+        self._generation += 1
+        self._write_header()
+        self._open_matrix()
+        logger.info(f"Compacted vdb_{self.namespace} to {len(metas)} rows")
+
+    def drop(self):
+        """Delete all storage files and start empty"""
+        self._matrix = None
+        for key in ('vectors', 'index', 'header'):
+            self.files[key].unlink(missing_ok=True)
+        self._reset()
+        self._generation += 1
+
+    # ------------------------------------------------------------------ reads
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self._dead)
+
+    def _all_vectors(self) -> np.ndarray:
+        blocks = ([self._matrix] if self._matrix is not None else []) + self._pending_vectors
+        if not blocks:
+            return np.empty((0, self.embedding_dim), dtype=np.float32)
+        return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+    def _vector(self, row: int) -> np.ndarray:
+        if row < self._committed_rows:
+            return np.array(self._matrix[row])
+        offset = row - self._committed_rows
+        for block in self._pending_vectors:
+            if offset < len(block):
+                return block[offset]
+            offset -= len(block)
+        raise IndexError(row)
+
+    def get(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """Metadata for the ids that exist, in request order"""
+        return [self._row_meta[self._id_to_row[id_]] for id_ in ids if id_ in self._id_to_row]
+
+    def get_vectors(self, ids: List[str]) -> Dict[str, np.ndarray]:
+        return {id_: self._vector(self._id_to_row[id_]) for id_ in ids if id_ in self._id_to_row}
+
+    def items(self) -> Iterator[Dict[str, Any]]:
+        """Metadata for every live row"""
+        return (meta for meta in self._row_meta if meta is not None)
+
+    def query(self, query_vector, top_k: int, better_than_threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Cosine top-k over live rows
+
+        Returns:
+            Metadata dicts with '__metrics__' set to the cosine similarity, best first
+        """
+        if not self._id_to_row or top_k <= 0:
+            return []
+
+        query_vector = _normalize(np.asarray(query_vector, dtype=np.float32).reshape(-1))
+        scores_blocks = []
+        if self._matrix is not None:
+            scores_blocks.append(self._matrix @ query_vector)
+        scores_blocks.extend(block @ query_vector for block in self._pending_vectors)
+        scores = np.concatenate(scores_blocks)
+
+        if self._dead:
+            scores[np.fromiter(self._dead, dtype=np.int64, count=len(self._dead))] = -np.inf
+        if better_than_threshold is not None:
+            scores = np.where(scores >= better_than_threshold, scores, -np.inf)
+
+        top_k = min(top_k, len(scores))
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        candidates = candidates[np.argsort(-scores[candidates])]
+
+        return [
+            {**self._row_meta[row], '__metrics__': float(scores[row])}
+            for row in candidates if np.isfinite(scores[row])
+        ]
+
+
+# ---------------------------------------------------------------------- stats helpers
+
+def count_vector_rows(storage_dir: Union[str, Path], namespace: str) -> int:
+    """
+    Live row count for a namespace without loading vectors
+
+    Reads the mmap header when present, otherwise falls back to a legacy vdb_{namespace}.json.
+    """
+    files = _storage_files(storage_dir, namespace)
+    header = _read_header(files)
+    if header is not None:
+        return int(header.get('live', 0))
+    if files['legacy'].exists():
+        with open(files['legacy'], 'r') as f:
+            return len(json.load(f).get('data', []))
+    return 0
+
+
+def iter_vector_metadata(storage_dir: Union[str, Path], namespace: str) -> Iterator[Dict[str, Any]]:
+    """
+    Metadata of live rows for a namespace (mmap index, or legacy vdb_{namespace}.json)
+
+    Only the metadata sidecar is read - vectors are never touched.
+    """
+    files = _storage_files(storage_dir, namespace)
+    header = _read_header(files)
+    if header is None:
+        if files['legacy'].exists():
+            with open(files['legacy'], 'r') as f:
+                data = json.load(f).get('data', [])
+            yield from ({k: v for k, v in dp.items() if k != 'vector'} for dp in data)
+        return
+
+    live: Dict[str, Dict[str, Any]] = {}
+    index_bytes = int(header.get('index_bytes', 0))
+    if index_bytes and files['index'].exists():
+        with open(files['index'], 'rb') as f:
+            for line in f.read(index_bytes).splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if '__deleted__' in record:
+                    live.pop(record['__deleted__'], None)
+                else:
+                    live.pop(record['__id__'], None)  # Re-insert so order follows the latest write
+                    live[record['__id__']] = record
+    yield from live.values()
+
+
+def read_index_tail(storage_dir: Union[str, Path], namespace: str,
+                    offset: int = 0) -> Optional[Dict[str, Any]]:
+    """
+    Index records committed after byte offset (row metadata and delete tombstones)
+
+    Lets callers follow the append-only index incrementally. 'generation' changes whenever
+    the index is rewritten (compaction, drop), which makes offsets from earlier reads stale.
+
+    Returns:
+        {'records', 'index_bytes', 'generation'}, or None when the namespace is not
+        stored in memory-mapped format
+    """
+    files = _storage_files(storage_dir, namespace)
+    header = _read_header(files)
+    if header is None:
+        return None
+
+    index_bytes = int(header.get('index_bytes', 0))
+    records = []
+    if index_bytes > offset and files['index'].exists():
+        with open(files['index'], 'rb') as f:
+            f.seek(offset)
+            records = [json.loads(line) for line in f.read(index_bytes - offset).splitlines() if line.strip()]
+    return {'records': records, 'index_bytes': index_bytes, 'generation': int(header.get('generation', 0))}
+
+
+def vector_storage_info(storage_dir: Union[str, Path], namespace: str) -> Dict[str, Any]:
+    """File name, existence and on-disk size of a namespace's vector storage (either backend)"""
+    files = _storage_files(storage_dir, namespace)
+    if files['header'].exists():
+        return {
+            'file': files['vectors'].name,
+            'exists': True,
+            'size_bytes': sum(files[key].stat().st_size for key in ('vectors', 'index', 'header') if files[key].exists()),
+            'backend': MMAP_VECTOR_STORAGE_NAME,
+        }
+    return {
+        'file': files['legacy'].name,
+        'exists': files['legacy'].exists(),
+        'size_bytes': files['legacy'].stat().st_size if files['legacy'].exists() else 0,
+        'backend': 'NanoVectorDBStorage',
+    }
+
+
+# ---------------------------------------------------------------------- LightRAG adapter
+
+try:
+    from lightrag.base import BaseVectorStorage
+    from lightrag.utils import compute_mdhash_id
+    from lightrag.kg.shared_storage import get_update_flag, set_all_update_flags
+    LIGHTRAG_AVAILABLE = True
+except ImportError:
+    LIGHTRAG_AVAILABLE = False
+
+if LIGHTRAG_AVAILABLE:
+    try:
+        # LightRAG >= 1.5: per-namespace locks, flags keyed by (namespace, workspace)
+        from lightrag.kg.shared_storage import get_namespace_lock
+        WORKSPACE_AWARE_SHARED_STORAGE = True
+    except ImportError:
+        # LightRAG 1.4.x: one storage lock, flags keyed by the combined namespace
+        from lightrag.kg.shared_storage import get_storage_lock
+        WORKSPACE_AWARE_SHARED_STORAGE = False
+
+
+if LIGHTRAG_AVAILABLE:
+    import asyncio
+
+    @dataclass
+    class ICEMmapVectorDBStorage(BaseVectorStorage):
+        """LightRAG vector storage backed by MmapVectorStore (drop-in for NanoVectorDBStorage)"""
+
+        def __post_init__(self):
+            self._store = None
+            self._storage_lock = None
+            self.storage_updated = None
+
+            kwargs = self.global_config.get("vector_db_storage_cls_kwargs", {})
+            cosine_threshold = kwargs.get("cosine_better_than_threshold")
+            if cosine_threshold is None:
+                raise ValueError(
+                    "cosine_better_than_threshold must be specified in vector_db_storage_cls_kwargs"
+                )
+            self.cosine_better_than_threshold = cosine_threshold
+
+            working_dir = self.global_config["working_dir"]
+            if self.workspace:
+                self._storage_dir = os.path.join(working_dir, self.workspace)
+                self.final_namespace = f"{self.workspace}_{self.namespace}"
+            else:
+                self.final_namespace = self.namespace
+                self.workspace = ""
+                self._storage_dir = working_dir
+
+            self._max_batch_size = self.global_config["embedding_batch_num"]
+            self._store = self._open_store()
+
+        def _open_store(self) -> MmapVectorStore:
+            return MmapVectorStore(self._storage_dir, self.namespace, self.embedding_func.embedding_dim)
+
+        async def initialize(self):
+            if WORKSPACE_AWARE_SHARED_STORAGE:
+                self.storage_updated = await get_update_flag(self.namespace, workspace=self.workspace)
+                self._storage_lock = get_namespace_lock(self.namespace, workspace=self.workspace)
+            else:
+                self.storage_updated = await get_update_flag(self.final_namespace)
+                self._storage_lock = get_storage_lock(enable_logging=False)
+
+        async def _notify_other_processes(self):
+            """Flag every process's copy of this namespace for reload from disk"""
+            if WORKSPACE_AWARE_SHARED_STORAGE:
+                await set_all_update_flags(self.namespace, workspace=self.workspace)
+            else:
+                await set_all_update_flags(self.final_namespace)
+
+        async def _get_store(self) -> MmapVectorStore:
+            """Reload if another process committed changes since our last load"""
+            async with self._storage_lock:
+                if self.storage_updated.value:
+                    logger.info(
+                        f"[{self.workspace}] Process {os.getpid()} reloading {self.namespace} due to update by another process"
+                    )
+                    self._store = self._open_store()
+                    self.storage_updated.value = False
+                return self._store
+
+        @staticmethod
+        def _to_result(meta: Dict[str, Any]) -> Dict[str, Any]:
+            return {**meta, "id": meta.get("__id__"), "created_at": meta.get("__created_at__")}
+
+        async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
+            if not data:
+                return
+
+            current_time = int(time.time())
+            metas = [
+                {
+                    "__id__": k,
+                    "__created_at__": current_time,
+                    **{k1: v1 for k1, v1 in v.items() if k1 in self.meta_fields},
+                }
+                for k, v in data.items()
+            ]
+            contents = [v["content"] for v in data.values()]
+            batches = [
+                contents[i: i + self._max_batch_size]
+                for i in range(0, len(contents), self._max_batch_size)
+            ]
+
+            # Embed outside the lock
+            embeddings = np.concatenate(await asyncio.gather(*[self.embedding_func(batch) for batch in batches]))
+            if len(embeddings) != len(metas):
+                logger.error(
+                    f"[{self.workspace}] embedding is not 1-1 with data, {len(embeddings)} != {len(metas)}"
+                )
+                return
+
+            store = await self._get_store()
+            return store.upsert(metas, embeddings)
+
+        async def query(
+            self, query: str, top_k: int, query_embedding: list[float] = None
+        ) -> list[dict[str, Any]]:
+            if query_embedding is not None:
+                embedding = query_embedding
+            else:
+                embedding = (await self.embedding_func([query], _priority=5))[0]
+
+            store = await self._get_store()
+            results = store.query(embedding, top_k=top_k, better_than_threshold=self.cosine_better_than_threshold)
+            return [{**self._to_result(dp), "distance": dp["__metrics__"]} for dp in results]
+
+        async def delete(self, ids: list[str]):
+            try:
+                store = await self._get_store()
+                store.delete(ids)
+                logger.debug(f"[{self.workspace}] Successfully deleted {len(ids)} vectors from {self.namespace}")
+            except Exception as e:
+                logger.error(f"[{self.workspace}] Error while deleting vectors from {self.namespace}: {e}")
+
+        async def delete_entity(self, entity_name: str) -> None:
+            try:
+                store = await self._get_store()
+                store.delete([compute_mdhash_id(entity_name, prefix="ent-")])
+            except Exception as e:
+                logger.error(f"[{self.workspace}] Error deleting entity {entity_name}: {e}")
+
+        async def delete_entity_relation(self, entity_name: str) -> None:
+            try:
+                store = await self._get_store()
+                ids_to_delete = [
+                    dp["__id__"] for dp in store.items()
+                    if dp.get("src_id") == entity_name or dp.get("tgt_id") == entity_name
+                ]
+                if ids_to_delete:
+                    store.delete(ids_to_delete)
+                logger.debug(f"[{self.workspace}] Deleted {len(ids_to_delete)} relations for {entity_name}")
+            except Exception as e:
+                logger.error(f"[{self.workspace}] Error deleting relations for {entity_name}: {e}")
+
+        async def index_done_callback(self) -> bool:
+            async with self._storage_lock:
+                if self.storage_updated.value:
+                    logger.warning(
+                        f"[{self.workspace}] Storage for {self.namespace} was updated by another process, reloading..."
+                    )
+                    self._store = self._open_store()
+                    self.storage_updated.value = False
+                    return False
+
+                try:
+                    self._store.save()
+                    await self._notify_other_processes()
+                    self.storage_updated.value = False
+                    return True
+                except Exception as e:
+                    logger.error(f"[{self.workspace}] Error saving data for {self.namespace}: {e}")
+                    return False
+
+        async def get_by_id(self, id: str) -> dict[str, Any] | None:
+            store = await self._get_store()
+            result = store.get([id])
+            return self._to_result(result[0]) if result else None
+
+        async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
+            if not ids:
+                return []
+            store = await self._get_store()
+            return [self._to_result(dp) for dp in store.get(ids)]
+
+        async def get_vectors_by_ids(self, ids: list[str]) -> dict[str, list[float]]:
+            if not ids:
+                return {}
+            store = await self._get_store()
+            return {id_: vector.tolist() for id_, vector in store.get_vectors(ids).items()}
+
+        async def drop(self) -> dict[str, str]:
+            try:
+                async with self._storage_lock:
+                    self._store.drop()
+                    await self._notify_other_processes()
+                    self.storage_updated.value = False
+                    logger.info(f"[{self.workspace}] Process {os.getpid()} drop {self.namespace}")
+                return {"status": "success", "message": "data dropped"}
+            except Exception as e:
+                logger.error(f"[{self.workspace}] Error dropping {self.namespace}: {e}")
+                return {"status": "error", "message": str(e)}
+
+
+def register_mmap_vector_storage() -> bool:
+    """
+    Make ICEMmapVectorDBStorage selectable via LightRAG(vector_storage=...)
+
+    Adds it to LightRAG's storage registries (module path, VECTOR_STORAGE implementations,
+    env requirements). Safe to call repeatedly.
+
+    Returns:
+        True if the backend is registered, False if LightRAG is unavailable
+    """
+    if not LIGHTRAG_AVAILABLE:
+        return False
+
+    from lightrag import kg
+    kg.STORAGES[MMAP_VECTOR_STORAGE_NAME] = __name__
+    implementations = kg.STORAGE_IMPLEMENTATIONS["VECTOR_STORAGE"]["implementations"]
+    if MMAP_VECTOR_STORAGE_NAME not in implementations:
+        implementations.append(MMAP_VECTOR_STORAGE_NAME)
+    kg.STORAGE_ENV_REQUIREMENTS.setdefault(MMAP_VECTOR_STORAGE_NAME, [])
+    return True
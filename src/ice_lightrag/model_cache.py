@@ -0,0 +1,244 @@
+# Location: src/ice_lightrag/model_cache.py
+# Purpose: Persistent content-addressed cache of LLM completions and embeddings shared by all LightRAG working dirs
+# Why: LightRAG's own LLM cache lives inside each working dir, so rebuilding a graph from scratch re-paid every call
+# Relevant Files: model_provider.py, ice_rag_fixed.py, query_cache.py
+
+"""
+Model call cache for the callables returned by get_llm_provider()
+
+Completions are keyed on sha256(model, prompt, system prompt, history, sampling kwargs)
+and embeddings on sha256(model, text), so identical calls are served from disk no matter
+which working directory (production graph, rebuilt graph, test storage) asked for them.
+Entries live in one SQLite file as compact BLOBs - zlib-compressed UTF-8 for completions,
+raw float32 for vectors - and the least recently used ones are evicted once the stored
+bytes exceed max_bytes.
+"""
+
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Call kwargs that don't change the model's output (transport, LightRAG plumbing)
+NON_SEMANTIC_KWARGS = frozenset({
+    'hashing_kv', 'host', 'timeout', 'api_key', 'base_url', 'client_configs', 'token_tracker', 'stream'
+})
+
+# Evict down to this fraction of max_bytes so eviction doesn't run on every write
+EVICTION_TARGET = 0.9
+
+
+class ModelCallCache:
+    """
+    SQLite-backed, size-bounded LRU cache of LLM completions and embedding vectors
+
+    Like QueryResultCache, a connection is opened per operation, so one cache can be
+    shared across threads, event loops and processes pointing at the same file.
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_bytes: int = 512 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.hits = {'llm': 0, 'embedding': 0}
+        self.misses = {'llm': 0, 'embedding': 0}
+        self._metrics_lock = threading.Lock()
+        self._stored_bytes: Optional[int] = None  # Estimate, resynced from the database on eviction
+        self._tables_ready = False  # Database file is created on first use
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._tables_ready:
+            self._create_tables()
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_tables(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path, timeout=30) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS model_calls (
+                    cache_key BLOB PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_accessed REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_model_calls_accessed ON model_calls(last_accessed)")
+            self._stored_bytes = conn.execute("SELECT TOTAL(size) FROM model_calls").fetchone()[0]
+        self._tables_ready = True
+
+    # ------------------------------------------------------------------ keys
+
+    @staticmethod
+    def llm_key(model: str, prompt: str, system_prompt: Optional[str] = None,
+                history_messages: Optional[List[Dict[str, Any]]] = None,
+                call_kwargs: Optional[Dict[str, Any]] = None) -> bytes:
+        """Key for one completion: model, full message list and sampling kwargs (temperature, seed, ...)"""
+        settings = {k: v for k, v in (call_kwargs or {}).items() if k not in NON_SEMANTIC_KWARGS}
+        payload = json.dumps(['llm', model, system_prompt, history_messages or [], prompt, settings],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).digest()
+
+    @staticmethod
+    def embedding_key(model: str, text: str, context: Optional[str] = None) -> bytes:
+        """Key for one text's embedding under a model (and asymmetric context: "query"/"document")"""
+        parts = ['embedding', model, text] if context is None else ['embedding', model, text, context]
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).digest()
+
+    def _record(self, kind: str, hits: int, misses: int):
+        with self._metrics_lock:
+            self.hits[kind] += hits
+            self.misses[kind] += misses
+
+    # ------------------------------------------------------------------ entries
+
+    def _get_many(self, kind: str, keys: List[bytes]) -> Dict[bytes, bytes]:
+        found = {}
+        try:
+            with self._connect() as conn:
+                for start in range(0, len(keys), 500):  # Stay under SQLite's bound-parameter limit
+                    batch = keys[start:start + 500]
+                    placeholders = ','.join('?' * len(batch))
+                    found.update(conn.execute(
+                        f"SELECT cache_key, value FROM model_calls WHERE cache_key IN ({placeholders})", batch
+                    ).fetchall())
+                if found:
+                    now = time.time()
+                    conn.executemany("UPDATE model_calls SET last_accessed = ? WHERE cache_key = ?",
+                                     [(now, key) for key in found])
+        except sqlite3.Error as e:
+            logger.warning(f"Model cache read failed: {e}")
+            found = {}
+        self._record(kind, len(found), len(keys) - len(found))
+        return found
+
+    def _put_many(self, kind: str, items: List[Tuple[bytes, bytes]]) -> bool:
+        try:
+            now = time.time()
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO model_calls (cache_key, kind, value, size, last_accessed) VALUES (?, ?, ?, ?, ?)",
+                    [(key, kind, value, len(key) + len(value), now) for key, value in items]
+                )
+                self._stored_bytes = (self._stored_bytes or 0) + sum(len(k) + len(v) for k, v in items)
+                if self._stored_bytes > self.max_bytes:
+                    self._evict(conn)
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Model cache write failed: {e}")
+            return False
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the cache is back under EVICTION_TARGET * max_bytes"""
+        conn.execute(
+            """DELETE FROM model_calls WHERE cache_key IN (
+                   SELECT cache_key FROM (
+                       SELECT cache_key, SUM(size) OVER (ORDER BY last_accessed DESC, cache_key) AS running
+                       FROM model_calls
+                   ) WHERE running > ?
+               )""",
+            (int(self.max_bytes * EVICTION_TARGET),)
+        )
+        self._stored_bytes = conn.execute("SELECT TOTAL(size) FROM model_calls").fetchone()[0]
+
+    def get_completion(self, key: bytes) -> Optional[str]:
+        """Cached completion text, or None"""
+        value = self._get_many('llm', [key]).get(key)
+        return zlib.decompress(value).decode('utf-8') if value is not None else None
+
+    def put_completion(self, key: bytes, text: str) -> bool:
+        return self._put_many('llm', [(key, zlib.compress(text.encode('utf-8')))])
+
+    def get_vectors(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Cached float32 vectors for the keys that are present"""
+        return {key: np.frombuffer(value, dtype=np.float32)
+                for key, value in self._get_many('embedding', keys).items()}
+
+    def put_vectors(self, vectors: Dict[bytes, np.ndarray]) -> bool:
+        return self._put_many('embedding', [(key, np.asarray(vector, dtype=np.float32).tobytes())
+                                            for key, vector in vectors.items()])
+
+    def clear(self) -> int:
+        """Remove every cached completion and embedding, returning how many were deleted"""
+        with self._connect() as conn:
+            deleted = conn.execute("DELETE FROM model_calls").rowcount
+        self._stored_bytes = 0
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics per kind and current size"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT kind, COUNT(*), TOTAL(size) FROM model_calls GROUP BY kind").fetchall()
+        by_kind = {kind: (count, size) for kind, count, size in rows}
+        stats = {'db_path': str(self.db_path), 'max_bytes': self.max_bytes,
+                 'stored_bytes': int(sum(size for _, size in by_kind.values()))}
+        for kind in ('llm', 'embedding'):
+            lookups = self.hits[kind] + self.misses[kind]
+            stats[kind] = {
+                'hits': self.hits[kind],
+                'misses': self.misses[kind],
+                'hit_rate': self.hits[kind] / lookups if lookups else 0.0,
+                'entries': by_kind.get(kind, (0, 0))[0]
+            }
+        return stats
+
+
+def cached_llm_func(llm_func: Callable, cache: ModelCallCache, model: str) -> Callable:
+    """
+    Wrap a LightRAG LLM completion function with the persistent cache
+
+    Streaming calls and non-text responses are passed through uncached. Returns a plain
+    function (not a callable object) because LightRAG deep-copies its config.
+    """
+    async def llm_model_func(prompt, system_prompt=None, history_messages=None, **kwargs):
+        if kwargs.get('stream'):
+            return await llm_func(prompt, system_prompt=system_prompt, history_messages=history_messages, **kwargs)
+
+        key = cache.llm_key(model, prompt, system_prompt, history_messages, kwargs)
+        cached = cache.get_completion(key)
+        if cached is not None:
+            return cached
+
+        response = await llm_func(prompt, system_prompt=system_prompt, history_messages=history_messages, **kwargs)
+        if isinstance(response, str) and response:
+            cache.put_completion(key, response)
+        return response
+
+    return llm_model_func
+
+
+def cached_embed_func(embed_func: Callable, cache: ModelCallCache, model: str) -> Callable:
+    """
+    Wrap an async embedding function so only texts missing from the cache are embedded
+
+    Returns float32 vectors in input order; duplicate texts in a batch are embedded once.
+    Query and document embeddings of the same text (the `context` kwarg) are cached apart.
+    """
+    async def embed(texts: List[str], **kwargs) -> np.ndarray:
+        context = kwargs.get('context')
+        keys = [cache.embedding_key(model, text, context) for text in texts]
+        vectors = cache.get_vectors(list(dict.fromkeys(keys)))
+
+        missing = {}  # key -> text, first occurrence order
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            embedded = np.asarray(await embed_func(list(missing.values()), **kwargs), dtype=np.float32)
+            new_vectors = dict(zip(missing, embedded))
+            cache.put_vectors(new_vectors)
+            vectors.update(new_vectors)
+
+        return np.stack([vectors[key] for key in keys]) if keys else np.empty((0, 0), dtype=np.float32)
+
+    return embed
@@ -1,16 +1,31 @@
 # Location: /src/ice_lightrag/model_provider.py
 # Purpose: Model provider factory for LightRAG supporting OpenAI and Ollama
 # Why: Enables user choice between paid OpenAI API ($5/mo) and free local Ollama ($0/mo)
-# Relevant Files: ice_rag_fixed.py, LOCAL_LLM_GUIDE.md, CLAUDE.md
+# Relevant Files: ice_rag_fixed.py, model_cache.py, LOCAL_LLM_GUIDE.md, CLAUDE.md
 
 import os
 import logging
+import dataclasses
 import requests
-from typing import Tuple, Dict, Any, Callable
+from pathlib import Path
+from typing import Tuple, Dict, Any, Callable, Optional
 from lightrag.utils import EmbeddingFunc
 
 logger = logging.getLogger(__name__)
 
+# Persistent LLM/embedding cache shared by every LightRAG working dir
+try:
+    try:
+        from .model_cache import ModelCallCache, cached_llm_func, cached_embed_func
+    except ImportError:  # Loaded as a top-level module (src/ice_lightrag on sys.path)
+        from model_cache import ModelCallCache, cached_llm_func, cached_embed_func
+    MODEL_CACHE_AVAILABLE = True
+except ImportError:
+    MODEL_CACHE_AVAILABLE = False
+    logger.warning("Model call cache not available")
+
+_model_call_caches: Dict[str, Any] = {}
+
 
 def get_extraction_temperature() -> float:
     """
@@ -107,6 +122,10 @@ def get_temperature() -> float:
 
 
 # Try importing LightRAG providers
+# Provider-qualified model names for model call cache keys (lightrag.llm.openai defaults)
+OPENAI_LLM_CACHE_NAME = "openai:gpt-4o-mini"
+OPENAI_EMBEDDING_CACHE_NAME = "openai:text-embedding-3-small"
+
 try:
     from lightrag.llm.openai import gpt_4o_mini_complete, openai_embed
     OPENAI_AVAILABLE = True
@@ -152,6 +171,60 @@ def create_model_kwargs_with_temperature(base_kwargs: Dict[str, Any], temperatur
     return kwargs
 
 
+def get_model_call_cache() -> Optional["ModelCallCache"]:
+    """
+    Shared persistent cache for LLM completions and embeddings (None when disabled)
+
+    One cache per directory per process, so every JupyterICERAG instance - production
+    graph, from-scratch rebuilds, test storages - reuses the same entries.
+
+    Environment Variables:
+        ICE_MODEL_CACHE: "true" (default) or "false"
+        ICE_MODEL_CACHE_DIR: Cache directory (default: "storage/cache/model_cache")
+        ICE_MODEL_CACHE_MAX_MB: Size bound before LRU eviction (default: 512)
+    """
+    if not MODEL_CACHE_AVAILABLE or os.getenv("ICE_MODEL_CACHE", "true").lower() != "true":
+        return None
+
+    db_path = str(Path(os.getenv("ICE_MODEL_CACHE_DIR", "storage/cache/model_cache")).resolve() / "model_calls.sqlite")
+    if db_path not in _model_call_caches:
+        try:
+            max_mb = float(os.getenv("ICE_MODEL_CACHE_MAX_MB", "512"))
+        except ValueError:
+            logger.warning("Invalid ICE_MODEL_CACHE_MAX_MB value, using default 512")
+            max_mb = 512
+        _model_call_caches[db_path] = ModelCallCache(db_path, max_bytes=int(max_mb * 1024 * 1024))
+    return _model_call_caches[db_path]
+
+
+def _with_model_cache(llm_func: Callable, llm_model: str,
+                      embed_func: EmbeddingFunc, embedding_model: str) -> Tuple[Callable, EmbeddingFunc]:
+    """
+    Wrap provider callables with the persistent model call cache (unchanged when disabled)
+
+    Args:
+        llm_func: LightRAG completion function
+        llm_model: Provider-qualified model name used in cache keys (e.g. "openai:gpt-4o-mini")
+        embed_func: LightRAG EmbeddingFunc
+        embedding_model: Provider-qualified embedding model name used in cache keys
+
+    Returns:
+        (llm_func, embed_func), with embed_func still an EmbeddingFunc as LightRAG requires.
+        The wrapper keeps every field of the wrapped EmbeddingFunc (model_name, which names
+        the vector collections, supports_asymmetric, send_dimensions, max_token_size), so
+        query/document context still reaches the provider.
+    """
+    cache = get_model_call_cache()
+    if cache is None:
+        return llm_func, embed_func
+
+    logger.info(f"✅ Model call cache enabled: {cache.db_path}")
+    return (
+        cached_llm_func(llm_func, cache, llm_model),
+        dataclasses.replace(embed_func, func=cached_embed_func(embed_func, cache, embedding_model))
+    )
+
+
 def check_ollama_service(host: str = "http://localhost:11434") -> bool:
     """
     Check if Ollama service is running
@@ -211,11 +284,12 @@ def get_llm_provider() -> Tuple[Callable, Callable, Dict[str, Any], Dict[str, An
         EMBEDDING_PROVIDER: "openai" (default) or "ollama"
         EMBEDDING_MODEL: Embedding model (default: "nomic-embed-text" for ollama)
         EMBEDDING_DIM: Embedding dimension (default: 1536 for openai, 768 for ollama)
+        ICE_MODEL_CACHE, ICE_MODEL_CACHE_DIR, ICE_MODEL_CACHE_MAX_MB: See get_model_call_cache()
 
     Returns:
         Tuple of (llm_func, embed_func, model_config, base_kwargs_template)
-        - llm_func: LLM completion function
-        - embed_func: Embedding function
+        - llm_func: LLM completion function (wrapped with the persistent model call cache)
+        - embed_func: Embedding function (wrapped with the persistent model call cache)
         - model_config: Dict with llm_model_name, llm_model_kwargs (with extraction temperature)
         - base_kwargs_template: Template kwargs for dynamic temperature changes
 
@@ -253,9 +327,12 @@ def get_llm_provider() -> Tuple[Callable, Callable, Dict[str, Any], Dict[str, An
             )
         }
 
+        llm_func, embed_func = _with_model_cache(
+            gpt_4o_mini_complete, OPENAI_LLM_CACHE_NAME, openai_embed, OPENAI_EMBEDDING_CACHE_NAME
+        )
         return (
-            gpt_4o_mini_complete,
-            openai_embed,
+            llm_func,
+            embed_func,
             model_config,
             base_kwargs_template
         )
@@ -304,6 +381,7 @@ def get_llm_provider() -> Tuple[Callable, Callable, Dict[str, Any], Dict[str, An
                     host=ollama_host
                 )
             )
+            embedding_cache_name = f"ollama:{embedding_model}"
             logger.info(f"✅ Using Ollama embeddings ({embedding_model}, {embedding_dim}-dim)")
         else:
             # Hybrid: Ollama LLM + OpenAI embeddings
@@ -312,6 +390,7 @@ def get_llm_provider() -> Tuple[Callable, Callable, Dict[str, Any], Dict[str, An
                 return _fallback_to_openai("OpenAI not available for embeddings")
 
             embed_func = openai_embed
+            embedding_cache_name = OPENAI_EMBEDDING_CACHE_NAME
             logger.info("✅ Using hybrid: Ollama LLM + OpenAI embeddings")
 
         extraction_temp = get_extraction_temperature()
@@ -341,8 +420,11 @@ def get_llm_provider() -> Tuple[Callable, Callable, Dict[str, Any], Dict[str, An
             )
         }
 
+        llm_func, embed_func = _with_model_cache(
+            ollama_model_complete, f"ollama:{model_name}", embed_func, embedding_cache_name
+        )
         return (
-            ollama_model_complete,
+            llm_func,
             embed_func,
             model_config,
             base_kwargs_template
@@ -406,9 +488,12 @@ def _fallback_to_openai(reason: str) -> Tuple[Callable, Callable, Dict[str, Any]
         )
     }
 
+    llm_func, embed_func = _with_model_cache(
+        gpt_4o_mini_complete, OPENAI_LLM_CACHE_NAME, openai_embed, OPENAI_EMBEDDING_CACHE_NAME
+    )
     return (
-        gpt_4o_mini_complete,
-        openai_embed,
+        llm_func,
+        embed_func,
         model_config,
         base_kwargs_template
     )
@@ -417,6 +502,7 @@ def _fallback_to_openai(reason: str) -> Tuple[Callable, Callable, Dict[str, Any]
 # Export for testing
 __all__ = [
     'get_llm_provider',
+    'get_model_call_cache',
     'check_ollama_service',
     'check_ollama_model_available'
 ]
@@ -0,0 +1,200 @@
+# Location: src/ice_lightrag/query_cache.py
+# Purpose: Persistent LightRAG query-result cache invalidated by a graph-version counter
+# Why: Dashboard and portfolio-analysis queries repeat verbatim; each one re-ran aquery_llm (~12s)
+# Relevant Files: ice_rag_fixed.py, updated_architectures/implementation/ice_simplified.py
+
+"""
+Query result cache for JupyterICERAG.query
+
+Entries are keyed on (normalized question, mode, graph version, answer settings) and
+stored as JSON in a small SQLite database next to the LightRAG storage. The graph version
+is a persisted counter bumped after every successful insert, so any change to the graph
+makes earlier answers unreachable - no per-entry dependency tracking is needed. Entries
+also expire after a TTL, and the least recently used ones are evicted beyond max_entries.
+"""
+
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_question(question: str) -> str:
+    """Case/whitespace/trailing-punctuation-insensitive form of a question"""
+    return _WHITESPACE.sub(' ', question).strip().rstrip('?.! ').casefold()
+
+
+class QueryResultCache:
+    """
+    SQLite-backed LRU/TTL cache of successful query results
+
+    A connection is opened per operation, so the cache is safe to share across threads
+    and event loops, and other processes using the same working directory see the same
+    graph version.
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_entries: int = 1000, ttl_seconds: float = 86400):
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._metrics_lock = threading.Lock()
+        self._tables_ready = False  # Database file is created on first use
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._tables_ready:
+            self._create_tables()
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _create_tables(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path, timeout=30) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS query_results (
+                    cache_key TEXT PRIMARY KEY,
+                    question TEXT NOT NULL,
+                    mode TEXT NOT NULL,
+                    graph_version INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    hit_count INTEGER DEFAULT 0
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_query_results_accessed ON query_results(last_accessed)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO cache_meta (key, value) VALUES ('graph_version', 0)")
+        self._tables_ready = True
+
+    # ------------------------------------------------------------------ graph version
+
+    @property
+    def graph_version(self) -> int:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM cache_meta WHERE key = 'graph_version'").fetchone()
+        return row[0] if row else 0
+
+    def bump_graph_version(self) -> int:
+        """Mark the graph as changed; every cached answer becomes stale"""
+        with self._connect() as conn:
+            conn.execute("UPDATE cache_meta SET value = value + 1 WHERE key = 'graph_version'")
+            return conn.execute("SELECT value FROM cache_meta WHERE key = 'graph_version'").fetchone()[0]
+
+    # ------------------------------------------------------------------ entries
+
+    @staticmethod
+    def _make_key(question: str, mode: str, graph_version: int, settings: Optional[Dict[str, Any]]) -> str:
+        payload = json.dumps([normalize_question(question), mode, graph_version, settings or {}],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _record(self, hit: bool):
+        with self._metrics_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, question: str, mode: str, settings: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Cached result for the question on the current graph, or None"""
+        try:
+            now = time.time()
+            with self._connect() as conn:
+                version = conn.execute("SELECT value FROM cache_meta WHERE key = 'graph_version'").fetchone()[0]
+                key = self._make_key(question, mode, version, settings)
+                row = conn.execute(
+                    "SELECT result, created_at FROM query_results WHERE cache_key = ?", (key,)
+                ).fetchone()
+
+                if row is None:
+                    self._record(False)
+                    return None
+                if now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM query_results WHERE cache_key = ?", (key,))
+                    self._record(False)
+                    return None
+
+                conn.execute(
+                    "UPDATE query_results SET last_accessed = ?, hit_count = hit_count + 1 WHERE cache_key = ?",
+                    (now, key)
+                )
+            self._record(True)
+            return json.loads(row[0])
+
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"Query cache read failed: {e}")
+            self._record(False)
+            return None
+
+    def put(self, question: str, mode: str, result: Dict[str, Any], settings: Optional[Dict[str, Any]] = None,
+            graph_version: Optional[int] = None) -> bool:
+        """
+        Store a result for the current graph version and evict stale/expired/LRU entries
+
+        Pass the graph_version read before the query ran: if an insert finished while the
+        query was in flight, the answer may describe the old graph and is not stored.
+        """
+        try:
+            now = time.time()
+            with self._connect() as conn:
+                version = conn.execute("SELECT value FROM cache_meta WHERE key = 'graph_version'").fetchone()[0]
+                if graph_version is not None and graph_version != version:
+                    return False
+                conn.execute(
+                    """INSERT OR REPLACE INTO query_results
+                       (cache_key, question, mode, graph_version, result, created_at, last_accessed, hit_count)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, 0)""",
+                    (self._make_key(question, mode, version, settings), question, mode, version,
+                     json.dumps(result, default=str), now, now)
+                )
+                # Answers for older graph versions or past their TTL can never be served again
+                conn.execute(
+                    "DELETE FROM query_results WHERE graph_version != ? OR created_at < ?",
+                    (version, now - self.ttl_seconds)
+                )
+                conn.execute(
+                    """DELETE FROM query_results WHERE cache_key IN (
+                           SELECT cache_key FROM query_results ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+                       )""",
+                    (self.max_entries,)
+                )
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Query cache write failed: {e}")
+            return False
+
+    def clear(self) -> int:
+        """Remove all cached results, returning how many were deleted"""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM query_results").rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics and current size"""
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM query_results").fetchone()[0]
+            version = conn.execute("SELECT value FROM cache_meta WHERE key = 'graph_version'").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'graph_version': version
+        }
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_async_http_connectors.py
+Purpose: Tests for the shared async HTTP client, token-bucket limiter and SEC connector concurrency
+Business Purpose: Watchlist-wide SEC/news fetches should be bounded by provider rate limits,
+                  not by serial round-trips or a new event loop per ticker
+
+RELEVANT FILES: ice_data_ingestion/async_http.py, ice_data_ingestion/sec_edgar_connector.py,
+                ice_data_ingestion/financial_news_connectors.py
+"""
+
+import asyncio
+import time
+import unittest
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+if AIOHTTP_AVAILABLE:
+    from ice_data_ingestion.async_http import AsyncTokenBucket, AsyncHTTPClient, run_sync, get_loop_runner
+    from ice_data_ingestion.sec_edgar_connector import SECEdgarConnector
+
+RESPONSE_DELAY = 0.1
+
+
+@unittest.skipUnless(AIOHTTP_AVAILABLE, "aiohttp not installed")
+class TestAsyncTokenBucket(unittest.TestCase):
+    """Reservations are spaced at the configured rate"""
+
+    def test_concurrent_acquires_are_spaced(self):
+        bucket = AsyncTokenBucket(rate=50, capacity=1)
+
+        async def acquire_all():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(acquire_all())
+
+        # First token is immediate, the other 5 arrive every 20ms
+        self.assertGreaterEqual(elapsed, 5 / 50 - 0.01)
+        self.assertLess(elapsed, 0.5)
+
+    def test_burst_up_to_capacity(self):
+        bucket = AsyncTokenBucket(rate=1, capacity=3)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertGreater(delays[3], 0.9)
+
+
+@unittest.skipUnless(AIOHTTP_AVAILABLE, "aiohttp not installed")
+class TestSECConnectorConcurrency(unittest.TestCase):
+    """SEC connector against a local server that answers slowly"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.requests = []
+
+        async def tickers(request):
+            cls.requests.append(request.path)
+            await asyncio.sleep(RESPONSE_DELAY)
+            return web.json_response({str(i): {'ticker': f'T{i}', 'cik_str': 1000 + i} for i in range(20)})
+
+        async def submissions(request):
+            cls.requests.append(request.path)
+            await asyncio.sleep(RESPONSE_DELAY)
+            return web.json_response({'filings': {'recent': {
+                'form': ['10-K', '8-K'], 'filingDate': ['2024-01-01', '2024-02-01'],
+                'accessionNumber': ['a-1', 'a-2']
+            }}})
+
+        async def start():
+            app = web.Application()
+            app.router.add_get('/files/company_tickers.json', tickers)
+            app.router.add_get('/submissions/{name}', submissions)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            return runner, runner.addresses[0][1]
+
+        cls.server, port = run_sync(start())
+        cls.base = f'http://127.0.0.1:{port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        run_sync(cls.server.cleanup())
+
+    def setUp(self):
+        self.requests.clear()
+        self.connector = SECEdgarConnector()
+        self.connector.base_url = self.base
+        self.connector.tickers_url = f'{self.base}/files/company_tickers.json'
+        self.connector.http_client = AsyncHTTPClient('sec_test')
+        self.connector.rate_limiter = AsyncTokenBucket(rate=1000, capacity=1)
+        self.addCleanup(self.connector.http_client.close)
+
+    def test_batch_overlaps_requests_and_loads_tickers_once(self):
+        start = time.perf_counter()
+        results = run_sync(self.connector.get_recent_filings_batch([f'T{i}' for i in range(20)], limit=1))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual([f.form for f in results['T7']], ['10-K'])
+        self.assertEqual(self.requests.count('/files/company_tickers.json'), 1)
+        # 21 serial round-trips would take 21 * RESPONSE_DELAY
+        self.assertLess(elapsed, 6 * RESPONSE_DELAY)
+
+    def test_rate_limit_bounds_throughput(self):
+        self.connector.rate_limiter = AsyncTokenBucket(rate=20, capacity=1)
+
+        start = time.perf_counter()
+        run_sync(self.connector.get_recent_filings_batch([f'T{i}' for i in range(5)], limit=1))
+        elapsed = time.perf_counter() - start
+
+        # 6 requests at 20/s: the last one can't start before 5/20s
+        self.assertGreaterEqual(elapsed, 5 / 20)
+
+    def test_sync_callers_share_the_long_lived_loop(self):
+        def fetch(ticker):
+            return run_sync(self.connector.get_recent_filings(ticker, limit=2))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fetch, [f'T{i}' for i in range(8)]))
+
+        self.assertTrue(all(len(filings) == 2 for filings in results))
+        self.assertEqual(self.connector.http_client._session.closed, False)
+
+    def test_awaiting_from_another_loop(self):
+        filings = asyncio.run(self.connector.get_recent_filings('T3', limit=2))
+
+        self.assertEqual([f.accession_number for f in filings], ['a-1', 'a-2'])
+
+    def test_run_sync_refuses_its_own_loop(self):
+        async def nested():
+            return run_sync(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            get_loop_runner().run(nested())
+
+
+if __name__ == '__main__':
+    unittest.main()
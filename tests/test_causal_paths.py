@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_causal_paths.py
+Purpose: Tests for bounded multi-hop causal path search in ICEGraphBuilder
+Business Purpose: Ticker intelligence and graph-context queries need the strongest
+                  supply-chain/risk paths within a few hops, in milliseconds
+
+RELEVANT FILES: src/ice_core/ice_graph_builder.py, ice_query_processor.py, ice_system_manager.py
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    import networkx as nx
+    NETWORKX_AVAILABLE = True
+except ImportError:
+    NETWORKX_AVAILABLE = False
+
+if NETWORKX_AVAILABLE:
+    from src.ice_core.ice_graph_builder import ICEGraphBuilder
+
+
+@unittest.skipUnless(NETWORKX_AVAILABLE, "networkx not installed")
+class TestFindCausalPaths(unittest.TestCase):
+    """Depth limit, confidence pruning and path ranking"""
+
+    def setUp(self):
+        self.builder = ICEGraphBuilder(lightrag_instance=None)
+        self.builder._rebuild_graph_from_edges([
+            ('NVDA', 'TSMC', 'depends_on', 0.9, 1, False),
+            ('TSMC', 'TAIWAN', 'operates_in', 0.8, 1, False),
+            ('NVDA', 'SUPPLY_CHAIN', 'exposed_to', 0.7, 1, False),
+            ('SUPPLY_CHAIN', 'TAIWAN', 'linked_to', 0.95, 1, False),
+            ('TAIWAN', 'CHINA_RISK', 'exposed_to', 0.9, 1, False),
+            ('NVDA', 'AMD', 'competes_with', 0.3, 1, False),
+            ('AMD', 'TSMC', 'depends_on', 0.99, 1, False),
+        ])
+
+    def test_respects_max_hops(self):
+        paths = self.builder.find_causal_paths('NVDA', max_hops=2)
+
+        self.assertTrue(paths)
+        self.assertTrue(all(p['hop_count'] <= 2 for p in paths))
+        self.assertNotIn('CHINA_RISK', {p['entities'][-1] for p in paths})
+        self.assertIn('CHINA_RISK', {p['entities'][-1] for p in self.builder.find_causal_paths('NVDA', max_hops=3)})
+
+    def test_prunes_low_confidence_edges(self):
+        paths = self.builder.find_causal_paths('NVDA', max_hops=3, min_confidence=0.6)
+
+        self.assertFalse(any('AMD' in p['entities'] for p in paths))
+        self.assertTrue(any('AMD' in p['entities'] for p in self.builder.find_causal_paths('NVDA', min_confidence=0.2)))
+
+    def test_multiple_paths_per_target_ranked_by_confidence(self):
+        paths = self.builder.find_causal_paths('NVDA', max_hops=3, paths_per_target=2)
+        to_taiwan = [p for p in paths if p['entities'][-1] == 'TAIWAN']
+
+        self.assertEqual([p['entities'] for p in to_taiwan],
+                         [['NVDA', 'TSMC', 'TAIWAN'], ['NVDA', 'SUPPLY_CHAIN', 'TAIWAN']])
+        self.assertAlmostEqual(to_taiwan[0]['confidence'], (0.9 * 0.8) ** 0.5)
+        self.assertEqual(to_taiwan[0]['path_str'], 'NVDA --depends_on--> TSMC → TSMC --operates_in--> TAIWAN')
+
+        confidences = [p['confidence'] for p in paths]
+        self.assertEqual(confidences, sorted(confidences, reverse=True))
+
+    def test_top_k_and_per_target_limits(self):
+        paths = self.builder.find_causal_paths('NVDA', max_hops=3, top_k=2, paths_per_target=1)
+
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(len({p['entities'][-1] for p in paths}), 2)
+
+    def test_strongest_parallel_edge_is_used(self):
+        self.builder.graph.add_edge('TSMC', 'ASML', edge_type='depends_on', confidence=0.4)
+        self.builder.graph.add_edge('TSMC', 'ASML', edge_type='sells_to', confidence=0.85)
+
+        path = next(p for p in self.builder.find_causal_paths('TSMC', max_hops=1) if p['entities'][-1] == 'ASML')
+
+        self.assertEqual(path['hops'][0]['edge_type'], 'sells_to')
+
+    def test_unknown_entity(self):
+        self.assertEqual(self.builder.find_causal_paths('MISSING'), [])
+
+    def test_hub_search_is_budgeted(self):
+        # Ticker-like hub: 200 suppliers, each with 5 downstream exposures
+        for i in range(200):
+            self.builder.graph.add_edge('HUB', f'S{i}', edge_type='depends_on', confidence=0.6 + i * 0.001)
+            for j in range(5):
+                self.builder.graph.add_edge(f'S{i}', f'R{i}_{j}', edge_type='exposed_to', confidence=0.9)
+
+        with patch.object(self.builder, '_strongest_out_edges', wraps=self.builder._strongest_out_edges) as expand:
+            paths = self.builder.find_causal_paths('HUB', max_hops=2, branching_limit=3)
+
+        # The hub plus its 3 strongest suppliers are expanded, not all 200
+        self.assertEqual(expand.call_count, 4)
+        self.assertEqual({p['entities'][1] for p in paths}, {'S199', 'S198', 'S197'})
+
+        with patch.object(self.builder, '_strongest_out_edges', wraps=self.builder._strongest_out_edges) as expand:
+            self.builder.find_causal_paths('HUB', max_hops=3, branching_limit=None, max_expansions=10)
+
+        self.assertEqual(expand.call_count, 10)
+
+    def test_entity_summary_centrality_matches_networkx(self):
+        summary = self.builder.get_entity_summary('TSMC')
+
+        self.assertAlmostEqual(summary['centrality'], nx.degree_centrality(self.builder.graph)['TSMC'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_chunk_embedding_cache.py
+Purpose: Tests for the memory-mapped chunk embedding cache used by SentenceAttributor
+Business Purpose: Attribution latency and embedding spend should scale with new chunks,
+                  not with queries x retrieved chunks
+
+RELEVANT FILES: src/ice_core/embedding_cache.py, src/ice_core/sentence_attributor.py
+"""
+
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.ice_core.embedding_cache import ChunkEmbeddingCache
+from src.ice_core.sentence_attributor import SentenceAttributor
+
+
+class FakeEmbedder:
+    """Deterministic 3-dim embeddings that record every batch requested"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        return np.array([[len(t), t.count('a'), 1.0] for t in texts], dtype=np.float32)
+
+
+class TestChunkEmbeddingCache(unittest.TestCase):
+    """Miss-only batching, persistence and LRU eviction"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.embed = FakeEmbedder()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_embeds_only_unique_misses(self):
+        cache = ChunkEmbeddingCache(self.tmp, 'test-model')
+
+        first = cache.get_or_embed(['alpha', 'beta', 'alpha'], self.embed)
+        second = cache.get_or_embed(['beta', 'gamma', 'alpha'], self.embed)
+
+        self.assertEqual(self.embed.batches, [['alpha', 'beta'], ['gamma']])
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(second[2], first[0])
+        self.assertEqual(cache.get_stats()['hits'], 2)
+
+    def test_persists_across_instances(self):
+        ChunkEmbeddingCache(self.tmp, 'test-model').get_or_embed(['alpha', 'beta'], self.embed)
+
+        reloaded = ChunkEmbeddingCache(self.tmp, 'test-model')
+        result = reloaded.get_or_embed(['beta'], self.embed)
+
+        self.assertEqual(len(self.embed.batches), 1)
+        np.testing.assert_array_equal(result[0], [4, 1, 1])
+
+    def test_models_do_not_share_entries(self):
+        ChunkEmbeddingCache(self.tmp, 'model/a').get_or_embed(['alpha'], self.embed)
+        ChunkEmbeddingCache(self.tmp, 'model-b').get_or_embed(['alpha'], self.embed)
+
+        self.assertEqual(len(self.embed.batches), 2)
+
+    def test_lru_eviction_reuses_slots(self):
+        cache = ChunkEmbeddingCache(self.tmp, 'test-model', max_entries=2)
+        cache.get_or_embed(['a', 'bb'], self.embed)
+        cache.get_or_embed(['a'], self.embed)  # 'bb' is now least recently used
+        result = cache.get_or_embed(['ccc', 'a'], self.embed)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.vectors_path.stat().st_size, 2 * 3 * 4)
+        np.testing.assert_array_equal(result, [[3, 0, 1], [1, 1, 1]])
+
+        reloaded = ChunkEmbeddingCache(self.tmp, 'test-model', max_entries=2)
+        reloaded.get_or_embed(['a', 'ccc', 'bb'], self.embed)
+        self.assertEqual(self.embed.batches[-1], ['bb'])
+
+
+class TestSentenceAttributorCache(unittest.TestCase):
+    """attribute_sentences reuses cached chunk embeddings"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_repeat_query_embeds_sentences_only(self):
+        embed = FakeEmbedder()
+
+        def init_embedding(attributor):
+            attributor._embedding_func = embed
+            attributor._embedding_model = 'fake'
+
+        with patch.object(SentenceAttributor, '_initialize_embedding_function', init_embedding):
+            attributor = SentenceAttributor(cache_dir=str(self.tmp))
+
+        context = {'chunks': [{'content': 'NVDA revenue grew', 'chunk_id': 1}]}
+        attributor.attribute_sentences('NVDA revenue grew.', context)
+        attributor.attribute_sentences('NVDA revenue grew.', context)
+
+        # Call 1: sentences, chunks; call 2: sentences only
+        self.assertEqual(embed.batches[2:], [['NVDA revenue grew.']])
+        self.assertEqual(attributor.get_cache_stats()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_concurrent_data_ingestion.py
+Purpose: Tests for concurrent multi-ticker fetching in DataIngester
+Business Purpose: Watchlist-wide fetches should cost roughly the slowest few API calls,
+                  not the sum of every provider latency, without breaching provider limits
+
+RELEVANT FILES: updated_architectures/implementation/data_ingestion.py
+"""
+
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+class TestConcurrentDataIngester(unittest.TestCase):
+    """DataIngester.fetch_tickers_concurrent and provider gating"""
+
+    def _make_ingester(self, services=('newsapi', 'finnhub')):
+        from updated_architectures.implementation.data_ingestion import DataIngester
+
+        with patch.object(DataIngester, '__init__', return_value=None):
+            ingester = DataIngester()
+        ingester.config = None
+        ingester.api_keys = {service: 'key' for service in services}
+        ingester.benzinga_client = None
+        ingester._provider_gates = {}
+        return ingester
+
+    def test_results_match_per_category_methods(self):
+        ingester = self._make_ingester()
+        ingester.fetch_company_news = lambda symbol, limit, parallel_providers=False: [{'content': f'{symbol} news', 'source': 'newsapi'}]
+        ingester.fetch_financial_fundamentals = lambda symbol, limit: [{'content': f'{symbol} fin', 'source': 'fmp'}]
+        ingester.fetch_market_data = lambda symbol, limit: []
+        ingester.fetch_sec_filings = lambda symbol, limit: [{'content': f'{symbol} 10-K', 'source': 'sec_edgar'}]
+
+        results = ingester.fetch_tickers_concurrent(['NVDA', 'AMD', 'NVDA'], max_workers=4)
+
+        self.assertEqual(list(results), ['NVDA', 'AMD'])
+        self.assertEqual(results['AMD'], {
+            'news': [{'content': 'AMD news', 'source': 'newsapi'}],
+            'financial': [{'content': 'AMD fin', 'source': 'fmp'}],
+            'market': [],
+            'sec': [{'content': 'AMD 10-K', 'source': 'sec_edgar'}],
+        })
+
+    def test_fetches_overlap_across_tickers(self):
+        ingester = self._make_ingester()
+        delay = 0.05
+
+        def slow(symbol, *args, **kwargs):
+            time.sleep(delay)
+            return [{'content': symbol, 'source': 'x'}]
+
+        ingester.fetch_company_news = slow
+        ingester.fetch_financial_fundamentals = slow
+        ingester.fetch_market_data = slow
+        ingester.fetch_sec_filings = slow
+
+        start = time.perf_counter()
+        ingester.fetch_tickers_concurrent(['A', 'B', 'C', 'D'], max_workers=16)
+        elapsed = time.perf_counter() - start
+
+        # 16 sequential calls would take 16 * delay
+        self.assertLess(elapsed, 8 * delay)
+
+    def test_parallel_news_providers_keep_priority_order(self):
+        ingester = self._make_ingester()
+        ingester._fetch_newsapi = lambda symbol, limit: (time.sleep(0.05), ['newsapi article'])[1]
+        ingester._fetch_finnhub_news = lambda symbol, limit: ['finnhub article 1', 'finnhub article 2']
+
+        documents = ingester.fetch_company_news('NVDA', limit=2, parallel_providers=True)
+
+        self.assertEqual(documents, [
+            {'content': 'newsapi article', 'source': 'newsapi'},
+            {'content': 'finnhub article 1', 'source': 'finnhub'},
+        ])
+
+    def test_serial_news_stops_once_limit_reached(self):
+        ingester = self._make_ingester()
+        ingester._fetch_newsapi = lambda symbol, limit: ['a', 'b']
+        ingester._fetch_finnhub_news = lambda symbol, limit: self.fail('Finnhub should not be called')
+
+        documents = ingester.fetch_company_news('NVDA', limit=2)
+
+        self.assertEqual([d['source'] for d in documents], ['newsapi', 'newsapi'])
+
+    def test_provider_concurrency_cap(self):
+        ingester = self._make_ingester()
+        ingester.PROVIDER_LIMITS = {'polygon': (1, 1000)}
+        in_flight = {'now': 0, 'peak': 0}
+        lock = threading.Lock()
+
+        def call():
+            with ingester._provider_slot('polygon'):
+                with lock:
+                    in_flight['now'] += 1
+                    in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+                time.sleep(0.02)
+                with lock:
+                    in_flight['now'] -= 1
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(in_flight['peak'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_concurrent_llm_temperature.py
+Purpose: Tests for task-local LLM temperature in JupyterICERAG
+Business Purpose: Entity extraction (reproducible, low temperature) and query answering
+                  (higher temperature) must not leak into each other when an ingestion batch
+                  and user queries run at the same time on one LightRAG instance
+
+RELEVANT FILES: src/ice_lightrag/ice_rag_fixed.py, src/ice_lightrag/model_provider.py
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+import sys
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from src.ice_lightrag import ice_rag_fixed
+    from src.ice_lightrag.ice_rag_fixed import JupyterICERAG, _with_call_kwargs
+    LIGHTRAG_WRAPPER_AVAILABLE = ice_rag_fixed.MODEL_PROVIDER_AVAILABLE
+except ImportError:
+    LIGHTRAG_WRAPPER_AVAILABLE = False
+
+try:
+    import numpy as np
+    from lightrag.utils import EmbeddingFunc, Tokenizer
+    LIGHTRAG_INSTALLED = LIGHTRAG_WRAPPER_AVAILABLE and ice_rag_fixed.LIGHTRAG_AVAILABLE
+except ImportError:
+    LIGHTRAG_INSTALLED = False
+
+EXTRACTION_TEMPERATURE = 0.1
+QUERY_TEMPERATURE = 0.7
+
+
+class QueuedLLM:
+    """LightRAG priority-queue double: every call runs on one long-lived worker task"""
+
+    def __init__(self, func):
+        self.func = func
+        self.queue = None
+        self.worker = None
+
+    async def __call__(self, *args, **kwargs):
+        if self.worker is None:
+            # Like LightRAG, the worker starts inside whichever task calls first
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self._work())
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((args, kwargs, future))
+        return await future
+
+    async def _work(self):
+        while True:
+            args, kwargs, future = await self.queue.get()
+            future.set_result(await self.func(*args, **kwargs))
+
+
+class FakeLightRAG:
+    """ainsert/aquery_llm make several interleaving LLM calls through llm_model_func"""
+
+    def __init__(self, bound_kwargs):
+        self.calls = []
+        self.processed = set()
+        self.doc_status = SimpleNamespace(get_by_ids=self._get_by_ids)
+
+        async def llm(prompt, **kwargs):
+            await asyncio.sleep(0.01)
+            self.calls.append((prompt.split(':')[0], kwargs['temperature'], kwargs['seed']))
+            return prompt
+
+        # LightRAG binds llm_model_kwargs once at init, then queues calls
+        self.llm_model_func = QueuedLLM(partial(llm, **bound_kwargs))
+
+    async def ainsert(self, input, ids=None, file_paths=None):
+        for text in input:
+            for chunk in range(3):
+                await self.llm_model_func(f'extract:{text}:{chunk}')
+        self.processed.update(ids)
+
+    async def _get_by_ids(self, ids):
+        return [{'status': 'processed'} if doc_id in self.processed else None for doc_id in ids]
+
+    async def aquery_llm(self, question, param=None):
+        for step in ('keywords', 'answer'):
+            await self.llm_model_func(f'query:{question}:{step}')
+        return {'llm_response': {'content': 'Answer'}, 'data': {}}
+
+
+@unittest.skipUnless(LIGHTRAG_WRAPPER_AVAILABLE, "LightRAG not installed")
+class TestConcurrentOperationTemperature(unittest.TestCase):
+    """Extraction and query calls each see their own temperature"""
+
+    def setUp(self):
+        with patch.object(JupyterICERAG, '__init__', return_value=None):
+            self.rag = JupyterICERAG()
+        self.rag.config = {'timeout': 30, 'batch_size': 5}
+        self.rag._query_cache = None
+        self.rag._context_parser = None
+        self.rag._base_kwargs_template = {'seed': 42}
+        self.rag._extraction_temperature = EXTRACTION_TEMPERATURE
+        self.rag._query_temperature = QUERY_TEMPERATURE
+
+        async def ensure_initialized():
+            return True
+
+        self.rag._ensure_initialized = ensure_initialized
+        self.rag._rag = FakeLightRAG({'seed': 42, 'temperature': EXTRACTION_TEMPERATURE})
+        self.rag._rag.llm_model_func = _with_call_kwargs(self.rag._rag.llm_model_func)
+
+    def test_interleaved_ingestion_and_queries(self):
+        async def run():
+            # Query first, so the shared worker task inherits the query's context
+            return await asyncio.gather(
+                self.rag.query('NVDA risks?'),
+                self.rag.add_documents_concurrent([f'doc{i}' for i in range(4)], max_concurrency=4),
+                self.rag.query('AMD risks?', use_cache=False)
+            )
+
+        with patch.object(ice_rag_fixed, 'QueryParam', lambda mode: SimpleNamespace(mode=mode), create=True):
+            asyncio.run(run())
+
+        calls = self.rag._rag.calls
+        self.assertEqual(len(calls), 4 * 3 + 2 * 2)
+        # Both operations were in flight at once
+        kinds = [kind for kind, _, _ in calls]
+        self.assertLess(kinds.index('extract'), len(kinds) - 1 - kinds[::-1].index('query'))
+        for kind, temperature, seed in calls:
+            expected = EXTRACTION_TEMPERATURE if kind == 'extract' else QUERY_TEMPERATURE
+            self.assertEqual(temperature, expected, kind)
+            self.assertEqual(seed, 42)
+
+    def test_temperature_does_not_outlive_the_operation(self):
+        async def run():
+            await self.rag.add_document('doc')
+            # No operation context: LightRAG's bound init kwargs apply
+            await self.rag._rag.llm_model_func('extract:outside')
+            return ice_rag_fixed._llm_call_kwargs.get()
+
+        self.assertIsNone(asyncio.run(run()))
+        self.assertEqual(self.rag._rag.calls[-1], ('extract', EXTRACTION_TEMPERATURE, 42))
+
+    def test_ollama_kwargs_replace_options(self):
+        self.rag._base_kwargs_template = {'host': 'http://localhost:11434', 'options': {'num_ctx': 32768, 'seed': 42}}
+
+        with self.rag._operation_temperature(QUERY_TEMPERATURE):
+            call_kwargs = ice_rag_fixed._llm_call_kwargs.get()
+
+        self.assertEqual(call_kwargs['options'], {'num_ctx': 32768, 'seed': 42, 'temperature': QUERY_TEMPERATURE})
+        self.assertNotIn('temperature', self.rag._base_kwargs_template['options'])
+
+
+class CharTokenizer:
+    """Offline tokenizer (LightRAG's default downloads tiktoken encodings)"""
+
+    def encode(self, content):
+        return [ord(c) for c in content]
+
+    def decode(self, tokens):
+        return ''.join(map(chr, tokens))
+
+
+@unittest.skipUnless(LIGHTRAG_INSTALLED, "LightRAG not installed")
+class TestRealLightRAGTemperature(unittest.TestCase):
+    """Operation kwargs reach the provider through a real LightRAG instance"""
+
+    def setUp(self):
+        self.provider_calls = []
+
+        async def llm(prompt, system_prompt=None, history_messages=None, **kwargs):
+            self.provider_calls.append(kwargs)
+            return 'Answer'
+
+        async def embed(texts, **kwargs):
+            return np.zeros((len(texts), 8), dtype=np.float32)
+
+        provider = (
+            llm,
+            EmbeddingFunc(embedding_dim=8, func=embed),
+            {'tokenizer': Tokenizer('chars', CharTokenizer())},
+            {'seed': 42}
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patches = [
+            patch.dict(os.environ, {'ICE_TESTING_MODE': 'true', 'ICE_QUERY_CACHE': 'false'}),
+            patch.object(ice_rag_fixed, 'get_llm_provider', return_value=provider),
+            patch.object(ice_rag_fixed, 'get_extraction_temperature', return_value=EXTRACTION_TEMPERATURE),
+            patch.object(ice_rag_fixed, 'get_query_temperature', return_value=QUERY_TEMPERATURE),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_query_temperature_reaches_provider(self):
+        rag = JupyterICERAG(self.tmp.name)
+
+        async def run():
+            self.assertTrue(await rag._ensure_initialized())
+            result = await rag.query('NVDA risks?', mode='bypass', use_cache=False)
+            await rag._rag.finalize_storages()
+            return result
+
+        result = asyncio.run(run())
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(len(self.provider_calls), 1)
+        self.assertEqual(self.provider_calls[0]['temperature'], QUERY_TEMPERATURE)
+        self.assertEqual(self.provider_calls[0]['seed'], 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
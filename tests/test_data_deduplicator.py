@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_data_deduplicator.py
+Purpose: Tests for DataDeduplicator recency-ordered eviction, time window, Bloom layer and batched persistence
+Business Purpose: Sustained news ingestion must keep filtering repeats without unbounded memory
+                  or rewriting the whole dedup cache every 100 items
+
+RELEVANT FILES: ice_data_ingestion/robust_ingestion_manager.py
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ice_data_ingestion import robust_ingestion_manager
+from ice_data_ingestion.robust_ingestion_manager import DataDeduplicator
+
+
+def item(i):
+    return {'symbol': f'T{i}', 'headline': f'Story {i}'}
+
+
+def make_cache_dir(test):
+    """Temp cache dir; deduplicators' exit flushes run before it is removed"""
+    tmp = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, tmp, ignore_errors=True)
+    test.addCleanup(robust_ingestion_manager._open_deduplicators.clear)
+    test.addCleanup(robust_ingestion_manager._flush_open_deduplicators)
+    return tmp
+
+
+class TestDataDeduplicator(unittest.TestCase):
+    """Exact store, window expiry and persistence"""
+
+    def setUp(self):
+        self.tmp = make_cache_dir(self)
+        self.now = 1_700_000_000.0
+        patcher = patch.object(robust_ingestion_manager.time, 'time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make(self, **kwargs):
+        kwargs.setdefault('bloom_capacity', 0)
+        return DataDeduplicator(cache_dir=self.tmp, **kwargs)
+
+    def test_evicts_least_recently_seen(self):
+        dedup = self.make(max_entries=3)
+        for i in range(3):
+            self.assertFalse(dedup.is_duplicate(item(i)))
+
+        self.assertTrue(dedup.is_duplicate(item(0)))  # Refreshes item 0
+        self.assertFalse(dedup.is_duplicate(item(3)))  # Evicts item 1, the least recently seen
+
+        self.assertTrue(dedup.is_duplicate(item(0)))
+        self.assertFalse(dedup.is_duplicate(item(1)))
+        self.assertEqual(len(dedup.seen_hashes), 3)
+        self.assertEqual(dedup.duplicates_found, 2)
+
+    def test_items_expire_after_the_window(self):
+        dedup = self.make(window_hours=1)
+        dedup.is_duplicate(item(0))
+
+        self.now += 1800
+        self.assertTrue(dedup.is_duplicate(item(0)))
+
+        self.now += 3601
+        self.assertFalse(dedup.is_duplicate(item(0)))
+
+    def test_persists_in_batches_and_compacts(self):
+        dedup = self.make(max_entries=20, save_every=5)
+        for i in range(4):
+            dedup.is_duplicate(item(i))
+        self.assertFalse(dedup.journal_file.exists())
+
+        dedup.is_duplicate(item(4))
+        self.assertEqual(len(dedup.journal_file.read_text().splitlines()), 5)
+
+        for i in range(5, 30):
+            dedup.is_duplicate(item(i))
+        dedup.flush()
+
+        # The journal outgrew the store at item 24: snapshot holds the 20 most recent, in order,
+        # and the journal restarts with the next batch
+        with open(dedup.snapshot_file) as f:
+            snapshot = json.load(f)
+        self.assertEqual([h for h, _ in snapshot], [dedup.compute_hash(item(i)) for i in range(5, 25)])
+        self.assertEqual(len(dedup.journal_file.read_text().splitlines()), 5)
+
+        reloaded = self.make(max_entries=20)
+        self.assertEqual(list(reloaded.seen_hashes), list(dedup.seen_hashes))
+        self.assertTrue(reloaded.is_duplicate(item(29)))
+        self.assertFalse(reloaded.is_duplicate(item(0)))
+
+    def test_loads_legacy_hash_list(self):
+        legacy = self.make().compute_hash(item(7))
+        with open(Path(self.tmp) / 'seen_hashes.json', 'w') as f:
+            json.dump([legacy], f)
+
+        self.assertTrue(self.make().is_duplicate(item(7)))
+
+    def test_pending_changes_flushed_at_exit(self):
+        dedup = self.make(save_every=100)
+        for i in range(5):
+            dedup.is_duplicate(item(i))
+
+        self.assertFalse(dedup.journal_file.exists())
+        self.assertIn(dedup, robust_ingestion_manager._open_deduplicators)
+
+        dedup.close()
+        self.assertNotIn(dedup, robust_ingestion_manager._open_deduplicators)
+
+        reloaded = self.make()
+        self.assertTrue(all(reloaded.is_duplicate(item(i)) for i in range(5)))
+
+
+class TestDeduplicatorBloomLayer(unittest.TestCase):
+    """Bloom filter remembers items evicted from the bounded exact store"""
+
+    def setUp(self):
+        self.tmp = make_cache_dir(self)
+
+    def test_evicted_items_stay_duplicates(self):
+        dedup = DataDeduplicator(cache_dir=self.tmp, max_entries=50, bloom_capacity=5000)
+        for i in range(2000):
+            dedup.is_duplicate(item(i))
+
+        self.assertEqual(len(dedup.seen_hashes), 50)
+        self.assertTrue(all(dedup.is_duplicate(item(i)) for i in range(2000)))
+
+        false_positives = sum(dedup.is_duplicate(item(i)) for i in range(10000, 12000))
+        self.assertLessEqual(false_positives, 10)  # 0.1% target error rate
+
+    def test_bloom_layer_survives_restart(self):
+        dedup = DataDeduplicator(cache_dir=self.tmp, max_entries=10, bloom_capacity=1000)
+        for i in range(100):
+            dedup.is_duplicate(item(i))
+        dedup.flush()
+
+        reloaded = DataDeduplicator(cache_dir=self.tmp, max_entries=10, bloom_capacity=1000)
+        self.assertTrue(reloaded.is_duplicate(item(3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_docling_conversion_service.py
+Purpose: Tests for the shared Docling conversion pool (content-hash cache, in-flight dedupe, async API)
+Business Purpose: The same broker PDF attached to several emails or re-ingested should be
+                  converted once, and URL downloads shouldn't stall while PDFs convert
+
+RELEVANT FILES: src/ice_docling/conversion_service.py, src/ice_docling/docling_processor.py
+"""
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ice_docling import conversion_service
+from src.ice_docling.conversion_service import DoclingConversionService
+
+
+class FakeConverter:
+    """Stands in for convert_document; records calls and can block until released"""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, content, filename):
+        self.release.wait(timeout=5)
+        self.calls.append(filename)
+        if content.startswith(b'bad'):
+            raise ValueError("unsupported format")
+        return {'text': content.decode(), 'tables': [{'index': 0, 'data': []}], 'page_count': 2}
+
+
+class TestDoclingConversionService(unittest.TestCase):
+    """In-process (max_workers=0) service with a fake converter"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.fake = FakeConverter()
+        patcher = patch.object(conversion_service, 'convert_document', self.fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = DoclingConversionService(max_workers=0, cache_dir=str(self.tmp))
+        self.addCleanup(self.service.shutdown)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_converts_once_per_content_hash(self):
+        first = self.service.convert(b'broker note', 'a.pdf')
+        second = self.service.convert(b'broker note', 'renamed.pdf')
+
+        self.assertEqual(self.fake.calls, ['a.pdf'])
+        self.assertNotIn('cached', first)
+        self.assertTrue(second['cached'])
+        self.assertEqual(second['text'], 'broker note')
+        self.assertEqual(self.service.stats['cache_hits'], 1)
+
+    def test_cache_persists_across_instances(self):
+        self.service.convert(b'broker note', 'a.pdf')
+
+        reloaded = DoclingConversionService(max_workers=0, cache_dir=str(self.tmp))
+        result = reloaded.convert(b'broker note', 'a.pdf')
+
+        self.assertTrue(result['cached'])
+        self.assertEqual(len(self.fake.calls), 1)
+
+    def test_identical_inflight_submissions_share_a_future(self):
+        self.fake.release.clear()
+        first = self.service.submit(b'same bytes', 'a.pdf')
+        second = self.service.submit(b'same bytes', 'b.pdf')
+        self.fake.release.set()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.result(timeout=5)['page_count'], 2)
+        self.assertEqual(self.fake.calls, ['a.pdf'])
+
+    def test_failures_are_raised_and_not_cached(self):
+        with self.assertRaises(ValueError):
+            self.service.convert(b'bad bytes', 'a.xyz')
+        with self.assertRaises(ValueError):
+            self.service.convert(b'bad bytes', 'a.xyz')
+
+        self.assertEqual(len(self.fake.calls), 2)
+        self.assertEqual(self.service.stats['failed'], 2)
+
+    def test_aconvert_runs_conversions_concurrently_with_the_loop(self):
+        async def run():
+            return await asyncio.gather(
+                self.service.aconvert(b'one', '1.pdf'),
+                self.service.aconvert(b'two', '2.pdf'),
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual([r['text'] for r in results], ['one', 'two'])
+
+
+if __name__ == '__main__':
+    unittest.main()
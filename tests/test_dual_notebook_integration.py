@@ -92,7 +92,8 @@ class TestDualNotebookIntegration(unittest.TestCase):
             # Verify the query was called with bypass mode
             core._rag.query.assert_called_once_with(
                 "What are general investment strategies?",
-                mode='bypass'
+                mode='bypass',
+                use_cache=True
             )
 
             # Verify metrics are still added
@@ -204,7 +205,8 @@ class TestDualNotebookIntegration(unittest.TestCase):
             # Verify 'mix' mode was used as default
             core._rag.query.assert_called_once_with(
                 "What is the market outlook?",
-                mode='mix'
+                mode='mix',
+                use_cache=True
             )
 
             # Verify metrics show 'mix' as the mode
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_email_bulk_fetch.py
+Purpose: Tests for bulk UID FETCH and pipelined parsing in EmailIngestionClient.fetch_emails_batch
+Business Purpose: Initial syncs of thousands of broker emails should cost a few round-trips
+                  per hundred messages, not one serialized fetch per message
+
+RELEVANT FILES: ice_data_ingestion/email_ingestion_unified.py, ice_data_ingestion/imap_bulk_fetch.py
+"""
+
+import shutil
+import tempfile
+import threading
+import unittest
+import sys
+from email.message import EmailMessage
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ice_data_ingestion.imap_bulk_fetch import adapt_batch_size, parse_uid_fetch_response
+
+try:
+    from ice_data_ingestion.email_ingestion_unified import EmailIngestionClient, EmailContent
+    EMAIL_CLIENT_AVAILABLE = True
+except ImportError:
+    EMAIL_CLIENT_AVAILABLE = False
+
+
+def make_raw_email(uid: int) -> bytes:
+    msg = EmailMessage()
+    msg['Subject'] = f'NVDA upgrade {uid}'
+    msg['From'] = 'analyst@broker.com'
+    msg['To'] = 'pm@fund.com'
+    msg['Message-ID'] = f'<msg-{uid}@broker.com>'
+    msg['Date'] = 'Mon, 06 Jan 2025 09:00:00 +0000'
+    msg.set_content(f'We upgrade NVDA to Buy. Note {uid}.')
+    return msg.as_bytes()
+
+
+class FakeIMAP:
+    """Single-threaded IMAP double: fails the test if used from two threads at once"""
+
+    def __init__(self, uids):
+        self.uids = uids
+        self.fetch_sets = []
+        self.stored = []
+        self.owner = threading.get_ident()
+
+    def noop(self):
+        return ('OK', [])
+
+    def select(self, folder, readonly=False):
+        return ('OK', [str(len(self.uids)).encode()])
+
+    def uid(self, command, *args):
+        assert threading.get_ident() == self.owner, "IMAP connection used from a worker thread"
+        if command == 'search':
+            return ('OK', [' '.join(str(u) for u in self.uids).encode()])
+        if command == 'fetch':
+            requested = args[0].split(',')
+            self.fetch_sets.append(requested)
+            data = []
+            for seq, uid in enumerate(requested, 1):
+                raw = make_raw_email(int(uid))
+                data.append((f'{seq} (UID {uid} RFC822 {{{len(raw)}}}'.encode(), raw))
+                data.append(b')')
+            return ('OK', data)
+        if command == 'store':
+            self.stored.extend(args[0].split(','))
+            return ('OK', [])
+        raise AssertionError(f"unexpected command {command}")
+
+
+class TestBulkFetchHelpers(unittest.TestCase):
+    """UID FETCH response parsing and adaptive batch sizing, without an IMAP client"""
+
+    def test_parses_messages_by_uid(self):
+        status, data = FakeIMAP([]).uid('fetch', '7,12,30', '(RFC822)')
+
+        raw_emails = parse_uid_fetch_response(data)
+
+        self.assertEqual(status, 'OK')
+        self.assertEqual(list(raw_emails), ['7', '12', '30'])
+        self.assertEqual(raw_emails['12'], make_raw_email(12))
+
+    def test_skips_separators_and_parts_without_uid(self):
+        data = [(b'1 (UID 5 RFC822 {3}', b'abc'), b')', (b'2 (FLAGS (\\Seen))', b''), b')']
+
+        self.assertEqual(parse_uid_fetch_response(data), {'5': b'abc'})
+        self.assertEqual(parse_uid_fetch_response(None), {})
+
+    def test_fast_fetches_grow_the_batch(self):
+        self.assertEqual(adapt_batch_size(50, 1.0, 5.0, 10, 500), 100)
+        self.assertEqual(adapt_batch_size(400, 1.0, 5.0, 10, 500), 500)
+
+    def test_slow_fetches_shrink_the_batch(self):
+        self.assertEqual(adapt_batch_size(40, 6.0, 5.0, 5, 500), 20)
+        self.assertEqual(adapt_batch_size(6, 6.0, 5.0, 5, 500), 5)
+
+    def test_batch_kept_near_the_target(self):
+        self.assertEqual(adapt_batch_size(40, 3.0, 5.0, 10, 500), 40)
+
+
+@unittest.skipUnless(EMAIL_CLIENT_AVAILABLE, "email ingestion dependencies not installed")
+class TestBulkUIDFetch(unittest.TestCase):
+    """Batched downloads, adaptive batch size and state checkpoints"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.client = EmailIngestionClient(state_dir=self.tmp)
+        for name, value in [('ensure_connection', lambda client: True),
+                            # Content extraction is covered elsewhere; keep these tests about fetching
+                            ('_extract_content', lambda client, message: EmailContent(body_text=message.get_payload()))]:
+            patcher = patch.object(EmailIngestionClient, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_fetches_in_growing_batches(self):
+        self.client.imap = FakeIMAP(list(range(1, 151)))
+
+        results = self.client.fetch_emails_batch(batch_size=10)
+
+        self.assertEqual(len(results), 150)
+        # Fast fetches double the batch: 10, 20, 40, 80
+        self.assertEqual([len(s) for s in self.client.imap.fetch_sets], [10, 20, 40, 80])
+        self.assertEqual(sorted(self.client.imap.stored, key=int), [str(u) for u in range(1, 151)])
+        self.assertEqual(self.client.state.get_last_uid('INBOX'), '150')
+        self.assertEqual(results[0].metadata.uid, '1')
+
+    def test_slow_fetches_shrink_the_batch(self):
+        self.client.fetch_target_seconds = 0.0
+        self.client.min_fetch_batch = 5
+
+        self.assertEqual(self.client._adapt_batch_size(40, 0.1), 20)
+        self.assertEqual(self.client._adapt_batch_size(6, 0.1), 5)
+
+    def test_incremental_sync_skips_seen_uids(self):
+        self.client.imap = FakeIMAP([7])  # 'UID 8:*' still returns the newest message
+
+        self.assertEqual(self.client.fetch_emails_batch(since_uid='7'), [])
+        self.assertEqual(self.client.imap.fetch_sets, [])
+
+    def test_missing_messages_are_recorded_as_failed(self):
+        imap = FakeIMAP([1, 2, 3])
+        original_uid = imap.uid
+        imap.uid = lambda command, *args: (
+            ('OK', [item for item in original_uid(command, *args)[1]
+                    if not (isinstance(item, tuple) and b'UID 2 ' in item[0])])
+            if command == 'fetch' else original_uid(command, *args)
+        )
+        self.client.imap = imap
+
+        results = self.client.fetch_emails_batch()
+
+        self.assertEqual([r.metadata.uid for r in results], ['1', '3'])
+        self.assertEqual(self.client.stats['emails_failed'], 1)
+        self.assertEqual(self.client.state.state['failed_emails'][0]['msg_id'], '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_email_parse_cache.py
+Purpose: Tests for parallel .eml parsing and the processed-email cache
+Business Purpose: Rebuilds and incremental ingests should only pay parsing/extraction
+                  cost for new or changed broker emails
+
+RELEVANT FILES: updated_architectures/implementation/email_parse_cache.py, data_ingestion.py
+"""
+
+import os
+import shutil
+from datetime import datetime, timezone
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from updated_architectures.implementation.email_parse_cache import (
+    EmailParseCache, parse_eml_file, parse_eml_files
+)
+
+try:
+    import bs4  # noqa: F401
+    BS4_AVAILABLE = True
+except ImportError:
+    BS4_AVAILABLE = False
+
+SAMPLE_EML = """From: Analyst <analyst@broker.com>
+Subject: NVDA Q2 Earnings
+Date: Mon, 1 Sep 2025 08:00:00 +0000
+MIME-Version: 1.0
+Content-Type: multipart/alternative; boundary="XYZ"
+
+--XYZ
+Content-Type: text/html; charset="utf-8"
+
+<html><body><p>NVDA beat estimates.</p>
+<table><tr><th>Metric</th><th>Q2</th></tr><tr><td>Revenue</td><td>$30.0B</td></tr></table>
+</body></html>
+--XYZ--
+"""
+
+
+class TestEmailParsing(unittest.TestCase):
+    """parse_eml_file / parse_eml_files"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.paths = []
+        for i in range(3):
+            path = self.tmp / f"email_{i}.eml"
+            path.write_text(SAMPLE_EML.replace('NVDA Q2', f'NVDA Q{i + 1}'))
+            self.paths.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_parse_extracts_headers_and_body(self):
+        parsed = parse_eml_file(self.paths[0])
+
+        self.assertEqual(parsed['subject'], 'NVDA Q1 Earnings')
+        self.assertEqual(parsed['sender'], 'Analyst <analyst@broker.com>')
+        self.assertIn('NVDA beat estimates.', parsed['body'])  # HTML converted to text
+        self.assertEqual(len(parsed['sha256']), 64)
+
+    @unittest.skipUnless(BS4_AVAILABLE, "beautifulsoup4 not installed")
+    def test_parse_extracts_html_tables(self):
+        parsed = parse_eml_file(self.paths[0])
+
+        self.assertEqual(parsed['html_tables_data'][0]['data'], [{'Metric': 'Revenue', 'Q2': '$30.0B'}])
+
+    def test_process_pool_matches_serial_parsing(self):
+        parallel = parse_eml_files(self.paths, max_workers=2)
+        serial = parse_eml_files(self.paths, max_workers=1)
+
+        self.assertEqual(list(parallel), self.paths)
+        for path in self.paths:
+            for key in ('subject', 'body', 'html_tables_data', 'sha256'):
+                self.assertEqual(parallel[path][key], serial[path][key])
+
+    def test_parse_errors_are_returned_per_file(self):
+        missing = self.tmp / 'missing.eml'
+        results = parse_eml_files([self.paths[0], missing], max_workers=1)
+
+        self.assertEqual(results[self.paths[0]]['subject'], 'NVDA Q1 Earnings')
+        self.assertIsInstance(results[missing], OSError)
+
+
+class TestEmailParseCache(unittest.TestCase):
+    """EmailParseCache validation by mtime/size, content hash and settings"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.eml = self.tmp / 'email.eml'
+        self.eml.write_text(SAMPLE_EML)
+        self.cache = EmailParseCache(self.tmp / 'cache', settings={'link_processor': True})
+        self.entry = {'document': 'enhanced doc', 'entities': {'tickers': [{'ticker': 'NVDA'}]}}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_hit_after_put(self):
+        self.assertIsNone(self.cache.get(self.eml))
+        self.cache.put(self.eml, self.entry)
+
+        self.assertEqual(self.cache.get(self.eml), self.entry)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_hit_returns_same_entry_as_fresh_parse(self):
+        entry = {
+            'document': 'enhanced doc',
+            'entities': {'tickers': [{'ticker': 'NVDA', 'span': (10, 14)}], 'topics': {'AI'}},
+            'email_data': {'date': datetime(2025, 9, 1, 8, tzinfo=timezone.utc), 'to': []},
+            'graph_data': {'nodes': [{'id': 'email_1', 'properties': {'confidence': 0.9}}]}
+        }
+        self.cache.put(self.eml, entry)
+
+        cached = self.cache.get(self.eml)
+
+        self.assertEqual(cached, entry)
+        self.assertIsInstance(cached['email_data']['date'], datetime)
+        self.assertIsInstance(cached['entities']['tickers'][0]['span'], tuple)
+
+    def test_entry_that_does_not_round_trip_is_not_cached(self):
+        self.cache.put(self.eml, {'document': 'doc', 'scores': {1: 0.5}})
+        self.cache.put(self.eml, {'document': 'doc', 'raw': object()})
+
+        self.assertIsNone(self.cache.get(self.eml))
+        self.assertEqual(list((self.tmp / 'cache').glob('*.json')), [])
+
+    def test_touched_file_with_same_content_still_hits(self):
+        self.cache.put(self.eml, self.entry)
+        stat = self.eml.stat()
+        os.utime(self.eml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.assertEqual(self.cache.get(self.eml), self.entry)
+
+    def test_changed_content_misses(self):
+        self.cache.put(self.eml, self.entry)
+        self.eml.write_text(SAMPLE_EML.replace('beat', 'missed'))
+
+        self.assertIsNone(self.cache.get(self.eml))
+
+    def test_different_settings_miss(self):
+        self.cache.put(self.eml, self.entry)
+        other = EmailParseCache(self.tmp / 'cache', settings={'link_processor': False})
+
+        self.assertIsNone(other.get(self.eml))
+
+    def test_corrupted_entry_is_dropped(self):
+        self.cache.put(self.eml, self.entry)
+        entry_file = next((self.tmp / 'cache').glob('*.json'))
+        entry_file.write_text('{not json')
+
+        self.assertIsNone(self.cache.get(self.eml))
+        self.assertFalse(entry_file.exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
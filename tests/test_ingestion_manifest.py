@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_ingestion_manifest.py
+Purpose: Tests for the hash-indexed, journaled ingestion manifest
+Business Purpose: Incremental ingestion must stay fast and crash-safe once the manifest
+                  tracks tens of thousands of emails and API documents
+
+RELEVANT FILES: src/ice_core/ingestion_manifest.py, ice_simplified.py
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ice_core import ingestion_manifest
+from src.ice_core.ingestion_manifest import IngestionManifest
+
+
+class TestManifestIndexes(unittest.TestCase):
+    """Content-hash lookups and incremental statistics"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.manifest = IngestionManifest(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_duplicate_detection_follows_replaced_content(self):
+        self.manifest.add_document('email:a.eml', 'broker note v1', {'source_type': 'email'})
+        self.assertTrue(self.manifest.is_content_duplicate('broker note v1'))
+
+        self.manifest.add_document('email:a.eml', 'broker note v2', {'source_type': 'email'})
+
+        self.assertFalse(self.manifest.is_content_duplicate('broker note v1'))
+        self.assertEqual(self.manifest.find_documents_by_hash(
+            self.manifest.compute_content_hash('broker note v2')), {'email:a.eml'})
+
+    def test_statistics_are_incremental(self):
+        self.manifest.add_document('email:a.eml', 'a', {'source_type': 'email'})
+        self.manifest.add_document('api_news:NVDA_0', 'b', {'source_type': 'api_news', 'ticker': 'NVDA'})
+        self.manifest.add_document('sec:AMD_0', 'c', {'source_type': 'api_sec', 'ticker': 'AMD'})
+        self.manifest.add_document('sec:AMD_0', 'c2', {'source_type': 'api_sec', 'ticker': 'TSMC'})
+
+        stats = self.manifest.manifest['statistics']
+        self.assertEqual((stats['total_documents'], stats['total_emails'], stats['total_api_documents']), (3, 1, 2))
+        self.assertEqual(stats['unique_tickers'], ['NVDA', 'TSMC'])
+
+    def test_get_new_documents_filters_ids_and_content(self):
+        self.manifest.add_document('email:a.eml', 'same body', {'source_type': 'email'})
+
+        new = self.manifest.get_new_documents([
+            {'id': 'email:a.eml', 'content': 'x'},
+            {'id': 'email:b.eml', 'content': 'same body'},
+            {'id': 'email:c.eml', 'content': 'fresh'},
+        ])
+
+        self.assertEqual([d['id'] for d in new], ['email:c.eml'])
+
+
+class TestManifestJournal(unittest.TestCase):
+    """Append-only saves, replay and compaction"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_save_appends_and_reload_replays(self):
+        manifest = IngestionManifest(self.tmp)
+        manifest.add_document('email:a.eml', 'a', {'source_type': 'email'})
+        manifest.save()  # First save writes the snapshot
+        snapshot = manifest.manifest_path.read_text()
+
+        manifest.add_document('api_news:NVDA_0', 'b', {'source_type': 'api_news', 'ticker': 'NVDA'})
+        manifest.update_api_coverage('NVDA', {'news': 2})
+        manifest.update_api_coverage('NVDA', {'news': 1})
+        manifest.update_portfolio(['NVDA'])
+        manifest.save()
+
+        self.assertEqual(manifest.manifest_path.read_text(), snapshot)
+        self.assertEqual(len(manifest.journal_path.read_text().splitlines()), 4)
+
+        reloaded = IngestionManifest(self.tmp)
+        self.assertEqual(reloaded.manifest['documents'], manifest.manifest['documents'])
+        self.assertEqual(reloaded.manifest['api_data_coverage'], {'NVDA': {'news': 3}})
+        self.assertEqual(reloaded.manifest['portfolio_history'][-1]['holdings'], ['NVDA'])
+        self.assertEqual(reloaded.manifest['statistics']['unique_tickers'], ['NVDA'])
+        self.assertTrue(reloaded.is_content_duplicate('b'))
+
+    def test_truncated_journal_tail_is_ignored(self):
+        manifest = IngestionManifest(self.tmp)
+        manifest.save()
+        manifest.add_document('email:a.eml', 'a', {'source_type': 'email'})
+        manifest.save()
+        with open(manifest.journal_path, 'a') as f:
+            f.write('{"seq": 99, "op": "docu')
+
+        reloaded = IngestionManifest(self.tmp)
+
+        self.assertEqual(list(reloaded.manifest['documents']), ['email:a.eml'])
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        original = ingestion_manifest.JOURNAL_COMPACTION_MIN_RECORDS
+        ingestion_manifest.JOURNAL_COMPACTION_MIN_RECORDS = 3
+        try:
+            manifest = IngestionManifest(self.tmp)
+            manifest.save()
+            for i in range(2):
+                manifest.update_portfolio([f'T{i}'])
+                manifest.save()
+            self.assertTrue(manifest.journal_path.exists())
+
+            manifest.update_portfolio(['T2'])
+            manifest.save()
+        finally:
+            ingestion_manifest.JOURNAL_COMPACTION_MIN_RECORDS = original
+
+        self.assertFalse(manifest.journal_path.exists())
+        snapshot = json.loads(manifest.manifest_path.read_text())
+        self.assertEqual(len(snapshot['portfolio_history']), 3)
+        self.assertEqual(len(IngestionManifest(self.tmp).manifest['portfolio_history']), 3)
+
+    def test_legacy_indented_manifest_is_loaded(self):
+        (self.tmp / '.ingestion_manifest.json').write_text(json.dumps({
+            'version': '1.0', 'created_at': 'x', 'last_updated': 'x', 'portfolio_history': [],
+            'api_data_coverage': {},
+            'documents': {'email:a.eml': {'content_hash': 'abc', 'source_type': 'email', 'ticker': 'MU'}}
+        }, indent=2))
+
+        manifest = IngestionManifest(self.tmp)
+
+        self.assertEqual(manifest.manifest['statistics']['total_emails'], 1)
+        self.assertEqual(manifest.find_documents_by_hash('abc'), {'email:a.eml'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_ingestion_pipeline.py
+Purpose: Tests for the bounded fetch/insert ingestion pipeline
+Business Purpose: Portfolio builds should overlap API/email fetching with graph insertion
+                  without buffering unbounded fetched documents in memory
+
+RELEVANT FILES: updated_architectures/implementation/ingestion_pipeline.py, ice_simplified.py
+"""
+
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from updated_architectures.implementation.ingestion_pipeline import IngestionPipeline, FetchedBatch
+
+
+class TestIngestionPipeline(unittest.TestCase):
+    """IngestionPipeline ordering, progress, error handling and overlap"""
+
+    def test_single_worker_consumes_in_stage_order(self):
+        consumed = []
+        stages = [(name, lambda name=name: [{'content': name}]) for name in ['emails', 'NVDA', 'AMD']]
+
+        stats = IngestionPipeline(max_queue_size=1, fetch_workers=1).run(
+            stages, lambda batch: consumed.append(batch.name))
+
+        self.assertEqual(consumed, ['emails', 'NVDA', 'AMD'])
+        self.assertEqual(stats['documents_fetched'], 3)
+        self.assertEqual(set(stats['fetch_time']), {'emails', 'NVDA', 'AMD'})
+        self.assertEqual(set(stats['insert_time']), {'emails', 'NVDA', 'AMD'})
+        self.assertEqual(stats['errors'], {})
+
+    def test_progress_total_is_lower_bound_until_fetching_finishes(self):
+        release = threading.Event()
+        totals = []
+
+        def slow_fetch():
+            release.wait(timeout=5)
+            return [{'content': 'b'}]
+
+        def consume(batch):
+            totals.append(batch.progress_total)
+            release.set()
+
+        stages = [('first', lambda: [{'content': 'a'}, {'content': 'a2'}]), ('second', slow_fetch)]
+        IngestionPipeline(fetch_workers=1).run(stages, consume)
+
+        self.assertEqual(totals, ['2+', 3])
+
+    def test_fetch_and_consume_errors_are_captured(self):
+        def failing_fetch():
+            raise RuntimeError('API down')
+
+        seen = []
+
+        def consume(batch):
+            seen.append((batch.name, batch.error is not None))
+            if batch.name == 'bad_insert':
+                raise ValueError('insert failed')
+
+        stages = [('bad_fetch', failing_fetch), ('bad_insert', lambda: [{'content': 'x'}]), ('ok', lambda: [])]
+        stats = IngestionPipeline(fetch_workers=1).run(stages, consume)
+
+        self.assertEqual(seen, [('bad_fetch', True), ('bad_insert', False), ('ok', False)])
+        self.assertEqual(stats['errors'], {'bad_fetch': 'API down', 'bad_insert': 'insert failed'})
+
+    def test_fetching_overlaps_insertion(self):
+        """The next stage is fetched while the previous batch is being inserted"""
+        delay = 0.05
+        stages = [(str(i), lambda: time.sleep(delay) or [{'content': 'doc'}]) for i in range(4)]
+
+        stats = IngestionPipeline(max_queue_size=2, fetch_workers=1).run(stages, lambda batch: time.sleep(delay))
+
+        # Serial fetch-then-insert would take ~8 * delay; pipelined ~5 * delay
+        self.assertLess(stats['wall_time'], stats['fetch_total'] + stats['insert_total'] - delay)
+        self.assertGreaterEqual(stats['max_queue_depth'], 1)
+
+    def test_bounded_queue_applies_back_pressure(self):
+        """Fast producers block on a full queue instead of buffering every batch"""
+        stages = [(str(i), lambda: [{'content': 'doc'}]) for i in range(5)]
+
+        stats = IngestionPipeline(max_queue_size=1, fetch_workers=1).run(stages, lambda batch: time.sleep(0.02))
+
+        self.assertLessEqual(stats['max_queue_depth'], 1)
+        self.assertGreater(stats['producer_blocked_time'], 0.02)
+
+    def test_fetched_batch_progress_total(self):
+        self.assertEqual(FetchedBatch(name='x', documents_fetched=7).progress_total, '7+')
+        self.assertEqual(FetchedBatch(name='x', documents_fetched=7, all_fetched=True).progress_total, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_link_download_scheduler.py
+Purpose: Tests for IntelligentLinkProcessor's shared download scheduler and batched link cache index
+Business Purpose: Link-heavy research digests should download in parallel over pooled keep-alive
+                  connections without hammering one broker host or rewriting the cache index per file
+
+RELEVANT FILES: imap_email_ingestion_pipeline/intelligent_link_processor.py, ice_data_ingestion/async_http.py
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    from aiohttp import web
+    from imap_email_ingestion_pipeline.intelligent_link_processor import IntelligentLinkProcessor
+    from ice_data_ingestion.async_http import run_sync
+    LINK_PROCESSOR_AVAILABLE = True
+except ImportError:
+    LINK_PROCESSOR_AVAILABLE = False
+
+RESPONSE_DELAY = 0.1
+
+
+@unittest.skipUnless(LINK_PROCESSOR_AVAILABLE, "link processor dependencies not installed")
+class TestLinkDownloadScheduler(unittest.TestCase):
+    """Downloads from a local server that reports concurrency and connection reuse"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.in_flight = 0
+        cls.max_in_flight = 0
+        cls.peers = set()  # Client ports of every connection opened (never cleared: the pool outlives tests)
+        cls.starts = []
+
+        async def report(request):
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.peers.add(request.transport.get_extra_info('peername')[1])
+            cls.starts.append(time.monotonic())
+            await asyncio.sleep(RESPONSE_DELAY)
+            cls.in_flight -= 1
+            return web.Response(text=f"Research note {request.match_info['name']} " * 20,
+                                content_type='text/plain')
+
+        async def start():
+            app = web.Application()
+            app.router.add_get('/research/{name}', report)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            return runner, runner.addresses[0][1]
+
+        cls.server, port = run_sync(start())
+        cls.base = f'http://127.0.0.1:{port}'
+
+    @classmethod
+    def tearDownClass(cls):
+        run_sync(cls.server.cleanup())
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        type(self).max_in_flight = 0
+        self.starts.clear()
+        # The pooled client is created once per process, so every test uses the same pool sizes
+        env = {'URL_RATE_LIMIT_DELAY': '0', 'URL_CONCURRENT_DOWNLOADS': '4', 'URL_CONNECTIONS_PER_HOST': '8',
+               'URL_MAX_REPORTS_PER_EMAIL': '30'}
+        with patch.dict(os.environ, env):
+            self.processor = IntelligentLinkProcessor(storage_path=str(self.tmp / 'attachments'),
+                                                      cache_dir=str(self.tmp / 'cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def digest_html(self, names):
+        return ''.join(f'<p><a href="{self.base}/research/{n}.pdf">Download report {n}</a></p>' for n in names)
+
+    def test_digest_downloads_in_parallel_within_the_global_limit(self):
+        start = time.perf_counter()
+        result = asyncio.run(self.processor.process_email_links(self.digest_html(range(12)), {'subject': 'Digest'}))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(result.research_reports), 12)
+        self.assertEqual(self.max_in_flight, 4)
+        # 12 serial downloads would take 12 * RESPONSE_DELAY
+        self.assertLess(elapsed, 8 * RESPONSE_DELAY)
+
+    def test_connections_are_reused_across_emails(self):
+        # Each asyncio.run() is a fresh caller loop; the pooled session must survive it
+        asyncio.run(self.processor.process_email_links(self.digest_html(['a1', 'a2']), {'subject': 'First'}))
+        opened = set(self.peers)
+        asyncio.run(self.processor.process_email_links(self.digest_html(['b1', 'b2']), {'subject': 'Second'}))
+
+        # A session per email would open fresh connections for the second email
+        self.assertEqual(self.peers, opened)
+
+    def test_requests_to_one_domain_are_spaced(self):
+        self.processor.rate_limit_delay = 0.15
+
+        asyncio.run(self.processor.process_email_links(self.digest_html(['x', 'y', 'z']), {'subject': 'Polite'}))
+
+        gaps = [later - earlier for earlier, later in zip(self.starts, self.starts[1:])]
+        self.assertEqual(len(gaps), 2)
+        self.assertTrue(all(gap >= 0.14 for gap in gaps), gaps)
+
+    def test_cache_index_is_written_once_per_email(self):
+        with patch.object(IntelligentLinkProcessor, '_save_cache_index',
+                          wraps=self.processor._save_cache_index) as save:
+            asyncio.run(self.processor.process_email_links(self.digest_html(range(6)), {'subject': 'Digest'}))
+
+        self.assertEqual(save.call_count, 1)
+        with open(self.processor.cache_index_file) as f:
+            self.assertEqual(len(json.load(f)), 6)
+
+        again = asyncio.run(self.processor.process_email_links(self.digest_html(range(6)), {'subject': 'Digest'}))
+
+        self.assertEqual(len(again.research_reports), 6)
+        self.assertEqual(again.processing_summary['cache_hits'], 6)
+        self.assertEqual(len(self.starts), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
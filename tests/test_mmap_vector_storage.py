@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_mmap_vector_storage.py
+Purpose: Tests for the memory-mapped vector storage backend and its stats helpers
+Business Purpose: Graph stats and query-time vector search should not require parsing
+                  the whole JSON-encoded vector database
+
+RELEVANT FILES: src/ice_lightrag/mmap_vector_storage.py, ice_rag_fixed.py, ice_simplified.py
+"""
+
+import asyncio
+import base64
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if NUMPY_AVAILABLE:
+    from src.ice_lightrag.mmap_vector_storage import (
+        MmapVectorStore, count_vector_rows, iter_vector_metadata, vector_storage_info
+    )
+
+try:
+    from lightrag.kg.shared_storage import finalize_share_data
+    from lightrag.utils import EmbeddingFunc, Tokenizer
+    from src.ice_lightrag import ice_rag_fixed
+    from src.ice_lightrag.ice_rag_fixed import JupyterICERAG
+    LIGHTRAG_INSTALLED = NUMPY_AVAILABLE and ice_rag_fixed.LIGHTRAG_AVAILABLE and ice_rag_fixed.MODEL_PROVIDER_AVAILABLE
+except ImportError:
+    LIGHTRAG_INSTALLED = False
+
+
+def _meta(id_, **fields):
+    return {'__id__': id_, '__created_at__': 0, **fields}
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestMmapVectorStore(unittest.TestCase):
+    """Append-only writes, queries, deletes, reloads and compaction"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.store = MmapVectorStore(self.tmp, 'entities', embedding_dim=3)
+        self.store.upsert(
+            [_meta('ent-a', entity_name='NVDA'), _meta('ent-b', entity_name='AMD'), _meta('ent-c', entity_name='TSMC')],
+            np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=np.float32)
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_query_ranks_by_cosine_and_applies_threshold(self):
+        results = self.store.query([0.9, 0.1, 0], top_k=5, better_than_threshold=0.05)
+
+        self.assertEqual([r['entity_name'] for r in results], ['NVDA', 'AMD'])
+        self.assertGreater(results[0]['__metrics__'], results[1]['__metrics__'])
+
+    def test_pending_rows_are_queryable_before_save(self):
+        self.store.save()
+        self.store.upsert([_meta('ent-d', entity_name='ASML')], np.array([[1, 1, 0]], dtype=np.float32))
+
+        results = self.store.query([1, 1, 0], top_k=1)
+
+        self.assertEqual(results[0]['entity_name'], 'ASML')
+        self.assertTrue(self.store.is_dirty)
+
+    def test_save_and_reload_round_trip(self):
+        self.store.save()
+        reloaded = MmapVectorStore(self.tmp, 'entities', embedding_dim=3)
+
+        self.assertEqual(len(reloaded), 3)
+        self.assertEqual(reloaded.query([0, 0, 1], top_k=1)[0]['entity_name'], 'TSMC')
+        np.testing.assert_allclose(reloaded.get_vectors(['ent-b'])['ent-b'], [0, 1, 0])
+
+    def test_upsert_supersedes_and_delete_tombstones(self):
+        self.store.save()
+        self.store.upsert([_meta('ent-a', entity_name='NVDA v2')], np.array([[0, 1, 1]], dtype=np.float32))
+        self.store.delete(['ent-c', 'missing'])
+        self.store.save()
+
+        reloaded = MmapVectorStore(self.tmp, 'entities', embedding_dim=3)
+        self.assertEqual(len(reloaded), 2)
+        self.assertEqual(reloaded.get(['ent-a'])[0]['entity_name'], 'NVDA v2')
+        self.assertEqual(reloaded.get(['ent-c']), [])
+        self.assertNotIn('TSMC', [r['entity_name'] for r in reloaded.query([0, 0, 1], top_k=3)])
+
+    def test_uncommitted_appends_are_ignored_on_reload(self):
+        self.store.save()
+        # Simulate a crash after appending but before the header was rewritten
+        with open(self.store.files['vectors'], 'ab') as f:
+            f.write(np.ones(3, dtype=np.float32).tobytes())
+        with open(self.store.files['index'], 'a') as f:
+            f.write(json.dumps(_meta('ent-x')) + '\n')
+
+        reloaded = MmapVectorStore(self.tmp, 'entities', embedding_dim=3)
+
+        self.assertEqual(len(reloaded), 3)
+        self.assertEqual(reloaded.get(['ent-x']), [])
+        self.assertEqual(self.store.files['vectors'].stat().st_size, 3 * 3 * 4)
+
+    def test_compaction_drops_garbage_rows(self):
+        from src.ice_lightrag import mmap_vector_storage
+        self.store.save()
+        for _ in range(3):
+            self.store.upsert([_meta('ent-a', entity_name='NVDA')], np.array([[1, 0, 0]], dtype=np.float32))
+        self.store.delete(['ent-b'])
+
+        original = mmap_vector_storage.COMPACTION_MIN_DEAD_ROWS
+        mmap_vector_storage.COMPACTION_MIN_DEAD_ROWS = 1
+        try:
+            self.store.save()
+        finally:
+            mmap_vector_storage.COMPACTION_MIN_DEAD_ROWS = original
+
+        self.assertEqual(self.store.dead_rows, 0)
+        self.assertEqual(self.store.files['vectors'].stat().st_size, 2 * 3 * 4)
+        reloaded = MmapVectorStore(self.tmp, 'entities', embedding_dim=3)
+        self.assertEqual(sorted(m['__id__'] for m in reloaded.items()), ['ent-a', 'ent-c'])
+
+    def test_embedding_dim_mismatch_raises(self):
+        self.store.save()
+        with self.assertRaises(ValueError):
+            MmapVectorStore(self.tmp, 'entities', embedding_dim=4)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestLegacyJsonAndStatsHelpers(unittest.TestCase):
+    """NanoVectorDB JSON migration and header/index based stats"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        matrix = np.array([[1, 0], [0, 1]], dtype=np.float32)
+        self.legacy = self.tmp / 'vdb_relationships.json'
+        self.legacy.write_text(json.dumps({
+            'embedding_dim': 2,
+            'data': [
+                {'__id__': 'rel-1', 'src_id': 'NVDA', 'tgt_id': 'TSMC', 'vector': 'abc'},
+                {'__id__': 'rel-2', 'src_id': 'AMD', 'tgt_id': 'TSMC', 'vector': 'def'},
+            ],
+            'matrix': base64.b64encode(matrix.tobytes()).decode()
+        }))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_helpers_read_legacy_json(self):
+        self.assertEqual(count_vector_rows(self.tmp, 'relationships'), 2)
+        self.assertEqual([m['__id__'] for m in iter_vector_metadata(self.tmp, 'relationships')], ['rel-1', 'rel-2'])
+        self.assertEqual(vector_storage_info(self.tmp, 'relationships')['file'], 'vdb_relationships.json')
+        self.assertEqual(count_vector_rows(self.tmp, 'entities'), 0)
+
+    def test_legacy_json_is_migrated(self):
+        store = MmapVectorStore(self.tmp, 'relationships', embedding_dim=2)
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.query([0, 1], top_k=1)[0]['src_id'], 'AMD')
+        self.assertNotIn('vector', store.get(['rel-1'])[0])
+        self.assertFalse(self.legacy.exists())
+        self.assertTrue((self.tmp / 'vdb_relationships.json.migrated').exists())
+
+    def test_helpers_read_mmap_storage_without_vectors(self):
+        store = MmapVectorStore(self.tmp, 'relationships', embedding_dim=2)
+        store.delete(['rel-1'])
+        store.upsert([{'__id__': 'rel-3', 'src_id': 'ASML', 'tgt_id': 'TSMC'}], np.array([[1, 1]], dtype=np.float32))
+        store.save()
+        store.upsert([{'__id__': 'rel-4'}], np.array([[1, 1]], dtype=np.float32))  # Not saved yet
+
+        self.assertEqual(count_vector_rows(self.tmp, 'relationships'), 2)
+        self.assertEqual([m['__id__'] for m in iter_vector_metadata(self.tmp, 'relationships')], ['rel-2', 'rel-3'])
+        info = vector_storage_info(self.tmp, 'relationships')
+        self.assertEqual(info['file'], 'vdb_relationships.f32')
+        self.assertGreater(info['size_bytes'], 0)
+
+
+
+class CharTokenizer:
+    """Offline tokenizer (LightRAG's default downloads tiktoken encodings)"""
+
+    def encode(self, content):
+        return [ord(c) for c in content]
+
+    def decode(self, tokens):
+        return ''.join(map(chr, tokens))
+
+
+@unittest.skipUnless(LIGHTRAG_INSTALLED, "LightRAG not installed")
+class TestRealLightRAGBackend(unittest.TestCase):
+    """ICEMmapVectorDBStorage loads into a real LightRAG instance as the configured backend"""
+
+    AXES = ['NVDA', 'AMD', 'TSMC']
+
+    def setUp(self):
+        async def llm(prompt, system_prompt=None, history_messages=None, **kwargs):
+            return 'Answer'
+
+        async def embed(texts, **kwargs):
+            # One axis per ticker, so cosine similarity picks the matching entity
+            return np.array([[float(axis in text) for axis in self.AXES] for text in texts], dtype=np.float32)
+
+        provider = (
+            llm,
+            EmbeddingFunc(embedding_dim=len(self.AXES), func=embed),
+            {'tokenizer': Tokenizer('chars', CharTokenizer())},
+            {}
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        # LightRAG keeps storage data per namespace in-process, not per working_dir
+        self.addCleanup(finalize_share_data)
+        patches = [
+            patch.dict(os.environ, {'ICE_TESTING_MODE': 'true', 'ICE_VECTOR_STORAGE': 'ICEMmapVectorDBStorage'}),
+            patch.object(ice_rag_fixed, 'get_llm_provider', return_value=provider),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_upsert_and_query_round_trip(self):
+        rag = JupyterICERAG(self.tmp.name)
+
+        async def run():
+            self.assertTrue(await rag._ensure_initialized())
+            vdb = rag._rag.entities_vdb
+            await vdb.upsert({
+                f'ent-{axis}': {'content': f'{axis} semiconductor', 'entity_name': axis}
+                for axis in self.AXES
+            })
+            await vdb.index_done_callback()
+            results = await vdb.query('AMD', top_k=1)
+            stored = await vdb.get_by_id('ent-TSMC')
+            await rag._rag.finalize_storages()
+            return type(vdb).__name__, results, stored
+
+        backend, results, stored = asyncio.run(run())
+
+        self.assertEqual(backend, 'ICEMmapVectorDBStorage')
+        self.assertEqual([r['entity_name'] for r in results], ['AMD'])
+        self.assertEqual(stored['entity_name'], 'TSMC')
+        self.assertEqual(count_vector_rows(Path(self.tmp.name), 'entities'), 3)
+
+    def test_unloadable_backend_raises(self):
+        rag = JupyterICERAG(self.tmp.name)
+
+        with patch.object(ice_rag_fixed, 'MMAP_VECTOR_STORAGE_AVAILABLE', False):
+            with self.assertRaises(RuntimeError):
+                rag._resolve_vector_storage()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_model_call_cache.py
+Purpose: Tests for the persistent LLM completion / embedding cache wrapped around provider callables
+Business Purpose: Rebuilding the graph from scratch (or in a fresh test storage) should not pay
+                  again for extraction prompts and embeddings it has already paid for
+
+RELEVANT FILES: src/ice_lightrag/model_cache.py, src/ice_lightrag/model_provider.py
+"""
+
+import asyncio
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.ice_lightrag.model_cache import ModelCallCache, cached_llm_func, cached_embed_func
+
+try:
+    from src.ice_lightrag import model_provider
+    MODEL_PROVIDER_AVAILABLE = model_provider.OPENAI_AVAILABLE
+except ImportError:
+    MODEL_PROVIDER_AVAILABLE = False
+
+
+class FakeLLM:
+    """Async completion function that records every call it actually makes"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, prompt, system_prompt=None, history_messages=None, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return f"entities for {prompt} @ {kwargs.get('temperature')}"
+
+
+class FakeEmbedder:
+    """Async embedding function: deterministic 3-dim float64 vectors, records each batch"""
+
+    def __init__(self):
+        self.batches = []
+        self.contexts = []
+
+    async def __call__(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        self.contexts.append(kwargs.get('context'))
+        return np.array([[len(t), t.count('a'), 1.0] for t in texts])
+
+
+class TestModelCallCache(unittest.TestCase):
+    """Content-addressed completions and embeddings that survive new working dirs"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.db_path = self.tmp / 'model_calls.sqlite'
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_completions_reused_across_cache_instances(self):
+        llm = FakeLLM()
+
+        async def build_graph():
+            # A fresh cache object per "rebuild", as a new process or working dir would create
+            func = cached_llm_func(llm, ModelCallCache(self.db_path), 'openai:gpt-4o-mini')
+            return [await func(f'chunk {i}', system_prompt='extract', temperature=0.3, seed=42, hashing_kv=object())
+                    for i in range(3)]
+
+        first = asyncio.run(build_graph())
+        second = asyncio.run(build_graph())
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(llm.calls), 3)  # The rebuild made no LLM calls
+
+    def test_completion_key_covers_model_prompt_and_sampling(self):
+        llm = FakeLLM()
+        cache = ModelCallCache(self.db_path)
+
+        async def run():
+            base = cached_llm_func(llm, cache, 'openai:gpt-4o-mini')
+            other_model = cached_llm_func(llm, cache, 'ollama:qwen3:30b-32k')
+            await base('p', temperature=0.3)
+            await base('p', temperature=0.3, hashing_kv=object(), timeout=300)  # Hit: transport kwargs ignored
+            await base('p', temperature=0.5)                                    # Miss: temperature
+            await base('p', system_prompt='s', temperature=0.3)                 # Miss: system prompt
+            await base('p', history_messages=[{'role': 'user', 'content': 'q'}], temperature=0.3)
+            await other_model('p', temperature=0.3)                             # Miss: model
+            await base('p', temperature=0.3, stream=True)                       # Streaming: never cached
+
+        asyncio.run(run())
+
+        self.assertEqual(len(llm.calls), 6)
+        stats = cache.get_stats()
+        self.assertEqual((stats['llm']['hits'], stats['llm']['entries']), (1, 5))
+
+    def test_embeddings_only_for_misses_in_input_order(self):
+        embed = FakeEmbedder()
+
+        async def run():
+            func = cached_embed_func(embed, ModelCallCache(self.db_path), 'openai:text-embedding-3-small')
+            first = await func(['alpha', 'beta', 'alpha'])
+            again = await cached_embed_func(embed, ModelCallCache(self.db_path),
+                                            'openai:text-embedding-3-small')(['gamma', 'beta', 'alpha'])
+            return first, again
+
+        first, again = asyncio.run(run())
+
+        self.assertEqual(embed.batches, [['alpha', 'beta'], ['gamma']])
+        self.assertEqual(first.dtype, np.float32)
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(again, np.array([[5, 2, 1], [4, 1, 1], [5, 2, 1]], dtype=np.float32))
+
+    def test_query_and_document_embeddings_cached_apart(self):
+        embed = FakeEmbedder()
+
+        async def run():
+            func = cached_embed_func(embed, ModelCallCache(self.db_path), 'm')
+            await func(['NVDA risks'], context='query')
+            await func(['NVDA risks'], context='document')
+            await func(['NVDA risks'], context='query')
+
+        asyncio.run(run())
+
+        self.assertEqual(embed.contexts, ['query', 'document'])
+
+    def test_size_bounded_lru_eviction(self):
+        embed = FakeEmbedder()
+        # Each 3-dim float32 row is 12 bytes + 32-byte key
+        cache = ModelCallCache(self.db_path, max_bytes=44 * 10)
+
+        async def run():
+            func = cached_embed_func(embed, cache, 'm')
+            await func([f'text {i}' for i in range(8)])
+            await func(['text 0'])  # Most recently used survives eviction
+            await func([f'new {i}' for i in range(4)])
+
+        asyncio.run(run())
+
+        stats = cache.get_stats()
+        self.assertLessEqual(stats['stored_bytes'], cache.max_bytes)
+        self.assertIn(cache.embedding_key('m', 'text 0'), cache.get_vectors([cache.embedding_key('m', 'text 0')]))
+        self.assertEqual(cache.get_vectors([cache.embedding_key('m', 'text 1')]), {})
+
+    def test_wrappers_survive_lightrag_config_deepcopy(self):
+        # LightRAG builds global_config with dataclasses.asdict(), which deep-copies its fields
+        cache = ModelCallCache(self.db_path)
+        llm_func = cached_llm_func(FakeLLM(), cache, 'm')
+
+        self.assertIs(copy.deepcopy(llm_func), llm_func)
+
+
+@unittest.skipUnless(MODEL_PROVIDER_AVAILABLE, "LightRAG OpenAI provider not installed")
+class TestProviderWiring(unittest.TestCase):
+    """get_llm_provider returns cached callables sharing one cache per directory"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        model_provider._model_call_caches.clear()
+
+    def tearDown(self):
+        model_provider._model_call_caches.clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_openai_callables_wrapped(self):
+        with patch.dict(os.environ, {'LLM_PROVIDER': 'openai', 'ICE_MODEL_CACHE_DIR': self.tmp}):
+            llm_func, embed_func, _, _ = model_provider.get_llm_provider()
+            again = model_provider.get_llm_provider()
+
+        self.assertIsNot(llm_func, model_provider.gpt_4o_mini_complete)
+        for field in ('embedding_dim', 'max_token_size', 'model_name', 'supports_asymmetric', 'send_dimensions'):
+            self.assertEqual(getattr(embed_func, field), getattr(model_provider.openai_embed, field), field)
+        self.assertEqual(len(model_provider._model_call_caches), 1)
+        self.assertIsNot(again[0], model_provider.gpt_4o_mini_complete)
+
+    def test_embedding_context_reaches_provider(self):
+        embed = FakeEmbedder()
+        provider_embed = model_provider.EmbeddingFunc(embedding_dim=3, func=embed, model_name='m',
+                                                      supports_asymmetric=True)
+
+        with patch.dict(os.environ, {'ICE_MODEL_CACHE_DIR': self.tmp}):
+            _, embed_func = model_provider._with_model_cache(FakeLLM(), 'm', provider_embed, 'm')
+
+        async def run():
+            await embed_func(['NVDA risks'], context='query')
+            await embed_func(['NVDA risks'], context='document')
+
+        asyncio.run(run())
+
+        self.assertEqual(embed.contexts, ['query', 'document'])
+
+    def test_disabled(self):
+        with patch.dict(os.environ, {'LLM_PROVIDER': 'openai', 'ICE_MODEL_CACHE': 'false'}):
+            llm_func, embed_func, _, _ = model_provider.get_llm_provider()
+
+        self.assertIs(llm_func, model_provider.gpt_4o_mini_complete)
+        self.assertIs(embed_func, model_provider.openai_embed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_query_cache.py
+Purpose: Tests for the persistent query-result cache and its graph-version invalidation
+Business Purpose: Repeated dashboard/portfolio questions should not re-run a ~12s LightRAG
+                  query, but must never return answers computed on an older graph
+
+RELEVANT FILES: src/ice_lightrag/query_cache.py, src/ice_lightrag/ice_rag_fixed.py
+"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ice_lightrag.query_cache import QueryResultCache, normalize_question
+
+
+RESULT = {'status': 'success', 'answer': 'NVDA depends on TSMC', 'sources': []}
+
+
+class TestQueryResultCache(unittest.TestCase):
+    """Keying, invalidation, eviction and metrics"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.cache = QueryResultCache(self.tmp / 'query_cache.sqlite', max_entries=3, ttl_seconds=60)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_normalized_question_hits(self):
+        self.cache.put('What is NVDA exposure to TSMC?', 'hybrid', RESULT)
+
+        self.assertEqual(self.cache.get('  what is nvda   exposure to TSMC ', 'hybrid'), RESULT)
+        self.assertIsNone(self.cache.get('What is NVDA exposure to TSMC?', 'local'))
+        self.assertEqual(normalize_question('Risks?!'), 'risks')
+
+    def test_settings_are_part_of_key(self):
+        self.cache.put('q', 'mix', RESULT, {'temperature': 0.5})
+
+        self.assertIsNone(self.cache.get('q', 'mix', {'temperature': 0.9}))
+        self.assertEqual(self.cache.get('q', 'mix', {'temperature': 0.5}), RESULT)
+
+    def test_graph_version_bump_invalidates(self):
+        self.cache.put('q', 'hybrid', RESULT)
+        self.assertEqual(self.cache.bump_graph_version(), 1)
+
+        self.assertIsNone(self.cache.get('q', 'hybrid'))
+        # Version is persisted for other instances/processes
+        self.assertEqual(QueryResultCache(self.cache.db_path).graph_version, 1)
+
+    def test_result_from_older_graph_is_not_stored(self):
+        version = self.cache.graph_version
+        self.cache.bump_graph_version()  # Insert finished while the query was running
+
+        self.assertFalse(self.cache.put('q', 'hybrid', RESULT, graph_version=version))
+        self.assertIsNone(self.cache.get('q', 'hybrid'))
+
+    def test_ttl_expiry(self):
+        with patch('src.ice_lightrag.query_cache.time.time', return_value=1000.0):
+            self.cache.put('q', 'hybrid', RESULT)
+        with patch('src.ice_lightrag.query_cache.time.time', return_value=1061.0):
+            self.assertIsNone(self.cache.get('q', 'hybrid'))
+        self.assertEqual(self.cache.get_stats()['entries'], 0)
+
+    def test_lru_eviction(self):
+        clock = iter(range(100, 200))
+        with patch('src.ice_lightrag.query_cache.time.time', side_effect=lambda: float(next(clock))):
+            for q in ('a', 'b', 'c'):
+                self.cache.put(q, 'hybrid', RESULT)
+            self.cache.get('a', 'hybrid')  # 'b' is now least recently used
+            self.cache.put('d', 'hybrid', RESULT)
+
+            self.assertIsNone(self.cache.get('b', 'hybrid'))
+            self.assertIsNotNone(self.cache.get('a', 'hybrid'))
+
+    def test_stats(self):
+        self.cache.get('q', 'hybrid')
+        self.cache.put('q', 'hybrid', RESULT)
+        self.cache.get('q', 'hybrid')
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(self.cache.clear(), 1)
+
+
+class TestJupyterICERAGQueryCache(unittest.TestCase):
+    """JupyterICERAG.query serves repeats from cache until the next insert"""
+
+    def setUp(self):
+        from src.ice_lightrag.ice_rag_fixed import JupyterICERAG
+
+        self.tmp = Path(tempfile.mkdtemp())
+        with patch.object(JupyterICERAG, '__init__', return_value=None):
+            self.rag = JupyterICERAG()
+        self.rag.config = {'timeout': 30, 'batch_size': 5}
+        self.rag._query_cache = QueryResultCache(self.tmp / 'query_cache.sqlite')
+        self.rag._query_temperature = 0.5
+        self.rag._extraction_temperature = 0.3
+        self.rag._base_kwargs_template = {'seed': 42}
+
+        async def ensure_initialized():
+            return True
+
+        self.rag._ensure_initialized = ensure_initialized
+        self.rag._rag = Mock()
+        self.rag._rag.ainsert = AsyncMock()
+        self.rag._rag.doc_status.get_by_ids = AsyncMock(return_value=[{'status': 'processed'}])
+        self.rag._rag.aquery_llm = AsyncMock(return_value={
+            'llm_response': {'content': 'Answer'}, 'data': {'chunks': [{'content': 'chunk'}]}
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_repeat_query_hits_until_insert(self):
+        first = asyncio.run(self.rag.query('NVDA risks?', 'hybrid'))
+        second = asyncio.run(self.rag.query('nvda risks', 'hybrid'))
+
+        self.assertEqual((first['cache_hit'], second['cache_hit']), (False, True))
+        self.assertEqual(second['answer'], 'Answer')
+        self.assertEqual(self.rag._rag.aquery_llm.await_count, 1)
+
+        asyncio.run(self.rag.add_document('New filing'))
+        self.assertFalse(asyncio.run(self.rag.query('NVDA risks?', 'hybrid'))['cache_hit'])
+        self.assertEqual(self.rag._rag.aquery_llm.await_count, 2)
+
+    def test_bypass_and_errors_are_not_cached(self):
+        asyncio.run(self.rag.query('q', 'hybrid'))
+        asyncio.run(self.rag.query('q', 'hybrid', use_cache=False))
+        self.assertEqual(self.rag._rag.aquery_llm.await_count, 2)
+
+        self.rag._rag.aquery_llm.return_value = {}
+        asyncio.run(self.rag.query('other', 'hybrid'))
+        self.assertEqual(self.rag.get_query_cache_stats()['entries'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
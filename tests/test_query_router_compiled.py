@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_query_router_compiled.py
+Purpose: Parity and latency tests for the compiled single-pass QueryRouter
+Business Purpose: Routing must stay identical to the per-pattern implementation while
+                  meeting the documented <50ms router latency target on evaluation-sized runs
+
+RELEVANT FILES: updated_architectures/implementation/query_router.py,
+                updated_architectures/implementation/ice_simplified.py
+"""
+
+import itertools
+import re
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from updated_architectures.implementation.query_router import QueryRouter, QueryType, RoutedQuery
+
+TICKERS = ['NVDA', 'AAPL', 'TSMC', 'AMD', 'MSFT', 'GOOGL', 'META', 'INTC', 'AVGO', 'QCOM']
+
+# (template, expected route with a Signal Store attached)
+LABELLED_TEMPLATES = [
+    ("What's {t}'s latest rating?", QueryType.STRUCTURED_RATING),
+    ("What is the current recommendation for {t}?", QueryType.STRUCTURED_RATING),
+    ("Show me all ratings for {t}", QueryType.STRUCTURED_RATING),
+    ("Latest analyst rating on {t}", QueryType.STRUCTURED_RATING),
+    ("Is {t} a buy rating at Goldman?", QueryType.STRUCTURED_RATING),
+    ("What's {t}'s Q2 2024 operating margin?", QueryType.STRUCTURED_METRIC),
+    ("Show {t} FY2024 revenue", QueryType.STRUCTURED_METRIC),
+    ("What was {t}'s gross margin in fy 2023?", QueryType.STRUCTURED_METRIC),
+    ("What is {t}'s TTM EPS?", QueryType.STRUCTURED_METRIC),
+    ("Get {t} quarterly earnings", QueryType.STRUCTURED_METRIC),
+    ("Why did Goldman upgrade {t}?", QueryType.SEMANTIC_WHY),
+    ("What is the reason for {t}'s supply chain shift?", QueryType.SEMANTIC_WHY),
+    ("How does China risk impact {t}?", QueryType.SEMANTIC_HOW),
+    ("How will export controls affect {t} suppliers?", QueryType.SEMANTIC_HOW),
+    ("Explain {t}'s competitive position", QueryType.SEMANTIC_EXPLAIN),
+    ("Describe the relationship between {t} and TSMC", QueryType.SEMANTIC_EXPLAIN),
+    ("What's {t}'s rating and why did it change?", QueryType.HYBRID),
+    ("What's {t}'s operating margin and why is it so high?", QueryType.HYBRID),
+    ("Explain {t}'s latest rating", QueryType.HYBRID),
+    ("{t} news today", QueryType.SEMANTIC_EXPLAIN),
+]
+
+# Fillers shift keywords around and add noise so the labelled set covers more than the templates
+FILLERS = ['', ' Please answer briefly.', ' Thanks!', ' (for the portfolio review)']
+
+
+class ReferenceRouter(QueryRouter):
+    """The original per-pattern implementation: one re.search per pattern string per call"""
+
+    def route_query(self, query):
+        query_lower = query.lower()
+
+        has_rating_pattern = self.signal_store and any(re.search(p, query_lower) for p in self.RATING_PATTERNS)
+        has_metric_pattern = self.signal_store and any(re.search(p, query_lower) for p in self.METRIC_PATTERNS)
+        has_why_pattern = any(re.search(p, query_lower) for p in self.SEMANTIC_WHY_PATTERNS)
+        has_how_pattern = any(re.search(p, query_lower) for p in self.SEMANTIC_HOW_PATTERNS)
+        has_explain_pattern = any(re.search(p, query_lower) for p in self.SEMANTIC_EXPLAIN_PATTERNS)
+
+        if (has_rating_pattern or has_metric_pattern) and (has_why_pattern or has_how_pattern or has_explain_pattern):
+            return (QueryType.HYBRID, 0.85)
+        if has_why_pattern:
+            return (QueryType.SEMANTIC_WHY, 0.90)
+        if has_how_pattern:
+            return (QueryType.SEMANTIC_HOW, 0.90)
+        if has_explain_pattern:
+            return (QueryType.SEMANTIC_EXPLAIN, 0.85)
+        if has_rating_pattern:
+            return (QueryType.STRUCTURED_RATING, 0.90)
+        if has_metric_pattern:
+            return (QueryType.STRUCTURED_METRIC, 0.90)
+        return (QueryType.SEMANTIC_EXPLAIN, 0.50)
+
+    def extract_ticker(self, query):
+        matches = re.findall(self.TICKER_PATTERN, query)
+        valid_tickers = [m for m in matches if m not in self.TICKER_STOPWORDS]
+        return valid_tickers[0] if valid_tickers else None
+
+    def extract_metric_info(self, query):
+        query_lower = query.lower()
+        metric_type = None
+        period = None
+
+        for keyword, normalized_name in self.METRIC_KEYWORDS.items():
+            if keyword in query_lower:
+                metric_type = normalized_name
+                break
+
+        for pattern in self.PERIOD_PATTERNS:
+            match = re.search(pattern, query_lower)
+            if match:
+                period = match.group(1).upper()
+                if 'Q' in period and len(period.split()) == 2:
+                    q, year = period.split()
+                    period = f"{q} {year}"
+                elif 'FY' in period:
+                    period = period.replace(' ', '')
+                break
+
+        return (metric_type, period)
+
+
+def labelled_queries():
+    """(query, expected QueryType) pairs - len(TICKERS) * templates * fillers = 800"""
+    return [(template.format(t=ticker) + filler, expected)
+            for (template, expected), ticker, filler in itertools.product(LABELLED_TEMPLATES, TICKERS, FILLERS)]
+
+
+class TestCompiledRouterParity(unittest.TestCase):
+    """Compiled router gives the same answers as the per-pattern implementation"""
+
+    def setUp(self):
+        self.router = QueryRouter(signal_store=object())
+        self.reference = ReferenceRouter(signal_store=object())
+
+    def test_labelled_accuracy(self):
+        queries = labelled_queries()
+        routed = self.router.route_queries([q for q, _ in queries])
+
+        self.assertEqual(len(routed), len(queries))
+        for (query, expected), result in zip(queries, routed):
+            self.assertEqual(result.query_type, expected, query)
+
+    def test_matches_reference_implementation(self):
+        # Labelled queries plus edge cases: multi-line input, no-ticker queries,
+        # uppercase stopwords, and metric/period priority that is not left-to-right
+        queries = [q for q, _ in labelled_queries()] + [
+            "Why?\nWhat's the NVDA rating",
+            "rating for nvda",
+            "THE rating FOR AMD ARE good",
+            "sales and operating margin for q3 2024 vs fy2023",
+            "annual eps trends over the TTM window",
+            "steps to hold a position",
+            "",
+            "   ",
+        ]
+
+        for query in queries:
+            self.assertEqual(self.router.route_query(query), self.reference.route_query(query), query)
+            self.assertEqual(self.router.extract_ticker(query), self.reference.extract_ticker(query), query)
+            self.assertEqual(self.router.extract_metric_info(query), self.reference.extract_metric_info(query), query)
+
+            analysis = self.router.analyze_query(query)
+            self.assertEqual((analysis.query_type, analysis.confidence), self.reference.route_query(query))
+            self.assertEqual(analysis.ticker, self.reference.extract_ticker(query))
+            self.assertEqual((analysis.metric_type, analysis.period), self.reference.extract_metric_info(query))
+
+    def test_without_signal_store_structured_patterns_are_ignored(self):
+        router = QueryRouter()
+        reference = ReferenceRouter()
+
+        for query, _ in labelled_queries()[::7]:
+            self.assertEqual(router.route_query(query), reference.route_query(query), query)
+
+    def test_analyze_query_single_result(self):
+        result = self.router.analyze_query("What's NVDA's Q2 2024 operating margin and why?")
+
+        self.assertEqual(result, RoutedQuery(QueryType.HYBRID, 0.85, 'NVDA', 'Operating Margin', 'Q2 2024'))
+
+    def test_subclass_patterns_compile_separately(self):
+        class ESGRouter(QueryRouter):
+            SEMANTIC_EXPLAIN_PATTERNS = QueryRouter.SEMANTIC_EXPLAIN_PATTERNS + [r'\besg\b']
+
+        self.assertEqual(ESGRouter().route_query("NVDA esg profile")[0], QueryType.SEMANTIC_EXPLAIN)
+        self.assertEqual(ESGRouter().route_query("NVDA esg profile")[1], 0.85)
+        self.assertEqual(QueryRouter().route_query("NVDA esg profile")[1], 0.50)
+
+
+class TestRouterLatency(unittest.TestCase):
+    """Documented target is <50ms per query; in practice routing is well under 1ms"""
+
+    def test_batch_latency(self):
+        router = QueryRouter(signal_store=object())
+        queries = [q for q, _ in labelled_queries()] * 4  # 3200 queries
+        router.route_queries(queries[:10])  # Warm up
+
+        worst = 0.0
+        start = time.perf_counter()
+        for query in queries:
+            query_start = time.perf_counter()
+            router.analyze_query(query)
+            worst = max(worst, time.perf_counter() - query_start)
+        mean = (time.perf_counter() - start) / len(queries)
+
+        self.assertLess(worst, 0.050)
+        self.assertLess(mean, 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# Location: tests/test_signal_store_concurrency.py
+# Purpose: Tests for Signal Store per-thread WAL connections and executemany batch inserts
+# Why: Parallel email ingestion writes thousands of signals while dashboards query concurrently
+# Relevant Files: signal_store.py, data_ingestion.py, test_signal_store.py
+
+import pytest
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from updated_architectures.implementation.signal_store import SignalStore
+
+
+def make_ratings(count, prefix='email'):
+    return [{
+        'ticker': f'TICKER_{i % 50}',
+        'rating': 'BUY',
+        'timestamp': f'2024-03-15T{i % 24:02d}:00:00Z',
+        'source_document_id': f'{prefix}_{i}',
+        'firm': 'Goldman Sachs',
+        'confidence': 0.9
+    } for i in range(count)]
+
+
+@pytest.fixture
+def signal_store(tmp_path):
+    """Signal Store on a file database (WAL needs a real file)"""
+    store = SignalStore(db_path=str(tmp_path / 'signal_store.db'))
+    yield store
+    store.close()
+
+
+def test_wal_mode_enabled(signal_store):
+    """Connections use WAL journal with synchronous=NORMAL"""
+    assert signal_store.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert signal_store.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_each_thread_gets_its_own_connection(signal_store):
+    """Worker threads never share the creating thread's connection"""
+    main_conn = signal_store.conn
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        worker_conn = executor.submit(lambda: signal_store.conn).result()
+
+    assert signal_store.conn is main_conn
+    assert worker_conn is not main_conn
+
+
+def test_connections_of_exited_threads_are_closed(signal_store):
+    """Repeated ingestion runs with fresh thread pools do not accumulate connections"""
+    signal_store.conn  # Main thread's connection stays open
+
+    for _ in range(5):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            worker_conns = list(executor.map(lambda _: signal_store.conn, range(4)))
+
+    # The next connection opened closes those of the finished workers
+    thread = threading.Thread(target=lambda: signal_store.conn)
+    thread.start()
+    thread.join()
+
+    assert len(signal_store._connections) == 2  # Main thread + the last thread
+    signal_store.conn.execute("SELECT 1")
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_conns[0].execute("SELECT 1")
+
+
+def test_readers_not_blocked_by_open_write_transaction(signal_store):
+    """A query sees the last committed data while another thread holds a write transaction"""
+    signal_store.insert_rating('NVDA', 'HOLD', '2024-03-14T10:00:00Z', 'email_1')
+
+    write_open = threading.Event()
+    release = threading.Event()
+
+    def slow_writer():
+        signal_store.begin_transaction()
+        signal_store.conn.execute("""
+            INSERT INTO ratings (ticker, rating, timestamp, source_document_id)
+            VALUES ('NVDA', 'BUY', '2024-03-15T10:00:00Z', 'email_2')
+        """)
+        write_open.set()
+        release.wait(5)
+        signal_store.commit()
+
+    writer = threading.Thread(target=slow_writer)
+    writer.start()
+    assert write_open.wait(5)
+
+    start = time.perf_counter()
+    latest = signal_store.get_latest_rating('NVDA')
+    elapsed = time.perf_counter() - start
+
+    release.set()
+    writer.join()
+
+    assert latest['rating'] == 'HOLD'  # Uncommitted write is invisible, not waited on
+    assert elapsed < 0.5
+    assert signal_store.get_latest_rating('NVDA')['rating'] == 'BUY'
+
+
+def test_parallel_batch_writers(signal_store):
+    """Concurrent executemany batches all land; writers queue instead of failing"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        counts = list(executor.map(
+            lambda n: signal_store.insert_ratings_batch(make_ratings(500, prefix=f'worker{n}')),
+            range(8)
+        ))
+
+    assert counts == [500] * 8
+    assert signal_store.count_ratings() == 4000
+
+
+def test_batch_rolls_back_on_bad_row(signal_store):
+    """A failing row discards the whole batch"""
+    metrics = [
+        {'ticker': 'NVDA', 'metric_type': 'Revenue', 'metric_value': '$26.97B', 'source_document_id': 'e1'},
+        {'ticker': 'NVDA', 'metric_type': 'EPS', 'metric_value': None, 'source_document_id': 'e1'}
+    ]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        signal_store.insert_metrics_batch(metrics)
+
+    assert signal_store.count_metrics() == 0
+    assert not signal_store.conn.in_transaction
+
+
+def test_batch_joins_caller_transaction(signal_store):
+    """Inside begin_transaction() a batch is committed or rolled back with the caller"""
+    signal_store.begin_transaction()
+    signal_store.insert_price_targets_batch([
+        {'ticker': 'NVDA', 'target_price': 500.0, 'timestamp': '2024-03-15T10:00:00Z', 'source_document_id': 'e1'}
+    ])
+    signal_store.rollback()
+
+    assert signal_store.count_price_targets() == 0
+
+    signal_store.insert_price_targets_batch([
+        {'ticker': 'NVDA', 'target_price': 520.0, 'timestamp': '2024-03-15T10:00:00Z', 'source_document_id': 'e2'}
+    ])
+    latest = signal_store.get_latest_price_target('NVDA')
+    assert latest['target_price'] == 520.0
+    assert latest['currency'] == 'USD'
+
+
+def test_closed_store_rejects_new_threads(tmp_path):
+    """close() closes every thread's connection and doesn't silently reopen"""
+    store = SignalStore(db_path=str(tmp_path / 'signal_store.db'))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(store.count_ratings).result()
+        store.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            executor.submit(store.count_ratings).result()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.count_ratings()
@@ -15,7 +15,9 @@ Tests the elegant caching solution for Alpha Vantage API issues:
 """
 
 import unittest
+import gc
 import json
+import weakref
 import shutil
 import time
 from pathlib import Path
@@ -26,6 +28,7 @@ import os
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from ice_data_ingestion import smart_cache
 from ice_data_ingestion.smart_cache import (
     SmartCache, CacheMetadata, CacheValidationStatus,
     AlphaVantageValidator, CircuitState, cached_api_call
@@ -191,9 +194,9 @@ class TestSmartCache(unittest.TestCase):
         print(f"✓ Memory cache at capacity: {len(self.cache.memory_cache)}/{self.cache.memory_size}")
 
         # All 7 items should be on disk
-        disk_files = list(self.test_cache_dir.glob("*.json"))
-        self.assertEqual(len(disk_files), 7)
-        print(f"✓ Disk cache contains all items: {len(disk_files)}")
+        disk_entries = self.cache.get_statistics()["disk_cache_size"]
+        self.assertEqual(disk_entries, 7)
+        print(f"✓ Disk cache contains all items: {disk_entries}")
 
         # Accessing old item should promote it to memory
         retrieved = self.cache.get(
@@ -204,6 +207,83 @@ class TestSmartCache(unittest.TestCase):
         self.assertIsNotNone(retrieved)
         print("✓ Old items promoted from disk to memory on access")
 
+    def test_single_file_store_with_batched_writes(self):
+        """Test that disk writes are buffered and committed in batches to one database file"""
+        print("\n=== Testing Batched Single-File Store ===")
+
+        cache = SmartCache(cache_dir=str(self.test_cache_dir / "batched"), memory_size=1, write_batch_size=3)
+        self.addCleanup(cache.close)
+
+        for symbol in ["AAPL", "MSFT"]:
+            cache.set("alpha_vantage", "overview", {"symbol": symbol}, {"Symbol": symbol, "Name": symbol}, symbol)
+        self.assertEqual(cache._conn.execute("SELECT COUNT(*) FROM smart_cache").fetchone()[0], 0)
+
+        # Buffered entries are still served after leaving the memory tier
+        self.assertEqual(cache.get("alpha_vantage", "overview", {"symbol": "AAPL"}, "AAPL")["Symbol"], "AAPL")
+
+        cache.set("alpha_vantage", "overview", {"symbol": "NVDA"}, {"Symbol": "NVDA", "Name": "NVIDIA"}, "NVDA")
+        self.assertEqual(cache._conn.execute("SELECT COUNT(*) FROM smart_cache").fetchone()[0], 3)
+        self.assertEqual([p.name for p in cache.cache_dir.iterdir() if p.suffix == ".json"], [])
+
+        # A fresh instance (empty memory tier) reads the compressed rows back
+        reopened = SmartCache(cache_dir=str(self.test_cache_dir / "batched"))
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get("alpha_vantage", "overview", {"symbol": "NVDA"}, "NVDA")["Name"], "NVIDIA")
+        print("✓ Writes committed per batch and readable from a new instance")
+
+    def test_exit_flush_does_not_keep_caches_alive(self):
+        """Test that open caches are flushed at exit without being pinned until then"""
+        cache = SmartCache(cache_dir=str(self.test_cache_dir / "exit"), write_batch_size=10)
+        cache.set("alpha_vantage", "overview", {"symbol": "AAPL"}, {"Symbol": "AAPL", "Name": "Apple"}, "AAPL")
+
+        smart_cache._flush_open_caches()
+        self.assertEqual(cache._conn.execute("SELECT COUNT(*) FROM smart_cache").fetchone()[0], 1)
+
+        cache.close()
+        self.assertNotIn(cache, smart_cache._open_caches)
+
+        dropped = weakref.ref(SmartCache(cache_dir=str(self.test_cache_dir / "dropped")))
+        gc.collect()
+        self.assertIsNone(dropped())
+        print("✓ Exit hook flushes open caches and holds only weak references")
+
+    def test_clear_invalid_expires_by_ttl_column(self):
+        """Test that expired entries are removed by the indexed expiry sweep"""
+        print("\n=== Testing Expiry Sweep ===")
+
+        self.cache.set("alpha_vantage", "overview", {"symbol": "AAPL"}, {"Symbol": "AAPL", "Name": "Apple"}, "AAPL")
+        self.cache.set("alpha_vantage", "overview", {"symbol": "MSFT"}, {"Symbol": "MSFT", "Name": "Microsoft"}, "MSFT")
+        self.cache.flush()
+        with self.cache._conn:
+            self.cache._conn.execute("UPDATE smart_cache SET expires_at = 0 WHERE requested_symbol = 'AAPL'")
+        self.cache.memory_cache.clear()
+
+        self.cache.clear_invalid()
+
+        self.assertEqual(self.cache.get_statistics()["disk_cache_size"], 1)
+        self.assertIsNone(self.cache.get("alpha_vantage", "overview", {"symbol": "AAPL"}, "AAPL"))
+        self.assertIsNotNone(self.cache.get("alpha_vantage", "overview", {"symbol": "MSFT"}, "MSFT"))
+        print("✓ Expired entries swept without reading payloads")
+
+    def test_legacy_json_entries_are_migrated(self):
+        """Test that entries from the one-file-per-key layout are imported once"""
+        print("\n=== Testing Legacy JSON Migration ===")
+
+        legacy_dir = self.test_cache_dir / "legacy"
+        legacy_dir.mkdir(parents=True)
+        key = self.cache._get_cache_key("alpha_vantage", "overview", {"symbol": "TSLA"})
+        with open(legacy_dir / f"{key}.json", "w") as f:
+            json.dump({"data": {"Symbol": "TSLA", "Name": "Tesla"}, "metadata": {
+                "timestamp": datetime.now().isoformat(), "ttl_seconds": 3600, "validation_status": "valid"
+            }}, f)
+
+        migrated = SmartCache(cache_dir=str(legacy_dir))
+        self.addCleanup(migrated.close)
+
+        self.assertEqual(list(legacy_dir.glob("*.json")), [])
+        self.assertEqual(migrated.get("alpha_vantage", "overview", {"symbol": "TSLA"}, "TSLA")["Name"], "Tesla")
+        print("✓ Legacy JSON cache imported into the single-file store")
+
     def test_rate_limit_detection(self):
         """Test detection of rate limit messages"""
         print("\n=== Testing Rate Limit Detection ===")
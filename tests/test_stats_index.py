@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+File: tests/test_stats_index.py
+Purpose: Tests for the incremental statistics index behind get_comprehensive_stats
+Business Purpose: Notebooks and the UI poll 3-tier graph stats after every batch;
+                  those calls must not rescan the whole LightRAG store
+
+RELEVANT FILES: updated_architectures/implementation/stats_index.py, ice_simplified.py,
+                src/ice_lightrag/mmap_vector_storage.py
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from updated_architectures.implementation.stats_index import StatsIndex
+from src.ice_lightrag.mmap_vector_storage import MmapVectorStore
+
+try:
+    from lightrag.kg.shared_storage import finalize_share_data
+    from lightrag.utils import EmbeddingFunc, Tokenizer
+    from src.ice_lightrag import ice_rag_fixed
+    from src.ice_lightrag.ice_rag_fixed import JupyterICERAG
+    LIGHTRAG_INSTALLED = ice_rag_fixed.LIGHTRAG_AVAILABLE and ice_rag_fixed.MODEL_PROVIDER_AVAILABLE
+except ImportError:
+    LIGHTRAG_INSTALLED = False
+
+
+def _doc(doc_id, summary):
+    return {'doc_id': doc_id, 'content_summary': summary}
+
+
+class TestDocumentStats(unittest.TestCase):
+    """Tier 1 counters fed at ingestion time"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.index = StatsIndex(self.tmp)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_record_documents_counts_sources_once(self):
+        docs = [
+            _doc('doc-1', '[FINANCIAL] [SOURCE:NEWSAPI|SYMBOL:NVDA] NVDA rallies'),
+            _doc('doc-2', '[EMAIL] [SOURCE_EMAIL:123|sender:a] Broker note'),
+            _doc('doc-3', '[FINANCIAL] [SOURCE:SEC_EDGAR|SYMBOL:AMD] 10-K'),
+            _doc('doc-4', '[FINANCIAL] No markers here'),
+        ]
+        self.assertEqual(self.index.record_documents(docs), 4)
+        self.assertEqual(self.index.record_documents(docs[:1]), 0)  # Re-inserted document
+
+        stats = self.index.get_document_stats()
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['by_source'], {'newsapi': 1, 'email': 1, 'sec_edgar': 1})
+        self.assertEqual((stats['api_total'], stats['sec_total']), (1, 1))
+        self.assertEqual(stats['source_diversity']['documents_without_markers'], 1)
+        self.assertEqual(stats['source_diversity']['status'], 'partial')
+
+    def test_rebuild_counts_processed_doc_status_ids(self):
+        (self.tmp / 'kv_store_doc_status.json').write_text(json.dumps({
+            'doc-fmp': {'status': 'processed', 'content_summary': '[FINANCIAL] [SOURCE:FMP|SYMBOL:NVDA] profile'},
+            'doc-failed': {'status': 'failed', 'content_summary': '[FINANCIAL] [SOURCE:FMP|SYMBOL:AMD] profile'},
+            'dup-fmp': {'status': 'failed', 'content_summary': '[DUPLICATE:filename] Original document: doc-fmp'},
+        }))
+
+        # Existing doc counted once even when the same document is ingested again
+        self.index.record_documents([_doc('doc-fmp', '[FINANCIAL] [SOURCE:FMP|SYMBOL:NVDA] profile')])
+
+        self.assertEqual(self.index.get_document_stats()['fmp'], 1)
+        self.assertEqual(self.index.get_document_stats()['total'], 1)
+
+
+class CharTokenizer:
+    """Offline tokenizer (LightRAG's default downloads tiktoken encodings)"""
+
+    def encode(self, content):
+        return [ord(c) for c in content]
+
+    def decode(self, tokens):
+        return ''.join(map(chr, tokens))
+
+
+@unittest.skipUnless(LIGHTRAG_INSTALLED, "LightRAG not installed")
+class TestRealLightRAGDocumentStats(unittest.TestCase):
+    """Incremental counts agree with a rebuild from LightRAG's own doc_status"""
+
+    def setUp(self):
+        async def llm(prompt, system_prompt=None, history_messages=None, **kwargs):
+            if 'FAIL' in prompt:
+                raise ValueError('extraction failed')
+            return '<|COMPLETE|>'
+
+        async def embed(texts, **kwargs):
+            return np.ones((len(texts), 8), dtype=np.float32)
+
+        provider = (
+            llm,
+            EmbeddingFunc(embedding_dim=8, func=embed),
+            {'tokenizer': Tokenizer('chars', CharTokenizer())},
+            {}
+        )
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp, True)
+        # LightRAG keeps storage data per namespace in-process, not per working_dir
+        self.addCleanup(finalize_share_data)
+        patches = [
+            patch.dict(os.environ, {'ICE_TESTING_MODE': 'true', 'ICE_QUERY_CACHE': 'false'}),
+            patch.object(ice_rag_fixed, 'get_llm_provider', return_value=provider),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_incremental_counts_match_rebuild(self):
+        rag = JupyterICERAG(str(self.tmp))
+        first = [
+            {'content': '[SOURCE:NEWSAPI|SYMBOL:NVDA] NVDA rallies', 'file_path': 'api_news:NVDA_0'},
+            {'content': '[SOURCE_EMAIL:1|sender:a] Broker note', 'type': 'email', 'file_path': 'email:a.eml'},
+            {'content': '[SOURCE:FMP|SYMBOL:AMD] FAIL', 'file_path': 'api_fmp:AMD_0'},
+        ]
+        second = [
+            first[1],  # Same email ingested again
+            {'content': '[SOURCE:SEC_EDGAR|SYMBOL:AMD] 10-K', 'file_path': 'sec:AMD_0'},
+        ]
+        index = StatsIndex(self.tmp)
+
+        async def run():
+            for batch in (first, second):
+                results = await rag.add_documents_concurrent(batch)
+                index.record_documents([r for r in results if r['status'] == 'success'])
+            await rag._rag.finalize_storages()
+
+        asyncio.run(run())
+
+        rebuilt = StatsIndex(self.tmp)
+        rebuilt.rebuild()
+        self.assertEqual(index.get_document_stats(), rebuilt.get_document_stats())
+        self.assertEqual(index.get_document_stats()['total'], 3)
+        self.assertEqual(index.get_document_stats()['by_source'], {'newsapi': 1, 'email': 1, 'sec_edgar': 1})
+
+
+class TestGraphStats(unittest.TestCase):
+    """Tier 2/3 counters from vector storage"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.entities = MmapVectorStore(self.tmp, 'entities', embedding_dim=2)
+        self.vec = np.ones((1, 2), dtype=np.float32)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _upsert(self, id_, name, content=''):
+        self.entities.upsert([{'__id__': id_, 'entity_name': name, 'content': content}], self.vec)
+
+    def test_tail_updates_handle_supersede_and_delete(self):
+        self._upsert('ent-1', 'NVDA', 'Analyst BUY rating')
+        self._upsert('ent-2', 'AMD', 'Key risk: supply')
+        self.entities.save()
+        index = StatsIndex(self.tmp)
+
+        self.assertEqual(index.get_investment_intelligence_stats(), {
+            'tickers_covered': ['AMD', 'NVDA'], 'buy_signals': 1, 'sell_signals': 0,
+            'price_targets': 0, 'risk_mentions': 1
+        })
+
+        self._upsert('ent-1', 'NVDA', 'Downgraded to SELL, price target cut')
+        self.entities.delete(['ent-2'])
+        self.entities.save()
+        index.refresh_graph()
+
+        self.assertEqual(index.get_investment_intelligence_stats(), {
+            'tickers_covered': ['NVDA'], 'buy_signals': 0, 'sell_signals': 1,
+            'price_targets': 1, 'risk_mentions': 0
+        })
+        self.assertEqual(index.get_graph_structure_stats()['total_entities'], 1)
+
+    def test_rewritten_index_is_replayed(self):
+        self._upsert('ent-1', 'NVDA', 'BUY')
+        self.entities.save()
+        index = StatsIndex(self.tmp)
+        index.refresh_graph()
+
+        self.entities.drop()
+        self._upsert('ent-9', 'TSMC')
+        self.entities.save()
+        index.refresh_graph()
+
+        stats = index.get_investment_intelligence_stats()
+        self.assertEqual((stats['tickers_covered'], stats['buy_signals']), (['TSMC'], 0))
+
+    def test_legacy_json_entities(self):
+        shutil.rmtree(self.tmp)
+        self.tmp.mkdir()
+        (self.tmp / 'vdb_entities.json').write_text(json.dumps({
+            'embedding_dim': 2, 'data': [{'__id__': 'ent-1', 'entity_name': 'ASML', 'content': 'BUY'}], 'matrix': ''
+        }))
+        (self.tmp / 'vdb_relationships.json').write_text(json.dumps({'embedding_dim': 2, 'data': [{}, {}], 'matrix': ''}))
+
+        index = StatsIndex(self.tmp)
+
+        self.assertEqual(index.get_graph_structure_stats(), {
+            'total_entities': 1, 'total_relationships': 2, 'avg_connections': 2.0
+        })
+        self.assertEqual(index.get_investment_intelligence_stats()['tickers_covered'], ['ASML'])
+
+
+class TestPersistence(unittest.TestCase):
+    """Saved index is reused; cleared storage triggers a rebuild"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_saved_index_is_loaded_without_rescanning(self):
+        index = StatsIndex(self.tmp)
+        index.record_documents([_doc('doc-mu', '[FINANCIAL] [SOURCE:NEWSAPI|SYMBOL:MU] news')])
+        index.save()
+
+        with patch.object(StatsIndex, 'rebuild', side_effect=AssertionError('should not rescan')):
+            self.assertEqual(StatsIndex(self.tmp).get_document_stats()['newsapi'], 1)
+
+    def test_deleted_index_file_resets_counts(self):
+        index = StatsIndex(self.tmp)
+        index.record_documents([_doc('doc-mu', '[FINANCIAL] [SOURCE:NEWSAPI|SYMBOL:MU] news')])
+        index.save()
+
+        index.index_path.unlink()
+
+        self.assertEqual(index.get_document_stats()['total'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -60,6 +60,10 @@ class ICEConfig:
 
         # Performance settings
         self.max_concurrent_queries = int(os.getenv('ICE_MAX_CONCURRENT_QUERIES', '3'))
+        # Documents LightRAG's pipeline processes at the same time in add_documents_batch (1 = serial)
+        self.max_concurrent_inserts = int(os.getenv('ICE_MAX_CONCURRENT_INSERTS', '4'))
+        # Worker threads used by DataIngester.fetch_tickers_concurrent (per-provider caps still apply)
+        self.max_fetch_workers = int(os.getenv('ICE_MAX_FETCH_WORKERS', '8'))
         self.cache_enabled = os.getenv('ICE_CACHE_ENABLED', 'true').lower() == 'true'
 
         # Docling Integration Feature Flags (Switchable Architecture)
@@ -90,6 +94,8 @@ class ICEConfig:
 
         # Docling Configuration
         self.docling_cache_dir = os.getenv('DOCLING_CACHE_DIR', str(Path.home() / '.ice' / 'docling_cache'))
+        # Conversion worker processes shared by all docling processors (0 = convert in-process)
+        self.docling_workers = int(os.getenv('DOCLING_WORKERS', str(min(4, os.cpu_count() or 1))))
         self.docling_log_conversions = os.getenv('DOCLING_LOG_CONVERSIONS', 'false').lower() == 'true'
 
         # Crawl4AI Integration Feature Flags (Switchable Architecture)
@@ -141,6 +147,27 @@ class ICEConfig:
         # false: minimal logging (production)
         self.signal_store_debug = os.getenv('SIGNAL_STORE_DEBUG', 'false').lower() == 'true'
 
+        # Email Parse Cache Feature Flags
+        # Environment variables: ICE_EMAIL_PARSE_CACHE, ICE_EMAIL_PARSE_CACHE_DIR, ICE_EMAIL_PARSE_WORKERS
+
+        # Cache processed emails (enhanced document + entities) keyed by path, mtime and content hash
+        # true: unchanged .eml files skip parsing, entity extraction and link downloads on rebuild
+        # false: re-process every email on every build
+        # Default: true
+        self.use_email_parse_cache = os.getenv('ICE_EMAIL_PARSE_CACHE', 'true').lower() == 'true'
+
+        # Email parse cache directory
+        # Default: <project root>/data/email_parse_cache (email_parse_cache.DEFAULT_EMAIL_PARSE_CACHE_DIR),
+        # independent of the working directory
+        self.email_parse_cache_dir = os.getenv(
+            'ICE_EMAIL_PARSE_CACHE_DIR',
+            str(Path(__file__).resolve().parent.parent.parent / 'data' / 'email_parse_cache')
+        )
+
+        # Worker processes for MIME/HTML parsing of uncached emails (1 = parse in-process)
+        # Default: 4
+        self.email_parse_workers = int(os.getenv('ICE_EMAIL_PARSE_WORKERS', '4'))
+
         # Validate critical configuration
         self._validate_critical_config()
 
@@ -178,7 +205,8 @@ class ICEConfig:
             'url_pdfs': self.use_docling_urls,
             'user_uploads': self.use_docling_uploads,
             'archives': self.use_docling_archives,
-            'news_pdfs': self.use_docling_news
+            'news_pdfs': self.use_docling_news,
+            'workers': self.docling_workers
         }
 
     def get_signal_store_status(self) -> Dict[str, Any]:
@@ -220,6 +248,8 @@ class ICEConfig:
             'default_query_mode': self.default_query_mode,
             'query_timeout': self.query_timeout,
             'max_concurrent_queries': self.max_concurrent_queries,
+            'max_concurrent_inserts': self.max_concurrent_inserts,
+            'max_fetch_workers': self.max_fetch_workers,
             'cache_enabled': self.cache_enabled,
             'log_to_file': self.log_to_file,
             'log_file': self.log_file
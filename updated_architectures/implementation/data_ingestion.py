@@ -8,12 +8,15 @@ Relevant files: ice_simplified.py, ice_core.py
 
 import os
 import sys
+import json
+import threading
 from pathlib import Path
 import requests
 import logging
-from typing import Dict, List, Optional, Any
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from html.parser import HTMLParser
 
 # Add project root to path for production module imports
 project_root = Path(__file__).parent.parent.parent
@@ -22,6 +25,7 @@ sys.path.insert(0, str(project_root))
 # Production module imports for robust data ingestion
 from ice_data_ingestion.robust_client import RobustHTTPClient
 from ice_data_ingestion.sec_edgar_connector import SECEdgarConnector
+from ice_data_ingestion.async_http import run_sync
 from imap_email_ingestion_pipeline.email_connector import EmailConnector
 from imap_email_ingestion_pipeline.entity_extractor import EntityExtractor
 from imap_email_ingestion_pipeline.graph_builder import GraphBuilder
@@ -31,32 +35,16 @@ from imap_email_ingestion_pipeline.enhanced_doc_creator import create_enhanced_d
 from imap_email_ingestion_pipeline.intelligent_link_processor import IntelligentLinkProcessor, LinkProcessingResult
 from imap_email_ingestion_pipeline.ticker_validator import TickerValidator
 from ice_data_ingestion.benzinga_client import BenzingaClient
+from ice_data_ingestion.news_apis import RateLimiter
 from ice_data_ingestion.exa_mcp_connector import ExaMCPConnector
+from updated_architectures.implementation.email_parse_cache import (
+    DEFAULT_EMAIL_PARSE_CACHE_DIR, EmailParseCache, parse_eml_files
+)
 import asyncio
 
 logger = logging.getLogger(__name__)
 
 
-class HTMLTextExtractor(HTMLParser):
-    """Extract clean text from HTML content"""
-    def __init__(self):
-        super().__init__()
-        self.text = []
-        self.in_style = False
-
-    def handle_starttag(self, tag, attrs):
-        if tag == 'style':
-            self.in_style = True
-
-    def handle_endtag(self, tag):
-        if tag == 'style':
-            self.in_style = False
-
-    def handle_data(self, data):
-        if not self.in_style and data.strip():
-            self.text.append(data.strip())
-
-
 class DataIngester:
     """
     Simple data ingestion - Direct API calls without transformation layers
@@ -69,6 +57,20 @@ class DataIngester:
     5. Graceful degradation when APIs are unavailable
     """
 
+    # Per-provider (max concurrent requests, requests per minute)
+    # Per-minute figures follow the documented free-tier limits (see get_service_status)
+    PROVIDER_LIMITS: Dict[str, Tuple[int, int]] = {
+        'newsapi': (4, 60),
+        'benzinga': (2, 10),
+        'finnhub': (4, 60),
+        'marketaux': (2, 30),
+        'fmp': (2, 10),
+        'alpha_vantage': (1, 5),
+        'polygon': (1, 5),
+        'sec_edgar': (10, 600),  # SEC fair-access 10 req/s is enforced per request by the connector's token bucket
+    }
+    _gates_lock = threading.Lock()
+
     def __init__(self, api_keys: Optional[Dict[str, str]] = None, timeout: int = 30, config: Optional['ICEConfig'] = None):
         """
         Initialize data ingester with API configuration and feature flags
@@ -97,6 +99,9 @@ class DataIngester:
 
         self.available_services = list(self.api_keys.keys())
 
+        # Per-provider concurrency/rate gates, created on first use (see _provider_slot)
+        self._provider_gates = {}
+
         # Initialize production modules for robust data ingestion
         # 1. Robust HTTP Client (replaces simple requests.get())
         # Note: For now, keep using requests for simple integration
@@ -273,6 +278,33 @@ class DataIngester:
                 logger.warning(f"Signal Store initialization failed, using LightRAG only: {e}")
                 self.signal_store = None
 
+        # 11. Email Parse Cache (processed .eml files: enhanced document + entities + graph data)
+        # Unchanged emails skip parsing, entity extraction and link downloads on the next build
+        # Uncached emails are MIME/HTML-parsed in a process pool (email_parse_workers)
+        if config:
+            use_email_cache = config.use_email_parse_cache
+            email_cache_dir = config.email_parse_cache_dir
+            self.email_parse_workers = config.email_parse_workers
+        else:
+            use_email_cache = os.getenv('ICE_EMAIL_PARSE_CACHE', 'true').lower() == 'true'
+            email_cache_dir = os.getenv('ICE_EMAIL_PARSE_CACHE_DIR', str(DEFAULT_EMAIL_PARSE_CACHE_DIR))
+            self.email_parse_workers = int(os.getenv('ICE_EMAIL_PARSE_WORKERS', '4'))
+
+        self.email_parse_cache = None
+        if use_email_cache:
+            try:
+                # Cached documents depend on which processors produced them
+                self.email_parse_cache = EmailParseCache(email_cache_dir, settings={
+                    'attachment_processor': type(self.attachment_processor).__name__ if self.attachment_processor else None,
+                    'link_processor': self.link_processor is not None,
+                    'use_docling_urls': use_docling_urls,
+                    'use_crawl4ai_links': bool(config and config.use_crawl4ai_links),
+                    'process_urls': bool(config.process_urls) if config else True
+                })
+            except Exception as e:
+                logger.warning(f"Email parse cache initialization failed, processing all emails: {e}")
+                self.email_parse_cache = None
+
     def _merge_entities(self, body_entities: Dict, table_entities: Dict) -> Dict:
         """
         Merge entities extracted from email body and attachment tables.
@@ -368,33 +400,35 @@ class DataIngester:
         firm = email_data.get('from', '').split('<')[0].strip()  # Extract firm from sender
         analyst = None  # EntityExtractor doesn't extract analyst names yet
 
-        # Write each rating to Signal Store
-        ratings_written = 0
-        try:
-            for rating_entity in ratings:
-                rating_value = rating_entity.get('rating', '').upper()
-                confidence = rating_entity.get('confidence', 0.0)
-
-                # Write rating for each ticker mentioned in email
-                # (Assumes rating applies to all tickers in email)
-                for ticker_entity in tickers:
-                    ticker = ticker_entity.get('ticker', '').upper()
-                    if not ticker:
-                        continue
-
-                    self.signal_store.insert_rating(
-                        ticker=ticker,
-                        rating=rating_value,
-                        timestamp=timestamp,
-                        source_document_id=source_document_id,
-                        analyst=analyst,
-                        firm=firm if firm else None,
-                        confidence=confidence
-                    )
-                    ratings_written += 1
+        # Collect ratings, then write them in one transaction
+        ratings_to_insert = []
+        for rating_entity in ratings:
+            rating_value = rating_entity.get('rating', '').upper()
+            confidence = rating_entity.get('confidence', 0.0)
+
+            # Write rating for each ticker mentioned in email
+            # (Assumes rating applies to all tickers in email)
+            for ticker_entity in tickers:
+                ticker = ticker_entity.get('ticker', '').upper()
+                if not ticker:
+                    continue
 
-            if ratings_written > 0:
-                logger.info(f"✅ Wrote {ratings_written} ratings to Signal Store")
+                ratings_to_insert.append({
+                    'ticker': ticker,
+                    'rating': rating_value,
+                    'timestamp': timestamp,
+                    'source_document_id': source_document_id,
+                    'analyst': analyst,
+                    'firm': firm if firm else None,
+                    'confidence': confidence
+                })
+
+        if not ratings_to_insert:
+            return
+
+        try:
+            ratings_written = self.signal_store.insert_ratings_batch(ratings_to_insert)
+            logger.info(f"✅ Wrote {ratings_written} ratings to Signal Store")
 
         except Exception as e:
             logger.warning(f"Signal Store write failed (graceful degradation): {e}")
@@ -444,37 +478,35 @@ class DataIngester:
         # Extract metadata from email for attribution
         source_document_id = email_data.get('message_id', f"email_{email_data.get('uid', 'unknown')}")
 
-        # Write each metric to Signal Store
-        metrics_written = 0
-        try:
-            for metric_entity in all_metrics:
-                # Extract fields from TableEntityExtractor format
-                ticker = metric_entity.get('ticker', '').upper()
-                metric_type = metric_entity.get('metric', '')
-                metric_value = str(metric_entity.get('value', ''))
-                period = metric_entity.get('period')
-                confidence = metric_entity.get('confidence', 0.0)
-                table_index = metric_entity.get('table_index')
-                row_index = metric_entity.get('row_index')
-
-                if not ticker or not metric_type or not metric_value:
-                    logger.debug(f"Skipping incomplete metric: ticker={ticker}, type={metric_type}, value={metric_value}")
-                    continue
+        # Collect metrics, then write them in one transaction
+        metrics_to_insert = []
+        for metric_entity in all_metrics:
+            # Extract fields from TableEntityExtractor format
+            ticker = metric_entity.get('ticker', '').upper()
+            metric_type = metric_entity.get('metric', '')
+            metric_value = str(metric_entity.get('value', ''))
 
-                self.signal_store.insert_metric(
-                    ticker=ticker,
-                    metric_type=metric_type,
-                    metric_value=metric_value,
-                    source_document_id=source_document_id,
-                    period=period,
-                    confidence=confidence,
-                    table_index=table_index,
-                    row_index=row_index
-                )
-                metrics_written += 1
+            if not ticker or not metric_type or not metric_value:
+                logger.debug(f"Skipping incomplete metric: ticker={ticker}, type={metric_type}, value={metric_value}")
+                continue
+
+            metrics_to_insert.append({
+                'ticker': ticker,
+                'metric_type': metric_type,
+                'metric_value': metric_value,
+                'source_document_id': source_document_id,
+                'period': metric_entity.get('period'),
+                'confidence': metric_entity.get('confidence', 0.0),
+                'table_index': metric_entity.get('table_index'),
+                'row_index': metric_entity.get('row_index')
+            })
 
-            if metrics_written > 0:
-                logger.info(f"✅ Wrote {metrics_written} metrics to Signal Store")
+        if not metrics_to_insert:
+            return
+
+        try:
+            metrics_written = self.signal_store.insert_metrics_batch(metrics_to_insert)
+            logger.info(f"✅ Wrote {metrics_written} metrics to Signal Store")
 
         except Exception as e:
             logger.warning(f"Signal Store metrics write failed (graceful degradation): {e}")
@@ -516,39 +548,39 @@ class DataIngester:
         firm = email_data.get('from', '').split('<')[0].strip()  # Extract firm from sender
         analyst = None  # EntityExtractor doesn't extract analyst names yet
 
-        targets_written = 0
-        try:
-            for pt_entity in price_targets:
-                # Extract price target value (can be 'value' or 'price' key)
-                target_value_str = pt_entity.get('value') or pt_entity.get('price', '')
-                ticker = pt_entity.get('ticker', '').upper()
-                currency = pt_entity.get('currency', 'USD')
-                confidence = pt_entity.get('confidence', 0.0)
-
-                if not ticker or not target_value_str:
-                    continue
+        targets_to_insert = []
+        for pt_entity in price_targets:
+            # Extract price target value (can be 'value' or 'price' key)
+            target_value_str = pt_entity.get('value') or pt_entity.get('price', '')
+            ticker = pt_entity.get('ticker', '').upper()
 
-                # Parse target price as float
-                try:
-                    target_price = float(target_value_str)
-                except (ValueError, TypeError):
-                    logger.debug(f"Could not parse price target value: {target_value_str}")
-                    continue
+            if not ticker or not target_value_str:
+                continue
 
-                self.signal_store.insert_price_target(
-                    ticker=ticker,
-                    target_price=target_price,
-                    timestamp=timestamp,
-                    source_document_id=source_document_id,
-                    analyst=analyst,
-                    firm=firm if firm else None,
-                    currency=currency,
-                    confidence=confidence
-                )
-                targets_written += 1
+            # Parse target price as float
+            try:
+                target_price = float(target_value_str)
+            except (ValueError, TypeError):
+                logger.debug(f"Could not parse price target value: {target_value_str}")
+                continue
+
+            targets_to_insert.append({
+                'ticker': ticker,
+                'target_price': target_price,
+                'timestamp': timestamp,
+                'source_document_id': source_document_id,
+                'analyst': analyst,
+                'firm': firm if firm else None,
+                'currency': pt_entity.get('currency', 'USD'),
+                'confidence': pt_entity.get('confidence', 0.0)
+            })
+
+        if not targets_to_insert:
+            return
 
-            if targets_written > 0:
-                logger.info(f"✅ Wrote {targets_written} price targets to Signal Store")
+        try:
+            targets_written = self.signal_store.insert_price_targets_batch(targets_to_insert)
+            logger.info(f"✅ Wrote {targets_written} price targets to Signal Store")
 
         except Exception as e:
             logger.warning(f"Signal Store price targets write failed (graceful degradation): {e}")
@@ -614,7 +646,6 @@ class DataIngester:
             confidence = properties.get('confidence', 1.0 if node_type in ['EMAIL', 'SENDER'] else 0.8)
 
             # Convert properties dict to JSON string for metadata
-            import json
             metadata = json.dumps(properties)
 
             entities_to_insert.append({
@@ -682,7 +713,6 @@ class DataIngester:
                 continue
 
             # Convert properties dict to JSON string for metadata
-            import json
             metadata = json.dumps(properties)
 
             relationships_to_insert.append({
@@ -703,10 +733,100 @@ class DataIngester:
                 logger.warning(f"Signal Store relationships write failed (graceful degradation): {e}")
                 # Continue processing - dual-write failure shouldn't block email ingestion
 
+    def _write_email_signals(self, merged_entities: Dict, email_data: Dict, graph_data: Dict):
+        """
+        Dual-write one email's structured signals to Signal Store (no-op when disabled)
+
+        Each write degrades gracefully - a Signal Store failure never blocks email ingestion.
+        """
+        if not self.signal_store:
+            return
+
+        # Phase 2: Ratings (email date as timestamp)
+        try:
+            self._write_ratings_to_signal_store(
+                merged_entities=merged_entities,
+                email_data=email_data,
+                timestamp=email_data.get('date')
+            )
+        except Exception as e:
+            logger.warning(f"Signal Store dual-write failed (graceful degradation): {e}")
+
+        # Phase 3: Financial metrics extracted from tables (Docling/TableEntityExtractor)
+        try:
+            self._write_metrics_to_signal_store(
+                merged_entities=merged_entities,
+                email_data=email_data
+            )
+        except Exception as e:
+            logger.warning(f"Signal Store metrics write failed (graceful degradation): {e}")
+
+        # Phase 4: Price targets extracted from email body
+        try:
+            self._write_price_targets_to_signal_store(
+                merged_entities=merged_entities,
+                email_data=email_data,
+                timestamp=email_data.get('date')
+            )
+        except Exception as e:
+            logger.warning(f"Signal Store price targets write failed (graceful degradation): {e}")
+
+        # Phase 4: Entities (nodes) and relationships (edges) from GraphBuilder
+        try:
+            self._write_entities_to_signal_store(
+                graph_data=graph_data,
+                email_data=email_data
+            )
+        except Exception as e:
+            logger.warning(f"Signal Store entities write failed (graceful degradation): {e}")
+
+        try:
+            self._write_relationships_to_signal_store(
+                graph_data=graph_data,
+                email_data=email_data
+            )
+        except Exception as e:
+            logger.warning(f"Signal Store relationships write failed (graceful degradation): {e}")
+
+    def _replay_cached_email(self, cached_entry: Dict[str, Any]):
+        """Restore the side effects of processing a cached email (graph data, Signal Store writes)"""
+        email_data = cached_entry['email_data']
+        self.last_graph_data[email_data.get('source_file', 'unknown')] = cached_entry['graph_data']
+
+        signal_snapshot = cached_entry.get('signal_snapshot')
+        if signal_snapshot:
+            self._write_email_signals(signal_snapshot['merged_entities'], email_data, signal_snapshot['graph_data'])
+
     def is_service_available(self, service: str) -> bool:
         """Check if specific API service is configured"""
         return service in self.api_keys and bool(self.api_keys[service])
 
+    @contextmanager
+    def _provider_slot(self, provider: str):
+        """
+        Hold one of the provider's concurrency slots and respect its per-minute rate limit
+
+        Every provider call goes through here, so serial and concurrent fetching share the
+        same caps (see PROVIDER_LIMITS). Unknown providers are not limited.
+        """
+        with self._gates_lock:
+            if provider not in self._provider_gates and provider in self.PROVIDER_LIMITS:
+                max_concurrent, per_minute = self.PROVIDER_LIMITS[provider]
+                self._provider_gates[provider] = (threading.BoundedSemaphore(max_concurrent),
+                                                  RateLimiter(requests_per_minute=per_minute),
+                                                  threading.Lock())
+            gate = self._provider_gates.get(provider)
+
+        if gate is None:
+            yield
+            return
+
+        semaphore, rate_limiter, rate_lock = gate
+        with semaphore:
+            with rate_lock:  # RateLimiter is not thread-safe; waiting is serialized per provider
+                rate_limiter.wait_if_needed()
+            yield
+
     def _format_number(self, value: Any) -> str:
         """Safely format a number with comma separators, handle strings/None"""
         try:
@@ -717,61 +837,59 @@ class DataIngester:
         except (ValueError, TypeError):
             return 'N/A'
 
-    def fetch_company_news(self, symbol: str, limit: int = 5) -> List[Dict[str, str]]:
+    def fetch_company_news(self, symbol: str, limit: int = 5, parallel_providers: bool = False) -> List[Dict[str, str]]:
         """
         Fetch company news from available APIs - return source-tagged documents
 
+        Providers are tried in priority order (NewsAPI, Benzinga, Finnhub, MarketAux) until
+        `limit` articles are collected. With parallel_providers=True every available provider
+        is queried at once for `limit` articles and results are merged in the same priority
+        order - lower latency at the cost of extra API calls against provider quotas.
+
         Args:
             symbol: Stock ticker symbol
             limit: Maximum number of articles
+            parallel_providers: Query all news providers concurrently
 
         Returns:
             List of dicts with 'content' and 'source' keys for source attribution
         """
-        documents = []
-
-        # Try NewsAPI.org if available
+        # (provider, display name, fetcher) in priority order
+        providers = []
         if self.is_service_available('newsapi'):
+            providers.append(('newsapi', 'NewsAPI', self._fetch_newsapi))
+        if self.benzinga_client:
+            # Professional-grade news
+            providers.append(('benzinga', 'Benzinga', self._fetch_benzinga_news))
+        if self.is_service_available('finnhub'):
+            providers.append(('finnhub', 'Finnhub', self._fetch_finnhub_news))
+        if self.is_service_available('marketaux'):
+            providers.append(('marketaux', 'MarketAux', self._fetch_marketaux_news))
+
+        def fetch_provider(provider: str, name: str, fetcher, count: int) -> List[Dict[str, str]]:
             try:
-                logger.info(f"  📰 {symbol}: Fetching from NewsAPI...")
-                newsapi_docs = self._fetch_newsapi(symbol, limit)
-                documents.extend([{'content': doc, 'source': 'newsapi'} for doc in newsapi_docs])
-                logger.info(f"    ✅ NewsAPI: {len(newsapi_docs)} article(s)")
-            except Exception as e:
-                logger.warning(f"NewsAPI fetch failed for {symbol}: {e}")
-
-        # Try Benzinga if available and we need more articles (professional-grade news)
-        if self.benzinga_client and len(documents) < limit:
-            try:
-                remaining = limit - len(documents)
-                logger.info(f"  📰 {symbol}: Fetching from Benzinga (professional)...")
-                benzinga_docs = self._fetch_benzinga_news(symbol, remaining)
-                documents.extend([{'content': doc, 'source': 'benzinga'} for doc in benzinga_docs])
-                logger.info(f"    ✅ Benzinga: {len(benzinga_docs)} article(s)")
-            except Exception as e:
-                logger.warning(f"Benzinga fetch failed for {symbol}: {e}")
-
-        # Try Finnhub if available and we need more articles
-        if self.is_service_available('finnhub') and len(documents) < limit:
-            try:
-                remaining = limit - len(documents)
-                logger.info(f"  📰 {symbol}: Fetching from Finnhub...")
-                finnhub_docs = self._fetch_finnhub_news(symbol, remaining)
-                documents.extend([{'content': doc, 'source': 'finnhub'} for doc in finnhub_docs])
-                logger.info(f"    ✅ Finnhub: {len(finnhub_docs)} article(s)")
+                logger.info(f"  📰 {symbol}: Fetching from {name}...")
+                with self._provider_slot(provider):
+                    provider_docs = fetcher(symbol, count)
+                logger.info(f"    ✅ {name}: {len(provider_docs)} article(s)")
+                return [{'content': doc, 'source': provider} for doc in provider_docs]
             except Exception as e:
-                logger.warning(f"Finnhub news fetch failed for {symbol}: {e}")
+                logger.warning(f"{name} fetch failed for {symbol}: {e}")
+                return []
 
-        # Try MarketAux if available and we need more articles
-        if self.is_service_available('marketaux') and len(documents) < limit:
-            try:
-                remaining = limit - len(documents)
-                logger.info(f"  📰 {symbol}: Fetching from MarketAux...")
-                marketaux_docs = self._fetch_marketaux_news(symbol, remaining)
-                documents.extend([{'content': doc, 'source': 'marketaux'} for doc in marketaux_docs])
-                logger.info(f"    ✅ MarketAux: {len(marketaux_docs)} article(s)")
-            except Exception as e:
-                logger.warning(f"MarketAux fetch failed for {symbol}: {e}")
+        documents = []
+        if parallel_providers and len(providers) > 1:
+            with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+                futures = [executor.submit(fetch_provider, provider, name, fetcher, limit)
+                           for provider, name, fetcher in providers]
+                for future in futures:
+                    documents.extend(future.result())
+        else:
+            # Move on to the next provider only while we still need more articles
+            for provider, name, fetcher in providers:
+                if len(documents) >= limit:
+                    break
+                documents.extend(fetch_provider(provider, name, fetcher, limit - len(documents)))
 
         logger.info(f"Fetched {len(documents)} news articles for {symbol}")
         return documents[:limit]
@@ -942,7 +1060,8 @@ Symbol: {symbol}
         if self.is_service_available('fmp'):
             try:
                 logger.info(f"  💰 {symbol}: Fetching fundamentals from FMP...")
-                fmp_docs = self._fetch_fmp_profile(symbol)
+                with self._provider_slot('fmp'):
+                    fmp_docs = self._fetch_fmp_profile(symbol)
                 documents.extend([{'content': doc, 'source': 'fmp'} for doc in fmp_docs])
                 logger.info(f"    ✅ FMP: {len(fmp_docs)} document(s)")
             except Exception as e:
@@ -952,7 +1071,8 @@ Symbol: {symbol}
         if self.is_service_available('alpha_vantage'):
             try:
                 logger.info(f"  💰 {symbol}: Fetching fundamentals from Alpha Vantage...")
-                av_docs = self._fetch_alpha_vantage_overview(symbol)
+                with self._provider_slot('alpha_vantage'):
+                    av_docs = self._fetch_alpha_vantage_overview(symbol)
                 documents.extend([{'content': doc, 'source': 'alpha_vantage'} for doc in av_docs])
                 logger.info(f"    ✅ Alpha Vantage: {len(av_docs)} document(s)")
             except Exception as e:
@@ -984,7 +1104,8 @@ Symbol: {symbol}
         if self.is_service_available('polygon'):
             try:
                 logger.info(f"  📈 {symbol}: Fetching market data from Polygon...")
-                poly_docs = self._fetch_polygon_details(symbol)
+                with self._provider_slot('polygon'):
+                    poly_docs = self._fetch_polygon_details(symbol)
                 documents.extend([{'content': doc, 'source': 'polygon'} for doc in poly_docs])
                 logger.info(f"    ✅ Polygon: {len(poly_docs)} document(s)")
             except Exception as e:
@@ -1018,7 +1139,6 @@ Symbol: {symbol}
             logger.info("⏭️ Skipping emails (limit=0, email source disabled)")
             return []
 
-        import email
         from pathlib import Path
 
         documents = []
@@ -1051,6 +1171,8 @@ Symbol: {symbol}
         filtered_items = []  # List of (document, entities) tuples
         all_items = []       # List of (document, entities) tuples
 
+        # Validate files up front so only real candidates are parsed or looked up in the cache
+        valid_files = []
         for eml_file in eml_files:
             try:
                 # Email format validation
@@ -1065,26 +1187,38 @@ Symbol: {symbol}
                 if file_size > 50 * 1024 * 1024:  # 50MB limit
                     logger.warning(f"Skipping oversized email file ({file_size / (1024*1024):.1f}MB): {eml_file.name}")
                     continue
+                valid_files.append(eml_file)
+            except Exception as e:
+                logger.warning(f"Failed to parse email {eml_file.name}: {e}")
 
-                # Character encoding detection
-                encoding = 'utf-8'
-                try:
-                    import chardet
-                    with open(eml_file, 'rb') as f:
-                        raw_data = f.read(10000)  # Sample first 10KB for detection
-                        detected = chardet.detect(raw_data)
-                        if detected and detected['encoding'] and detected['confidence'] > 0.7:
-                            encoding = detected['encoding']
-                            if encoding != 'utf-8':
-                                logger.debug(f"Detected encoding {encoding} (confidence: {detected['confidence']:.2f}) for {eml_file.name}")
-                except ImportError:
-                    # chardet not installed, fallback to utf-8
-                    pass
-                except Exception as e:
-                    logger.debug(f"Encoding detection failed for {eml_file.name}: {e}, using utf-8")
+        # Unchanged emails come straight from the parse cache; the rest are parsed
+        # (encoding detection, MIME decoding, HTML tables) in a process pool
+        cached_emails = {}
+        if self.email_parse_cache:
+            for eml_file in valid_files:
+                cached_entry = self.email_parse_cache.get(eml_file)
+                if cached_entry is not None:
+                    cached_emails[eml_file] = cached_entry
+        files_to_parse = [f for f in valid_files if f not in cached_emails]
+        parsed_emails = parse_eml_files(files_to_parse, max_workers=self.email_parse_workers)
+        if self.email_parse_cache:
+            logger.info(f"📦 Email parse cache: {len(cached_emails)} cached, {len(files_to_parse)} to process")
+
+        for eml_file in valid_files:
+            if eml_file in cached_emails:
+                cached_entry = cached_emails[eml_file]
+                self._replay_cached_email(cached_entry)
+                item = (cached_entry['document'], cached_entry['entities'], cached_entry['metadata'])
+                all_items.append(item)
+                if tickers and any(ticker.upper() in cached_entry['filter_text'] for ticker in tickers):
+                    filtered_items.append(item)
+                continue
 
-                with open(eml_file, 'r', encoding=encoding, errors='ignore') as f:
-                    msg = email.message_from_file(f)
+            try:
+                parsed = parsed_emails[eml_file]
+                if isinstance(parsed, Exception):
+                    raise parsed
+                msg = parsed['msg']
 
                 # Validate email structure
                 if not msg:
@@ -1092,97 +1226,31 @@ Symbol: {symbol}
                     continue
 
                 # Extract email metadata
-                subject = msg.get('Subject', 'No Subject')
-                sender = msg.get('From', 'Unknown Sender')
-                date = msg.get('Date', 'Unknown Date')
+                subject = parsed['subject']
+                sender = parsed['sender']
+                date = parsed['date']
 
                 # Additional validation: must have at least subject or sender
                 if subject == 'No Subject' and sender == 'Unknown Sender':
                     logger.warning(f"Email missing critical metadata (no subject or sender): {eml_file.name}")
                     # Continue processing but log warning
 
-                # Extract email body (fallback: text/plain → HTML → empty)
-                body_text = ""
-                body_html = ""
-
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        if part.get_content_type() == "text/plain" and not body_text:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                # Try to use part's charset if available, otherwise use detected encoding
-                                charset = part.get_content_charset() or encoding
-                                body_text = payload.decode(charset, errors='ignore')
-                        elif part.get_content_type() == "text/html" and not body_html:
-                            payload = part.get_payload(decode=True)
-                            if payload:
-                                # Try to use part's charset if available, otherwise use detected encoding
-                                charset = part.get_content_charset() or encoding
-                                body_html = payload.decode(charset, errors='ignore')
-                else:
-                    payload = msg.get_payload(decode=True)
-                    if payload:
-                        # Try to use message's charset if available, otherwise use detected encoding
-                        charset = msg.get_content_charset() or encoding
-                        body_text = payload.decode(charset, errors='ignore')
-
-                # Use text/plain if available, otherwise convert HTML to text
-                if body_text:
-                    body = body_text
-                elif body_html:
-                    parser = HTMLTextExtractor()
-                    parser.feed(body_html)
-                    body = '\n'.join(parser.text)
-                else:
-                    body = ""
+                # Email body (text/plain, or HTML converted to text) and HTML body
+                body = parsed['body']
+                body_html = parsed['body_html']
 
-                # FIX #4: Extract HTML tables from email body for structured table processing
+                # FIX #4: HTML tables from email body for structured table processing
                 # Enables queries on earnings summaries embedded as HTML tables (not just attachments)
                 # Example: Quarterly results table in email body (not as PDF attachment)
-                html_tables_data = []
-                if body_html:
-                    try:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(body_html, 'html.parser')
-
-                        for table_idx, html_table in enumerate(soup.find_all('table')):
-                            # Extract headers (first row)
-                            rows = html_table.find_all('tr')
-                            if len(rows) < 2:  # Skip tables with no data rows (headers only)
-                                continue
-
-                            headers = [th.get_text(strip=True) for th in rows[0].find_all(['th', 'td'])]
-                            if not headers:  # Skip tables with no headers
-                                continue
-
-                            # Extract data rows
-                            table_data = []
-                            for row in rows[1:]:
-                                cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
-                                if len(cells) == len(headers):
-                                    table_data.append(dict(zip(headers, cells)))
-
-                            if table_data:  # Only add non-empty tables
-                                html_tables_data.append({
-                                    'index': table_idx,
-                                    'data': table_data,
-                                    'num_rows': len(table_data),
-                                    'num_cols': len(headers),
-                                    'source': 'email_body_html',
-                                    'error': None
-                                })
-
-                        if html_tables_data:
-                            logger.debug(f"Extracted {len(html_tables_data)} HTML table(s) from email body")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to extract HTML tables from email body: {e}")
-                        html_tables_data = []
+                html_tables_data = parsed['html_tables_data']
+                if html_tables_data:
+                    logger.debug(f"Extracted {len(html_tables_data)} HTML table(s) from email body")
 
                 # Extract attachments if processor available (Phase 2.6.1)
                 # Only 3/71 emails have attachments, so this is optional
                 attachments_data = []
                 attachment_stats = {'total': 0, 'successful': 0, 'failed': 0, 'cached': 0}
+                pending_attachments = []
                 if self.attachment_processor and msg.is_multipart():
                     for part in msg.walk():
                         content_disposition = part.get('Content-Disposition', '')
@@ -1199,34 +1267,50 @@ Symbol: {symbol}
                             filename = part.get_filename()
                             if filename:
                                 attachment_stats['total'] += 1  # Track total attachments encountered
-                                try:
-                                    # Process attachment using AttachmentProcessor interface
-                                    # Requires: attachment_data (Dict with 'part' and 'filename' keys) and email_uid
-                                    attachment_dict = {
-                                        'part': part,
-                                        'filename': filename,
-                                        'content_type': part.get_content_type()
-                                    }
-                                    email_uid = eml_file.stem  # Use filename without extension as UID
-
-                                    result = self.attachment_processor.process_attachment(attachment_dict, email_uid)
-                                    # BUG FIX: DoclingProcessor returns 'processing_status': 'completed', not 'status': 'success'
-                                    # This was preventing inline images from being added to attachments_data
-                                    if result.get('processing_status') == 'completed':
-                                        attachments_data.append(result)
-                                        attachment_stats['successful'] += 1  # Track successful processing
-                                        # Track if this was cached or fresh processing
-                                        if result.get('cached', False):
-                                            attachment_stats['cached'] += 1
-                                        logger.debug(f"Processed attachment: {filename} ({result.get('extraction_method', 'unknown')})")
-                                    else:
-                                        # Processing didn't complete successfully
-                                        attachment_stats['failed'] += 1
-                                        logger.warning(f"Attachment processing incomplete for {filename}: status={result.get('processing_status', 'unknown')}")
-
-                                except Exception as e:
-                                    attachment_stats['failed'] += 1  # Track failed processing
-                                    logger.warning(f"Failed to process attachment {filename}: {e}")
+                                # Process attachment using AttachmentProcessor interface
+                                # Requires: attachment_data (Dict with 'part' and 'filename' keys) and email_uid
+                                pending_attachments.append({
+                                    'part': part,
+                                    'filename': filename,
+                                    'content_type': part.get_content_type()
+                                })
+
+                if pending_attachments:
+                    email_uid = eml_file.stem  # Use filename without extension as UID
+                    if hasattr(self.attachment_processor, 'process_attachments'):
+                        # DoclingProcessor: convert all of this email's attachments concurrently on the worker pool
+                        try:
+                            attachment_results = self.attachment_processor.process_attachments(
+                                [(attachment_dict, email_uid) for attachment_dict in pending_attachments]
+                            )
+                        except Exception as e:
+                            attachment_results = [e] * len(pending_attachments)
+                    else:
+                        attachment_results = []
+                        for attachment_dict in pending_attachments:
+                            try:
+                                attachment_results.append(self.attachment_processor.process_attachment(attachment_dict, email_uid))
+                            except Exception as e:
+                                attachment_results.append(e)
+
+                    for attachment_dict, result in zip(pending_attachments, attachment_results):
+                        filename = attachment_dict['filename']
+                        if isinstance(result, Exception):
+                            attachment_stats['failed'] += 1  # Track failed processing
+                            logger.warning(f"Failed to process attachment {filename}: {result}")
+                        # BUG FIX: DoclingProcessor returns 'processing_status': 'completed', not 'status': 'success'
+                        # This was preventing inline images from being added to attachments_data
+                        elif result.get('processing_status') == 'completed':
+                            attachments_data.append(result)
+                            attachment_stats['successful'] += 1  # Track successful processing
+                            # Track if this was cached or fresh processing
+                            if result.get('cached', False):
+                                attachment_stats['cached'] += 1
+                            logger.debug(f"Processed attachment: {filename} ({result.get('extraction_method', 'unknown')})")
+                        else:
+                            # Processing didn't complete successfully
+                            attachment_stats['failed'] += 1
+                            logger.warning(f"Attachment processing incomplete for {filename}: status={result.get('processing_status', 'unknown')}")
 
                 # Log attachment processing summary for user visibility
                 if attachment_stats['total'] > 0:
@@ -1240,6 +1324,8 @@ Symbol: {symbol}
 
                 # Phase 2.6.1: Use EntityExtractor for structured extraction
                 document = None  # Will store either enhanced or fallback document
+                extraction_ok = False  # Only enhanced documents are cached, never the fallback
+                signal_snapshot = None
                 try:
                     # Prepare email data for entity extraction
                     # Validate and sanitize metadata to prevent 'unknown' values in enhanced documents
@@ -1330,32 +1416,6 @@ Symbol: {symbol}
                     merged_entities = self._merge_entities(body_entities, table_entities)
                     merged_entities = self._merge_entities(merged_entities, html_table_entities)
 
-                    # Phase 2: Dual-write to Signal Store (structured queries)
-                    # Write ratings to SQLite before creating enhanced document
-                    # Uses transaction-based pattern: both Signal Store and LightRAG succeed or both fail
-                    if self.signal_store:
-                        try:
-                            self._write_ratings_to_signal_store(
-                                merged_entities=merged_entities,
-                                email_data=email_data,
-                                timestamp=date  # Email date as timestamp
-                            )
-                        except Exception as e:
-                            logger.warning(f"Signal Store dual-write failed (graceful degradation): {e}")
-                            # Continue processing - dual-write failure shouldn't block email ingestion
-
-                    # Phase 3: Write financial metrics to Signal Store
-                    # Dual-write pattern for metrics extracted from tables (Docling/TableEntityExtractor)
-                    if self.signal_store:
-                        try:
-                            self._write_metrics_to_signal_store(
-                                merged_entities=merged_entities,
-                                email_data=email_data
-                            )
-                        except Exception as e:
-                            logger.warning(f"Signal Store metrics write failed (graceful degradation): {e}")
-                            # Continue processing - dual-write failure shouldn't block email ingestion
-
                     # Build typed relationship graph using GraphBuilder (Phase 2.6.1)
                     # Creates edges like ANALYST_RECOMMENDS, FIRM_COVERS, PRICE_TARGET_SET
                     # Now includes entities from both email body AND attachment tables
@@ -1369,42 +1429,15 @@ Symbol: {symbol}
                     email_id = email_data.get('source_file', 'unknown')
                     self.last_graph_data[email_id] = graph_data
 
-                    # Phase 4: Write price targets to Signal Store
-                    # Dual-write pattern for price targets extracted from email body
-                    if self.signal_store:
-                        try:
-                            self._write_price_targets_to_signal_store(
-                                merged_entities=merged_entities,
-                                email_data=email_data,
-                                timestamp=date  # Email date as timestamp
-                            )
-                        except Exception as e:
-                            logger.warning(f"Signal Store price targets write failed (graceful degradation): {e}")
-                            # Continue processing - dual-write failure shouldn't block email ingestion
-
-                    # Phase 4: Write entities to Signal Store
-                    # Dual-write pattern for entities (nodes) from GraphBuilder
-                    if self.signal_store:
-                        try:
-                            self._write_entities_to_signal_store(
-                                graph_data=graph_data,
-                                email_data=email_data
-                            )
-                        except Exception as e:
-                            logger.warning(f"Signal Store entities write failed (graceful degradation): {e}")
-                            # Continue processing - dual-write failure shouldn't block email ingestion
+                    # Phases 2-4: Dual-write ratings, metrics, price targets, entities and
+                    # relationships to Signal Store (structured queries)
+                    self._write_email_signals(merged_entities, email_data, graph_data)
 
-                    # Phase 4: Write relationships to Signal Store
-                    # Dual-write pattern for relationships (edges) from GraphBuilder
-                    if self.signal_store:
-                        try:
-                            self._write_relationships_to_signal_store(
-                                graph_data=graph_data,
-                                email_data=email_data
-                            )
-                        except Exception as e:
-                            logger.warning(f"Signal Store relationships write failed (graceful degradation): {e}")
-                            # Continue processing - dual-write failure shouldn't block email ingestion
+                    # Snapshot what was dual-written so a cache hit can replay the same writes
+                    # (linked-report entities merged below are not written to Signal Store)
+                    signal_snapshot = json.loads(json.dumps(
+                        {'merged_entities': merged_entities, 'graph_data': graph_data}, default=str
+                    )) if self.email_parse_cache else None
 
                     # Phase 2: Process links in email body to download research reports
                     # Uses IntelligentLinkProcessor with hybrid Crawl4AI routing
@@ -1633,6 +1666,7 @@ Symbol: {symbol}
                     logger.debug(f"EntityExtractor: Found {len(merged_entities.get('tickers', []))} tickers, "
                                 f"GraphBuilder: Created {len(graph_data.get('nodes', []))} nodes, "
                                 f"{len(graph_data.get('edges', []))} edges in {eml_file.name}")
+                    extraction_ok = True
 
                 except Exception as e:
                     # Graceful fallback to basic text extraction if EntityExtractor/GraphBuilder fails
@@ -1664,11 +1698,22 @@ Tickers Mentioned: {', '.join(tickers) if tickers else 'All'}
                 all_items.append((document.strip(), merged_entities, metadata))
 
                 # Check if matches ticker filter
+                content_text = f"{subject} {body}".upper()
                 if tickers:
-                    content_text = f"{subject} {body}".upper()
                     if any(ticker.upper() in content_text for ticker in tickers):
                         filtered_items.append((document.strip(), merged_entities, metadata))
 
+                if self.email_parse_cache and extraction_ok:
+                    self.email_parse_cache.put(eml_file, {
+                        'document': document.strip(),
+                        'entities': merged_entities,
+                        'metadata': metadata,
+                        'filter_text': content_text,
+                        'email_data': email_data,
+                        'graph_data': graph_data,
+                        'signal_snapshot': signal_snapshot
+                    }, sha256=parsed['sha256'])
+
             except Exception as e:
                 logger.warning(f"Failed to parse email {eml_file.name}: {e}")
                 continue
@@ -1724,21 +1769,14 @@ Tickers Mentioned: {', '.join(tickers) if tickers else 'All'}
         Returns:
             List of dicts with 'content' and 'source' keys for source attribution
         """
-        import asyncio
-
         documents = []
 
         try:
             # 1. Fetch filing metadata (existing functionality, always runs)
+            # Runs on the shared long-lived loop, so concurrent tickers overlap on one keep-alive pool
             logger.info(f"  📋 {symbol}: Fetching SEC filings...")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                filings = loop.run_until_complete(
-                    self.sec_connector.get_recent_filings(symbol, limit=limit)
-                )
-            finally:
-                loop.close()
+            with self._provider_slot('sec_edgar'):
+                filings = run_sync(self.sec_connector.get_recent_filings(symbol, limit=limit))
 
             # 2. Content extraction (NEW - conditional on toggle)
             use_docling = self.config and self.config.use_docling_sec
@@ -2089,6 +2127,64 @@ Retrieved: {datetime.now().isoformat()}
 """
         return [details_text.strip()]
 
+    def fetch_tickers_concurrent(self, symbols: List[str],
+                                 news_limit: int = 2,
+                                 financial_limit: int = 2,
+                                 market_limit: int = 1,
+                                 sec_limit: int = 2,
+                                 max_workers: Optional[int] = None) -> Dict[str, Dict[str, List[Dict[str, str]]]]:
+        """
+        Fetch news, fundamentals, market data and SEC filings for many symbols concurrently
+
+        Every (symbol, category) pair runs on a shared thread pool and news providers are
+        queried in parallel, so wall-clock time approaches the slowest few requests rather
+        than the sum of all of them. Per-provider concurrency and rate limits still apply
+        (see PROVIDER_LIMITS), so slow-tier APIs like Polygon are throttled, not hammered.
+
+        Args:
+            symbols: List of stock ticker symbols
+            news_limit: Maximum number of news articles per symbol
+            financial_limit: Maximum number of financial fundamental documents per symbol
+            market_limit: Maximum number of market data documents per symbol
+            sec_limit: Maximum number of SEC filings per symbol
+            max_workers: Thread pool size (default: config.max_fetch_workers / ICE_MAX_FETCH_WORKERS)
+
+        Returns:
+            {symbol: {'news': [...], 'financial': [...], 'market': [...], 'sec': [...]}} in input order,
+            holding the same source-tagged document dicts as the per-category fetch methods
+        """
+        if max_workers is None:
+            max_workers = self.config.max_fetch_workers if self.config else int(os.getenv('ICE_MAX_FETCH_WORKERS', '8'))
+
+        categories = [
+            ('news', lambda symbol: self.fetch_company_news(symbol, news_limit, parallel_providers=True)),
+            ('financial', lambda symbol: self.fetch_financial_fundamentals(symbol, financial_limit)),
+            ('market', lambda symbol: self.fetch_market_data(symbol, market_limit)),
+            ('sec', lambda symbol: self.fetch_sec_filings(symbol, limit=sec_limit)),
+        ]
+
+        symbols = list(dict.fromkeys(symbols))  # Dedupe, keep order
+        results = {symbol: {category: [] for category, _ in categories} for symbol in symbols}
+        start_time = datetime.now()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='ice-fetch') as executor:
+            futures = {
+                executor.submit(fetch, symbol): (symbol, category)
+                for symbol in symbols
+                for category, fetch in categories
+            }
+            for future, (symbol, category) in futures.items():
+                try:
+                    results[symbol][category] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ {category} fetch failed for {symbol}: {e}")
+
+        elapsed = (datetime.now() - start_time).total_seconds()
+        total_docs = sum(len(docs) for data in results.values() for docs in data.values())
+        logger.info(f"⚡ Fetched {total_docs} documents for {len(symbols)} symbols in {elapsed:.2f}s "
+                    f"({max_workers} workers)")
+        return results
+
     def fetch_comprehensive_data(self, symbols: List[str],
                                 news_limit: int = 2,
                                 financial_limit: int = 2,
@@ -2134,39 +2230,31 @@ Retrieved: {datetime.now().isoformat()}
         except Exception as e:
             logger.error(f"❌ Category 1 (Email) failed: {e}")
 
-        # CATEGORIES 2-6: For each symbol, get API/MCP data + SEC filings
+        # CATEGORIES 2-5: API data + SEC filings, fetched concurrently across symbols and sources
+        ticker_data = self.fetch_tickers_concurrent(symbols,
+                                                    news_limit=news_limit,
+                                                    financial_limit=financial_limit,
+                                                    market_limit=market_limit,
+                                                    sec_limit=sec_limit)
+
         for symbol in symbols:
+            data = ticker_data.get(symbol, {})
+
             # CATEGORY 2: News data (API)
-            try:
-                news_docs = self.fetch_company_news(symbol, news_limit)
-                all_documents.extend(news_docs)
-                logger.info(f"✅ Category 2 (News): Added {len(news_docs)} documents for {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Category 2 (News) failed for {symbol}: {e}")
+            all_documents.extend(data.get('news', []))
+            logger.info(f"✅ Category 2 (News): Added {len(data.get('news', []))} documents for {symbol}")
 
             # CATEGORY 3: Financial fundamentals (API)
-            try:
-                financial_docs = self.fetch_financial_fundamentals(symbol, financial_limit)
-                all_documents.extend(financial_docs)
-                logger.info(f"✅ Category 3 (Financial): Added {len(financial_docs)} documents for {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Category 3 (Financial) failed for {symbol}: {e}")
+            all_documents.extend(data.get('financial', []))
+            logger.info(f"✅ Category 3 (Financial): Added {len(data.get('financial', []))} documents for {symbol}")
 
             # CATEGORY 4: Market data (API)
-            try:
-                market_docs = self.fetch_market_data(symbol, market_limit)
-                all_documents.extend(market_docs)
-                logger.info(f"✅ Category 4 (Market): Added {len(market_docs)} documents for {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Category 4 (Market) failed for {symbol}: {e}")
+            all_documents.extend(data.get('market', []))
+            logger.info(f"✅ Category 4 (Market): Added {len(data.get('market', []))} documents for {symbol}")
 
             # CATEGORY 5: SEC EDGAR filings (regulatory)
-            try:
-                sec_docs = self.fetch_sec_filings(symbol, limit=sec_limit)
-                all_documents.extend(sec_docs)
-                logger.info(f"✅ Category 5 (SEC): Added {len(sec_docs)} filings for {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Category 5 (SEC) failed for {symbol}: {e}")
+            all_documents.extend(data.get('sec', []))
+            logger.info(f"✅ Category 5 (SEC): Added {len(data.get('sec', []))} filings for {symbol}")
 
             # CATEGORY 6: Research/Search (MCP - on-demand only, not auto-ingested)
             # Note: research_limit typically 0 (default) since research_company_deep() is user-directed
@@ -0,0 +1,364 @@
+# Location: /updated_architectures/implementation/email_parse_cache.py
+# Purpose: Parallel .eml parsing and an on-disk cache of processed emails
+# Why: fetch_email_documents re-parsed and re-extracted every sample email on every build
+# Relevant Files: data_ingestion.py, config.py
+
+"""
+Email parsing stage + processed-email cache for DataIngester.fetch_email_documents
+
+parse_eml_file() does the pure, CPU-bound part of email ingestion (encoding detection,
+MIME decoding, HTML -> text, HTML table extraction). It only depends on the standard
+library (plus optional chardet/bs4), so parse_eml_files() can fan it out to a process
+pool without dragging EntityExtractor/LightRAG imports into the workers.
+
+EmailParseCache stores the end result of processing an email (enhanced document,
+extracted entities, graph data) as one JSON file per .eml, keyed by file path and
+validated by mtime/size with a content-hash fallback. Unchanged emails skip parsing,
+entity extraction and link downloads entirely on the next build.
+"""
+
+import io
+import os
+import json
+import email
+import hashlib
+import logging
+import multiprocessing
+from datetime import date, datetime
+from pathlib import Path
+from html.parser import HTMLParser
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Bump when the processed-email format (enhanced document, entities, graph data) changes
+EMAIL_CACHE_VERSION = 2
+
+# Default cache location, anchored at the project root rather than the working directory
+DEFAULT_EMAIL_PARSE_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / 'data' / 'email_parse_cache'
+
+# Tagged JSON forms for values plain JSON would not round-trip (see _encode_entry)
+_TAG_DATETIME, _TAG_DATE, _TAG_TUPLE, _TAG_SET = '__datetime__', '__date__', '__tuple__', '__set__'
+
+
+def _encode_entry(value: Any) -> Any:
+    """
+    Convert a processed-email entry to JSON-clean data that decodes back to an equal value
+
+    datetimes, dates, tuples and sets are tagged; anything else JSON cannot represent
+    exactly (non-str dict keys, arbitrary objects) raises TypeError so the entry is not cached.
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("dict keys must be strings")
+        return {key: _encode_entry(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode_entry(item) for item in value]
+    if isinstance(value, tuple):
+        return {_TAG_TUPLE: [_encode_entry(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {_TAG_SET: [_encode_entry(item) for item in value]}
+    if isinstance(value, datetime):
+        return {_TAG_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_TAG_DATE: value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode_tagged(obj: Dict[str, Any]) -> Any:
+    """json object_hook reversing _encode_entry's tags"""
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        if tag == _TAG_DATETIME:
+            return datetime.fromisoformat(value)
+        if tag == _TAG_DATE:
+            return date.fromisoformat(value)
+        if tag == _TAG_TUPLE:
+            return tuple(value)
+        if tag == _TAG_SET:
+            return set(value)
+    return obj
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Extract clean text from HTML content"""
+    def __init__(self):
+        super().__init__()
+        self.text = []
+        self.in_style = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'style':
+            self.in_style = True
+
+    def handle_endtag(self, tag):
+        if tag == 'style':
+            self.in_style = False
+
+    def handle_data(self, data):
+        if not self.in_style and data.strip():
+            self.text.append(data.strip())
+
+
+def _extract_html_tables(body_html: str) -> List[Dict[str, Any]]:
+    """Extract header/row tables from an HTML email body (FIX #4: tables embedded in email body)"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(body_html, 'html.parser')
+
+    html_tables_data = []
+    for table_idx, html_table in enumerate(soup.find_all('table')):
+        # Extract headers (first row)
+        rows = html_table.find_all('tr')
+        if len(rows) < 2:  # Skip tables with no data rows (headers only)
+            continue
+
+        headers = [th.get_text(strip=True) for th in rows[0].find_all(['th', 'td'])]
+        if not headers:  # Skip tables with no headers
+            continue
+
+        # Extract data rows
+        table_data = []
+        for row in rows[1:]:
+            cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
+            if len(cells) == len(headers):
+                table_data.append(dict(zip(headers, cells)))
+
+        if table_data:  # Only add non-empty tables
+            html_tables_data.append({
+                'index': table_idx,
+                'data': table_data,
+                'num_rows': len(table_data),
+                'num_cols': len(headers),
+                'source': 'email_body_html',
+                'error': None
+            })
+
+    return html_tables_data
+
+
+def parse_eml_file(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Parse one .eml file into headers, decoded bodies and HTML tables
+
+    Module-level (picklable) so it can run in a ProcessPoolExecutor worker.
+
+    Args:
+        path: Path to the .eml file
+
+    Returns:
+        Dict with msg (email.message.Message, needed for attachments), subject, sender,
+        date, body (text/plain, or HTML converted to text), body_html, html_tables_data
+        and sha256 of the raw file
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+
+    # Character encoding detection
+    encoding = 'utf-8'
+    try:
+        import chardet
+        detected = chardet.detect(raw[:10000])  # Sample first 10KB for detection
+        if detected and detected['encoding'] and detected['confidence'] > 0.7:
+            encoding = detected['encoding']
+    except ImportError:
+        # chardet not installed, fallback to utf-8
+        pass
+    except Exception as e:
+        logger.debug(f"Encoding detection failed for {path.name}: {e}, using utf-8")
+
+    # TextIOWrapper keeps the newline handling of open(..., 'r')
+    msg = email.message_from_file(io.TextIOWrapper(io.BytesIO(raw), encoding=encoding, errors='ignore'))
+
+    # Extract email body (fallback: text/plain → HTML → empty)
+    body_text = ""
+    body_html = ""
+
+    if msg.is_multipart():
+        for part in msg.walk():
+            if part.get_content_type() == "text/plain" and not body_text:
+                payload = part.get_payload(decode=True)
+                if payload:
+                    # Try to use part's charset if available, otherwise use detected encoding
+                    charset = part.get_content_charset() or encoding
+                    body_text = payload.decode(charset, errors='ignore')
+            elif part.get_content_type() == "text/html" and not body_html:
+                payload = part.get_payload(decode=True)
+                if payload:
+                    charset = part.get_content_charset() or encoding
+                    body_html = payload.decode(charset, errors='ignore')
+    else:
+        payload = msg.get_payload(decode=True)
+        if payload:
+            # Try to use message's charset if available, otherwise use detected encoding
+            charset = msg.get_content_charset() or encoding
+            body_text = payload.decode(charset, errors='ignore')
+
+    # Use text/plain if available, otherwise convert HTML to text
+    if body_text:
+        body = body_text
+    elif body_html:
+        parser = HTMLTextExtractor()
+        parser.feed(body_html)
+        body = '\n'.join(parser.text)
+    else:
+        body = ""
+
+    html_tables_data = []
+    if body_html:
+        try:
+            html_tables_data = _extract_html_tables(body_html)
+        except Exception as e:
+            logger.warning(f"Failed to extract HTML tables from email body: {e}")
+            html_tables_data = []
+
+    return {
+        'msg': msg,
+        'subject': msg.get('Subject', 'No Subject'),
+        'sender': msg.get('From', 'Unknown Sender'),
+        'date': msg.get('Date', 'Unknown Date'),
+        'body': body,
+        'body_html': body_html,
+        'html_tables_data': html_tables_data,
+        'sha256': hashlib.sha256(raw).hexdigest()
+    }
+
+
+def parse_eml_files(paths: List[Path], max_workers: int = 1) -> Dict[Path, Union[Dict[str, Any], Exception]]:
+    """
+    Parse several .eml files, in a process pool when there is more than one to do
+
+    Args:
+        paths: .eml files to parse
+        max_workers: Worker processes (1 = parse in this process)
+
+    Returns:
+        {path: parse_eml_file() result, or the exception raised while parsing it}
+    """
+    results: Dict[Path, Union[Dict[str, Any], Exception]] = {}
+    if max_workers > 1 and len(paths) > 1:
+        try:
+            # spawn, not fork: by now this process holds the async HTTP loop thread and
+            # SQLite connections, and forking them can deadlock the child
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(paths)),
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {path: executor.submit(parse_eml_file, str(path)) for path in paths}
+                for path, future in futures.items():
+                    try:
+                        results[path] = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        results[path] = e
+            return results
+        except Exception as e:
+            # e.g. BrokenProcessPool or no multiprocessing support - parse in-process instead
+            logger.warning(f"Parallel email parsing unavailable, parsing serially: {e}")
+            results = {}
+
+    for path in paths:
+        try:
+            results[path] = parse_eml_file(path)
+        except Exception as e:
+            results[path] = e
+    return results
+
+
+class EmailParseCache:
+    """
+    On-disk cache of processed emails (enhanced document + extracted entities)
+
+    One JSON file per .eml under cache_dir. An entry is valid while the email file keeps
+    its mtime and size, or - if those changed - its SHA-256 content hash. Entries written
+    under different processing settings (cache version, attachment/link processors) are
+    treated as misses.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], settings: Optional[Dict[str, Any]] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.settings = {'version': EMAIL_CACHE_VERSION, **(settings or {})}
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_file(self, path: Path) -> Path:
+        key = hashlib.md5(str(Path(path).resolve()).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+    def get(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for an unchanged email, or None"""
+        path = Path(path)
+        entry_file = self._entry_file(path)
+        if not entry_file.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry_file, 'r') as f:
+                cached = json.load(f, object_hook=_decode_tagged)
+            stat = path.stat()
+
+            if cached.get('settings') != self.settings:
+                self.misses += 1
+                return None
+
+            if cached['mtime_ns'] != stat.st_mtime_ns or cached['size'] != stat.st_size:
+                # Touched or rewritten - only a content change invalidates the entry
+                if cached['sha256'] != self._file_sha256(path):
+                    self.misses += 1
+                    return None
+                cached['mtime_ns'], cached['size'] = stat.st_mtime_ns, stat.st_size
+                with open(entry_file, 'w') as f:
+                    json.dump({**cached, 'entry': _encode_entry(cached['entry'])}, f)
+
+            self.hits += 1
+            return cached['entry']
+
+        except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Invalid email cache entry {entry_file}: {e}")
+            entry_file.unlink(missing_ok=True)  # Remove corrupted cache
+            self.misses += 1
+            return None
+
+    def put(self, path: Union[str, Path], entry: Dict[str, Any], sha256: Optional[str] = None):
+        """Cache the processed result for an email file (skipped if it would not round-trip exactly)"""
+        path = Path(path)
+        try:
+            encoded_entry = _encode_entry(entry)
+        except TypeError as e:
+            logger.warning(f"Not caching processed email {path.name}: {e}")
+            return
+
+        try:
+            stat = path.stat()
+            cached = {
+                'path': str(path),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': sha256 or self._file_sha256(path),
+                'settings': self.settings,
+                'entry': encoded_entry
+            }
+            # Write-then-rename so a crash never leaves a half-written entry behind
+            entry_file = self._entry_file(path)
+            tmp_file = entry_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(cached, f)
+            os.replace(tmp_file, entry_file)
+        except Exception as e:
+            logger.warning(f"Failed to cache processed email {path.name}: {e}")
+
+    def clear(self) -> int:
+        """Remove all cached entries, returning how many were deleted"""
+        removed = 0
+        for entry_file in self.cache_dir.glob('*.json'):
+            entry_file.unlink(missing_ok=True)
+            removed += 1
+        return removed
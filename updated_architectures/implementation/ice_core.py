@@ -8,7 +8,7 @@ Relevant files: src/ice_lightrag/ice_rag_fixed.py, ice_simplified.py
 
 import os
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -219,13 +219,14 @@ class ICECore:
                 }
             }
 
-    def query(self, question: str, mode: str = 'mix') -> Dict[str, Any]:
+    def query(self, question: str, mode: str = 'mix', use_cache: bool = True) -> Dict[str, Any]:
         """
         Query the knowledge base - Direct passthrough to working wrapper
 
         Args:
             question: Investment question to analyze
             mode: LightRAG query mode (naive, local, global, hybrid, mix, bypass)
+            use_cache: Serve repeated questions from the query-result cache (invalidated on insert)
 
         Returns:
             Query results with answer and metadata
@@ -266,7 +267,7 @@ class ICECore:
             start_time = datetime.now()
 
             # Direct passthrough to working wrapper - no query optimization layers
-            result = self._rag.query(question.strip(), mode=mode)
+            result = self._rag.query(question.strip(), mode=mode, use_cache=use_cache)
 
             # Calculate query metrics
             query_time = (datetime.now() - start_time).total_seconds()
@@ -311,6 +312,72 @@ class ICECore:
                 }
             }
 
+    def query_batch(self, questions: List[str], mode: str = 'mix', max_concurrency: Optional[int] = None,
+                    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                    timeout: Optional[float] = None, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Run several questions concurrently - passthrough to JupyterSyncWrapper.query_concurrent()
+
+        All questions share one event loop run with at most max_concurrency in flight,
+        so N questions take about N / max_concurrency query latencies.
+
+        Args:
+            questions: Investment questions to analyze
+            mode: LightRAG query mode for every question
+            max_concurrency: Maximum queries in flight (default: ICE_MAX_CONCURRENT_QUERIES)
+            on_result: Called with (index, result) as each question finishes
+            timeout: Overall deadline in seconds; unfinished questions come back as timeouts
+            use_cache: Serve repeated questions from the query-result cache
+
+        Returns:
+            One result dict per question, in input order
+        """
+        if not self.is_ready():
+            return [{
+                "status": "error",
+                "message": "ICE not ready - check LightRAG initialization",
+                "error_code": "NOT_READY"
+            } for _ in questions]
+
+        if mode not in self.get_query_modes():
+            logger.warning(f"Invalid mode '{mode}', using 'mix' instead")
+            mode = 'mix'
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(questions)
+        valid = [i for i, q in enumerate(questions) if q and q.strip()]
+        for i in set(range(len(questions))) - set(valid):
+            results[i] = {
+                "status": "error",
+                "message": "Question cannot be empty",
+                "error_code": "EMPTY_QUERY"
+            }
+
+        def _completed(batch_index: int, result: Dict[str, Any]):
+            if on_result is not None:
+                on_result(valid[batch_index], result)
+
+        try:
+            batch = self._rag.query_concurrent(
+                [{"question": questions[i].strip(), "mode": mode, "use_cache": use_cache} for i in valid],
+                mode, max_concurrency=max_concurrency, on_result=_completed, timeout=timeout
+            )
+        except Exception as e:
+            logger.error(f"Batch query failed: {e}")
+            batch = [{"status": "error", "message": str(e), "error_code": "QUERY_FAILED"} for _ in valid]
+
+        for i, result in zip(valid, batch):
+            result.setdefault('metrics', {}).update({
+                'query_time': result.get('response_time', 0.0),
+                'query_mode': mode,
+                'question_length': len(questions[i].strip()),
+                'answer_length': len(result.get('answer', '')) if result.get('status') == 'success' else 0
+            })
+            results[i] = result
+
+        successful = sum(1 for r in results if r.get('status') == 'success')
+        logger.info(f"Batch query completed: {successful}/{len(questions)} successful, mode: {mode}")
+        return results
+
     def get_query_modes(self) -> List[str]:
         """
         Get list of available LightRAG query modes
@@ -336,20 +403,19 @@ class ICECore:
         }
 
         if storage_path.exists():
+            from src.ice_lightrag.mmap_vector_storage import vector_storage_info
+
             # Check for key LightRAG storage files
-            key_files = [
-                'graph_chunk_entity_relation.graphml',
-                'vdb_entities.json',
-                'vdb_relationships.json',
-                'vdb_chunks.json'
-            ]
-
-            for filename in key_files:
-                filepath = storage_path / filename
-                info['files'][filename] = {
-                    'exists': filepath.exists(),
-                    'size': filepath.stat().st_size if filepath.exists() else 0
-                }
+            filepath = storage_path / 'graph_chunk_entity_relation.graphml'
+            info['files'][filepath.name] = {
+                'exists': filepath.exists(),
+                'size': filepath.stat().st_size if filepath.exists() else 0
+            }
+
+            # Vector DBs: memory-mapped vdb_*.f32 (+ index/header) or legacy vdb_*.json
+            for namespace in ('entities', 'relationships', 'chunks'):
+                vdb = vector_storage_info(storage_path, namespace)
+                info['files'][vdb['file']] = {'exists': vdb['exists'], 'size': vdb['size_bytes']}
 
         return info
 
@@ -497,7 +563,13 @@ class ICECore:
         Returns:
             Storage statistics and component status
         """
+        from src.ice_lightrag.mmap_vector_storage import vector_storage_info
+
         storage_info = self.get_storage_info()
+        vdb_files = {
+            namespace: vector_storage_info(storage_info['working_dir'], namespace)['file']
+            for namespace in ('chunks', 'entities', 'relationships')
+        }
 
         stats = {
             'working_dir': storage_info['working_dir'],
@@ -505,21 +577,21 @@ class ICECore:
             'components': {
                 'chunks_vdb': {
                     'description': 'Vector embeddings of text chunks',
-                    'file': 'vdb_chunks.json',
-                    'exists': storage_info['files'].get('vdb_chunks.json', {}).get('exists', False),
-                    'size_bytes': storage_info['files'].get('vdb_chunks.json', {}).get('size', 0)
+                    'file': vdb_files['chunks'],
+                    'exists': storage_info['files'].get(vdb_files['chunks'], {}).get('exists', False),
+                    'size_bytes': storage_info['files'].get(vdb_files['chunks'], {}).get('size', 0)
                 },
                 'entities_vdb': {
                     'description': 'Vector embeddings of extracted entities',
-                    'file': 'vdb_entities.json',
-                    'exists': storage_info['files'].get('vdb_entities.json', {}).get('exists', False),
-                    'size_bytes': storage_info['files'].get('vdb_entities.json', {}).get('size', 0)
+                    'file': vdb_files['entities'],
+                    'exists': storage_info['files'].get(vdb_files['entities'], {}).get('exists', False),
+                    'size_bytes': storage_info['files'].get(vdb_files['entities'], {}).get('size', 0)
                 },
                 'relationships_vdb': {
                     'description': 'Vector embeddings of relationships',
-                    'file': 'vdb_relationships.json',
-                    'exists': storage_info['files'].get('vdb_relationships.json', {}).get('exists', False),
-                    'size_bytes': storage_info['files'].get('vdb_relationships.json', {}).get('size', 0)
+                    'file': vdb_files['relationships'],
+                    'exists': storage_info['files'].get(vdb_files['relationships'], {}).get('exists', False),
+                    'size_bytes': storage_info['files'].get(vdb_files['relationships'], {}).get('size', 0)
                 },
                 'chunk_entity_relation_graph': {
                     'description': 'Graph structure storage',
@@ -25,8 +25,9 @@ import os
 import sys
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Callable
 from datetime import datetime
 
 # Add project root to path for imports
@@ -46,10 +47,20 @@ from updated_architectures.implementation.config import ICEConfig
 # Import ingestion manifest for deduplication
 from src.ice_core.ingestion_manifest import IngestionManifest
 
+# Import pipelined fetch-and-insert for ingestion workflows
+from updated_architectures.implementation.ingestion_pipeline import IngestionPipeline, FetchedBatch
+
+# Import incremental statistics index for get_comprehensive_stats
+from updated_architectures.implementation.stats_index import StatsIndex
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Signal Store half of HYBRID routed queries runs here while LightRAG runs on the caller's
+# thread (and event loop); SignalStore gives every worker thread its own WAL connection
+_router_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ice-router')
+
 
 class ICECore:
     """
@@ -70,6 +81,9 @@ class ICECore:
         self._system_manager = None
         self._initialized = False
 
+        # Stats counters updated as documents are ingested (read by get_comprehensive_stats)
+        self.stats_index = StatsIndex(Path(self.config.working_dir))
+
         logger.info("ICE Core initializing with ICESystemManager orchestration")
 
         # Import and initialize ICESystemManager from production modules
@@ -154,6 +168,8 @@ class ICECore:
             # Delegate to ICESystemManager which handles graceful degradation
             result = self._system_manager.add_document(text, doc_type=doc_type)
             logger.info(f"Document added successfully: {len(text)} chars, type: {doc_type}")
+            if result.get('status') == 'success':
+                self._update_stats_index([result])
             return result
         except Exception as e:
             logger.error(f"Document processing failed: {e}")
@@ -184,13 +200,13 @@ class ICECore:
 
         return "Untitled"
 
-    def _print_document_progress(self, doc_index: int, total_docs: int, doc_content: str, symbol: str = ""):
+    def _print_document_progress(self, doc_index: int, total_docs: Union[int, str], doc_content: str, symbol: str = ""):
         """
         Print visually distinct progress for each document being processed
 
         Args:
             doc_index: Current document index (1-based)
-            total_docs: Total number of documents
+            total_docs: Total number of documents ("N+" while later documents are still being fetched)
             doc_content: Document content string
             symbol: Ticker symbol being processed
         """
@@ -225,12 +241,15 @@ class ICECore:
             print(f"┃ Title: {title:<{box_width - 11}}┃")
         print(f"{'┗' + '━' * (box_width - 2) + '┛'}")
 
-    def add_documents_batch(self, documents: List[Union[str, Dict[str, str]]]) -> Dict[str, Any]:
+    def add_documents_batch(self, documents: List[Union[str, Dict[str, str]]],
+                            max_concurrency: Optional[int] = None) -> Dict[str, Any]:
         """
         Batch document processing via ICESystemManager
 
         Args:
             documents: List of document strings OR {"content": str, "type": str} dictionaries
+            max_concurrency: Documents LightRAG processes at the same time
+                (default: config.max_concurrent_inserts; 1 = one at a time)
 
         Returns:
             Batch processing results with graceful degradation
@@ -244,58 +263,47 @@ class ICECore:
             }
 
         try:
-            # Process documents one at a time using ICESystemManager
-            # This provides better error handling than batch processing
             results = []
             errors = []
-            total_docs = len(documents)  # Cache count before loop to prevent inconsistency
+            max_concurrency = max_concurrency or self.config.max_concurrent_inserts
+
+            # Handle both string documents and dict documents
+            # Progress is shown at ingestion level (ingest_historical_data), not per document here
+            normalized_docs = []
+            for doc in documents:
+                if isinstance(doc, str):
+                    normalized_docs.append({'content': doc, 'type': 'financial', 'file_path': None})
+                else:
+                    normalized_docs.append({
+                        'content': doc.get('content', ''),
+                        'type': doc.get('type', 'financial'),
+                        'file_path': doc.get('file_path', None)  # Extract file_path for traceability
+                    })
 
-            for i, doc in enumerate(documents):
-                try:
-                    # Handle both string documents and dict documents
-                    if isinstance(doc, str):
-                        content = doc
-                        doc_type = 'financial'
-                        symbol = ''
-                        file_path = None  # No file_path for plain strings
-                    else:
-                        content = doc.get('content', '')
-                        doc_type = doc.get('type', 'financial')
-                        symbol = doc.get('symbol', '')
-                        file_path = doc.get('file_path', None)  # Extract file_path for traceability
-
-                    # Progress indicator: REMOVED to fix duplicate display bug
-                    # Progress is now shown at ingestion level (ingest_historical_data)
-                    # before calling this batch function, to avoid showing each doc 2-3 times
-                    # self._print_document_progress(
-                    #     doc_index=i+1,
-                    #     total_docs=total_docs,
-                    #     doc_content=content,
-                    #     symbol=symbol
-                    # )
-
-                    result = self._system_manager.add_document(content, doc_type=doc_type, file_path=file_path)
-
-                    if result.get('status') == 'success':
-                        results.append({
-                            'index': i,
-                            'status': 'success',
-                            'doc_type': doc_type
-                        })
-                    else:
-                        errors.append({
-                            'index': i,
-                            'error': result.get('message', 'Unknown error')
-                        })
+            # One LightRAG batch: its pipeline processes up to max_concurrency documents at a time
+            # Results come back in input order, so indices match the input documents
+            doc_results = self._system_manager.add_documents_batch(
+                normalized_docs, max_concurrency=max_concurrency
+            )
 
-                except Exception as e:
+            for i, (doc, result) in enumerate(zip(normalized_docs, doc_results)):
+                if result.get('status') == 'success':
+                    results.append({
+                        'index': i,
+                        'status': 'success',
+                        'doc_type': doc['type']
+                    })
+                else:
                     errors.append({
                         'index': i,
-                        'error': str(e)
+                        'error': result.get('message', 'Unknown error')
                     })
 
             logger.info(f"Batch processing completed: {len(results)} successful, {len(errors)} failed")
 
+            if results:
+                self._update_stats_index([doc_results[r['index']] for r in results])
+
             return {
                 'status': 'success' if len(results) > 0 else 'error',
                 'successful': len(results),
@@ -309,13 +317,29 @@ class ICECore:
             logger.error(f"Batch processing failed: {e}")
             return {"status": "error", "message": str(e)}
 
-    def query(self, question: str, mode: str = 'hybrid') -> Dict[str, Any]:
+    def _update_stats_index(self, documents: List[Dict[str, Any]]):
+        """
+        Count newly inserted documents and pick up new entities/relationships in the stats index
+
+        Args:
+            documents: Successful insert results carrying LightRAG's doc_id and content_summary
+        """
+        try:
+            self.stats_index.record_documents(documents)
+            self.stats_index.refresh_graph()
+            self.stats_index.save()
+        except Exception as e:
+            # Stats are advisory - never fail ingestion over them
+            logger.warning(f"Stats index update failed: {e}")
+
+    def query(self, question: str, mode: str = 'hybrid', use_cache: bool = True) -> Dict[str, Any]:
         """
         Query the knowledge base via ICESystemManager
 
         Args:
             question: Investment question to analyze
             mode: LightRAG query mode (naive, local, global, hybrid, mix, kg)
+            use_cache: Serve repeated questions from the query-result cache (invalidated on insert)
 
         Returns:
             Query results with answer and metadata, includes graceful degradation
@@ -331,7 +355,7 @@ class ICECore:
         try:
             # Delegate to ICESystemManager which uses query_ice() method
             # Week 2: ICEQueryProcessor is Week 3+ feature, disable for now
-            result = self._system_manager.query_ice(question, mode=mode, use_graph_context=False)
+            result = self._system_manager.query_ice(question, mode=mode, use_graph_context=False, use_cache=use_cache)
             logger.info(f"Query completed: {len(question)} chars, mode: {mode}")
             return result
         except Exception as e:
@@ -344,6 +368,41 @@ class ICECore:
                 "mode": mode
             }
 
+    def query_batch(self, questions: List[Any], mode: str = 'hybrid', max_concurrency: Optional[int] = None,
+                    on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+                    timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Run several queries concurrently via ICESystemManager
+
+        Args:
+            questions: List of question strings or {"question", "mode", "use_cache"} dicts
+            mode: LightRAG query mode for plain-string questions
+            max_concurrency: Queries in flight at the same time
+                (default: config.max_concurrent_queries; 1 = one at a time)
+            on_result: Called with (index, result) as each query finishes
+            timeout: Overall deadline in seconds; unfinished queries come back as timeouts
+
+        Returns:
+            One result dict per question, in input order (partial failures stay per-question)
+        """
+        if not self.is_ready():
+            status = self.get_system_status()
+            return [{
+                "status": "error",
+                "message": "ICE not ready - check system status",
+                "system_status": status
+            } for _ in questions]
+
+        max_concurrency = max_concurrency or self.config.max_concurrent_queries
+        try:
+            results = self._system_manager.query_ice_batch(questions, mode=mode, max_concurrency=max_concurrency,
+                                                           on_result=on_result, timeout=timeout)
+            logger.info(f"Batch query completed: {len(questions)} queries, mode: {mode}, max_concurrency: {max_concurrency}")
+            return results
+        except Exception as e:
+            logger.error(f"Batch query failed: {e}")
+            return [{"status": "error", "message": str(e), "mode": mode} for _ in questions]
+
     def get_storage_stats(self) -> Dict[str, Any]:
         """
         Get LightRAG storage statistics for notebook monitoring
@@ -359,24 +418,30 @@ class ICECore:
             working_dir = Path(self.config.working_dir)
 
             # Define expected LightRAG storage components
+            # Vector DBs: memory-mapped vdb_*.f32 storage, or legacy vdb_*.json (NanoVectorDB)
+            from src.ice_lightrag.mmap_vector_storage import vector_storage_info
+
+            chunks_info = vector_storage_info(working_dir, "chunks")
+            entities_info = vector_storage_info(working_dir, "entities")
+            relationships_info = vector_storage_info(working_dir, "relationships")
             components = {
                 "chunks_vdb": {
-                    "exists": (working_dir / "vdb_chunks.json").exists(),
-                    "file": "vdb_chunks.json",
+                    "exists": chunks_info["exists"],
+                    "file": chunks_info["file"],
                     "description": "Vector database for document chunks",
-                    "size_bytes": (working_dir / "vdb_chunks.json").stat().st_size if (working_dir / "vdb_chunks.json").exists() else 0
+                    "size_bytes": chunks_info["size_bytes"]
                 },
                 "entities_vdb": {
-                    "exists": (working_dir / "vdb_entities.json").exists(),
-                    "file": "vdb_entities.json",
+                    "exists": entities_info["exists"],
+                    "file": entities_info["file"],
                     "description": "Vector database for extracted entities",
-                    "size_bytes": (working_dir / "vdb_entities.json").stat().st_size if (working_dir / "vdb_entities.json").exists() else 0
+                    "size_bytes": entities_info["size_bytes"]
                 },
                 "relationships_vdb": {
-                    "exists": (working_dir / "vdb_relationships.json").exists(),
-                    "file": "vdb_relationships.json",
+                    "exists": relationships_info["exists"],
+                    "file": relationships_info["file"],
                     "description": "Vector database for entity relationships",
-                    "size_bytes": (working_dir / "vdb_relationships.json").stat().st_size if (working_dir / "vdb_relationships.json").exists() else 0
+                    "size_bytes": relationships_info["size_bytes"]
                 },
                 "graph": {
                     "exists": (working_dir / "graph_chunk_entity_relation.graphml").exists(),
@@ -740,71 +805,99 @@ class QueryEngine:
         self.ice = ice_core
         logger.info("Query Engine initialized")
 
-    def analyze_portfolio_risks(self, holdings: List[str]) -> Dict[str, Any]:
+    HOLDING_QUERIES = {
+        'risk_analysis': "What are the main business and market risks facing {symbol}? Include supply chain, regulatory, competitive, and financial risks.",
+        'opportunity_analysis': "What are the main growth opportunities and market advantages for {symbol}? Include technology trends, market expansion, and competitive positioning."
+    }
+
+    def analyze_holdings(self, holdings: List[str], analyses: List[str],
+                         max_concurrency: Optional[int] = None,
+                         on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                         timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
         """
-        Analyze risks for portfolio holdings
+        Run per-holding analyses concurrently in one bounded batch
+
+        Every (analysis, holding) query shares one concurrency window and one event loop,
+        so a book of N names costs about N * len(analyses) / max_concurrency query latencies.
 
         Args:
             holdings: List of ticker symbols
+            analyses: Keys of HOLDING_QUERIES to run ('risk_analysis', 'opportunity_analysis')
+            max_concurrency: Queries in flight (default: config.max_concurrent_queries; 1 = serial)
+            on_result: Called with (symbol, analysis) as each query completes; the analysis
+                dict carries its answer under the analysis key
+            timeout: Overall deadline in seconds; queries still running come back as errors
 
         Returns:
-            Dictionary mapping symbols to risk analysis
+            {analysis_key: {symbol: analysis}} with completed analyses kept on partial failure
         """
-        results = {}
-
-        for symbol in holdings:
-            logger.info(f"Analyzing risks for {symbol}")
-
-            query = f"What are the main business and market risks facing {symbol}? Include supply chain, regulatory, competitive, and financial risks."
-
-            result = self.ice.query(query, mode='hybrid')
+        jobs = [(key, symbol) for key in analyses for symbol in holdings]
 
+        def _entry(key: str, result: Dict[str, Any]) -> Dict[str, Any]:
             if result.get('status') == 'success':
-                results[symbol] = {
+                return {
                     'status': 'success',
-                    'risk_analysis': result.get('answer', ''),
+                    key: result.get('answer', ''),
                     'query_mode': 'hybrid'
                 }
-            else:
-                results[symbol] = {
-                    'status': 'error',
-                    'error': result.get('message', 'Unknown error')
-                }
+            return {
+                'status': 'error',
+                'error': result.get('message', 'Unknown error')
+            }
 
-        logger.info(f"Portfolio risk analysis completed for {len(holdings)} holdings")
+        def _completed(index: int, result: Dict[str, Any]):
+            key, symbol = jobs[index]
+            logger.info(f"{'✅' if result.get('status') == 'success' else '❌'} {key} finished for {symbol}")
+            if on_result is not None:
+                on_result(symbol, _entry(key, result))
+
+        raw_results = self.ice.query_batch(
+            [self.HOLDING_QUERIES[key].format(symbol=symbol) for key, symbol in jobs],
+            mode='hybrid', max_concurrency=max_concurrency, on_result=_completed, timeout=timeout
+        )
+
+        results = {key: {} for key in analyses}
+        for (key, symbol), result in zip(jobs, raw_results):
+            results[key][symbol] = _entry(key, result)
         return results
 
-    def analyze_portfolio_opportunities(self, holdings: List[str]) -> Dict[str, Any]:
+    def analyze_portfolio_risks(self, holdings: List[str], max_concurrency: Optional[int] = None,
+                                on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                timeout: Optional[float] = None) -> Dict[str, Any]:
         """
-        Analyze opportunities for portfolio holdings
+        Analyze risks for portfolio holdings
 
         Args:
             holdings: List of ticker symbols
+            max_concurrency: Holdings queried at the same time (default: config.max_concurrent_queries)
+            on_result: Called with (symbol, analysis) as each holding completes
+            timeout: Overall deadline in seconds; holdings still running come back as errors
 
         Returns:
-            Dictionary mapping symbols to opportunity analysis
+            Dictionary mapping symbols to risk analysis
         """
-        results = {}
-
-        for symbol in holdings:
-            logger.info(f"Analyzing opportunities for {symbol}")
-
-            query = f"What are the main growth opportunities and market advantages for {symbol}? Include technology trends, market expansion, and competitive positioning."
+        logger.info(f"Analyzing risks for {len(holdings)} holdings")
+        results = self.analyze_holdings(holdings, ['risk_analysis'], max_concurrency, on_result, timeout)['risk_analysis']
+        logger.info(f"Portfolio risk analysis completed for {len(holdings)} holdings")
+        return results
 
-            result = self.ice.query(query, mode='hybrid')
+    def analyze_portfolio_opportunities(self, holdings: List[str], max_concurrency: Optional[int] = None,
+                                        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Analyze opportunities for portfolio holdings
 
-            if result.get('status') == 'success':
-                results[symbol] = {
-                    'status': 'success',
-                    'opportunity_analysis': result.get('answer', ''),
-                    'query_mode': 'hybrid'
-                }
-            else:
-                results[symbol] = {
-                    'status': 'error',
-                    'error': result.get('message', 'Unknown error')
-                }
+        Args:
+            holdings: List of ticker symbols
+            max_concurrency: Holdings queried at the same time (default: config.max_concurrent_queries)
+            on_result: Called with (symbol, analysis) as each holding completes
+            timeout: Overall deadline in seconds; holdings still running come back as errors
 
+        Returns:
+            Dictionary mapping symbols to opportunity analysis
+        """
+        logger.info(f"Analyzing opportunities for {len(holdings)} holdings")
+        results = self.analyze_holdings(holdings, ['opportunity_analysis'], max_concurrency, on_result, timeout)['opportunity_analysis']
         logger.info(f"Portfolio opportunity analysis completed for {len(holdings)} holdings")
         return results
 
@@ -1004,96 +1097,109 @@ class ICESimplified:
             }
         }
 
-        # STEP 1: Fetch portfolio-wide emails ONCE (before symbol loop)
+        # Emails and each holding's ticker data are fetched on producer threads while this
+        # thread inserts already-fetched batches, so network I/O overlaps LLM extraction
+
+        # Emails are fetched ONCE for the whole portfolio (not per symbol)
         # Rationale: Emails are broker research covering multiple tickers, not ticker-specific
         # "Trust the Graph" strategy - emails fetched unfiltered for relationship discovery
-        email_start_time = datetime.now()
-        try:
+        def fetch_emails() -> List[Dict[str, Any]]:
             email_docs = self.ingester.fetch_email_documents(tickers=None, limit=email_limit)
-            if email_docs:
-                # email_docs now returns List[Dict] with format: {'content': str, 'file_path': 'email:filename.eml', 'type': 'financial'}
-                # Extract content and preserve file_path for LightRAG traceability
-                email_doc_list = [
-                    {
-                        'content': doc['content'],  # Extract content from dict
-                        'file_path': doc.get('file_path'),  # Pass through file_path for traceability
-                        'type': 'email',
-                        'symbol': 'PORTFOLIO'
-                    }
-                    for doc in email_docs
-                ]
-
-                email_result = self.core.add_documents_batch(email_doc_list)
+            # email_docs now returns List[Dict] with format: {'content': str, 'file_path': 'email:filename.eml', 'type': 'financial'}
+            # Extract content and preserve file_path for LightRAG traceability
+            return [
+                {
+                    'content': doc['content'],  # Extract content from dict
+                    'file_path': doc.get('file_path'),  # Pass through file_path for traceability
+                    'type': 'email',
+                    'symbol': 'PORTFOLIO'
+                }
+                for doc in email_docs or []
+            ]
+
+        def fetch_ticker(symbol: str) -> List[Dict[str, Any]]:
+            # Fetch ticker-specific data using individual methods (not fetch_comprehensive_data)
+            # This prevents duplicate email fetching
+            logger.info(f"💰 {symbol}: Fetching data from APIs...")
+            financial_docs = self.ingester.fetch_company_financials(symbol, limit=news_limit)  # Returns List[Dict]
+            news_docs = self.ingester.fetch_company_news(symbol, news_limit)  # Returns List[Dict]
+            sec_docs = self.ingester.fetch_sec_filings(symbol, limit=sec_limit)  # Returns List[Dict]
+
+            # Build document list with SOURCE markers for post-processing statistics
+            # Phase 1: Enhanced SOURCE markers with timestamps (retrieval time)
+            retrieval_timestamp = datetime.now().isoformat()
+
+            return [
+                {'content': f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"}
+                for doc_dict in financial_docs + news_docs + sec_docs
+            ]
+
+        def insert_emails(batch: FetchedBatch):
+            if batch.error is not None:
+                logger.warning(f"⚠️ Email ingestion failed (non-fatal): {batch.error}")
+                return
+            if not batch.documents:
+                return
+
+            insert_start = datetime.now()
+            try:
+                email_result = self.core.add_documents_batch(batch.documents)
 
                 if email_result.get('status') == 'success':
-                    results['email_documents'] = len(email_docs)
-                    results['total_documents'] += len(email_docs)
-                    results['documents'].extend(email_doc_list)
-                    email_time = (datetime.now() - email_start_time).total_seconds()
+                    results['email_documents'] = len(batch.documents)
+                    results['total_documents'] += len(batch.documents)
+                    results['documents'].extend(batch.documents)
+                    email_time = batch.fetch_time + (datetime.now() - insert_start).total_seconds()
                     results['metrics']['email_processing_time'] = email_time
-                    logger.info(f"✅ Successfully ingested {len(email_docs)} portfolio-wide emails in {email_time:.2f}s")
+                    logger.info(f"✅ Successfully ingested {len(batch.documents)} portfolio-wide emails in {email_time:.2f}s")
                 else:
                     logger.warning(f"⚠️ Email batch processing had issues: {email_result.get('message')}")
-        except Exception as e:
-            logger.warning(f"⚠️ Email ingestion failed (non-fatal): {e}")
+            except Exception as e:
+                logger.warning(f"⚠️ Email ingestion failed (non-fatal): {e}")
 
-        # STEP 2: Loop through holdings for ticker-specific data (API + SEC)
-        for symbol in holdings:
-            symbol_start_time = datetime.now()
+        def insert_ticker(batch: FetchedBatch):
+            symbol = batch.name
+            doc_list = batch.documents
             logger.info(f"Ingesting ticker-specific data for {symbol}")
 
-            try:
-                # Fetch ticker-specific data using individual methods (not fetch_comprehensive_data)
-                # This prevents duplicate email fetching
-                logger.info(f"💰 {symbol}: Fetching data from APIs...")
-                financial_docs = self.ingester.fetch_company_financials(symbol, limit=news_limit)  # Returns List[Dict]
-                news_docs = self.ingester.fetch_company_news(symbol, news_limit)  # Returns List[Dict]
-                sec_docs = self.ingester.fetch_sec_filings(symbol, limit=sec_limit)  # Returns List[Dict]
-
-                # Build document list with SOURCE markers for post-processing statistics
-                # Phase 1: Enhanced SOURCE markers with timestamps (retrieval time)
-                retrieval_timestamp = datetime.now().isoformat()
-
-                doc_list = []
-                for doc_dict in financial_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
-
-                for doc_dict in news_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
+            if batch.error is not None:
+                results['failed'].append({
+                    'symbol': symbol,
+                    'error': str(batch.error)
+                })
+                logger.error(f"❌ Ticker-specific ingestion failed for {symbol}: {batch.error}")
+                return
 
-                for doc_dict in sec_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
+            if not doc_list:
+                results['failed'].append({
+                    'symbol': symbol,
+                    'error': 'No ticker-specific documents fetched'
+                })
+                logger.warning(f"⚠️ No ticker-specific documents fetched for {symbol}")
+                return
 
-                if doc_list:
-                    # Add ticker-specific documents to knowledge base
-                    batch_result = self.core.add_documents_batch(doc_list)
+            insert_start = datetime.now()
+            try:
+                # Add ticker-specific documents to knowledge base
+                batch_result = self.core.add_documents_batch(doc_list)
 
-                    if batch_result.get('status') == 'success':
-                        results['successful'].append(symbol)
-                        results['ticker_documents'] += len(doc_list)
-                        results['total_documents'] += len(doc_list)
-                        results['documents'].extend(doc_list)
-                        results['metrics']['documents_per_symbol'][symbol] = len(doc_list)
+                if batch_result.get('status') == 'success':
+                    results['successful'].append(symbol)
+                    results['ticker_documents'] += len(doc_list)
+                    results['total_documents'] += len(doc_list)
+                    results['documents'].extend(doc_list)
+                    results['metrics']['documents_per_symbol'][symbol] = len(doc_list)
 
-                        symbol_time = (datetime.now() - symbol_start_time).total_seconds()
-                        results['metrics']['processing_time_per_symbol'][symbol] = symbol_time
+                    symbol_time = batch.fetch_time + (datetime.now() - insert_start).total_seconds()
+                    results['metrics']['processing_time_per_symbol'][symbol] = symbol_time
 
-                        logger.info(f"✅ {symbol}: {len(doc_list)} documents ingested in {symbol_time:.2f}s")
-                    else:
-                        results['failed'].append({
-                            'symbol': symbol,
-                            'error': batch_result.get('message', 'Batch processing failed')
-                        })
-                        logger.error(f"❌ Batch processing failed for {symbol}")
+                    logger.info(f"✅ {symbol}: {len(doc_list)} documents ingested in {symbol_time:.2f}s")
                 else:
                     results['failed'].append({
                         'symbol': symbol,
-                        'error': 'No ticker-specific documents fetched'
+                        'error': batch_result.get('message', 'Batch processing failed')
                     })
-                    logger.warning(f"⚠️ No ticker-specific documents fetched for {symbol}")
+                    logger.error(f"❌ Batch processing failed for {symbol}")
 
             except Exception as e:
                 results['failed'].append({
@@ -1102,6 +1208,17 @@ class ICESimplified:
                 })
                 logger.error(f"❌ Ticker-specific ingestion failed for {symbol}: {e}")
 
+        def insert_batch(batch: FetchedBatch):
+            if batch.name == 'emails':
+                insert_emails(batch)
+            else:
+                insert_ticker(batch)
+
+        stages = [('emails', fetch_emails)] + [
+            (symbol, lambda symbol=symbol: fetch_ticker(symbol)) for symbol in holdings
+        ]
+        results['metrics']['pipeline'] = IngestionPipeline().run(stages, insert_batch)
+
         # Calculate final metrics
         total_time = (datetime.now() - start_time).total_seconds()
         results['metrics']['ingestion_time'] = total_time
@@ -1112,13 +1229,22 @@ class ICESimplified:
         logger.info(f"Portfolio ingestion completed: {len(results['successful'])} successful, {len(results['failed'])} failed in {total_time:.2f}s")
         return results
 
-    def analyze_portfolio(self, holdings: List[str], include_opportunities: bool = True) -> Dict[str, Any]:
+    def analyze_portfolio(self, holdings: List[str], include_opportunities: bool = True,
+                          max_concurrency: Optional[int] = None,
+                          on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Complete portfolio analysis - risks, opportunities, and relationships
 
         Args:
             holdings: List of ticker symbols
             include_opportunities: Whether to include opportunity analysis
+            max_concurrency: Per-holding queries in flight (default: config.max_concurrent_queries;
+                1 = one at a time). Risk and opportunity queries share one batch.
+            on_result: Called with (symbol, analysis) as each per-holding query completes;
+                the analysis dict has a 'risk_analysis' or 'opportunity_analysis' key
+            timeout: Overall deadline in seconds for the per-holding batch; finished
+                analyses are kept and the rest are reported as errors
 
         Returns:
             Comprehensive portfolio analysis
@@ -1132,14 +1258,13 @@ class ICESimplified:
             'summary': {}
         }
 
-        # Analyze risks
-        logger.info("Analyzing portfolio risks...")
-        analysis['risk_analysis'] = self.query_engine.analyze_portfolio_risks(holdings)
-
-        # Analyze opportunities if requested
-        if include_opportunities:
-            logger.info("Analyzing portfolio opportunities...")
-            analysis['opportunity_analysis'] = self.query_engine.analyze_portfolio_opportunities(holdings)
+        # Analyze risks (and opportunities if requested) in one concurrent batch
+        per_holding = ['risk_analysis'] + (['opportunity_analysis'] if include_opportunities else [])
+        logger.info("Analyzing portfolio risks and opportunities..." if include_opportunities
+                    else "Analyzing portfolio risks...")
+        analysis.update(self.query_engine.analyze_holdings(
+            holdings, per_holding, max_concurrency=max_concurrency, on_result=on_result, timeout=timeout
+        ))
 
         # Analyze relationships between holdings
         if len(holdings) > 1:
@@ -1161,7 +1286,7 @@ class ICESimplified:
         logger.info(f"Portfolio analysis completed: {successful_risks}/{len(holdings)} risk analyses successful")
         return analysis
 
-    def query_rating(self, ticker: str) -> Dict[str, Any]:
+    def query_rating(self, ticker: str, use_lightrag_fallback: bool = True) -> Dict[str, Any]:
         """
         Query latest analyst rating for a ticker using dual-layer architecture.
 
@@ -1169,6 +1294,8 @@ class ICESimplified:
 
         Args:
             ticker: Stock ticker symbol (e.g., 'NVDA', 'AAPL')
+            use_lightrag_fallback: Query LightRAG when Signal Store has no rating; when False,
+                a miss returns rating 'UNKNOWN' with source 'none'
 
         Returns:
             Dict with rating data:
@@ -1209,6 +1336,14 @@ class ICESimplified:
             except Exception as e:
                 logger.warning(f"Signal Store query failed: {e}, falling back to LightRAG")
 
+        if not use_lightrag_fallback:
+            return {
+                'ticker': ticker,
+                'rating': 'UNKNOWN',
+                'source': 'none',
+                'latency_ms': int((time.time() - start_time) * 1000)
+            }
+
         # Fallback: Query LightRAG for semantic rating extraction
         try:
             query = f"What is the latest analyst rating or recommendation for {ticker}?"
@@ -1243,7 +1378,8 @@ class ICESimplified:
         self,
         ticker: str,
         metric_type: str,
-        period: Optional[str] = None
+        period: Optional[str] = None,
+        use_lightrag_fallback: bool = True
     ) -> Dict[str, Any]:
         """
         Query financial metric for a ticker using dual-layer architecture.
@@ -1254,6 +1390,8 @@ class ICESimplified:
             ticker: Stock ticker symbol (e.g., 'NVDA', 'AAPL')
             metric_type: Type of financial metric (e.g., 'Operating Margin', 'Revenue', 'EPS')
             period: Optional time period filter (e.g., 'Q2 2024', 'FY2024', 'TTM')
+            use_lightrag_fallback: Query LightRAG when Signal Store has no value; when False,
+                a miss returns metric_value 'UNKNOWN' with source 'none'
 
         Returns:
             Dict with metric data:
@@ -1300,6 +1438,16 @@ class ICESimplified:
             except Exception as e:
                 logger.warning(f"Signal Store metric query failed: {e}, falling back to LightRAG")
 
+        if not use_lightrag_fallback:
+            return {
+                'ticker': ticker,
+                'metric_type': metric_type,
+                'metric_value': 'UNKNOWN',
+                'period': period,
+                'source': 'none',
+                'latency_ms': int((time.time() - start_time) * 1000)
+            }
+
         # Fallback: Query LightRAG for semantic metric extraction
         try:
             period_str = f" for {period}" if period else ""
@@ -1334,18 +1482,67 @@ class ICESimplified:
                 'latency_ms': int((time.time() - start_time) * 1000)
             }
 
-    def query_with_router(self, query: str, mode: str = 'hybrid') -> Dict[str, Any]:
+    def _lookup_structured(self, routed: Any) -> Optional[Dict[str, Any]]:
+        """
+        Signal Store half of a HYBRID query: latest rating plus any metric named in the query
+
+        No LightRAG fallback - the semantic half of the hybrid query already asks LightRAG.
+        Returns the rating, the metric, {'rating': ..., 'metric': ...} for both, or None.
+        """
+        ticker = routed.ticker
+        if not ticker:
+            return None
+
+        signal_store_data = None
+        rating_data = self.query_rating(ticker, use_lightrag_fallback=False)
+        if rating_data and rating_data.get('rating') != 'UNKNOWN':
+            signal_store_data = rating_data
+
+        if routed.metric_type:
+            metric_data = self.query_metric(ticker, routed.metric_type, routed.period, use_lightrag_fallback=False)
+            if metric_data and metric_data.get('metric_value') != 'UNKNOWN':
+                # If we have both, combine them
+                if signal_store_data:
+                    signal_store_data = {
+                        'rating': rating_data,
+                        'metric': metric_data
+                    }
+                else:
+                    signal_store_data = metric_data
+
+        return signal_store_data
+
+    def _format_structured_section(self, signal_store_data: Optional[Dict[str, Any]], query: str) -> str:
+        """Structured Data section of a hybrid answer"""
+        section = "**Structured Data:**\n"
+        if signal_store_data:
+            # Handle combined rating + metric response
+            if isinstance(signal_store_data, dict) and 'rating' in signal_store_data and 'metric' in signal_store_data:
+                section += self.query_router.format_signal_store_result(signal_store_data['rating'], query)
+                section += "\n\n"
+                section += self.query_router.format_signal_store_result(signal_store_data['metric'], query)
+            else:
+                section += self.query_router.format_signal_store_result(signal_store_data, query)
+        else:
+            section += "No structured data found"
+        return section
+
+    def query_with_router(self, query: str, mode: str = 'hybrid',
+                          on_structured: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Execute query using intelligent routing (Signal Store vs LightRAG).
 
         Uses QueryRouter to classify query intent and route to optimal layer:
         - Structured queries (What/Which/Show) → Signal Store (<1s)
         - Semantic queries (Why/How/Explain) → LightRAG (~12s)
-        - Hybrid queries → Both layers, combined result
+        - Hybrid queries → Both layers concurrently, combined result (latency ≈ LightRAG alone)
 
         Args:
             query: User query string
             mode: LightRAG query mode if routing to LightRAG ('local', 'global', 'hybrid', 'naive')
+            on_structured: Hybrid queries only - called with the structured half of the result
+                (same keys as the final result, 'semantic_pending': True) as soon as the Signal
+                Store lookups finish, while LightRAG is still answering. Called from a worker thread.
 
         Returns:
             Dict with query result:
@@ -1355,7 +1552,8 @@ class ICESimplified:
                 'query_type': 'structured_rating' | 'semantic_why' | etc.,
                 'source': 'signal_store' | 'lightrag' | 'hybrid',
                 'confidence': 0.90,
-                'latency_ms': 850
+                'latency_ms': 850,
+                'timings_ms': {'routing': 0, 'signal_store': 4, 'lightrag': 840, 'total': 850}
             }
 
         Examples:
@@ -1367,20 +1565,34 @@ class ICESimplified:
         """
         import time
         start_time = time.time()
+        timings = {}
+
+        def elapsed_ms(since: float) -> int:
+            return int((time.time() - since) * 1000)
+
+        def finish() -> Dict[str, int]:
+            timings['total'] = elapsed_ms(start_time)
+            return timings
 
         # Route query to optimal layer
         if self.query_router:
             from updated_architectures.implementation.query_router import QueryType
 
-            query_type, confidence = self.query_router.route_query(query)
+            # One scan gives intent, ticker, metric and period
+            routed = self.query_router.analyze_query(query)
+            query_type, confidence = routed.query_type, routed.confidence
+            timings['routing'] = elapsed_ms(start_time)
             logger.info(f"Query routed: {query_type.value} (confidence: {confidence:.2f})")
 
             # Handle structured rating queries
             if query_type == QueryType.STRUCTURED_RATING:
-                ticker = self.query_router.extract_ticker(query)
+                ticker = routed.ticker
                 if ticker:
+                    layer_start = time.time()
                     rating_data = self.query_rating(ticker)
+                    timings['lightrag' if rating_data.get('source') == 'lightrag' else 'signal_store'] = elapsed_ms(layer_start)
                     formatted_answer = self.query_router.format_signal_store_result(rating_data, query)
+                    finish()
 
                     return {
                         'query': query,
@@ -1388,18 +1600,21 @@ class ICESimplified:
                         'query_type': query_type.value,
                         'source': 'signal_store',
                         'confidence': confidence,
-                        'latency_ms': int((time.time() - start_time) * 1000),
+                        'latency_ms': timings['total'],
+                        'timings_ms': timings,
                         'raw_data': rating_data
                     }
 
             # Handle structured metric queries
             elif query_type == QueryType.STRUCTURED_METRIC:
-                ticker = self.query_router.extract_ticker(query)
-                metric_type, period = self.query_router.extract_metric_info(query)
+                ticker, metric_type, period = routed.ticker, routed.metric_type, routed.period
 
                 if ticker and metric_type:
+                    layer_start = time.time()
                     metric_data = self.query_metric(ticker, metric_type, period)
+                    timings['lightrag' if metric_data.get('source') == 'lightrag' else 'signal_store'] = elapsed_ms(layer_start)
                     formatted_answer = self.query_router.format_signal_store_result(metric_data, query)
+                    finish()
 
                     return {
                         'query': query,
@@ -1407,13 +1622,17 @@ class ICESimplified:
                         'query_type': query_type.value,
                         'source': 'signal_store',
                         'confidence': confidence,
-                        'latency_ms': int((time.time() - start_time) * 1000),
+                        'latency_ms': timings['total'],
+                        'timings_ms': timings,
                         'raw_data': metric_data
                     }
 
             # Handle semantic queries (route to LightRAG)
             elif query_type in (QueryType.SEMANTIC_WHY, QueryType.SEMANTIC_HOW, QueryType.SEMANTIC_EXPLAIN):
+                layer_start = time.time()
                 lightrag_result = self.core.query(query, mode=mode)
+                timings['lightrag'] = elapsed_ms(layer_start)
+                finish()
 
                 return {
                     'query': query,
@@ -1421,52 +1640,50 @@ class ICESimplified:
                     'query_type': query_type.value,
                     'source': 'lightrag',
                     'confidence': confidence,
-                    'latency_ms': int((time.time() - start_time) * 1000)
+                    'latency_ms': timings['total'],
+                    'timings_ms': timings
                 }
 
-            # Handle hybrid queries (both layers)
+            # Handle hybrid queries (both layers at once)
             elif query_type == QueryType.HYBRID:
-                # Get structured data from Signal Store (try ratings and metrics)
-                ticker = self.query_router.extract_ticker(query)
-                signal_store_data = None
-
-                if ticker:
-                    # Try rating query first
-                    rating_data = self.query_rating(ticker)
-                    if rating_data and rating_data.get('rating') != 'UNKNOWN':
-                        signal_store_data = rating_data
-
-                    # Also try metric query
-                    metric_type, period = self.query_router.extract_metric_info(query)
-                    if metric_type:
-                        metric_data = self.query_metric(ticker, metric_type, period)
-                        if metric_data and metric_data.get('metric_value') != 'UNKNOWN':
-                            # If we have both, combine them
-                            if signal_store_data:
-                                signal_store_data = {
-                                    'rating': rating_data,
-                                    'metric': metric_data
-                                }
-                            else:
-                                signal_store_data = metric_data
-
-                # Get semantic context from LightRAG
+                def structured_layer() -> Optional[Dict[str, Any]]:
+                    layer_start = time.time()
+                    data = self._lookup_structured(routed)
+                    timings['signal_store'] = elapsed_ms(layer_start)
+
+                    if on_structured is not None:
+                        try:
+                            on_structured({
+                                'query': query,
+                                'answer': self._format_structured_section(data, query),
+                                'query_type': query_type.value,
+                                'source': 'signal_store',
+                                'confidence': confidence,
+                                'latency_ms': elapsed_ms(start_time),
+                                'signal_store_data': data,
+                                'semantic_pending': True
+                            })
+                        except Exception as e:
+                            logger.warning(f"on_structured callback failed: {e}")
+                    return data
+
+                # Signal Store lookups run on a worker; LightRAG stays on this thread's event loop
+                structured_future = _router_executor.submit(structured_layer)
+
+                layer_start = time.time()
                 lightrag_result = self.core.query(query, mode=mode)
+                timings['lightrag'] = elapsed_ms(layer_start)
 
-                # Combine results
-                combined_answer = f"**Structured Data:**\n"
-                if signal_store_data:
-                    # Handle combined rating + metric response
-                    if isinstance(signal_store_data, dict) and 'rating' in signal_store_data and 'metric' in signal_store_data:
-                        combined_answer += self.query_router.format_signal_store_result(signal_store_data['rating'], query)
-                        combined_answer += "\n\n"
-                        combined_answer += self.query_router.format_signal_store_result(signal_store_data['metric'], query)
-                    else:
-                        combined_answer += self.query_router.format_signal_store_result(signal_store_data, query)
-                else:
-                    combined_answer += "No structured data found"
+                try:
+                    signal_store_data = structured_future.result()
+                except Exception as e:
+                    logger.warning(f"Signal Store lookup failed for hybrid query (graceful degradation): {e}")
+                    signal_store_data = None
 
+                # Combine results
+                combined_answer = self._format_structured_section(signal_store_data, query)
                 combined_answer += f"\n\n**Semantic Analysis:**\n{lightrag_result}"
+                finish()
 
                 return {
                     'query': query,
@@ -1474,13 +1691,17 @@ class ICESimplified:
                     'query_type': query_type.value,
                     'source': 'hybrid',
                     'confidence': confidence,
-                    'latency_ms': int((time.time() - start_time) * 1000),
+                    'latency_ms': timings['total'],
+                    'timings_ms': timings,
                     'signal_store_data': signal_store_data
                 }
 
         # Fallback: No router available, use LightRAG only
         logger.debug("Query router not available, using LightRAG only")
+        layer_start = time.time()
         lightrag_result = self.core.query(query, mode=mode)
+        timings['lightrag'] = elapsed_ms(layer_start)
+        finish()
 
         return {
             'query': query,
@@ -1488,7 +1709,8 @@ class ICESimplified:
             'query_type': 'semantic_explain',
             'source': 'lightrag',
             'confidence': 0.50,
-            'latency_ms': int((time.time() - start_time) * 1000)
+            'latency_ms': timings['total'],
+            'timings_ms': timings
         }
 
     def ingest_historical_data(self, holdings: List[str], years: int = 2,
@@ -1544,26 +1766,39 @@ class ICESimplified:
         # Track cumulative document count for progress display
         cumulative_doc_count = 0
 
-        # PRE-FETCH PHASE: Calculate total documents for accurate progress display (Fix for "Document 12/7" bug)
-        logger.info("📊 Pre-fetching documents to calculate totals...")
-        print("\n📊 Pre-fetching documents to calculate totals...")
-        total_all_docs = 0
-        prefetched_data = {'emails': [], 'tickers': {}}
+        # PIPELINED FETCH + INSERT: fetch stages (emails, then each ticker) run on producer
+        # threads while this thread inserts already-fetched batches into the graph.
+        # Progress totals are exact once all stages are fetched, and shown as "N+" before that.
+        logger.info("🔀 Fetching and ingesting documents in a pipeline...")
+        print("\n🔀 Fetching and ingesting documents in a pipeline...")
 
-        # Pre-fetch emails
-        try:
+        def fetch_emails() -> List[Dict[str, Any]]:
             print("  ⏳ Fetching emails...")
             email_docs = self.ingester.fetch_email_documents(tickers=None, limit=email_limit, email_files=email_files)
-            if email_docs:
-                prefetched_data['emails'] = email_docs
-                total_all_docs += len(email_docs)
-                print(f"     ✓ Found {len(email_docs)} emails")
-        except Exception as e:
-            logger.warning(f"⚠️ Email pre-fetch failed: {e}")
-            print(f"     ⚠️ Email fetch failed: {e}")
+            if not email_docs:
+                return []
+            print(f"     ✓ Found {len(email_docs)} emails")
+
+            # Capture entities from emails (read right after the fetch that produced them)
+            if hasattr(self.ingester, 'last_extracted_entities'):
+                all_entities.extend(self.ingester.last_extracted_entities)
+
+            # email_docs now returns List[Dict] with format: {'content': str, 'file_path': 'email:filename.eml', 'type': 'financial'}
+            # Extract content and preserve file_path for LightRAG traceability
+            return [
+                {
+                    'content': doc['content'],  # Extract content from dict
+                    'file_path': doc.get('file_path'),  # Pass through file_path for traceability
+                    'type': 'email_historical',
+                    'symbol': 'PORTFOLIO',
+                    'ingestion_mode': 'historical'
+                }
+                for doc in email_docs
+            ]
 
-        # Pre-fetch ticker documents (6 categories)
-        for symbol in holdings:
+        def fetch_ticker(symbol: str) -> List[Dict[str, Any]]:
+            # Ticker-specific data (5 categories); fetch failures are non-fatal and
+            # surface as "No historical ticker data available" for the symbol
             try:
                 print(f"  ⏳ Fetching {symbol} data...")
                 news_docs = self.ingester.fetch_company_news(symbol, news_limit)
@@ -1576,147 +1811,100 @@ class ICESimplified:
                         research_docs = self.ingester.research_company_deep(symbol, symbol, topics=None, include_competitors=False)[:research_limit]
                     except:
                         pass  # Research failures are non-critical
-
-                prefetched_data['tickers'][symbol] = {
-                    'news': news_docs,
-                    'financial': financial_docs,
-                    'market': market_docs,
-                    'sec': sec_docs,
-                    'research': research_docs
-                }
                 ticker_total = len(news_docs) + len(financial_docs) + len(market_docs) + len(sec_docs) + len(research_docs)
-                total_all_docs += ticker_total
-                print(f"     ✓ Found {ticker_total} documents (news: {len(news_docs)}, financial: {len(financial_docs)}, market: {len(market_docs)}, SEC: {len(sec_docs)}, research: {len(research_docs)})")
+                print(f"     ✓ Found {ticker_total} {symbol} documents (news: {len(news_docs)}, financial: {len(financial_docs)}, market: {len(market_docs)}, SEC: {len(sec_docs)}, research: {len(research_docs)})")
             except Exception as e:
-                logger.warning(f"⚠️ {symbol} pre-fetch failed: {e}")
+                logger.warning(f"⚠️ {symbol} fetch failed: {e}")
                 print(f"     ⚠️ {symbol} fetch failed: {e}")
-                prefetched_data['tickers'][symbol] = {'news': [], 'financial': [], 'market': [], 'sec': [], 'research': []}
+                return []
 
-        logger.info(f"📊 Total documents to process: {total_all_docs}")
-        print(f"\n📊 Total documents to process: {total_all_docs}")
-        print("━" * 50)
-
-        # STEP 1: Process portfolio-wide emails
-        try:
-            email_docs = prefetched_data['emails']
-            if email_docs:
-                # Capture entities from emails
-                if hasattr(self.ingester, 'last_extracted_entities'):
-                    all_entities.extend(self.ingester.last_extracted_entities)
-
-                # email_docs now returns List[Dict] with format: {'content': str, 'file_path': 'email:filename.eml', 'type': 'financial'}
-                # Extract content and preserve file_path for LightRAG traceability
-                email_doc_list = [
-                    {
-                        'content': doc['content'],  # Extract content from dict
-                        'file_path': doc.get('file_path'),  # Pass through file_path for traceability
-                        'type': 'email_historical',
-                        'symbol': 'PORTFOLIO',
-                        'ingestion_mode': 'historical'
-                    }
-                    for doc in email_docs
-                ]
-
-                # Print progress for emails (using total_all_docs for accurate count)
-                for idx, doc_dict in enumerate(email_doc_list, start=1):
-                    cumulative_doc_count += 1
-                    self.core._print_document_progress(
-                        doc_index=cumulative_doc_count,
-                        total_docs=total_all_docs,  # Fixed: use total across all sources
-                        doc_content=doc_dict['content'],
-                        symbol='PORTFOLIO'
-                    )
+            # Email entities already captured in fetch_emails
+            # Ticker-specific sources (news/financials/market/SEC/research) don't extract entities
 
-                email_result = self.core.add_documents_batch(email_doc_list)
-                if email_result.get('status') == 'success':
-                    results['total_documents'] += len(email_docs)
-                    logger.info(f"✅ Historical emails ingested: {len(email_docs)} documents")
-        except Exception as e:
-            logger.warning(f"⚠️ Historical email ingestion failed (non-fatal): {e}")
+            # Build document list with SOURCE markers (all 5 ticker categories)
+            # Phase 1: Enhanced SOURCE markers with timestamps (retrieval time)
+            retrieval_timestamp = datetime.now().isoformat()
 
-        # STEP 2: Loop through holdings for ticker-specific historical data (6 categories)
-        for symbol in holdings:
-            try:
-                # Use prefetched ticker-specific data
-                logger.info(f"💰 {symbol}: Processing {years} years of historical data...")
-                ticker_data = prefetched_data['tickers'].get(symbol, {})
-                news_docs = ticker_data.get('news', [])
-                financial_docs = ticker_data.get('financial', [])
-                market_docs = ticker_data.get('market', [])
-                sec_docs = ticker_data.get('sec', [])
-                research_docs = ticker_data.get('research', [])
-
-                # Email entities already captured in STEP 1
-                # Ticker-specific sources (news/financials/market/SEC/research) don't extract entities
-                # So no new entities to capture here
-
-                # Build document list with SOURCE markers (all 5 ticker categories)
-                # Phase 1: Enhanced SOURCE markers with timestamps (retrieval time)
-                retrieval_timestamp = datetime.now().isoformat()
-
-                doc_list = []
+            # Categories 2-5: News, financial fundamentals, market data, SEC filings
+            doc_list = [
+                {'content': f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"}
+                for doc_dict in news_docs + financial_docs + market_docs + sec_docs
+            ]
 
-                # Category 2: News
-                for doc_dict in news_docs:
+            # Category 6: Research (if any)
+            for doc_dict in research_docs:
+                if isinstance(doc_dict, dict) and 'source' in doc_dict:
                     content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
                     doc_list.append({'content': content_with_marker})
 
-                # Category 3: Financial fundamentals
-                for doc_dict in financial_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
+            return doc_list
 
-                # Category 4: Market data
-                for doc_dict in market_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
+        def insert_batch(batch: FetchedBatch):
+            nonlocal cumulative_doc_count
+            is_email_stage = batch.name == 'emails'
+            symbol = 'PORTFOLIO' if is_email_stage else batch.name
+            doc_list = batch.documents
 
-                # Category 5: SEC filings
-                for doc_dict in sec_docs:
-                    content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                    doc_list.append({'content': content_with_marker})
+            try:
+                if not doc_list:
+                    if not is_email_stage:
+                        results['failed_holdings'].append({
+                            'symbol': symbol,
+                            'error': 'No historical ticker data available'
+                        })
+                    return
 
-                # Category 6: Research (if any)
-                for doc_dict in research_docs:
-                    if isinstance(doc_dict, dict) and 'source' in doc_dict:
-                        content_with_marker = f"[SOURCE:{doc_dict['source'].upper()}|SYMBOL:{symbol}|DATE:{retrieval_timestamp}]\n{doc_dict['content']}"
-                        doc_list.append({'content': content_with_marker})
+                if not is_email_stage:
+                    logger.info(f"💰 {symbol}: Processing {years} years of historical data...")
 
-                if doc_list:
-                    # Print progress for each document (using total_all_docs for accurate count)
-                    for idx, doc_dict in enumerate(doc_list, start=1):
-                        cumulative_doc_count += 1
-                        self.core._print_document_progress(
-                            doc_index=cumulative_doc_count,
-                            total_docs=total_all_docs,  # Fixed: use total across all sources
-                            doc_content=doc_dict['content'],
-                            symbol=symbol
-                        )
+                # Print progress for each document (total is exact once fetching completes)
+                for doc_dict in doc_list:
+                    cumulative_doc_count += 1
+                    self.core._print_document_progress(
+                        doc_index=cumulative_doc_count,
+                        total_docs=batch.progress_total,
+                        doc_content=doc_dict['content'],
+                        symbol=symbol
+                    )
 
-                    batch_result = self.core.add_documents_batch(doc_list)
+                batch_result = self.core.add_documents_batch(doc_list)
 
+                if is_email_stage:
                     if batch_result.get('status') == 'success':
-                        results['holdings_processed'].append(symbol)
                         results['total_documents'] += len(doc_list)
-                        results['metrics']['documents_per_holding'][symbol] = len(doc_list)
-                        logger.info(f"✅ {symbol}: {len(doc_list)} historical documents ingested")
-                    else:
-                        results['failed_holdings'].append({
-                            'symbol': symbol,
-                            'error': batch_result.get('message', 'Unknown error')
-                        })
+                        logger.info(f"✅ Historical emails ingested: {len(doc_list)} documents")
+                elif batch_result.get('status') == 'success':
+                    results['holdings_processed'].append(symbol)
+                    results['total_documents'] += len(doc_list)
+                    results['metrics']['documents_per_holding'][symbol] = len(doc_list)
+                    logger.info(f"✅ {symbol}: {len(doc_list)} historical documents ingested")
                 else:
                     results['failed_holdings'].append({
                         'symbol': symbol,
-                        'error': 'No historical ticker data available'
+                        'error': batch_result.get('message', 'Unknown error')
                     })
 
             except Exception as e:
-                logger.error(f"❌ Error processing historical ticker data for {symbol}: {str(e)}")
-                results['failed_holdings'].append({
-                    'symbol': symbol,
-                    'error': str(e)
-                })
+                if is_email_stage:
+                    logger.warning(f"⚠️ Historical email ingestion failed (non-fatal): {e}")
+                else:
+                    logger.error(f"❌ Error processing historical ticker data for {symbol}: {str(e)}")
+                    results['failed_holdings'].append({
+                        'symbol': symbol,
+                        'error': str(e)
+                    })
+
+        stages = [('emails', fetch_emails)] + [
+            (symbol, lambda symbol=symbol: fetch_ticker(symbol)) for symbol in holdings
+        ]
+        pipeline_stats = IngestionPipeline().run(stages, insert_batch)
+        results['metrics']['pipeline'] = pipeline_stats
+
+        logger.info(f"📊 Total documents processed: {pipeline_stats['documents_fetched']} "
+                    f"(fetch {pipeline_stats['fetch_total']:.1f}s, insert {pipeline_stats['insert_total']:.1f}s, "
+                    f"wall {pipeline_stats['wall_time']:.1f}s)")
+        print(f"\n📊 Total documents processed: {pipeline_stats['documents_fetched']}")
+        print("━" * 50)
 
         # Calculate metrics
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -2131,7 +2319,7 @@ class ICESimplified:
         pct = f"{count/total*100:5.1f}%"
         return f"{bar} {count:3d} ({pct})"
 
-    def get_comprehensive_stats(self) -> Dict[str, Any]:
+    def get_comprehensive_stats(self, rebuild: bool = False) -> Dict[str, Any]:
         """
         Generate comprehensive 3-tier knowledge graph statistics
 
@@ -2139,31 +2327,27 @@ class ICESimplified:
         Tier 2: Graph structure (entities, relationships, connectivity)
         Tier 3: Investment intelligence (signals, ticker coverage)
 
+        Reads counters from the stats index maintained at ingestion time, so it is cheap
+        enough to poll after every batch.
+
+        Args:
+            rebuild: Recount from LightRAG storage first (e.g. after editing storage outside ICE)
+
         Returns:
             Dict with tier1, tier2, tier3 statistics
         """
-        import json
-        import re
-        from pathlib import Path
-        from collections import Counter
+        if rebuild:
+            self.core.stats_index.rebuild()
 
         stats = {
-            'tier1': {},
-            'tier2': {},
-            'tier3': {}
+            # TIER 1: Document Source Breakdown
+            'tier1': self.core.stats_index.get_document_stats(),
+            # TIER 2: Graph Structure Statistics
+            'tier2': self.core.stats_index.get_graph_structure_stats(),
+            # TIER 3: Investment Intelligence Metrics
+            'tier3': self.core.stats_index.get_investment_intelligence_stats()
         }
 
-        storage_path = Path(self.config.working_dir)
-
-        # TIER 1: Document Source Breakdown
-        stats['tier1'] = self._get_document_stats(storage_path)
-
-        # TIER 2: Graph Structure Statistics
-        stats['tier2'] = self._get_graph_structure_stats(storage_path)
-
-        # TIER 3: Investment Intelligence Metrics
-        stats['tier3'] = self._get_investment_intelligence_stats(storage_path)
-
         # Validate source marker coverage and log recommendations
         diversity = stats['tier1'].get('source_diversity', {})
         coverage = diversity.get('coverage_percentage', 0.0)
@@ -2183,148 +2367,6 @@ class ICESimplified:
 
         return stats
 
-    def _get_document_stats(self, storage_path: Path) -> Dict[str, Any]:
-        """Parse SOURCE markers from stored documents for Tier 1 statistics"""
-        import json
-        import re
-        from collections import Counter
-
-        doc_status_file = storage_path / 'kv_store_doc_status.json'
-        if not doc_status_file.exists():
-            return {'total': 0, 'by_source': {}, 'email': 0, 'api_total': 0, 'sec_total': 0}
-
-        docs = json.load(open(doc_status_file))
-        source_counts = Counter()
-
-        # Parse SOURCE markers from content
-        for doc in docs.values():
-            content = doc.get('content_summary', '')
-
-            # Match [SOURCE:NEWSAPI|SYMBOL:NVDA] pattern
-            match = re.search(r'\[SOURCE:(\w+)\|', content)
-            if match:
-                source = match.group(1).lower()
-                source_counts[source] += 1
-            elif 'SOURCE_EMAIL' in content or '[TICKER:' in content:
-                # Email documents use different markup pattern
-                source_counts['email'] += 1
-
-        # Calculate totals
-        api_sources = {'newsapi', 'finnhub', 'marketaux', 'fmp', 'alpha_vantage', 'polygon', 'benzinga'}
-        api_total = sum(source_counts[s] for s in api_sources)
-        sec_total = source_counts.get('sec_edgar', 0)
-        exa_total = source_counts.get('exa_company', 0) + source_counts.get('exa_competitors', 0)
-
-        # Calculate source diversity metrics
-        total_with_markers = sum(source_counts.values())
-        total_without_markers = len(docs) - total_with_markers
-        unique_sources = len([v for v in source_counts.values() if v > 0])
-        coverage_percentage = (total_with_markers / len(docs) * 100) if len(docs) > 0 else 0.0
-
-        # Determine completeness status
-        has_email = source_counts.get('email', 0) > 0
-        has_api = api_total > 0
-        has_sec = sec_total > 0
-        expected_sources_present = sum([has_email, has_api, has_sec])
-
-        if expected_sources_present == 3 and coverage_percentage >= 95:
-            status = 'complete'
-        elif expected_sources_present >= 2 or coverage_percentage >= 50:
-            status = 'partial'
-        else:
-            status = 'incomplete'
-
-        return {
-            'total': len(docs),
-            'by_source': dict(source_counts),
-            'email': source_counts.get('email', 0),
-            'api_total': api_total,
-            'sec_total': sec_total,
-            'exa_total': exa_total,
-            **{k: source_counts.get(k, 0) for k in ['newsapi', 'finnhub', 'marketaux', 'benzinga', 'fmp', 'alpha_vantage', 'polygon', 'sec_edgar', 'exa_company', 'exa_competitors']},
-            'source_diversity': {
-                'unique_sources': unique_sources,
-                'expected_sources': 3,  # Email, API, SEC
-                'expected_sources_present': expected_sources_present,
-                'coverage_percentage': coverage_percentage,
-                'documents_with_markers': total_with_markers,
-                'documents_without_markers': total_without_markers,
-                'status': status
-            }
-        }
-
-    def _get_graph_structure_stats(self, storage_path: Path) -> Dict[str, Any]:
-        """Read VDB files for Tier 2 graph structure statistics"""
-        import json
-
-        stats = {
-            'total_entities': 0,
-            'total_relationships': 0,
-            'avg_connections': 0.0
-        }
-
-        # Parse entities
-        entities_file = storage_path / 'vdb_entities.json'
-        if entities_file.exists():
-            data = json.load(open(entities_file))
-            stats['total_entities'] = len(data.get('data', []))
-
-        # Parse relationships
-        rels_file = storage_path / 'vdb_relationships.json'
-        if rels_file.exists():
-            data = json.load(open(rels_file))
-            stats['total_relationships'] = len(data.get('data', []))
-
-        # Calculate connectivity
-        if stats['total_entities'] > 0:
-            stats['avg_connections'] = stats['total_relationships'] / stats['total_entities']
-
-        return stats
-
-    def _get_investment_intelligence_stats(self, storage_path: Path) -> Dict[str, Any]:
-        """Parse entities for Tier 3 investment intelligence metrics"""
-        import json
-
-        TICKERS = {'NVDA', 'TSMC', 'AMD', 'ASML', 'INTC', 'QCOM', 'AVGO', 'TXN', 'MU', 'LRCX'}
-
-        stats = {
-            'tickers_covered': [],
-            'buy_signals': 0,
-            'sell_signals': 0,
-            'price_targets': 0,
-            'risk_mentions': 0
-        }
-
-        # Parse entities for investment signals
-        entities_file = storage_path / 'vdb_entities.json'
-        if not entities_file.exists():
-            return stats
-
-        data = json.load(open(entities_file))
-        tickers_found = set()
-
-        for entity in data.get('data', []):
-            text = f"{entity.get('entity_name', '')} {entity.get('content', '')}".upper()
-
-            # Detect tickers
-            for ticker in TICKERS:
-                if ticker in text:
-                    tickers_found.add(ticker)
-
-            # Detect signals
-            if 'BUY' in text or 'RATING:BUY' in text:
-                stats['buy_signals'] += 1
-            if 'SELL' in text or 'RATING:SELL' in text:
-                stats['sell_signals'] += 1
-            if 'PRICE TARGET' in text or 'PRICE_TARGET' in text:
-                stats['price_targets'] += 1
-            if 'RISK' in text:
-                stats['risk_mentions'] += 1
-
-        stats['tickers_covered'] = sorted(list(tickers_found))
-
-        return stats
-
 
 # Session management for Streamlit UI and workflow notebooks
 # Singleton pattern ensures consistent state across notebook cells and UI sessions
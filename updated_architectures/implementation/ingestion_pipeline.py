@@ -0,0 +1,139 @@
+# Location: /updated_architectures/implementation/ingestion_pipeline.py
+# Purpose: Bounded producer/consumer pipeline that overlaps document fetching with graph insertion
+# Why: Pre-fetching everything before inserting left LightRAG idle during network I/O (and vice versa)
+# Relevant Files: ice_simplified.py, data_ingestion.py
+
+"""
+Pipelined fetch-and-insert for ICE ingestion
+
+Fetch stages (portfolio emails, one stage per ticker) run on producer threads and
+push their documents into a bounded queue. The caller's thread drains the queue and
+inserts each batch into the graph while the next stages are still being fetched, so
+a portfolio build costs roughly the longer of the two stages instead of their sum.
+
+The bounded queue provides back-pressure: when insertion falls behind, producers
+block on put() instead of piling fetched documents up in memory. Time spent blocked
+is reported in the pipeline stats alongside per-stage fetch/insert timings.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FetchedBatch:
+    """Documents produced by one fetch stage, plus progress info for the consumer"""
+    name: str
+    documents: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[Exception] = None
+    fetch_time: float = 0.0
+    documents_fetched: int = 0      # Documents fetched across all stages when this batch was dequeued
+    all_fetched: bool = False       # True once every stage has finished fetching
+
+    @property
+    def progress_total(self):
+        """Total for progress display: exact once fetching is done, otherwise a lower bound ('N+')"""
+        return self.documents_fetched if self.all_fetched else f"{self.documents_fetched}+"
+
+
+class IngestionPipeline:
+    """
+    Bounded producer/consumer pipeline for ingestion
+
+    Args:
+        max_queue_size: Fetched batches allowed to wait for insertion (default: ICE_INGEST_QUEUE_SIZE or 4)
+        fetch_workers: Producer threads running fetch stages (default: ICE_INGEST_FETCH_WORKERS or 1).
+            With a single worker, stages are fetched - and therefore consumed - in submission order.
+    """
+
+    def __init__(self, max_queue_size: Optional[int] = None, fetch_workers: Optional[int] = None):
+        self.max_queue_size = max(1, max_queue_size or int(os.getenv('ICE_INGEST_QUEUE_SIZE', '4')))
+        self.fetch_workers = max(1, fetch_workers or int(os.getenv('ICE_INGEST_FETCH_WORKERS', '1')))
+
+    def run(self, stages: List[Tuple[str, Callable[[], List[Dict[str, Any]]]]],
+            consume: Callable[[FetchedBatch], None]) -> Dict[str, Any]:
+        """
+        Run fetch stages on producer threads and consume their batches on the calling thread
+
+        Args:
+            stages: (name, fetch_fn) pairs; fetch_fn returns a list of document dicts
+            consume: Called once per stage (in completion order) with its FetchedBatch
+
+        Returns:
+            Pipeline stats: per-stage fetch/insert times, back-pressure and queue depth
+        """
+        start = time.perf_counter()
+        batches: "queue.Queue[FetchedBatch]" = queue.Queue(maxsize=self.max_queue_size)
+        stats = {
+            'stages': len(stages),
+            'fetch_time': {},
+            'insert_time': {},
+            'producer_blocked_time': 0.0,
+            'consumer_idle_time': 0.0,
+            'max_queue_depth': 0,
+            'documents_fetched': 0,
+            'errors': {}
+        }
+        progress = {'fetched': 0, 'finished': 0}
+        lock = threading.Lock()
+
+        def produce(name: str, fetch_fn: Callable[[], List[Dict[str, Any]]]):
+            fetch_start = time.perf_counter()
+            batch = FetchedBatch(name=name)
+            try:
+                batch.documents = list(fetch_fn() or [])
+            except Exception as e:
+                logger.warning(f"⚠️ Fetch stage '{name}' failed: {e}")
+                batch.error = e
+            batch.fetch_time = time.perf_counter() - fetch_start
+
+            # Counters are updated before put() so the consumer never sees a batch
+            # whose documents are missing from the running total
+            with lock:
+                progress['fetched'] += len(batch.documents)
+                progress['finished'] += 1
+
+            put_start = time.perf_counter()
+            batches.put(batch)  # Blocks when the consumer falls behind (back-pressure)
+            with lock:
+                stats['producer_blocked_time'] += time.perf_counter() - put_start
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='ice-fetch') as executor:
+            for name, fetch_fn in stages:
+                executor.submit(produce, name, fetch_fn)
+
+            for _ in range(len(stages)):
+                wait_start = time.perf_counter()
+                batch = batches.get()
+                stats['consumer_idle_time'] += time.perf_counter() - wait_start
+                stats['max_queue_depth'] = max(stats['max_queue_depth'], batches.qsize() + 1)
+
+                with lock:
+                    batch.documents_fetched = progress['fetched']
+                    batch.all_fetched = progress['finished'] == len(stages)
+                stats['fetch_time'][batch.name] = batch.fetch_time
+                if batch.error is not None:
+                    stats['errors'][batch.name] = str(batch.error)
+
+                insert_start = time.perf_counter()
+                try:
+                    consume(batch)
+                except Exception as e:
+                    # Keep draining so producers blocked on put() can finish
+                    logger.error(f"❌ Consuming stage '{batch.name}' failed: {e}")
+                    stats['errors'][batch.name] = str(e)
+                stats['insert_time'][batch.name] = time.perf_counter() - insert_start
+
+        stats['documents_fetched'] = progress['fetched']
+        stats['fetch_total'] = sum(stats['fetch_time'].values())
+        stats['insert_total'] = sum(stats['insert_time'].values())
+        stats['wall_time'] = time.perf_counter() - start
+        return stats
@@ -7,7 +7,7 @@ Relevant files: ice_core.py, ice_simplified.py
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -54,21 +54,56 @@ class QueryEngine:
             'portfolio_opportunities': "What are the combined growth opportunities and synergies across {symbols}?"
         }
 
-    def analyze_portfolio_risks(self, holdings: List[str], mode: str = 'hybrid') -> Dict[str, Any]:
+    def _run_template_queries(self, queries: List[str], mode: str, answer_key: str, max_concurrency: Optional[int],
+                              on_result: Optional[Callable[[int, Dict[str, Any]], None]],
+                              timeout: Optional[float]) -> List[Dict[str, Any]]:
         """
-        Analyze risks for portfolio holdings
+        Run template queries concurrently and shape each result into an analysis entry
 
-        Args:
-            holdings: List of ticker symbols
-            mode: LightRAG query mode (default: hybrid)
+        All queries go through one ICECore.query_batch call (bounded concurrency, one event loop).
+        on_result(index, entry) streams each entry as its query completes.
 
         Returns:
-            Dictionary mapping symbols to risk analysis results
+            One analysis entry per query, in input order
         """
-        logger.info(f"Analyzing portfolio risks for {len(holdings)} holdings using {mode} mode")
+        def _entry(query: str, result: Dict[str, Any]) -> Dict[str, Any]:
+            if result.get('status') == 'success':
+                return {
+                    'status': 'success',
+                    answer_key: result.get('answer', ''),
+                    'query_used': query,
+                    'response_time': result.get('response_time', 0)
+                }
+            return {
+                'status': 'error',
+                'error': result.get('message', 'Unknown error'),
+                'query_used': query
+            }
+
+        def _completed(index: int, result: Dict[str, Any]):
+            if on_result is not None:
+                on_result(index, _entry(queries[index], result))
+
+        try:
+            raw_results = self.ice.query_batch(queries, mode=mode, max_concurrency=max_concurrency,
+                                               on_result=_completed, timeout=timeout)
+        except Exception as e:
+            logger.error(f"❌ Exception during batch analysis: {e}")
+            return [{'status': 'exception', 'error': str(e), 'query_used': query} for query in queries]
+
+        return [_entry(query, result) for query, result in zip(queries, raw_results)]
+
+    def _analyze_holdings(self, holdings: List[str], analysis_type: str, answer_key: str, mode: str,
+                          max_concurrency: Optional[int],
+                          on_result: Optional[Callable[[str, Dict[str, Any]], None]],
+                          timeout: Optional[float]) -> Dict[str, Any]:
+        """Run one template per holding concurrently (shared by the portfolio analyses)"""
+        label = analysis_type.replace('_', ' ')
+        logger.info(f"Analyzing {label} for {len(holdings)} holdings using {mode} mode "
+                    f"(max_concurrency={max_concurrency or 'default'})")
 
         results = {
-            'analysis_type': 'portfolio_risks',
+            'analysis_type': analysis_type,
             'mode': mode,
             'timestamp': datetime.now().isoformat(),
             'holdings': holdings,
@@ -76,41 +111,22 @@ class QueryEngine:
             'summary': {}
         }
 
-        successful_analyses = 0
-
-        for symbol in holdings:
-            logger.info(f"Analyzing risks for {symbol}")
-
-            # Use risk query template
-            query = self.query_templates['risks'].format(symbol=symbol)
-
-            try:
-                result = self.ice.query(query, mode=mode)
-
-                if result.get('status') == 'success':
-                    results['individual_analyses'][symbol] = {
-                        'status': 'success',
-                        'risk_analysis': result.get('answer', ''),
-                        'query_used': query,
-                        'response_time': result.get('response_time', 0)
-                    }
-                    successful_analyses += 1
-                    logger.info(f"✅ Risk analysis completed for {symbol}")
-                else:
-                    results['individual_analyses'][symbol] = {
-                        'status': 'error',
-                        'error': result.get('message', 'Unknown error'),
-                        'query_used': query
-                    }
-                    logger.warning(f"❌ Risk analysis failed for {symbol}: {result.get('message')}")
+        template_key = analysis_type.replace('portfolio_', '')
+        queries = [self.query_templates[template_key].format(symbol=symbol) for symbol in holdings]
+        entries = self._run_template_queries(
+            queries, mode, answer_key, max_concurrency,
+            (lambda index, entry: on_result(holdings[index], entry)) if on_result else None,
+            timeout
+        )
 
-            except Exception as e:
-                results['individual_analyses'][symbol] = {
-                    'status': 'exception',
-                    'error': str(e),
-                    'query_used': query
-                }
-                logger.error(f"❌ Exception during risk analysis for {symbol}: {e}")
+        successful_analyses = 0
+        for symbol, entry in zip(holdings, entries):
+            results['individual_analyses'][symbol] = entry
+            if entry['status'] == 'success':
+                successful_analyses += 1
+                logger.info(f"✅ {label.capitalize()} analysis completed for {symbol}")
+            else:
+                logger.warning(f"❌ {label.capitalize()} analysis failed for {symbol}: {entry.get('error')}")
 
         # Generate summary
         results['summary'] = {
@@ -120,77 +136,48 @@ class QueryEngine:
             'failed_analyses': len(holdings) - successful_analyses
         }
 
-        logger.info(f"Portfolio risk analysis completed: {successful_analyses}/{len(holdings)} successful")
+        logger.info(f"{label.capitalize()} analysis completed: {successful_analyses}/{len(holdings)} successful")
         return results
 
-    def analyze_portfolio_opportunities(self, holdings: List[str], mode: str = 'hybrid') -> Dict[str, Any]:
+    def analyze_portfolio_risks(self, holdings: List[str], mode: str = 'hybrid',
+                                max_concurrency: Optional[int] = None,
+                                on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                timeout: Optional[float] = None) -> Dict[str, Any]:
         """
-        Analyze opportunities for portfolio holdings
+        Analyze risks for portfolio holdings
 
         Args:
             holdings: List of ticker symbols
             mode: LightRAG query mode (default: hybrid)
+            max_concurrency: Holdings queried at the same time (default: ICE_MAX_CONCURRENT_QUERIES; 1 = serial)
+            on_result: Called with (symbol, analysis) as each holding completes
+            timeout: Overall deadline in seconds; holdings still running are reported as errors
 
         Returns:
-            Dictionary mapping symbols to opportunity analysis results
+            Dictionary mapping symbols to risk analysis results
         """
-        logger.info(f"Analyzing portfolio opportunities for {len(holdings)} holdings using {mode} mode")
-
-        results = {
-            'analysis_type': 'portfolio_opportunities',
-            'mode': mode,
-            'timestamp': datetime.now().isoformat(),
-            'holdings': holdings,
-            'individual_analyses': {},
-            'summary': {}
-        }
-
-        successful_analyses = 0
+        return self._analyze_holdings(holdings, 'portfolio_risks', 'risk_analysis', mode,
+                                      max_concurrency, on_result, timeout)
 
-        for symbol in holdings:
-            logger.info(f"Analyzing opportunities for {symbol}")
-
-            # Use opportunity query template
-            query = self.query_templates['opportunities'].format(symbol=symbol)
-
-            try:
-                result = self.ice.query(query, mode=mode)
-
-                if result.get('status') == 'success':
-                    results['individual_analyses'][symbol] = {
-                        'status': 'success',
-                        'opportunity_analysis': result.get('answer', ''),
-                        'query_used': query,
-                        'response_time': result.get('response_time', 0)
-                    }
-                    successful_analyses += 1
-                    logger.info(f"✅ Opportunity analysis completed for {symbol}")
-                else:
-                    results['individual_analyses'][symbol] = {
-                        'status': 'error',
-                        'error': result.get('message', 'Unknown error'),
-                        'query_used': query
-                    }
-                    logger.warning(f"❌ Opportunity analysis failed for {symbol}: {result.get('message')}")
-
-            except Exception as e:
-                results['individual_analyses'][symbol] = {
-                    'status': 'exception',
-                    'error': str(e),
-                    'query_used': query
-                }
-                logger.error(f"❌ Exception during opportunity analysis for {symbol}: {e}")
+    def analyze_portfolio_opportunities(self, holdings: List[str], mode: str = 'hybrid',
+                                        max_concurrency: Optional[int] = None,
+                                        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Analyze opportunities for portfolio holdings
 
-        # Generate summary
-        results['summary'] = {
-            'total_holdings': len(holdings),
-            'successful_analyses': successful_analyses,
-            'success_rate': (successful_analyses / len(holdings)) * 100 if holdings else 0,
-            'failed_analyses': len(holdings) - successful_analyses
-        }
+        Args:
+            holdings: List of ticker symbols
+            mode: LightRAG query mode (default: hybrid)
+            max_concurrency: Holdings queried at the same time (default: ICE_MAX_CONCURRENT_QUERIES; 1 = serial)
+            on_result: Called with (symbol, analysis) as each holding completes
+            timeout: Overall deadline in seconds; holdings still running are reported as errors
 
-        logger.info(f"Portfolio opportunity analysis completed: {successful_analyses}/{len(holdings)} successful")
-        return results
+        Returns:
+            Dictionary mapping symbols to opportunity analysis results
+        """
+        return self._analyze_holdings(holdings, 'portfolio_opportunities', 'opportunity_analysis', mode,
+                                      max_concurrency, on_result, timeout)
 
     def analyze_market_relationships(self, symbols: List[str], mode: str = 'global') -> Dict[str, Any]:
         """
@@ -248,7 +235,10 @@ class QueryEngine:
                 'query_used': query
             }
 
-    def analyze_symbol(self, symbol: str, analysis_types: List[str] = None, mode: str = 'hybrid') -> Dict[str, Any]:
+    def analyze_symbol(self, symbol: str, analysis_types: List[str] = None, mode: str = 'hybrid',
+                       max_concurrency: Optional[int] = None,
+                       on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                       timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Comprehensive analysis of a single symbol
 
@@ -256,6 +246,9 @@ class QueryEngine:
             symbol: Stock ticker symbol
             analysis_types: List of analysis types to perform (default: risks, opportunities, fundamentals)
             mode: LightRAG query mode
+            max_concurrency: Analyses run at the same time (default: ICE_MAX_CONCURRENT_QUERIES; 1 = serial)
+            on_result: Called with (analysis_type, analysis) as each analysis completes
+            timeout: Overall deadline in seconds; analyses still running are reported as errors
 
         Returns:
             Comprehensive analysis results for the symbol
@@ -274,8 +267,7 @@ class QueryEngine:
             'summary': {}
         }
 
-        successful_analyses = 0
-
+        known_types = []
         for analysis_type in analysis_types:
             if analysis_type not in self.query_templates:
                 logger.warning(f"Unknown analysis type: {analysis_type}")
@@ -283,39 +275,24 @@ class QueryEngine:
                     'status': 'error',
                     'error': f'Unknown analysis type: {analysis_type}'
                 }
-                continue
-
-            logger.info(f"Running {analysis_type} analysis for {symbol}")
-
-            query = self.query_templates[analysis_type].format(symbol=symbol)
+            else:
+                known_types.append(analysis_type)
 
-            try:
-                result = self.ice.query(query, mode=mode)
+        queries = [self.query_templates[analysis_type].format(symbol=symbol) for analysis_type in known_types]
+        entries = self._run_template_queries(
+            queries, mode, 'analysis', max_concurrency,
+            (lambda index, entry: on_result(known_types[index], entry)) if on_result else None,
+            timeout
+        )
 
-                if result.get('status') == 'success':
-                    results['analyses'][analysis_type] = {
-                        'status': 'success',
-                        'analysis': result.get('answer', ''),
-                        'query_used': query,
-                        'response_time': result.get('response_time', 0)
-                    }
-                    successful_analyses += 1
-                    logger.info(f"✅ {analysis_type} analysis completed for {symbol}")
-                else:
-                    results['analyses'][analysis_type] = {
-                        'status': 'error',
-                        'error': result.get('message', 'Unknown error'),
-                        'query_used': query
-                    }
-                    logger.warning(f"❌ {analysis_type} analysis failed for {symbol}")
-
-            except Exception as e:
-                results['analyses'][analysis_type] = {
-                    'status': 'exception',
-                    'error': str(e),
-                    'query_used': query
-                }
-                logger.error(f"❌ Exception during {analysis_type} analysis for {symbol}: {e}")
+        successful_analyses = 0
+        for analysis_type, entry in zip(known_types, entries):
+            results['analyses'][analysis_type] = entry
+            if entry['status'] == 'success':
+                successful_analyses += 1
+                logger.info(f"✅ {analysis_type} analysis completed for {symbol}")
+            else:
+                logger.warning(f"❌ {analysis_type} analysis failed for {symbol}")
 
         # Generate summary
         results['summary'] = {
@@ -6,7 +6,8 @@
 import sqlite3
 import logging
 import os
-from typing import Dict, List, Any, Optional
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -29,6 +30,10 @@ class SignalStore:
     - Same data written to both Signal Store and LightRAG
     - Transaction-based (both succeed or both fail)
     - Graceful degradation (falls back to LightRAG if Signal Store fails)
+
+    Concurrency: WAL journal with synchronous=NORMAL and one connection per thread,
+    so query-router readers never wait on ingestion writers and parallel writers
+    queue on SQLite's busy timeout instead of sharing a cursor.
     """
 
     def __init__(self, db_path: str = "data/signal_store/signal_store.db"):
@@ -45,15 +50,79 @@ class SignalStore:
         db_dir = Path(db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize database connection
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row  # Access columns by name
+        # Seconds a writer waits for another thread's write transaction before raising
+        self.busy_timeout = float(os.getenv('SIGNAL_STORE_BUSY_TIMEOUT', '30'))
+
+        # One connection per thread: pipelined ingestion writes signals from worker threads
+        # while the query router reads from others. An in-memory database exists only on the
+        # connection that created it, so ':memory:' stores share a single connection.
+        self._local = threading.local()
+        # (owning thread, connection); connections of exited threads are closed in _connect()
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._shared_conn: Optional[sqlite3.Connection] = None
+        self._closed = False
+        if db_path == ':memory:':
+            self._shared_conn = self._connect()
 
         # Create tables if they don't exist
         self._create_tables()
 
         self.logger.info(f"Signal Store initialized at {db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a WAL-mode connection and register it for close(), closing those of exited threads."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed Signal Store.")
+
+        # Ingestion runs use a fresh ThreadPoolExecutor each time, so without pruning every
+        # run would leave one open connection per finished worker thread
+        with self._connections_lock:
+            dead = [conn for thread, conn in self._connections if not thread.is_alive()]
+            self._connections = [(thread, conn) for thread, conn in self._connections if thread.is_alive()]
+        for conn in dead:
+            conn.close()
+
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Access columns by name
+        # WAL: readers see the last committed snapshot while a writer appends;
+        # synchronous=NORMAL fsyncs at checkpoints instead of on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._connections_lock:
+            self._connections.append((threading.current_thread(), conn))
+        return conn
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The calling thread's connection (opened on first use)."""
+        if self._shared_conn is not None:
+            return self._shared_conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def _insert_batch(self, sql: str, rows: List[tuple]) -> None:
+        """executemany in one write transaction; rolls back and re-raises on failure."""
+        conn = self.conn
+        if conn.in_transaction:
+            # Part of a caller's begin_transaction(); their commit/rollback decides
+            conn.executemany(sql, rows)
+            return
+
+        # IMMEDIATE takes the write lock up front, so concurrent batches wait on the
+        # busy timeout rather than failing when a read lock can't be upgraded
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(sql, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def _create_tables(self):
         """Create all Signal Store tables with proper indexes."""
         cursor = self.conn.cursor()
@@ -213,23 +282,19 @@ class SignalStore:
         Returns:
             Number of ratings inserted
         """
-        cursor = self.conn.cursor()
-
-        for rating in ratings:
-            cursor.execute("""
-                INSERT INTO ratings (ticker, analyst, firm, rating, confidence, timestamp, source_document_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                rating['ticker'],
-                rating.get('analyst'),
-                rating.get('firm'),
-                rating['rating'],
-                rating.get('confidence'),
-                rating['timestamp'],
-                rating['source_document_id']
-            ))
+        self._insert_batch("""
+            INSERT INTO ratings (ticker, analyst, firm, rating, confidence, timestamp, source_document_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [(
+            rating['ticker'],
+            rating.get('analyst'),
+            rating.get('firm'),
+            rating['rating'],
+            rating.get('confidence'),
+            rating['timestamp'],
+            rating['source_document_id']
+        ) for rating in ratings])
 
-        self.conn.commit()
         count = len(ratings)
         self.logger.info(f"Inserted {count} ratings in batch")
         return count
@@ -385,25 +450,21 @@ class SignalStore:
         Returns:
             Number of metrics inserted
         """
-        cursor = self.conn.cursor()
-
-        for metric in metrics:
-            cursor.execute("""
-                INSERT INTO metrics (ticker, metric_type, metric_value, period, confidence,
-                                   source_document_id, table_index, row_index)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                metric['ticker'],
-                metric['metric_type'],
-                metric['metric_value'],
-                metric.get('period'),
-                metric.get('confidence'),
-                metric['source_document_id'],
-                metric.get('table_index'),
-                metric.get('row_index')
-            ))
+        self._insert_batch("""
+            INSERT INTO metrics (ticker, metric_type, metric_value, period, confidence,
+                               source_document_id, table_index, row_index)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(
+            metric['ticker'],
+            metric['metric_type'],
+            metric['metric_value'],
+            metric.get('period'),
+            metric.get('confidence'),
+            metric['source_document_id'],
+            metric.get('table_index'),
+            metric.get('row_index')
+        ) for metric in metrics])
 
-        self.conn.commit()
         count = len(metrics)
         self.logger.info(f"Inserted {count} metrics in batch")
         return count
@@ -580,6 +641,36 @@ class SignalStore:
         self.logger.debug(f"Inserted price target: {ticker} ${target_price} (id={row_id})")
         return row_id
 
+    def insert_price_targets_batch(self, price_targets: List[Dict[str, Any]]) -> int:
+        """
+        Insert multiple price targets in a single transaction.
+
+        Args:
+            price_targets: List of price target dicts with keys: ticker, target_price, timestamp,
+                           source_document_id, analyst (optional), firm (optional),
+                           currency (optional, default 'USD'), confidence (optional)
+
+        Returns:
+            Number of price targets inserted
+        """
+        self._insert_batch("""
+            INSERT INTO price_targets (ticker, analyst, firm, target_price, currency, confidence, timestamp, source_document_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [(
+            target['ticker'],
+            target.get('analyst'),
+            target.get('firm'),
+            target['target_price'],
+            target.get('currency') or 'USD',
+            target.get('confidence'),
+            target['timestamp'],
+            target['source_document_id']
+        ) for target in price_targets])
+
+        count = len(price_targets)
+        self.logger.info(f"Inserted {count} price targets in batch")
+        return count
+
     def get_latest_price_target(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
         Get the most recent price target for a ticker.
@@ -716,34 +807,27 @@ class SignalStore:
             >>> store.insert_entities_batch(entities)
             2
         """
-        cursor = self.conn.cursor()
-        cursor.execute("BEGIN TRANSACTION")
-
         try:
-            for entity in entities:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO entities (
-                        entity_id, entity_type, entity_name, confidence, source_document_id, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    entity['entity_id'],
-                    entity['entity_type'],
-                    entity['entity_name'],
-                    entity.get('confidence'),
-                    entity['source_document_id'],
-                    entity.get('metadata')
-                ))
-
-            self.conn.commit()
-            count = len(entities)
-            self.logger.info(f"Batch inserted {count} entities")
-            return count
-
+            self._insert_batch("""
+                INSERT OR REPLACE INTO entities (
+                    entity_id, entity_type, entity_name, confidence, source_document_id, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, [(
+                entity['entity_id'],
+                entity['entity_type'],
+                entity['entity_name'],
+                entity.get('confidence'),
+                entity['source_document_id'],
+                entity.get('metadata')
+            ) for entity in entities])
         except Exception as e:
-            self.conn.rollback()
             self.logger.error(f"Batch entity insert failed: {e}")
             raise
 
+        count = len(entities)
+        self.logger.info(f"Batch inserted {count} entities")
+        return count
+
     def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """
         Get entity by ID.
@@ -871,34 +955,27 @@ class SignalStore:
             >>> store.insert_relationships_batch(relationships)
             2
         """
-        cursor = self.conn.cursor()
-        cursor.execute("BEGIN TRANSACTION")
-
         try:
-            for rel in relationships:
-                cursor.execute("""
-                    INSERT INTO relationships (
-                        source_entity, target_entity, relationship_type, confidence, source_document_id, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    rel['source_entity'],
-                    rel['target_entity'],
-                    rel['relationship_type'],
-                    rel.get('confidence'),
-                    rel['source_document_id'],
-                    rel.get('metadata')
-                ))
-
-            self.conn.commit()
-            count = len(relationships)
-            self.logger.info(f"Batch inserted {count} relationships")
-            return count
-
+            self._insert_batch("""
+                INSERT INTO relationships (
+                    source_entity, target_entity, relationship_type, confidence, source_document_id, metadata
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, [(
+                rel['source_entity'],
+                rel['target_entity'],
+                rel['relationship_type'],
+                rel.get('confidence'),
+                rel['source_document_id'],
+                rel.get('metadata')
+            ) for rel in relationships])
         except Exception as e:
-            self.conn.rollback()
             self.logger.error(f"Batch relationship insert failed: {e}")
             raise
 
+        count = len(relationships)
+        self.logger.info(f"Batch inserted {count} relationships")
+        return count
+
     def get_relationships(
         self,
         source_entity: Optional[str] = None,
@@ -976,9 +1053,14 @@ class SignalStore:
     # ==================== UTILITY METHODS ====================
 
     def close(self):
-        """Close database connection."""
-        self.conn.close()
-        self.logger.info("Signal Store connection closed")
+        """Close every thread's connection; later operations raise sqlite3.ProgrammingError."""
+        with self._connections_lock:
+            self._closed = True
+            connections, self._connections = self._connections, []
+        self._shared_conn = None
+        for _, conn in connections:
+            conn.close()
+        self.logger.info(f"Signal Store closed ({len(connections)} connections)")
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,345 @@
+# Location: /updated_architectures/implementation/stats_index.py
+# Purpose: Persisted, incrementally maintained index behind ICESimplified.get_comprehensive_stats
+# Why: Every stats call re-read kv_store_doc_status.json and the entity/relationship vector
+#      storage and rescanned every document summary and entity
+# Relevant Files: ice_simplified.py, src/ice_lightrag/mmap_vector_storage.py
+
+"""
+Incremental 3-tier statistics index
+
+StatsIndex keeps the counters behind the 3-tier knowledge graph statistics in
+{working_dir}/.ice_stats_index.json:
+
+- Tier 1: source counts per processed LightRAG doc id, fed by ICECore.add_documents_batch
+  with the doc ids and content summaries LightRAG stored
+- Tier 2: entity/relationship totals from vector storage headers
+- Tier 3: a signal/ticker profile per entity, updated from the tail of the append-only
+  entity index (memory-mapped storage). For legacy vdb_entities.json storage, the
+  entities are rescanned only when the file changes.
+
+Updates happen at ingestion time. Stats reads only combine counters. The index is rebuilt
+from a full scan when it is missing or its version is out of date.
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.ice_lightrag.mmap_vector_storage import count_vector_rows, iter_vector_metadata, read_index_tail
+
+logger = logging.getLogger(__name__)
+
+# Bump when counting rules change so existing indexes are rebuilt
+STATS_INDEX_VERSION = 2
+
+API_SOURCES = {'newsapi', 'finnhub', 'marketaux', 'fmp', 'alpha_vantage', 'polygon', 'benzinga'}
+SOURCE_KEYS = ['newsapi', 'finnhub', 'marketaux', 'benzinga', 'fmp', 'alpha_vantage', 'polygon',
+               'sec_edgar', 'exa_company', 'exa_competitors']
+TIER3_TICKERS = {'NVDA', 'TSMC', 'AMD', 'ASML', 'INTC', 'QCOM', 'AVGO', 'TXN', 'MU', 'LRCX'}
+
+SOURCE_MARKER_PATTERN = re.compile(r'\[SOURCE:(\w+)\|')
+
+# Entity signal flags (bitmask stored per entity)
+SIGNAL_FLAGS = {'buy_signals': 1, 'sell_signals': 2, 'price_targets': 4, 'risk_mentions': 8}
+
+
+def classify_document_source(summary: str) -> Optional[str]:
+    """Source of a document from its SOURCE markers, or None when unmarked"""
+    match = SOURCE_MARKER_PATTERN.search(summary)
+    if match:
+        return match.group(1).lower()
+    if 'SOURCE_EMAIL' in summary or '[TICKER:' in summary:
+        # Email documents use different markup pattern
+        return 'email'
+    return None
+
+
+def entity_signal_profile(entity: Dict[str, Any]) -> Tuple[int, List[str]]:
+    """(signal flag bitmask, tickers mentioned) for one entity vector record"""
+    text = f"{entity.get('entity_name', '')} {entity.get('content', '')}".upper()
+
+    flags = 0
+    if 'BUY' in text:
+        flags |= SIGNAL_FLAGS['buy_signals']
+    if 'SELL' in text:
+        flags |= SIGNAL_FLAGS['sell_signals']
+    if 'PRICE TARGET' in text or 'PRICE_TARGET' in text:
+        flags |= SIGNAL_FLAGS['price_targets']
+    if 'RISK' in text:
+        flags |= SIGNAL_FLAGS['risk_mentions']
+
+    return flags, sorted(ticker for ticker in TIER3_TICKERS if ticker in text)
+
+
+class StatsIndex:
+    """
+    Incrementally maintained counters for ICESimplified.get_comprehensive_stats
+
+    record_documents() and refresh_graph() run at ingestion time; the get_*_stats()
+    methods only read counters. Thread-safe for the ingestion pipeline's consumer thread
+    and concurrent stats polling.
+    """
+
+    def __init__(self, storage_path: Path):
+        self.storage_path = Path(storage_path)
+        self.index_path = self.storage_path / '.ice_stats_index.json'
+        self._lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._persisted = False
+
+    # ------------------------------------------------------------------ state
+
+    @staticmethod
+    def _empty_state() -> Dict[str, Any]:
+        return {
+            'version': STATS_INDEX_VERSION,
+            'updated_at': None,
+            'documents': {},  # processed LightRAG doc id -> source ('' when unmarked)
+            'source_counts': {},
+            'total_entities': 0,
+            'total_relationships': 0,
+            'entity_profiles': {},  # entity id -> [flags, tickers], only non-empty profiles
+            'signal_counts': {name: 0 for name in SIGNAL_FLAGS},
+            'ticker_counts': {},
+            'entities_cursor': {'index_bytes': 0, 'generation': None, 'legacy_signature': None},
+        }
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """Loaded index state, rebuilt from storage on first use if missing or outdated"""
+        with self._lock:
+            if self._persisted and not self.index_path.exists():
+                # Storage was cleared underneath us (e.g. graph rebuild) - start over
+                self._state, self._persisted = None, False
+            if self._state is None:
+                self._state = self._load()
+                if self._state is None:
+                    self.rebuild()
+            return self._state
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        if not self.index_path.exists():
+            return None
+        try:
+            with open(self.index_path, 'r') as f:
+                state = json.load(f)
+            if state.get('version') != STATS_INDEX_VERSION:
+                logger.info("Stats index version changed, rebuilding")
+                return None
+            self._persisted = True
+            return state
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Unreadable stats index {self.index_path}, rebuilding: {e}")
+            return None
+
+    def save(self):
+        """Persist the index (write-then-rename)"""
+        with self._lock:
+            if self._state is None:
+                return
+            self._state['updated_at'] = datetime.now().isoformat()
+            try:
+                self.storage_path.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.index_path.with_suffix(f'.{os.getpid()}.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._state, f)
+                os.replace(tmp_path, self.index_path)
+                self._persisted = True
+            except OSError as e:
+                logger.warning(f"Failed to save stats index: {e}")
+
+    def rebuild(self):
+        """Recount processed documents in kv_store_doc_status.json and everything in the vector storage"""
+        with self._lock:
+            self._state = self._empty_state()
+
+            doc_status_file = self.storage_path / 'kv_store_doc_status.json'
+            if doc_status_file.exists():
+                with open(doc_status_file, 'r') as f:
+                    docs = json.load(f)
+                for doc_id, doc in docs.items():
+                    # Failed inserts and duplicate-attempt records are not in the graph
+                    if doc.get('status') == 'processed':
+                        self._add_document(doc_id, doc.get('content_summary', ''))
+
+            self.refresh_graph()
+            self.save()
+            logger.info(f"📊 Stats index rebuilt: {len(self._state['documents'])} documents, "
+                        f"{self._state['total_entities']} entities")
+
+    # ------------------------------------------------------------------ tier 1
+
+    def _add_document(self, doc_id: str, summary: str) -> bool:
+        documents = self._state['documents']
+        if doc_id in documents:
+            return False  # Already counted (document inserted again)
+        source = classify_document_source(summary) or ''
+        documents[doc_id] = source
+        if source:
+            counts = self._state['source_counts']
+            counts[source] = counts.get(source, 0) + 1
+        return True
+
+    def record_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Count successfully inserted documents
+
+        Args:
+            documents: {'doc_id', 'content_summary'} dicts for processed documents, as in
+                JupyterICERAG.add_documents_concurrent results (ids LightRAG stored)
+
+        Returns:
+            Number of documents not seen before
+        """
+        with self._lock:
+            self.state  # Load or rebuild before counting
+            added = 0
+            for doc in documents:
+                added += self._add_document(doc['doc_id'], doc.get('content_summary', ''))
+            return added
+
+    # ------------------------------------------------------------------ tiers 2 + 3
+
+    def _apply_entity(self, entity_id: str, profile: Optional[Tuple[int, List[str]]]):
+        """Replace an entity's contribution to signal/ticker counts (None = removed)"""
+        profiles = self._state['entity_profiles']
+        signal_counts = self._state['signal_counts']
+        ticker_counts = self._state['ticker_counts']
+
+        old = profiles.pop(entity_id, None)
+        if old:
+            for name, bit in SIGNAL_FLAGS.items():
+                if old[0] & bit:
+                    signal_counts[name] -= 1
+            for ticker in old[1]:
+                ticker_counts[ticker] -= 1
+                if not ticker_counts[ticker]:
+                    del ticker_counts[ticker]
+
+        if profile and (profile[0] or profile[1]):
+            profiles[entity_id] = [profile[0], profile[1]]
+            for name, bit in SIGNAL_FLAGS.items():
+                if profile[0] & bit:
+                    signal_counts[name] += 1
+            for ticker in profile[1]:
+                ticker_counts[ticker] = ticker_counts.get(ticker, 0) + 1
+
+    def _reset_entities(self):
+        self._state['entity_profiles'] = {}
+        self._state['signal_counts'] = {name: 0 for name in SIGNAL_FLAGS}
+        self._state['ticker_counts'] = {}
+
+    def refresh_graph(self):
+        """Update entity/relationship totals and entity signal profiles from vector storage"""
+        with self._lock:
+            state = self.state
+            state['total_entities'] = count_vector_rows(self.storage_path, 'entities')
+            state['total_relationships'] = count_vector_rows(self.storage_path, 'relationships')
+
+            cursor = state['entities_cursor']
+            tail = read_index_tail(self.storage_path, 'entities', cursor['index_bytes'])
+
+            if tail is not None:
+                if tail['generation'] != cursor['generation'] or tail['index_bytes'] < cursor['index_bytes']:
+                    # Index rewritten (compaction/drop) or first read - replay it from the start
+                    self._reset_entities()
+                    tail = read_index_tail(self.storage_path, 'entities', 0)
+                for record in tail['records']:
+                    if '__deleted__' in record:
+                        self._apply_entity(record['__deleted__'], None)
+                    else:
+                        self._apply_entity(record['__id__'], entity_signal_profile(record))
+                state['entities_cursor'] = {
+                    'index_bytes': tail['index_bytes'], 'generation': tail['generation'], 'legacy_signature': None
+                }
+                return
+
+            # Legacy vdb_entities.json: rescan only when the file changed
+            legacy_file = self.storage_path / 'vdb_entities.json'
+            signature = None
+            if legacy_file.exists():
+                stat = legacy_file.stat()
+                signature = [stat.st_mtime_ns, stat.st_size]
+            if signature != cursor['legacy_signature'] or cursor['generation'] is not None:
+                self._reset_entities()
+                for entity in iter_vector_metadata(self.storage_path, 'entities'):
+                    self._apply_entity(entity.get('__id__'), entity_signal_profile(entity))
+                state['entities_cursor'] = {'index_bytes': 0, 'generation': None, 'legacy_signature': signature}
+
+    # ------------------------------------------------------------------ reads
+
+    def get_document_stats(self) -> Dict[str, Any]:
+        """Tier 1 statistics (same shape as the former full-scan implementation)"""
+        with self._lock:
+            state = self.state
+            source_counts = Counter(state['source_counts'])
+            total = len(state['documents'])
+
+        api_total = sum(source_counts[s] for s in API_SOURCES)
+        sec_total = source_counts.get('sec_edgar', 0)
+        exa_total = source_counts.get('exa_company', 0) + source_counts.get('exa_competitors', 0)
+
+        # Calculate source diversity metrics
+        total_with_markers = sum(source_counts.values())
+        unique_sources = len([v for v in source_counts.values() if v > 0])
+        coverage_percentage = (total_with_markers / total * 100) if total > 0 else 0.0
+
+        # Determine completeness status
+        has_email = source_counts.get('email', 0) > 0
+        has_api = api_total > 0
+        has_sec = sec_total > 0
+        expected_sources_present = sum([has_email, has_api, has_sec])
+
+        if expected_sources_present == 3 and coverage_percentage >= 95:
+            status = 'complete'
+        elif expected_sources_present >= 2 or coverage_percentage >= 50:
+            status = 'partial'
+        else:
+            status = 'incomplete'
+
+        return {
+            'total': total,
+            'by_source': dict(source_counts),
+            'email': source_counts.get('email', 0),
+            'api_total': api_total,
+            'sec_total': sec_total,
+            'exa_total': exa_total,
+            **{k: source_counts.get(k, 0) for k in SOURCE_KEYS},
+            'source_diversity': {
+                'unique_sources': unique_sources,
+                'expected_sources': 3,  # Email, API, SEC
+                'expected_sources_present': expected_sources_present,
+                'coverage_percentage': coverage_percentage,
+                'documents_with_markers': total_with_markers,
+                'documents_without_markers': total - total_with_markers,
+                'status': status
+            }
+        }
+
+    def get_graph_structure_stats(self) -> Dict[str, Any]:
+        """Tier 2 statistics"""
+        with self._lock:
+            state = self.state
+            total_entities = state['total_entities']
+            total_relationships = state['total_relationships']
+
+        return {
+            'total_entities': total_entities,
+            'total_relationships': total_relationships,
+            'avg_connections': total_relationships / total_entities if total_entities > 0 else 0.0
+        }
+
+    def get_investment_intelligence_stats(self) -> Dict[str, Any]:
+        """Tier 3 statistics"""
+        with self._lock:
+            state = self.state
+            return {
+                'tickers_covered': sorted(state['ticker_counts']),
+                **state['signal_counts']
+            }